@@ -8,6 +8,9 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import normalization helpers
 from sports_index_normalizer import normalize_indexes, plot_top_10_indexes
+from sports_storage import read_table, write_table
+from sports_archetypes import add_archetypes
+from sports_scoring import score_table
 
 def calc_american_football_index(row):
     """
@@ -251,42 +254,13 @@ def calc_american_football_index(row):
 
 def main():
     # 1) Load the dataset
-    df = pd.read_csv("american_football_dataset.csv")
-
-    # Ensure that all necessary columns are present
-    required_columns = [
-        "player_name", "position", "years_active", "teams_played_for",
-        "games_played", "games_started", "wins", "losses", "ties",
-        "passing_completions", "passing_attempts", "passing_yards",
-        "passing_touchdowns", "passing_interceptions", "passing_rating",
-        "rushing_attempts", "rushing_yards", "rushing_touchdowns",
-        "rushing_longest_run", "receptions", "receiving_yards",
-        "receiving_touchdowns", "receiving_longest_reception",
-        "tackles", "sacks", "forced_fumbles", "fumble_recoveries",
-        "interceptions_defense", "pass_deflections",
-        "field_goals_made", "field_goals_attempted",
-        "field_goal_percentage", "longest_field_goal",
-        "extra_points_made", "extra_points_attempted",
-        "punt_returns", "punt_return_yards", "punt_return_touchdowns",
-        "kick_returns", "kick_return_yards", "kick_return_touchdowns",
-        "pro_bowls", "all_pro_selections", "mvp_awards",
-        "super_bowl_titles", "hall_of_fame_inducted",
-        "quarterback_rating", "yards_per_attempt",
-        "yards_per_carry", "yards_per_reception",
-        "career_earnings_million_usd", "total_trophies_won",
-        "super_bowl_appearances",
-        "turnovers", "failed_field_goals"  # Ensure these columns exist
-    ]
-
-    missing_columns = set(required_columns) - set(df.columns)
-    if missing_columns:
-        print(f"Missing columns in the dataset: {missing_columns}")
-        # Optionally, fill missing columns with 0
-        for col in missing_columns:
-            df[col] = 0
-
-    # 2) Calculate the American Football Index Score for each player
-    df["american_football_index"] = df.apply(calc_american_football_index, axis=1)
+    df = read_table("american_football_dataset.csv")
+
+    # 2) Calculate the American Football Index Score for each player. Stats added to
+    # the schema after the dataset was written score with their declared defaults,
+    # passed to the vectorized engine as scalars instead of allocated columns
+    df["american_football_index"] = score_table("american_football_dataset.csv", calc_american_football_index,
+                                                schema="american_football")
 
     # 3) Sort players by that score, descending
     df_sorted = df.sort_values(by="american_football_index", ascending=False).reset_index(drop=True)
@@ -302,8 +276,11 @@ def main():
     # 5) Normalize the index scores (0–100)
     normalized_df = normalize_indexes(df_sorted, name_col='player_name', index_col='american_football_index')
 
+    # Add each athlete's archetype (cluster) and its distance to the centroid
+    normalized_df = add_archetypes(normalized_df, "american_football")
+
     # 6) Save the sorted results with normalized scores to a new CSV
-    normalized_df.to_csv("american_football_index_scored.csv", index=False)
+    write_table(normalized_df, "american_football_index_scored.csv")
 
     # 7) Create a line plot of the top 10
     plot_top_10_indexes(
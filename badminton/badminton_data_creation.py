@@ -1,4 +1,67 @@
-import csv
+import os
+import sys
+
+# Add parent directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sports_player_data import load_players, write_dataset
+
+# One record per player; fields a player does not list are written as 0
+PLAYERS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "badminton_players.json")
+
+# ------------------------- COLUMN HEADERS (41+) -------------------------
+HEADERS = [
+    "player_name",
+    "gender",
+    "country",
+    "handedness",
+    "event_type",  # Singles/Doubles/Mixed
+    "years_active",
+    "highest_world_ranking",
+    "world_ranking_history",  # Number of times ranked in top 10
+    "international_matches_played",
+    "international_matches_won",
+    "international_matches_lost",
+    "international_titles_won",
+    "international_title_percentage",
+    "olympic_medals",
+    "world_championship_titles",
+    "commonwealth_medals",
+    "asian_games_medals",
+    "bwf_super_series_titles",
+    "bwf_world_superseries_championships",
+    "bwf_world_cup_titles",
+    "bwf_world_series_titles",
+    "bwf_grand_prix_titles",
+    "bwf_grand_prix_gold_titles",
+    "total_points_scored",
+    "total_kills",
+    "total_deals",
+    "total_defense_points",
+    "total_blocks",
+    "total_serves_aces",
+    "total_serves_errors",
+    "serve_accuracy_percent",
+    "return_accuracy_percent",
+    "smash_success_rate",
+    "drop_shot_success_rate",
+    "net_play_success_rate",
+    "overall_efficiency",
+    "attack_efficiency",
+    "defense_efficiency",
+    "reception_accuracy_percent",
+    "serve_receive_efficiency",
+    "career_earnings_million_usd",
+    "total_trophies_won",
+    "best_player_awards",
+    "mvp_awards",
+    "most_improved_player_awards",
+    "sportsmanship_awards",
+    "hall_of_fame_inducted",
+    "coach_achievements",
+    "overall_performance_score",
+]
+
 
 def create_badminton_dataset(filename="badminton_dataset.csv"):
     """
@@ -11,1893 +74,9 @@ def create_badminton_dataset(filename="badminton_dataset.csv"):
     After creation, you'll have a 'badminton_dataset.csv' file with 30 rows,
     each containing 41+ columns of data.
     """
+    players_data = load_players(PLAYERS_FILE)
+    write_dataset(HEADERS, players_data, filename, expected_count=30)
 
-    # ------------------------- COLUMN HEADERS (41+) -------------------------
-    headers = [
-        "player_name",
-        "gender",
-        "country",
-        "handedness",
-        "event_type",  # Singles/Doubles/Mixed
-        "years_active",
-        "highest_world_ranking",
-        "world_ranking_history",  # Number of times ranked in top 10
-        "international_matches_played",
-        "international_matches_won",
-        "international_matches_lost",
-        "international_titles_won",
-        "international_title_percentage",
-        "olympic_medals",
-        "world_championship_titles",
-        "commonwealth_medals",
-        "asian_games_medals",
-        "bwf_super_series_titles",
-        "bwf_world_superseries_championships",
-        "bwf_world_cup_titles",
-        "bwf_world_series_titles",
-        "bwf_grand_prix_titles",
-        "bwf_grand_prix_gold_titles",
-        "total_points_scored",
-        "total_kills",
-        "total_deals",
-        "total_defense_points",
-        "total_blocks",
-        "total_serves_aces",
-        "total_serves_errors",
-        "serve_accuracy_percent",
-        "return_accuracy_percent",
-        "smash_success_rate",
-        "drop_shot_success_rate",
-        "net_play_success_rate",
-        "overall_efficiency",
-        "attack_efficiency",
-        "defense_efficiency",
-        "reception_accuracy_percent",
-        "serve_receive_efficiency",
-        "career_earnings_million_usd",
-        "total_trophies_won",
-        "best_player_awards",
-        "mvp_awards",
-        "most_improved_player_awards",
-        "sportsmanship_awards",
-        "hall_of_fame_inducted",
-        "coach_achievements",
-        "overall_performance_score",
-    ]
-
-    # Define exactly 30 players, each with 41+ fields.
-    # Stats below are approximate or best-known from public data.
-    # Some older players may have incomplete data for advanced metrics => set them to 0 or minimal.
-
-    players_data = [
-        # 1) Lin Dan (China, Male)
-        {
-            "player_name": "Lin Dan",
-            "gender": "Male",
-            "country": "China",
-            "handedness": "Right",
-            "event_type": "Singles",
-            "years_active": 20,  # 2001-2021
-            "highest_world_ranking": 1,
-            "world_ranking_history": 18,  # Number of times ranked in top 10
-            "international_matches_played": 350,
-            "international_matches_won": 300,
-            "international_matches_lost": 50,
-            "international_titles_won": 28,
-            "international_title_percentage": 80.0,  # 28/35
-            "olympic_medals": 2,  # 2 Gold
-            "world_championship_titles": 5,
-            "commonwealth_medals": 0,  # Not applicable
-            "asian_games_medals": 6,
-            "bwf_super_series_titles": 46,
-            "bwf_world_superseries_championships": 2,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 12000,
-            "total_kills": 7000,
-            "total_deals": 3000,
-            "total_defense_points": 2000,
-            "total_blocks": 500,
-            "total_serves_aces": 800,
-            "total_serves_errors": 200,
-            "serve_accuracy_percent": 75.0,
-            "return_accuracy_percent": 80.0,
-            "smash_success_rate": 85.0,
-            "drop_shot_success_rate": 80.0,
-            "net_play_success_rate": 78.0,
-            "overall_efficiency": 82.0,
-            "attack_efficiency": 85.0,
-            "defense_efficiency": 80.0,
-            "reception_accuracy_percent": 78.0,
-            "serve_receive_efficiency": 80.0,
-            "career_earnings_million_usd": 4.5,
-            "total_trophies_won": 50,
-            "best_player_awards": 10,
-            "mvp_awards": 8,
-            "most_improved_player_awards": 0,
-            "sportsmanship_awards": 3,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 95.0,
-        },
-        # 2) Lee Chong Wei (Malaysia, Male)
-        {
-            "player_name": "Lee Chong Wei",
-            "gender": "Male",
-            "country": "Malaysia",
-            "handedness": "Right",
-            "event_type": "Singles",
-            "years_active": 17,  # 2002-2019
-            "highest_world_ranking": 1,
-            "world_ranking_history": 29,
-            "international_matches_played": 400,
-            "international_matches_won": 340,
-            "international_matches_lost": 60,
-            "international_titles_won": 21,
-            "international_title_percentage": 70.0,  # 21/30
-            "olympic_medals": 0,
-            "world_championship_titles": 1,
-            "commonwealth_medals": 3,
-            "asian_games_medals": 5,
-            "bwf_super_series_titles": 39,
-            "bwf_world_superseries_championships": 1,
-            "bwf_world_cup_titles": 2,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 11000,
-            "total_kills": 6500,
-            "total_deals": 2800,
-            "total_defense_points": 1800,
-            "total_blocks": 450,
-            "total_serves_aces": 750,
-            "total_serves_errors": 180,
-            "serve_accuracy_percent": 73.0,
-            "return_accuracy_percent": 76.0,
-            "smash_success_rate": 82.0,
-            "drop_shot_success_rate": 78.0,
-            "net_play_success_rate": 75.0,
-            "overall_efficiency": 80.0,
-            "attack_efficiency": 82.0,
-            "defense_efficiency": 78.0,
-            "reception_accuracy_percent": 75.0,
-            "serve_receive_efficiency": 78.0,
-            "career_earnings_million_usd": 4.0,
-            "total_trophies_won": 40,
-            "best_player_awards": 8,
-            "mvp_awards": 6,
-            "most_improved_player_awards": 0,
-            "sportsmanship_awards": 2,
-            "hall_of_fame_inducted": 0,
-            "coach_achievements": 0,
-            "overall_performance_score": 90.0,
-        },
-        # 3) Taufik Hidayat (Indonesia, Male)
-        {
-            "player_name": "Taufik Hidayat",
-            "gender": "Male",
-            "country": "Indonesia",
-            "handedness": "Right",
-            "event_type": "Singles",
-            "years_active": 14,  # 1997-2011
-            "highest_world_ranking": 1,
-            "world_ranking_history": 15,
-            "international_matches_played": 250,
-            "international_matches_won": 220,
-            "international_matches_lost": 30,
-            "international_titles_won": 18,
-            "international_title_percentage": 72.0,  # 18/25
-            "olympic_medals": 1,  # 1 Gold
-            "world_championship_titles": 1,
-            "commonwealth_medals": 0,  # Not applicable
-            "asian_games_medals": 4,
-            "bwf_super_series_titles": 15,
-            "bwf_world_superseries_championships": 0,
-            "bwf_world_cup_titles": 1,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 9000,
-            "total_kills": 5000,
-            "total_deals": 2000,
-            "total_defense_points": 1500,
-            "total_blocks": 300,
-            "total_serves_aces": 600,
-            "total_serves_errors": 150,
-            "serve_accuracy_percent": 70.0,
-            "return_accuracy_percent": 72.0,
-            "smash_success_rate": 80.0,
-            "drop_shot_success_rate": 75.0,
-            "net_play_success_rate": 73.0,
-            "overall_efficiency": 78.0,
-            "attack_efficiency": 80.0,
-            "defense_efficiency": 75.0,
-            "reception_accuracy_percent": 72.0,
-            "serve_receive_efficiency": 75.0,
-            "career_earnings_million_usd": 3.5,
-            "total_trophies_won": 35,
-            "best_player_awards": 6,
-            "mvp_awards": 5,
-            "most_improved_player_awards": 0,
-            "sportsmanship_awards": 2,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 88.0,
-        },
-        # 4) Chen Long (China, Male)
-        {
-            "player_name": "Chen Long",
-            "gender": "Male",
-            "country": "China",
-            "handedness": "Right",
-            "event_type": "Singles",
-            "years_active": 14,  # 2008-2022
-            "highest_world_ranking": 1,
-            "world_ranking_history": 12,
-            "international_matches_played": 300,
-            "international_matches_won": 270,
-            "international_matches_lost": 30,
-            "international_titles_won": 22,
-            "international_title_percentage": 73.3,  # 22/30
-            "olympic_medals": 2,  # 1 Gold, 1 Bronze
-            "world_championship_titles": 2,
-            "commonwealth_medals": 0,  # Not applicable
-            "asian_games_medals": 5,
-            "bwf_super_series_titles": 25,
-            "bwf_world_superseries_championships": 1,
-            "bwf_world_cup_titles": 2,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 10000,
-            "total_kills": 5500,
-            "total_deals": 2200,
-            "total_defense_points": 1600,
-            "total_blocks": 350,
-            "total_serves_aces": 700,
-            "total_serves_errors": 180,
-            "serve_accuracy_percent": 72.0,
-            "return_accuracy_percent": 74.0,
-            "smash_success_rate": 83.0,
-            "drop_shot_success_rate": 76.0,
-            "net_play_success_rate": 75.0,
-            "overall_efficiency": 80.0,
-            "attack_efficiency": 83.0,
-            "defense_efficiency": 76.0,
-            "reception_accuracy_percent": 75.0,
-            "serve_receive_efficiency": 76.0,
-            "career_earnings_million_usd": 4.0,
-            "total_trophies_won": 38,
-            "best_player_awards": 7,
-            "mvp_awards": 6,
-            "most_improved_player_awards": 0,
-            "sportsmanship_awards": 3,
-            "hall_of_fame_inducted": 0,
-            "coach_achievements": 0,
-            "overall_performance_score": 90.0,
-        },
-        # 5) Viktor Axelsen (Denmark, Male)
-        {
-            "player_name": "Viktor Axelsen",
-            "gender": "Male",
-            "country": "Denmark",
-            "handedness": "Right",
-            "event_type": "Singles",
-            "years_active": 12,  # 2011-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 10,
-            "international_matches_played": 280,
-            "international_matches_won": 250,
-            "international_matches_lost": 30,
-            "international_titles_won": 25,
-            "international_title_percentage": 89.3,  # 25/28
-            "olympic_medals": 1,  # 1 Gold
-            "world_championship_titles": 3,
-            "commonwealth_medals": 0,  # Not applicable
-            "asian_games_medals": 0,  # Not applicable
-            "bwf_super_series_titles": 30,
-            "bwf_world_superseries_championships": 2,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 11000,
-            "total_kills": 6000,
-            "total_deals": 2400,
-            "total_defense_points": 1700,
-            "total_blocks": 400,
-            "total_serves_aces": 750,
-            "total_serves_errors": 190,
-            "serve_accuracy_percent": 74.0,
-            "return_accuracy_percent": 76.0,
-            "smash_success_rate": 85.0,
-            "drop_shot_success_rate": 78.0,
-            "net_play_success_rate": 77.0,
-            "overall_efficiency": 82.0,
-            "attack_efficiency": 85.0,
-            "defense_efficiency": 78.0,
-            "reception_accuracy_percent": 76.0,
-            "serve_receive_efficiency": 78.0,
-            "career_earnings_million_usd": 4.5,
-            "total_trophies_won": 42,
-            "best_player_awards": 8,
-            "mvp_awards": 7,
-            "most_improved_player_awards": 0,
-            "sportsmanship_awards": 3,
-            "hall_of_fame_inducted": 0,
-            "coach_achievements": 0,
-            "overall_performance_score": 92.0,
-        },
-        # 6) Gao Ling (China, Female)
-        {
-            "player_name": "Gao Ling",
-            "gender": "Female",
-            "country": "China",
-            "handedness": "Right",
-            "event_type": "Doubles",
-            "years_active": 18,  # 1996-2014
-            "highest_world_ranking": 1,
-            "world_ranking_history": 25,
-            "international_matches_played": 500,
-            "international_matches_won": 450,
-            "international_matches_lost": 50,
-            "international_titles_won": 40,
-            "international_title_percentage": 80.0,  # 40/50
-            "olympic_medals": 3,  # 2 Gold, 1 Bronze
-            "world_championship_titles": 5,
-            "commonwealth_medals": 0,  # Not applicable
-            "asian_games_medals": 8,
-            "bwf_super_series_titles": 50,
-            "bwf_world_superseries_championships": 5,
-            "bwf_world_cup_titles": 4,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 15000,
-            "total_kills": 8000,
-            "total_deals": 4000,
-            "total_defense_points": 2500,
-            "total_blocks": 600,
-            "total_serves_aces": 1200,
-            "total_serves_errors": 300,
-            "serve_accuracy_percent": 78.0,
-            "return_accuracy_percent": 80.0,
-            "smash_success_rate": 88.0,
-            "drop_shot_success_rate": 82.0,
-            "net_play_success_rate": 80.0,
-            "overall_efficiency": 85.0,
-            "attack_efficiency": 88.0,
-            "defense_efficiency": 80.0,
-            "reception_accuracy_percent": 80.0,
-            "serve_receive_efficiency": 80.0,
-            "career_earnings_million_usd": 5.0,
-            "total_trophies_won": 60,
-            "best_player_awards": 10,
-            "mvp_awards": 9,
-            "most_improved_player_awards": 0,
-            "sportsmanship_awards": 4,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 93.0,
-        },
-        # 7) Lee Hyun-il (South Korea, Male)
-        {
-            "player_name": "Lee Hyun-il",
-            "gender": "Male",
-            "country": "South Korea",
-            "handedness": "Right",
-            "event_type": "Singles",
-            "years_active": 19,  # 2000-2019
-            "highest_world_ranking": 2,
-            "world_ranking_history": 20,
-            "international_matches_played": 450,
-            "international_matches_won": 380,
-            "international_matches_lost": 70,
-            "international_titles_won": 25,
-            "international_title_percentage": 55.6,  # 25/45
-            "olympic_medals": 1,  # 1 Bronze
-            "world_championship_titles": 1,
-            "commonwealth_medals": 0,  # Not applicable
-            "asian_games_medals": 5,
-            "bwf_super_series_titles": 22,
-            "bwf_world_superseries_championships": 1,
-            "bwf_world_cup_titles": 2,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 13000,
-            "total_kills": 6500,
-            "total_deals": 2600,
-            "total_defense_points": 1800,
-            "total_blocks": 400,
-            "total_serves_aces": 900,
-            "total_serves_errors": 220,
-            "serve_accuracy_percent": 76.0,
-            "return_accuracy_percent": 78.0,
-            "smash_success_rate": 83.0,
-            "drop_shot_success_rate": 80.0,
-            "net_play_success_rate": 77.0,
-            "overall_efficiency": 80.0,
-            "attack_efficiency": 83.0,
-            "defense_efficiency": 78.0,
-            "reception_accuracy_percent": 78.0,
-            "serve_receive_efficiency": 78.0,
-            "career_earnings_million_usd": 4.0,
-            "total_trophies_won": 40,
-            "best_player_awards": 7,
-            "mvp_awards": 6,
-            "most_improved_player_awards": 0,
-            "sportsmanship_awards": 3,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 90.0,
-        },
-        # 8) Ratchanok Intanon (Thailand, Female)
-        {
-            "player_name": "Ratchanok Intanon",
-            "gender": "Female",
-            "country": "Thailand",
-            "handedness": "Right",
-            "event_type": "Singles",
-            "years_active": 12,  # 2011-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 15,
-            "international_matches_played": 280,
-            "international_matches_won": 240,
-            "international_matches_lost": 40,
-            "international_titles_won": 20,
-            "international_title_percentage": 71.4,  # 20/28
-            "olympic_medals": 0,
-            "world_championship_titles": 2,
-            "commonwealth_medals": 2,
-            "asian_games_medals": 4,
-            "bwf_super_series_titles": 18,
-            "bwf_world_superseries_championships": 1,
-            "bwf_world_cup_titles": 2,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 11500,
-            "total_kills": 6000,
-            "total_deals": 2400,
-            "total_defense_points": 1600,
-            "total_blocks": 350,
-            "total_serves_aces": 850,
-            "total_serves_errors": 200,
-            "serve_accuracy_percent": 75.0,
-            "return_accuracy_percent": 80.0,
-            "smash_success_rate": 85.0,
-            "drop_shot_success_rate": 82.0,
-            "net_play_success_rate": 80.0,
-            "overall_efficiency": 82.0,
-            "attack_efficiency": 85.0,
-            "defense_efficiency": 80.0,
-            "reception_accuracy_percent": 80.0,
-            "serve_receive_efficiency": 80.0,
-            "career_earnings_million_usd": 4.2,
-            "total_trophies_won": 45,
-            "best_player_awards": 8,
-            "mvp_awards": 7,
-            "most_improved_player_awards": 1,
-            "sportsmanship_awards": 3,
-            "hall_of_fame_inducted": 0,
-            "coach_achievements": 0,
-            "overall_performance_score": 91.0,
-        },
-        # 9) Saina Nehwal (India, Female)
-        {
-            "player_name": "Saina Nehwal",
-            "gender": "Female",
-            "country": "India",
-            "handedness": "Right",
-            "event_type": "Singles",
-            "years_active": 16,  # 2006-2022
-            "highest_world_ranking": 1,
-            "world_ranking_history": 20,
-            "international_matches_played": 400,
-            "international_matches_won": 350,
-            "international_matches_lost": 50,
-            "international_titles_won": 25,
-            "international_title_percentage": 62.5,  # 25/40
-            "olympic_medals": 1,  # 1 Bronze
-            "world_championship_titles": 1,
-            "commonwealth_medals": 5,
-            "asian_games_medals": 6,
-            "bwf_super_series_titles": 22,
-            "bwf_world_superseries_championships": 1,
-            "bwf_world_cup_titles": 2,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 14000,
-            "total_kills": 7000,
-            "total_deals": 2800,
-            "total_defense_points": 2000,
-            "total_blocks": 500,
-            "total_serves_aces": 1000,
-            "total_serves_errors": 250,
-            "serve_accuracy_percent": 78.0,
-            "return_accuracy_percent": 82.0,
-            "smash_success_rate": 86.0,
-            "drop_shot_success_rate": 80.0,
-            "net_play_success_rate": 78.0,
-            "overall_efficiency": 84.0,
-            "attack_efficiency": 86.0,
-            "defense_efficiency": 80.0,
-            "reception_accuracy_percent": 82.0,
-            "serve_receive_efficiency": 82.0,
-            "career_earnings_million_usd": 4.8,
-            "total_trophies_won": 50,
-            "best_player_awards": 9,
-            "mvp_awards": 8,
-            "most_improved_player_awards": 2,
-            "sportsmanship_awards": 4,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 93.0,
-        },
-        # 10) P. V. Sindhu (India, Female)
-        {
-            "player_name": "P. V. Sindhu",
-            "gender": "Female",
-            "country": "India",
-            "handedness": "Right",
-            "event_type": "Singles",
-            "years_active": 10,  # 2013-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 12,
-            "international_matches_played": 220,
-            "international_matches_won": 190,
-            "international_matches_lost": 30,
-            "international_titles_won": 18,
-            "international_title_percentage": 81.8,  # 18/22
-            "olympic_medals": 2,  # 1 Silver, 1 Bronze
-            "world_championship_titles": 2,
-            "commonwealth_medals": 3,
-            "asian_games_medals": 4,
-            "bwf_super_series_titles": 18,
-            "bwf_world_superseries_championships": 1,
-            "bwf_world_cup_titles": 1,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 10000,
-            "total_kills": 5500,
-            "total_deals": 2200,
-            "total_defense_points": 1600,
-            "total_blocks": 400,
-            "total_serves_aces": 900,
-            "total_serves_errors": 200,
-            "serve_accuracy_percent": 76.0,
-            "return_accuracy_percent": 80.0,
-            "smash_success_rate": 84.0,
-            "drop_shot_success_rate": 79.0,
-            "net_play_success_rate": 76.0,
-            "overall_efficiency": 83.0,
-            "attack_efficiency": 84.0,
-            "defense_efficiency": 78.0,
-            "reception_accuracy_percent": 80.0,
-            "serve_receive_efficiency": 80.0,
-            "career_earnings_million_usd": 4.2,
-            "total_trophies_won": 45,
-            "best_player_awards": 8,
-            "mvp_awards": 7,
-            "most_improved_player_awards": 1,
-            "sportsmanship_awards": 3,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 92.0,
-        },
-        # 11) Susi Susanti (Indonesia, Female)
-        {
-            "player_name": "Susi Susanti",
-            "gender": "Female",
-            "country": "Indonesia",
-            "handedness": "Right",
-            "event_type": "Singles",
-            "years_active": 14,  # 1989-2003
-            "highest_world_ranking": 1,
-            "world_ranking_history": 10,
-            "international_matches_played": 300,
-            "international_matches_won": 270,
-            "international_matches_lost": 30,
-            "international_titles_won": 25,
-            "international_title_percentage": 83.3,  # 25/30
-            "olympic_medals": 1,  # 1 Gold
-            "world_championship_titles": 1,
-            "commonwealth_medals": 0,  # Not applicable
-            "asian_games_medals": 5,
-            "bwf_super_series_titles": 20,
-            "bwf_world_superseries_championships": 1,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 12000,
-            "total_kills": 7000,
-            "total_deals": 2800,
-            "total_defense_points": 2000,
-            "total_blocks": 500,
-            "total_serves_aces": 1000,
-            "total_serves_errors": 250,
-            "serve_accuracy_percent": 78.0,
-            "return_accuracy_percent": 82.0,
-            "smash_success_rate": 86.0,
-            "drop_shot_success_rate": 80.0,
-            "net_play_success_rate": 78.0,
-            "overall_efficiency": 84.0,
-            "attack_efficiency": 86.0,
-            "defense_efficiency": 80.0,
-            "reception_accuracy_percent": 82.0,
-            "serve_receive_efficiency": 82.0,
-            "career_earnings_million_usd": 4.5,
-            "total_trophies_won": 50,
-            "best_player_awards": 9,
-            "mvp_awards": 8,
-            "most_improved_player_awards": 0,
-            "sportsmanship_awards": 4,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 94.0,
-        },
-        # 12) Gao Ling (China, Female) - Doubles Specialist
-        {
-            "player_name": "Gao Ling",
-            "gender": "Female",
-            "country": "China",
-            "handedness": "Left",
-            "event_type": "Doubles",
-            "years_active": 18,  # 1996-2014
-            "highest_world_ranking": 1,
-            "world_ranking_history": 25,
-            "international_matches_played": 500,
-            "international_matches_won": 450,
-            "international_matches_lost": 50,
-            "international_titles_won": 40,
-            "international_title_percentage": 80.0,  # 40/50
-            "olympic_medals": 3,  # 2 Gold, 1 Bronze
-            "world_championship_titles": 5,
-            "commonwealth_medals": 0,  # Not applicable
-            "asian_games_medals": 8,
-            "bwf_super_series_titles": 50,
-            "bwf_world_superseries_championships": 5,
-            "bwf_world_cup_titles": 4,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 15000,
-            "total_kills": 8000,
-            "total_deals": 4000,
-            "total_defense_points": 2500,
-            "total_blocks": 600,
-            "total_serves_aces": 1200,
-            "total_serves_errors": 300,
-            "serve_accuracy_percent": 78.0,
-            "return_accuracy_percent": 80.0,
-            "smash_success_rate": 88.0,
-            "drop_shot_success_rate": 82.0,
-            "net_play_success_rate": 80.0,
-            "overall_efficiency": 85.0,
-            "attack_efficiency": 88.0,
-            "defense_efficiency": 80.0,
-            "reception_accuracy_percent": 80.0,
-            "serve_receive_efficiency": 80.0,
-            "career_earnings_million_usd": 5.0,
-            "total_trophies_won": 60,
-            "best_player_awards": 10,
-            "mvp_awards": 9,
-            "most_improved_player_awards": 0,
-            "sportsmanship_awards": 4,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 93.0,
-        },
-        # 13) Viktor Axelsen (Duplicate Removed)
-        # 13) Chen Long (Duplicate Removed)
-        # 13) Carolina Marin (Spain, Female)
-        {
-            "player_name": "Carolina Marin",
-            "gender": "Female",
-            "country": "Spain",
-            "handedness": "Right",
-            "event_type": "Singles",
-            "years_active": 10,  # 2013-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 12,
-            "international_matches_played": 220,
-            "international_matches_won": 190,
-            "international_matches_lost": 30,
-            "international_titles_won": 20,
-            "international_title_percentage": 90.9,  # 20/22
-            "olympic_medals": 1,  # 1 Gold
-            "world_championship_titles": 2,
-            "commonwealth_medals": 0,  # Not applicable
-            "asian_games_medals": 0,  # Not applicable
-            "bwf_super_series_titles": 20,
-            "bwf_world_superseries_championships": 1,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 11000,
-            "total_kills": 6000,
-            "total_deals": 2400,
-            "total_defense_points": 1800,
-            "total_blocks": 400,
-            "total_serves_aces": 900,
-            "total_serves_errors": 200,
-            "serve_accuracy_percent": 76.0,
-            "return_accuracy_percent": 80.0,
-            "smash_success_rate": 84.0,
-            "drop_shot_success_rate": 80.0,
-            "net_play_success_rate": 78.0,
-            "overall_efficiency": 83.0,
-            "attack_efficiency": 84.0,
-            "defense_efficiency": 78.0,
-            "reception_accuracy_percent": 80.0,
-            "serve_receive_efficiency": 80.0,
-            "career_earnings_million_usd": 4.5,
-            "total_trophies_won": 50,
-            "best_player_awards": 9,
-            "mvp_awards": 8,
-            "most_improved_player_awards": 1,
-            "sportsmanship_awards": 3,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 92.0,
-        },
-        # 14) Kento Momota (Japan, Male)
-        {
-            "player_name": "Kento Momota",
-            "gender": "Male",
-            "country": "Japan",
-            "handedness": "Right",
-            "event_type": "Singles",
-            "years_active": 11,  # 2012-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 15,
-            "international_matches_played": 250,
-            "international_matches_won": 220,
-            "international_matches_lost": 30,
-            "international_titles_won": 22,
-            "international_title_percentage": 88.0,  # 22/25
-            "olympic_medals": 1,  # 1 Bronze
-            "world_championship_titles": 3,
-            "commonwealth_medals": 0,  # Not applicable
-            "asian_games_medals": 4,
-            "bwf_super_series_titles": 25,
-            "bwf_world_superseries_championships": 3,
-            "bwf_world_cup_titles": 2,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 12500,
-            "total_kills": 6500,
-            "total_deals": 2600,
-            "total_defense_points": 1900,
-            "total_blocks": 450,
-            "total_serves_aces": 950,
-            "total_serves_errors": 220,
-            "serve_accuracy_percent": 77.0,
-            "return_accuracy_percent": 81.0,
-            "smash_success_rate": 85.0,
-            "drop_shot_success_rate": 81.0,
-            "net_play_success_rate": 79.0,
-            "overall_efficiency": 84.0,
-            "attack_efficiency": 85.0,
-            "defense_efficiency": 79.0,
-            "reception_accuracy_percent": 81.0,
-            "serve_receive_efficiency": 81.0,
-            "career_earnings_million_usd": 4.3,
-            "total_trophies_won": 48,
-            "best_player_awards": 8,
-            "mvp_awards": 7,
-            "most_improved_player_awards": 1,
-            "sportsmanship_awards": 3,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 92.0,
-        },
-        # 15) P. V. Sindhu (Duplicate Removed)
-        # 15) Zhang Ning (China, Female)
-        {
-            "player_name": "Zhang Ning",
-            "gender": "Female",
-            "country": "China",
-            "handedness": "Right",
-            "event_type": "Singles",
-            "years_active": 14,  # 1999-2013
-            "highest_world_ranking": 1,
-            "world_ranking_history": 18,
-            "international_matches_played": 300,
-            "international_matches_won": 270,
-            "international_matches_lost": 30,
-            "international_titles_won": 25,
-            "international_title_percentage": 83.3,  # 25/30
-            "olympic_medals": 2,  # 2 Gold
-            "world_championship_titles": 2,
-            "commonwealth_medals": 0,  # Not applicable
-            "asian_games_medals": 5,
-            "bwf_super_series_titles": 20,
-            "bwf_world_superseries_championships": 2,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 13500,
-            "total_kills": 7000,
-            "total_deals": 2800,
-            "total_defense_points": 2000,
-            "total_blocks": 500,
-            "total_serves_aces": 1000,
-            "total_serves_errors": 250,
-            "serve_accuracy_percent": 78.0,
-            "return_accuracy_percent": 82.0,
-            "smash_success_rate": 86.0,
-            "drop_shot_success_rate": 80.0,
-            "net_play_success_rate": 78.0,
-            "overall_efficiency": 85.0,
-            "attack_efficiency": 86.0,
-            "defense_efficiency": 80.0,
-            "reception_accuracy_percent": 82.0,
-            "serve_receive_efficiency": 82.0,
-            "career_earnings_million_usd": 4.5,
-            "total_trophies_won": 50,
-            "best_player_awards": 9,
-            "mvp_awards": 8,
-            "most_improved_player_awards": 0,
-            "sportsmanship_awards": 4,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 94.0,
-        },
-        # 16) Peter Gade (Denmark, Male)
-        {
-            "player_name": "Peter Gade",
-            "gender": "Male",
-            "country": "Denmark",
-            "handedness": "Right",
-            "event_type": "Singles",
-            "years_active": 19,  # 1997-2016
-            "highest_world_ranking": 1,
-            "world_ranking_history": 22,
-            "international_matches_played": 420,
-            "international_matches_won": 380,
-            "international_matches_lost": 40,
-            "international_titles_won": 30,
-            "international_title_percentage": 71.4,  # 30/42
-            "olympic_medals": 0,
-            "world_championship_titles": 1,
-            "commonwealth_medals": 0,  # Not applicable
-            "asian_games_medals": 0,  # Not applicable
-            "bwf_super_series_titles": 28,
-            "bwf_world_superseries_championships": 2,
-            "bwf_world_cup_titles": 4,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 12500,
-            "total_kills": 6800,
-            "total_deals": 2700,
-            "total_defense_points": 1900,
-            "total_blocks": 450,
-            "total_serves_aces": 950,
-            "total_serves_errors": 220,
-            "serve_accuracy_percent": 77.0,
-            "return_accuracy_percent": 80.0,
-            "smash_success_rate": 84.0,
-            "drop_shot_success_rate": 79.0,
-            "net_play_success_rate": 76.0,
-            "overall_efficiency": 83.0,
-            "attack_efficiency": 84.0,
-            "defense_efficiency": 78.0,
-            "reception_accuracy_percent": 80.0,
-            "serve_receive_efficiency": 80.0,
-            "career_earnings_million_usd": 4.7,
-            "total_trophies_won": 48,
-            "best_player_awards": 8,
-            "mvp_awards": 7,
-            "most_improved_player_awards": 1,
-            "sportsmanship_awards": 3,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 91.0,
-        },
-        # 17) Viktor Axelsen (Duplicate Removed)
-        # 17) Saina Nehwal (Duplicate Removed)
-        # 17) Li Xuerui (China, Female)
-        {
-            "player_name": "Li Xuerui",
-            "gender": "Female",
-            "country": "China",
-            "handedness": "Right",
-            "event_type": "Singles",
-            "years_active": 12,  # 2010-2022
-            "highest_world_ranking": 1,
-            "world_ranking_history": 14,
-            "international_matches_played": 260,
-            "international_matches_won": 220,
-            "international_matches_lost": 40,
-            "international_titles_won": 19,
-            "international_title_percentage": 73.1,  # 19/26
-            "olympic_medals": 1,  # 1 Gold
-            "world_championship_titles": 2,
-            "commonwealth_medals": 0,  # Not applicable
-            "asian_games_medals": 4,
-            "bwf_super_series_titles": 19,
-            "bwf_world_superseries_championships": 1,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 11500,
-            "total_kills": 6200,
-            "total_deals": 2400,
-            "total_defense_points": 1700,
-            "total_blocks": 400,
-            "total_serves_aces": 850,
-            "total_serves_errors": 200,
-            "serve_accuracy_percent": 76.0,
-            "return_accuracy_percent": 80.0,
-            "smash_success_rate": 85.0,
-            "drop_shot_success_rate": 80.0,
-            "net_play_success_rate": 78.0,
-            "overall_efficiency": 84.0,
-            "attack_efficiency": 85.0,
-            "defense_efficiency": 78.0,
-            "reception_accuracy_percent": 80.0,
-            "serve_receive_efficiency": 80.0,
-            "career_earnings_million_usd": 4.1,
-            "total_trophies_won": 45,
-            "best_player_awards": 7,
-            "mvp_awards": 6,
-            "most_improved_player_awards": 0,
-            "sportsmanship_awards": 3,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 92.0,
-        },
-        # 18) Misaki Matsutomo (Japan, Female)
-        {
-            "player_name": "Misaki Matsutomo",
-            "gender": "Female",
-            "country": "Japan",
-            "handedness": "Right",
-            "event_type": "Doubles",
-            "years_active": 11,  # 2012-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 12,
-            "international_matches_played": 220,
-            "international_matches_won": 190,
-            "international_matches_lost": 30,
-            "international_titles_won": 18,
-            "international_title_percentage": 81.8,  # 18/22
-            "olympic_medals": 1,  # 1 Gold
-            "world_championship_titles": 2,
-            "commonwealth_medals": 0,  # Not applicable
-            "asian_games_medals": 3,
-            "bwf_super_series_titles": 18,
-            "bwf_world_superseries_championships": 2,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 9000,
-            "total_kills": 4500,
-            "total_deals": 1800,
-            "total_defense_points": 1300,
-            "total_blocks": 300,
-            "total_serves_aces": 700,
-            "total_serves_errors": 150,
-            "serve_accuracy_percent": 75.0,
-            "return_accuracy_percent": 78.0,
-            "smash_success_rate": 82.0,
-            "drop_shot_success_rate": 75.0,
-            "net_play_success_rate": 76.0,
-            "overall_efficiency": 80.0,
-            "attack_efficiency": 82.0,
-            "defense_efficiency": 76.0,
-            "reception_accuracy_percent": 78.0,
-            "serve_receive_efficiency": 78.0,
-            "career_earnings_million_usd": 3.8,
-            "total_trophies_won": 38,
-            "best_player_awards": 7,
-            "mvp_awards": 6,
-            "most_improved_player_awards": 0,
-            "sportsmanship_awards": 3,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 91.0,
-        },
-        # 19) Taufik Hidayat (Duplicate Removed)
-        # 19) Carolina Marin (Duplicate Removed)
-        # 19) Peter Gade (Duplicate Removed)
-        # 19) Zhang Ning (Duplicate Removed)
-        # 19) Li Xuerui (Duplicate Removed)
-        # 19) Ganda Wijaya (Indonesia, Male) - Simulated Player
-        {
-            "player_name": "Ganda Wijaya",
-            "gender": "Male",
-            "country": "Indonesia",
-            "handedness": "Right",
-            "event_type": "Doubles",
-            "years_active": 12,  # 2011-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 14,
-            "international_matches_played": 200,
-            "international_matches_won": 170,
-            "international_matches_lost": 30,
-            "international_titles_won": 17,
-            "international_title_percentage": 85.0,  # 17/20
-            "olympic_medals": 1,  # 1 Bronze
-            "world_championship_titles": 1,
-            "commonwealth_medals": 0,  # Not applicable
-            "asian_games_medals": 3,
-            "bwf_super_series_titles": 15,
-            "bwf_world_superseries_championships": 1,
-            "bwf_world_cup_titles": 2,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 8000,
-            "total_kills": 4000,
-            "total_deals": 1600,
-            "total_defense_points": 1200,
-            "total_blocks": 250,
-            "total_serves_aces": 600,
-            "total_serves_errors": 120,
-            "serve_accuracy_percent": 74.0,
-            "return_accuracy_percent": 76.0,
-            "smash_success_rate": 80.0,
-            "drop_shot_success_rate": 73.0,
-            "net_play_success_rate": 75.0,
-            "overall_efficiency": 78.0,
-            "attack_efficiency": 80.0,
-            "defense_efficiency": 75.0,
-            "reception_accuracy_percent": 76.0,
-            "serve_receive_efficiency": 76.0,
-            "career_earnings_million_usd": 3.5,
-            "total_trophies_won": 35,
-            "best_player_awards": 6,
-            "mvp_awards": 5,
-            "most_improved_player_awards": 1,
-            "sportsmanship_awards": 2,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 89.0,
-        },
-        # 20) Ratchanok Intanon (Duplicate Removed)
-        # 20) Ganda Wijaya (Duplicate Removed)
-        # 20) Zheng Siwei (China, Male)
-        {
-            "player_name": "Zheng Siwei",
-            "gender": "Male",
-            "country": "China",
-            "handedness": "Right",
-            "event_type": "Doubles",
-            "years_active": 11,  # 2012-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 16,
-            "international_matches_played": 210,
-            "international_matches_won": 180,
-            "international_matches_lost": 30,
-            "international_titles_won": 19,
-            "international_title_percentage": 90.5,  # 19/21
-            "olympic_medals": 1,  # 1 Bronze
-            "world_championship_titles": 2,
-            "commonwealth_medals": 0,  # Not applicable
-            "asian_games_medals": 4,
-            "bwf_super_series_titles": 20,
-            "bwf_world_superseries_championships": 2,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 8500,
-            "total_kills": 4200,
-            "total_deals": 1700,
-            "total_defense_points": 1300,
-            "total_blocks": 300,
-            "total_serves_aces": 700,
-            "total_serves_errors": 150,
-            "serve_accuracy_percent": 75.0,
-            "return_accuracy_percent": 78.0,
-            "smash_success_rate": 82.0,
-            "drop_shot_success_rate": 75.0,
-            "net_play_success_rate": 76.0,
-            "overall_efficiency": 80.0,
-            "attack_efficiency": 82.0,
-            "defense_efficiency": 76.0,
-            "reception_accuracy_percent": 78.0,
-            "serve_receive_efficiency": 78.0,
-            "career_earnings_million_usd": 3.9,
-            "total_trophies_won": 38,
-            "best_player_awards": 7,
-            "mvp_awards": 6,
-            "most_improved_player_awards": 0,
-            "sportsmanship_awards": 3,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 90.0,
-        },
-        # 21) Gao Ling (Duplicate Removed)
-        # 21) Zhang Ning (Duplicate Removed)
-        # 21) Li Xuerui (Duplicate Removed)
-        # 21) Susi Susanti (Duplicate Removed)
-        # 21) Carolina Marin (Duplicate Removed)
-        # 21) Peter Gade (Duplicate Removed)
-        # 21) Saina Nehwal (Duplicate Removed)
-        # 21) Zhang Ning (Duplicate Removed)
-        # 21) Li Xuerui (Duplicate Removed)
-        # 21) Ganda Wijaya (Duplicate Removed)
-        # 21) Zheng Siwei (Duplicate Removed)
-        # 21) Zhang Jun (China, Male) - Simulated Player
-        {
-            "player_name": "Zhang Jun",
-            "gender": "Male",
-            "country": "China",
-            "handedness": "Right",
-            "event_type": "Doubles",
-            "years_active": 13,  # 2010-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 14,
-            "international_matches_played": 230,
-            "international_matches_won": 200,
-            "international_matches_lost": 30,
-            "international_titles_won": 20,
-            "international_title_percentage": 86.9,  # 20/23
-            "olympic_medals": 2,  # 1 Gold, 1 Bronze
-            "world_championship_titles": 3,
-            "commonwealth_medals": 0,  # Not applicable
-            "asian_games_medals": 5,
-            "bwf_super_series_titles": 22,
-            "bwf_world_superseries_championships": 2,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 9500,
-            "total_kills": 4800,
-            "total_deals": 2000,
-            "total_defense_points": 1400,
-            "total_blocks": 320,
-            "total_serves_aces": 750,
-            "total_serves_errors": 160,
-            "serve_accuracy_percent": 76.0,
-            "return_accuracy_percent": 79.0,
-            "smash_success_rate": 83.0,
-            "drop_shot_success_rate": 76.0,
-            "net_play_success_rate": 77.0,
-            "overall_efficiency": 81.0,
-            "attack_efficiency": 83.0,
-            "defense_efficiency": 77.0,
-            "reception_accuracy_percent": 79.0,
-            "serve_receive_efficiency": 79.0,
-            "career_earnings_million_usd": 4.0,
-            "total_trophies_won": 42,
-            "best_player_awards": 8,
-            "mvp_awards": 7,
-            "most_improved_player_awards": 0,
-            "sportsmanship_awards": 3,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 91.0,
-        },
-        # 22) Zhang Jun (Duplicate Removed)
-        # 22) Xie Xingfang (China, Female)
-        {
-            "player_name": "Xie Xingfang",
-            "gender": "Female",
-            "country": "China",
-            "handedness": "Left",
-            "event_type": "Singles",
-            "years_active": 15,  # 2001-2016
-            "highest_world_ranking": 1,
-            "world_ranking_history": 16,
-            "international_matches_played": 350,
-            "international_matches_won": 300,
-            "international_matches_lost": 50,
-            "international_titles_won": 28,
-            "international_title_percentage": 80.0,  # 28/35
-            "olympic_medals": 1,  # 1 Silver
-            "world_championship_titles": 2,
-            "commonwealth_medals": 0,  # Not applicable
-            "asian_games_medals": 6,
-            "bwf_super_series_titles": 30,
-            "bwf_world_superseries_championships": 3,
-            "bwf_world_cup_titles": 4,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 14000,
-            "total_kills": 7500,
-            "total_deals": 3000,
-            "total_defense_points": 2200,
-            "total_blocks": 550,
-            "total_serves_aces": 1100,
-            "total_serves_errors": 270,
-            "serve_accuracy_percent": 80.0,
-            "return_accuracy_percent": 83.0,
-            "smash_success_rate": 88.0,
-            "drop_shot_success_rate": 80.0,
-            "net_play_success_rate": 80.0,
-            "overall_efficiency": 85.0,
-            "attack_efficiency": 88.0,
-            "defense_efficiency": 80.0,
-            "reception_accuracy_percent": 83.0,
-            "serve_receive_efficiency": 83.0,
-            "career_earnings_million_usd": 4.7,
-            "total_trophies_won": 55,
-            "best_player_awards": 10,
-            "mvp_awards": 9,
-            "most_improved_player_awards": 0,
-            "sportsmanship_awards": 4,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 94.0,
-        },
-        # 23) Zhang Jun (Duplicate Removed)
-        # 23) Misaki Matsutomo (Duplicate Removed)
-        # 23) Susi Susanti (Duplicate Removed)
-        # 23) Carolina Marin (Duplicate Removed)
-        # 23) Peter Gade (Duplicate Removed)
-        # 23) Zhang Jun (Duplicate Removed)
-        # 23) Misaki Matsutomo (Duplicate Removed)
-        # 23) Susi Susanti (Duplicate Removed)
-        # 23) Carolina Marin (Duplicate Removed)
-        # 23) Peter Gade (Duplicate Removed)
-        # 23) Zhang Jun (Duplicate Removed)
-        # 23) Li Xuerui (Duplicate Removed)
-        # 23) Zhang Jun (Duplicate Removed)
-        # 23) Saina Nehwal (Duplicate Removed)
-        # 23) Susi Susanti (Duplicate Removed)
-        # 23) Zhang Jun (Duplicate Removed)
-        # 23) Zhang Jun (Duplicate Removed)
-        # 23) Susi Susanti (Duplicate Removed)
-        # 23) Carolina Marin (Duplicate Removed)
-        # 23) Susi Susanti (Duplicate Removed)
-        # 23) Zhang Jun (Duplicate Removed)
-        # 23) Saina Nehwal (Duplicate Removed)
-        # 23) Li Xuerui (Duplicate Removed)
-        # 23) Zhang Jun (Duplicate Removed)
-        # 23) Susi Susanti (Duplicate Removed)
-        # 23) Saina Nehwal (Duplicate Removed)
-        # 23) Zhang Jun (Duplicate Removed)
-        # 23) Susi Susanti (Duplicate Removed)
-        # 23) Li Xuerui (Duplicate Removed)
-        # 23) Saina Nehwal (Duplicate Removed)
-        # 23) Susi Susanti (Duplicate Removed)
-        # 23) Zhang Jun (Duplicate Removed)
-        # To reach 30, add seven more unique players:
-        # 23) Nozomi Okuhara (Japan, Female)
-        {
-            "player_name": "Nozomi Okuhara",
-            "gender": "Female",
-            "country": "Japan",
-            "handedness": "Right",
-            "event_type": "Singles",
-            "years_active": 12,  # 2011-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 13,
-            "international_matches_played": 230,
-            "international_matches_won": 200,
-            "international_matches_lost": 30,
-            "international_titles_won": 19,
-            "international_title_percentage": 82.6,  # 19/23
-            "olympic_medals": 1,  # 1 Bronze
-            "world_championship_titles": 2,
-            "commonwealth_medals": 0,  # Not applicable
-            "asian_games_medals": 4,
-            "bwf_super_series_titles": 20,
-            "bwf_world_superseries_championships": 2,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 11000,
-            "total_kills": 5800,
-            "total_deals": 2300,
-            "total_defense_points": 1600,
-            "total_blocks": 380,
-            "total_serves_aces": 850,
-            "total_serves_errors": 190,
-            "serve_accuracy_percent": 77.0,
-            "return_accuracy_percent": 80.0,
-            "smash_success_rate": 84.0,
-            "drop_shot_success_rate": 78.0,
-            "net_play_success_rate": 76.0,
-            "overall_efficiency": 82.0,
-            "attack_efficiency": 84.0,
-            "defense_efficiency": 78.0,
-            "reception_accuracy_percent": 80.0,
-            "serve_receive_efficiency": 80.0,
-            "career_earnings_million_usd": 4.3,
-            "total_trophies_won": 47,
-            "best_player_awards": 8,
-            "mvp_awards": 7,
-            "most_improved_player_awards": 1,
-            "sportsmanship_awards": 3,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 91.0,
-        },
-        # 24) Nozomi Okuhara (Duplicate Removed)
-        # 24) Xie Xingfang (Duplicate Removed)
-        # 24) Li Xuerui (Duplicate Removed)
-        # 24) Xie Xingfang (Duplicate Removed)
-        # 24) Li Xuerui (Duplicate Removed)
-        # 24) Ganda Wijaya (Duplicate Removed)
-        # 24) Zhang Jun (Duplicate Removed)
-        # 24) Xie Xingfang (Duplicate Removed)
-        # 24) Li Xuerui (Duplicate Removed)
-        # 24) Ganda Wijaya (Duplicate Removed)
-        # 24) Zheng Siwei (Duplicate Removed)
-        # 24) Zhang Jun (Duplicate Removed)
-        # 24) Xie Xingfang (Duplicate Removed)
-        # 24) Li Xuerui (Duplicate Removed)
-        # 24) Ganda Wijaya (Duplicate Removed)
-        # 24) Zheng Siwei (Duplicate Removed)
-        # 24) Zhang Jun (Duplicate Removed)
-        # 24) Xie Xingfang (Duplicate Removed)
-        # 24) Li Xuerui (Duplicate Removed)
-        # 24) Ganda Wijaya (Duplicate Removed)
-        # 24) Zheng Siwei (Duplicate Removed)
-        # To reach 30, add five more unique players:
-        # 24) Xie Xingfang (Duplicate Removed)
-        # 24) Li Xuerui (Duplicate Removed)
-        # 24) Ganda Wijaya (Duplicate Removed)
-        # 24) Zheng Siwei (Duplicate Removed)
-        # 24) Xie Xingfang (Duplicate Removed)
-        # 24) Li Xuerui (Duplicate Removed)
-        # 24) Ganda Wijaya (Duplicate Removed)
-        # 24) Zheng Siwei (Duplicate Removed)
-        # 24) Ruy de Almeida (Brazil, Male) - Simulated Player
-        {
-            "player_name": "Ruy de Almeida",
-            "gender": "Male",
-            "country": "Brazil",
-            "handedness": "Right",
-            "event_type": "Singles",
-            "years_active": 11,  # 2012-2023
-            "highest_world_ranking": 2,
-            "world_ranking_history": 13,
-            "international_matches_played": 240,
-            "international_matches_won": 200,
-            "international_matches_lost": 40,
-            "international_titles_won": 19,
-            "international_title_percentage": 79.2,  # 19/24
-            "olympic_medals": 0,
-            "world_championship_titles": 1,
-            "commonwealth_medals": 0,  # Not applicable
-            "asian_games_medals": 0,  # Not applicable
-            "bwf_super_series_titles": 18,
-            "bwf_world_superseries_championships": 1,
-            "bwf_world_cup_titles": 2,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 10000,
-            "total_kills": 5000,
-            "total_deals": 2000,
-            "total_defense_points": 1500,
-            "total_blocks": 350,
-            "total_serves_aces": 800,
-            "total_serves_errors": 180,
-            "serve_accuracy_percent": 75.0,
-            "return_accuracy_percent": 78.0,
-            "smash_success_rate": 83.0,
-            "drop_shot_success_rate": 77.0,
-            "net_play_success_rate": 75.0,
-            "overall_efficiency": 81.0,
-            "attack_efficiency": 83.0,
-            "defense_efficiency": 77.0,
-            "reception_accuracy_percent": 78.0,
-            "serve_receive_efficiency": 78.0,
-            "career_earnings_million_usd": 3.8,
-            "total_trophies_won": 40,
-            "best_player_awards": 7,
-            "mvp_awards": 6,
-            "most_improved_player_awards": 1,
-            "sportsmanship_awards": 3,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 90.0,
-        },
-        # 25) Zheng Siwei (Duplicate Removed)
-        # 25) Jana Bečvářová (Duplicate Removed)
-        # 25) Monica De Gennaro (Duplicate Removed)
-        # 25) Misaki Matsutomo (Duplicate Removed)
-        # 25) Jana Bečvářová (Duplicate Removed)
-        # 25) Misaki Matsutomo (Duplicate Removed)
-        # 25) Jana Bečvářová (Duplicate Removed)
-        # 25) Misaki Matsutomo (Duplicate Removed)
-        # 25) Jana Bečvářová (Duplicate Removed)
-        # 25) Misaki Matsutomo (Duplicate Removed)
-        # 25) Jana Bečvářová (Duplicate Removed)
-        # To reach 30, add five more unique players:
-        # 25) Ruy de Almeida (Duplicate Removed)
-        # 25) Jana Bečvářová (Duplicate Removed)
-        # 25) Misaki Matsutomo (Duplicate Removed)
-        # 25) Ruy de Almeida (Duplicate Removed)
-        # 25) Jana Bečvářová (Duplicate Removed)
-        # 25) Misaki Matsutomo (Duplicate Removed)
-        # 25) Ruy de Almeida (Duplicate Removed)
-        # 25) Jana Bečvářová (Duplicate Removed)
-        # 25) Misaki Matsutomo (Duplicate Removed)
-        # 25) Janice Lee (USA, Female) - Simulated Player
-        {
-            "player_name": "Janice Lee",
-            "gender": "Female",
-            "country": "USA",
-            "handedness": "Left",
-            "event_type": "Doubles",
-            "years_active": 10,  # 2013-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 10,
-            "international_matches_played": 180,
-            "international_matches_won": 160,
-            "international_matches_lost": 20,
-            "international_titles_won": 16,
-            "international_title_percentage": 88.9,  # 16/18
-            "olympic_medals": 1,  # 1 Bronze
-            "world_championship_titles": 2,
-            "commonwealth_medals": 0,  # Not applicable
-            "asian_games_medals": 0,  # Not applicable
-            "bwf_super_series_titles": 16,
-            "bwf_world_superseries_championships": 1,
-            "bwf_world_cup_titles": 2,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 7000,
-            "total_kills": 3500,
-            "total_deals": 1400,
-            "total_defense_points": 1100,
-            "total_blocks": 250,
-            "total_serves_aces": 600,
-            "total_serves_errors": 120,
-            "serve_accuracy_percent": 74.0,
-            "return_accuracy_percent": 76.0,
-            "smash_success_rate": 81.0,
-            "drop_shot_success_rate": 74.0,
-            "net_play_success_rate": 75.0,
-            "overall_efficiency": 79.0,
-            "attack_efficiency": 81.0,
-            "defense_efficiency": 75.0,
-            "reception_accuracy_percent": 76.0,
-            "serve_receive_efficiency": 76.0,
-            "career_earnings_million_usd": 3.6,
-            "total_trophies_won": 35,
-            "best_player_awards": 6,
-            "mvp_awards": 5,
-            "most_improved_player_awards": 1,
-            "sportsmanship_awards": 2,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 89.0,
-        },
-        # 26) Samuele Papi (Duplicate Removed)
-        # 26) Ruy de Almeida (Duplicate Removed)
-        # 26) Jana Bečvářová (Duplicate Removed)
-        # 26) Misaki Matsutomo (Duplicate Removed)
-        # 26) Ruy de Almeida (Duplicate Removed)
-        # 26) Jana Bečvářová (Duplicate Removed)
-        # 26) Misaki Matsutomo (Duplicate Removed)
-        # 26) Ruy de Almeida (Duplicate Removed)
-        # 26) Jana Bečvářová (Duplicate Removed)
-        # To reach 30, add four more unique players:
-        # 26) Fabiana Claudino (Duplicate Removed)
-        # 26) Jana Bečvářová (Duplicate Removed)
-        # 26) Elena Cosma (Duplicate Removed)
-        # 26) Jana Bečvářová (Duplicate Removed)
-        # 26) Hannah Alker (USA, Female) - Simulated Player
-        {
-            "player_name": "Hannah Alker",
-            "gender": "Female",
-            "country": "USA",
-            "handedness": "Right",
-            "event_type": "Singles",
-            "years_active": 10,  # 2014-2024
-            "highest_world_ranking": 2,
-            "world_ranking_history": 10,
-            "international_matches_played": 150,
-            "international_matches_won": 130,
-            "international_matches_lost": 20,
-            "international_titles_won": 13,
-            "international_title_percentage": 86.7,  # 13/15
-            "olympic_medals": 0,
-            "world_championship_titles": 1,
-            "commonwealth_medals": 0,  # Not applicable
-            "asian_games_medals": 0,  # Not applicable
-            "bwf_super_series_titles": 13,
-            "bwf_world_superseries_championships": 1,
-            "bwf_world_cup_titles": 2,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 6000,
-            "total_kills": 3000,
-            "total_deals": 1200,
-            "total_defense_points": 900,
-            "total_blocks": 180,
-            "total_serves_aces": 400,
-            "total_serves_errors": 90,
-            "serve_accuracy_percent": 73.0,
-            "return_accuracy_percent": 75.0,
-            "smash_success_rate": 79.0,
-            "drop_shot_success_rate": 72.0,
-            "net_play_success_rate": 73.0,
-            "overall_efficiency": 78.0,
-            "attack_efficiency": 79.0,
-            "defense_efficiency": 73.0,
-            "reception_accuracy_percent": 75.0,
-            "serve_receive_efficiency": 75.0,
-            "career_earnings_million_usd": 3.2,
-            "total_trophies_won": 30,
-            "best_player_awards": 5,
-            "mvp_awards": 4,
-            "most_improved_player_awards": 1,
-            "sportsmanship_awards": 2,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 88.0,
-        },
-        # 27) Janice Lee (Duplicate Removed)
-        # 27) Jana Bečvářová (Duplicate Removed)
-        # 27) Misaki Matsutomo (Duplicate Removed)
-        # 27) Janice Lee (Duplicate Removed)
-        # 27) Jana Bečvářová (Duplicate Removed)
-        # 27) Misaki Matsutomo (Duplicate Removed)
-        # 27) Janice Lee (Duplicate Removed)
-        # 27) Jana Bečvářová (Duplicate Removed)
-        # 27) Misaki Matsutomo (Duplicate Removed)
-        # To reach 30, add three more unique players:
-        # 27) Elena Cosma (Duplicate Removed)
-        # 27) Hannah Alker (Duplicate Removed)
-        # 27) Elena Cosma (Duplicate Removed)
-        # 27) Hannah Alker (Duplicate Removed)
-        # 27) Elena Cosma (Duplicate Removed)
-        # 27) Hannah Alker (Duplicate Removed)
-        # 27) Elena Cosma (Duplicate Removed)
-        # 27) Hannah Alker (Duplicate Removed)
-        # 27) Elena Cosma (Duplicate Removed)
-        # 27) Hannah Alker (Duplicate Removed)
-        # To reach 30, add three more unique players:
-        # 27) Jian Fang Lay (Malaysia, Female)
-        {
-            "player_name": "Jian Fang Lay",
-            "gender": "Female",
-            "country": "Malaysia",
-            "handedness": "Right",
-            "event_type": "Doubles",
-            "years_active": 12,  # 2011-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 14,
-            "international_matches_played": 200,
-            "international_matches_won": 170,
-            "international_matches_lost": 30,
-            "international_titles_won": 17,
-            "international_title_percentage": 85.0,  # 17/20
-            "olympic_medals": 1,  # 1 Bronze
-            "world_championship_titles": 2,
-            "commonwealth_medals": 0,  # Not applicable
-            "asian_games_medals": 3,
-            "bwf_super_series_titles": 17,
-            "bwf_world_superseries_championships": 2,
-            "bwf_world_cup_titles": 2,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 7500,
-            "total_kills": 4000,
-            "total_deals": 1600,
-            "total_defense_points": 1200,
-            "total_blocks": 280,
-            "total_serves_aces": 700,
-            "total_serves_errors": 160,
-            "serve_accuracy_percent": 75.0,
-            "return_accuracy_percent": 77.0,
-            "smash_success_rate": 81.0,
-            "drop_shot_success_rate": 74.0,
-            "net_play_success_rate": 75.0,
-            "overall_efficiency": 79.0,
-            "attack_efficiency": 81.0,
-            "defense_efficiency": 75.0,
-            "reception_accuracy_percent": 77.0,
-            "serve_receive_efficiency": 77.0,
-            "career_earnings_million_usd": 3.5,
-            "total_trophies_won": 35,
-            "best_player_awards": 6,
-            "mvp_awards": 5,
-            "most_improved_player_awards": 1,
-            "sportsmanship_awards": 2,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 89.0,
-        },
-        # 28) Janice Lee (Duplicate Removed)
-        # 28) Jian Fang Lay (Duplicate Removed)
-        # 28) Elena Cosma (Duplicate Removed)
-        # 28) Hannah Alker (Duplicate Removed)
-        # 28) Janice Lee (Duplicate Removed)
-        # 28) Jian Fang Lay (Duplicate Removed)
-        # 28) Elena Cosma (Duplicate Removed)
-        # To reach 30, add two more unique players:
-        # 28) Carolina Marin (Duplicate Removed)
-        # 28) Elena Cosma (Duplicate Removed)
-        # 28) Brenden Carlson (USA, Male) - Simulated Player
-        {
-            "player_name": "Brenden Carlson",
-            "gender": "Male",
-            "country": "USA",
-            "handedness": "Right",
-            "event_type": "Singles",
-            "years_active": 10,  # 2014-2024
-            "highest_world_ranking": 2,
-            "world_ranking_history": 12,
-            "international_matches_played": 180,
-            "international_matches_won": 160,
-            "international_matches_lost": 20,
-            "international_titles_won": 16,
-            "international_title_percentage": 88.9,  # 16/18
-            "olympic_medals": 0,
-            "world_championship_titles": 1,
-            "commonwealth_medals": 0,  # Not applicable
-            "asian_games_medals": 0,  # Not applicable
-            "bwf_super_series_titles": 16,
-            "bwf_world_superseries_championships": 1,
-            "bwf_world_cup_titles": 2,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 7000,
-            "total_kills": 3500,
-            "total_deals": 1400,
-            "total_defense_points": 1100,
-            "total_blocks": 220,
-            "total_serves_aces": 600,
-            "total_serves_errors": 120,
-            "serve_accuracy_percent": 73.0,
-            "return_accuracy_percent": 75.0,
-            "smash_success_rate": 79.0,
-            "drop_shot_success_rate": 72.0,
-            "net_play_success_rate": 73.0,
-            "overall_efficiency": 78.0,
-            "attack_efficiency": 79.0,
-            "defense_efficiency": 73.0,
-            "reception_accuracy_percent": 75.0,
-            "serve_receive_efficiency": 75.0,
-            "career_earnings_million_usd": 3.3,
-            "total_trophies_won": 30,
-            "best_player_awards": 6,
-            "mvp_awards": 5,
-            "most_improved_player_awards": 1,
-            "sportsmanship_awards": 2,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 88.0,
-        },
-        # 29) Brenden Carlson (Duplicate Removed)
-        # 29) Samuele Papi (Duplicate Removed)
-        # 29) Janice Lee (Duplicate Removed)
-        # 29) Ganda Wijaya (Duplicate Removed)
-        # To reach 30, add one more unique player:
-        # 29) Elena Cosma (Duplicate Removed)
-        # 29) Hannah Alker (Duplicate Removed)
-        # 29) Jana Bečvářová (Duplicate Removed)
-        # 29) Elena Cosma (Duplicate Removed)
-        # 29) Hannah Alker (Duplicate Removed)
-        # 29) Jana Bečvářová (Duplicate Removed)
-        # 29) Elena Cosma (Duplicate Removed)
-        # 29) Hannah Alker (Duplicate Removed)
-        # 29) Jana Bečvářová (Duplicate Removed)
-        # 29) Elena Cosma (Duplicate Removed)
-        # 29) Hannah Alker (Duplicate Removed)
-        # 29) Jana Bečvářová (Duplicate Removed)
-        # 29) Elena Cosma (Duplicate Removed)
-        # 29) Hannah Alker (Duplicate Removed)
-        # 29) Jana Bečvářová (Duplicate Removed)
-        # 29) Elena Cosma (Duplicate Removed)
-        # 29) Hannah Alker (Duplicate Removed)
-        # To reach 30, add one more unique player:
-        # 29) Li Ling (China, Female) - Simulated Player
-        {
-            "player_name": "Li Ling",
-            "gender": "Female",
-            "country": "China",
-            "handedness": "Right",
-            "event_type": "Singles",
-            "years_active": 10,  # 2014-2024
-            "highest_world_ranking": 2,
-            "world_ranking_history": 11,
-            "international_matches_played": 160,
-            "international_matches_won": 140,
-            "international_matches_lost": 20,
-            "international_titles_won": 14,
-            "international_title_percentage": 87.5,  # 14/16
-            "olympic_medals": 1,  # 1 Silver
-            "world_championship_titles": 1,
-            "commonwealth_medals": 0,  # Not applicable
-            "asian_games_medals": 3,
-            "bwf_super_series_titles": 14,
-            "bwf_world_superseries_championships": 1,
-            "bwf_world_cup_titles": 2,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 6500,
-            "total_kills": 3500,
-            "total_deals": 1400,
-            "total_defense_points": 1100,
-            "total_blocks": 220,
-            "total_serves_aces": 600,
-            "total_serves_errors": 120,
-            "serve_accuracy_percent": 73.0,
-            "return_accuracy_percent": 75.0,
-            "smash_success_rate": 80.0,
-            "drop_shot_success_rate": 73.0,
-            "net_play_success_rate": 73.0,
-            "overall_efficiency": 77.0,
-            "attack_efficiency": 80.0,
-            "defense_efficiency": 73.0,
-            "reception_accuracy_percent": 75.0,
-            "serve_receive_efficiency": 75.0,
-            "career_earnings_million_usd": 3.0,
-            "total_trophies_won": 30,
-            "best_player_awards": 6,
-            "mvp_awards": 5,
-            "most_improved_player_awards": 1,
-            "sportsmanship_awards": 2,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 88.0,
-        },
-        # 30) Li Ling (Duplicate Removed)
-        # To reach 30, add one more unique player:
-        # 30) Elena Cosma (Duplicate Removed)
-        # 30) Samuele Papi (Duplicate Removed)
-        # 30) Hannah Alker (Duplicate Removed)
-        # 30) Jana Bečvářová (Duplicate Removed)
-        # 30) Elena Cosma (Duplicate Removed)
-        # 30) Hannah Alker (Duplicate Removed)
-        # 30) Jana Bečvářová (Duplicate Removed)
-        # 30) Elena Cosma (Duplicate Removed)
-        # 30) Hannah Alker (Duplicate Removed)
-        # To reach 30, add one more unique player:
-        # 30) Elena Cosma (Duplicate Removed)
-        # 30) Li Ling (Duplicate Removed)
-        # 30) Jana Bečvářová (Duplicate Removed)
-        # 30) Elena Cosma (Duplicate Removed)
-        # 30) Samantha Bricio (Duplicate Removed)
-        # 30) Elena Cosma (Duplicate Removed)
-        # 30) Hannah Alker (Duplicate Removed)
-        # 30) Jana Bečvářová (Duplicate Removed)
-        # 30) Samuele Papi (Duplicate Removed)
-        # 30) Elena Cosma (Duplicate Removed)
-        # 30) Hannah Alker (Duplicate Removed)
-        # 30) Jana Bečvářová (Duplicate Removed)
-        # 30) Samuele Papi (Duplicate Removed)
-        # To reach 30, add one more unique player:
-        # 30) Elena Cosma (Duplicate Removed)
-        # 30) Samantha Bricio (Duplicate Removed)
-        # 30) Janice Lee (Duplicate Removed)
-        # 30) Hannah Alker (Duplicate Removed)
-        # 30) Janice Lee (Duplicate Removed)
-        # 30) Hannah Alker (Duplicate Removed)
-        # 30) Elena Cosma (Duplicate Removed)
-        # 30) Hannah Alker (Duplicate Removed)
-        # 30) Janice Lee (Duplicate Removed)
-        # 30) Elena Cosma (Duplicate Removed)
-        # 30) Hannah Alker (Duplicate Removed)
-        # 30) Elena Cosma (Duplicate Removed)
-        # 30) Hannah Alker (Duplicate Removed)
-        # 30) Elena Cosma (Duplicate Removed)
-        # 30) Samantha Bricio (Duplicate Removed)
-        # 30) Janice Lee (Duplicate Removed)
-        # 30) Hannah Alker (Duplicate Removed)
-        # 30) Elena Cosma (Duplicate Removed)
-        # To reach 30, add one more unique player:
-        # 30) Jana Bečvářová (Duplicate Removed)
-        # 30) Elena Cosma (Duplicate Removed)
-        # 30) Samantha Bricio (Duplicate Removed)
-        # 30) Janice Lee (Duplicate Removed)
-        # 30) Elena Cosma (Duplicate Removed)
-        # 30) Jana Bečvářová (Duplicate Removed)
-        # 30) Samantha Bricio (Duplicate Removed)
-        # 30) Janice Lee (Duplicate Removed)
-        # 30) Elena Cosma (Duplicate Removed)
-        # 30) Jana Bečvářová (Duplicate Removed)
-        # 30) Elena Cosma (Duplicate Removed)
-        # 30) Samantha Bricio (Duplicate Removed)
-        # 30) Jana Bečvářová (Duplicate Removed)
-        # 30) Elena Cosma (Duplicate Removed)
-        # 30) Samantha Bricio (Duplicate Removed)
-        # 30) Jana Bečvářová (Duplicate Removed)
-        # 30) Samantha Bricio (Duplicate Removed)
-        # 30) Elena Cosma (Duplicate Removed)
-        # 30) Hannah Alker (Duplicate Removed)
-        # 30) Elena Cosma (Duplicate Removed)
-        # 30) Jana Bečvářová (Duplicate Removed)
-        # 30) Misaki Matsutomo (Duplicate Removed)
-        # 30) Samuele Papi (Duplicate Removed)
-        # 30) Elena Cosma (Duplicate Removed)
-        # 30) Hannah Alker (Duplicate Removed)
-        # 30) Jana Bečvářová (Duplicate Removed)
-        # 30) Samantha Bricio (Duplicate Removed)
-        # 30) Jana Bečvářová (Duplicate Removed)
-        # 30) Jana Bečvářová (Duplicate Removed)
-        # 30) Misaki Matsutomo (Duplicate Removed)
-        # To reach 30, add one more unique player:
-        # 30) Katarina Srebotnik (Slovenia, Female)
-        {
-            "player_name": "Katarina Srebotnik",
-            "gender": "Female",
-            "country": "Slovenia",
-            "handedness": "Right",
-            "event_type": "Doubles",
-            "years_active": 15,  # 2005-2020
-            "highest_world_ranking": 1,
-            "world_ranking_history": 15,
-            "international_matches_played": 220,
-            "international_matches_won": 190,
-            "international_matches_lost": 30,
-            "international_titles_won": 18,
-            "international_title_percentage": 81.8,  # 18/22
-            "olympic_medals": 2,  # 1 Silver, 1 Bronze
-            "world_championship_titles": 2,
-            "commonwealth_medals": 0,  # Not applicable
-            "asian_games_medals": 0,  # Not applicable
-            "bwf_super_series_titles": 18,
-            "bwf_world_superseries_championships": 2,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "bwf_grand_prix_titles": 0,
-            "bwf_grand_prix_gold_titles": 0,
-            "total_points_scored": 8000,
-            "total_kills": 4000,
-            "total_deals": 1600,
-            "total_defense_points": 1200,
-            "total_blocks": 300,
-            "total_serves_aces": 700,
-            "total_serves_errors": 140,
-            "serve_accuracy_percent": 75.0,
-            "return_accuracy_percent": 77.0,
-            "smash_success_rate": 81.0,
-            "drop_shot_success_rate": 74.0,
-            "net_play_success_rate": 75.0,
-            "overall_efficiency": 79.0,
-            "attack_efficiency": 81.0,
-            "defense_efficiency": 75.0,
-            "reception_accuracy_percent": 77.0,
-            "serve_receive_efficiency": 77.0,
-            "career_earnings_million_usd": 3.7,
-            "total_trophies_won": 35,
-            "best_player_awards": 7,
-            "mvp_awards": 6,
-            "most_improved_player_awards": 1,
-            "sportsmanship_awards": 3,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 90.0,
-        },
-    ]
-
-    # Confirm we have exactly 30 players
-    if len(players_data) != 30:
-        raise ValueError(f"Expected 30 badminton players, got {len(players_data)}")
-
-    # ----------------------- WRITE TO CSV -----------------------
-    with open(filename, mode="w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-        for pdata in players_data:
-            # Fill missing fields with 0 if needed
-            for h in headers:
-                if h not in pdata:
-                    pdata[h] = 0
-            writer.writerow(pdata)
 
 if __name__ == "__main__":
     create_badminton_dataset()
@@ -8,6 +8,9 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import normalization helpers
 from sports_index_normalizer import normalize_indexes, plot_top_10_indexes
+from sports_storage import read_table, write_table
+from sports_archetypes import add_archetypes
+from sports_scoring import score_table
 
 def calc_field_hockey_index(row):
     """
@@ -194,79 +197,17 @@ def calc_field_hockey_index(row):
 
 def main():
     # 1) Load the dataset
-    df = pd.read_csv("field_hockey_dataset.csv")
+    df = read_table("field_hockey_dataset.csv")
     
-    # 2) Ensure all necessary columns are present
-    required_columns = [
-        "player_name",
-        "position",
-        "years_active",
-        "teams_played_for",
-        "international_caps",
-        "international_goals",
-        "international_assists",
-        "international_yellow_cards",
-        "international_red_cards",
-        "club_caps",
-        "club_goals",
-        "club_assists",
-        "club_yellow_cards",
-        "club_red_cards",
-        "penalty_corners_taken",
-        "penalty_corners_scored",
-        "penalty_strokes_taken",
-        "penalty_strokes_scored",
-        "goals_from_penalty_corners",
-        "goals_from_penalty_strokes",
-        "assists_from_penalty_corners",
-        "assists_from_penalty_strokes",
-        "goals",
-        "assists",
-        "shots_on_goal",
-        "shots_off_goal",
-        "dribbles_completed",
-        "pass_accuracy_percent",
-        "big_chances_created",
-        "big_chances_converted",
-        "defensive_blocks",
-        "interceptions",
-        "tackles",
-        "tackle_success_rate",
-        "clearances",
-        "blocks",
-        "deflections",
-        "faceoffs_won",
-        "faceoffs_lost",
-        "possession_time_percent",
-        "yellow_cards",
-        "red_cards",
-        "pro_bowls",
-        "all_star_selections",
-        "best_player_awards",
-        "world_cup_titles",
-        "olympic_medals",
-        "hall_of_fame_inducted",
-        "yards_per_attempt",
-        "yards_per_carry",
-        "yards_per_reception",
-        "career_earnings_million_usd",
-        "total_trophies_won"
-    ]
-
-    missing_columns = set(required_columns) - set(df.columns)
-    if missing_columns:
-        print(f"Missing columns in the dataset: {missing_columns}")
-        # Optionally, fill missing columns with 0
-        for col in missing_columns:
-            df[col] = 0
-
-    # 3) Calculate the Field Hockey Index Score for each player
-    df["field_hockey_index"] = df.apply(calc_field_hockey_index, axis=1)
-
-    # 4) Sort players by that score, descending
+    # 2) Calculate the Field Hockey Index Score for each player. Stats added to the
+    # schema after the dataset was written score with their declared defaults,
+    # passed to the vectorized engine as scalars instead of allocated columns
+    df["field_hockey_index"] = score_table("field_hockey_dataset.csv", calc_field_hockey_index, schema="field_hockey")
+
+    # 3) Sort players by that score, descending
     df_sorted = df.sort_values(by="field_hockey_index", ascending=False).reset_index(drop=True)
 
-    # 5) Print the ranking
+    # 4) Print the ranking
     print("\n====== FIELD HOCKEY INDEX RANKING (TOP 30) ======")
     for i, row in df_sorted.iterrows():
         rank = i + 1
@@ -274,13 +215,16 @@ def main():
         index_score = row['field_hockey_index']
         print(f"{rank}. {player_name} - Index: {index_score:.1f}")
 
-    # 6) Normalize the index scores (0–100)
+    # 5) Normalize the index scores (0–100)
     normalized_df = normalize_indexes(df_sorted, name_col='player_name', index_col='field_hockey_index')
 
-    # 7) Save the sorted results with normalized scores to a new CSV
-    normalized_df.to_csv("field_hockey_index_scored.csv", index=False)
+    # Add each athlete's archetype (cluster) and its distance to the centroid
+    normalized_df = add_archetypes(normalized_df, "field_hockey")
+
+    # 6) Save the sorted results with normalized scores to a new CSV
+    write_table(normalized_df, "field_hockey_index_scored.csv")
 
-    # 8) Create a line plot of the top 10
+    # 7) Create a line plot of the top 10
     plot_top_10_indexes(
         normalized_df,
         name_col='player_name',
@@ -1,4 +1,59 @@
-import csv
+import os
+import sys
+
+# Add parent directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sports_player_data import load_players, write_dataset
+
+# One record per player; fields a player does not list are written as 0
+PLAYERS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mens_boxing_players.json")
+
+# Define the header (41 columns total)
+HEADERS = [
+    "player_name",
+    "country",
+    "weight_class",
+    "stance",
+    "years_active",
+    "total_fights",
+    "wins",
+    "losses",
+    "draws",
+    "kos",                  # knockout wins
+    "ko_percentage",
+    "world_titles_held",    # total recognized belts
+    "undisputed_titles",    # # times undisputed champion
+    "lineal_titles",        # # lineal championships
+    "ring_magazine_titles", # # recognized by The Ring
+    "peak_p4p_ranking",     # best pound-for-pound rank (1=best)
+    "signature_win",        # # of widely recognized signature wins
+    "major_upset_wins",     # # fights won as underdog
+    "title_defenses",       
+    "unified_title_defenses",
+    "avg_punches_landed_per_round",
+    "avg_punches_thrown_per_round",
+    "knockdowns_scored",
+    "knockdowns_received",
+    "height_cm",
+    "reach_cm",
+    "age_at_debut",
+    "fights_in_hometown",
+    "doping_tests_passed",
+    "doping_tests_failed",
+    "hall_of_fame_inducted",
+    "major_awards",         # e.g. BWAA fighter of the year
+    "years_as_champion",    # total years holding a recognized belt
+    "notable_rivalries",    # # big rivalry fights
+    "avg_attendance_events",# approximate average attendance
+    "ppv_buys_millions",    # approximate total or top-level PPV buys
+    "longest_win_streak",
+    "earliest_round_ko",
+    "career_earnings_million_usd",
+    "retirement_year",      # 0 if still active
+    "trainer_name"
+]
+
 
 def create_mens_boxing_dataset(filename="mens_boxing_dataset.csv"):
     """
@@ -6,463 +61,9 @@ def create_mens_boxing_dataset(filename="mens_boxing_dataset.csv"):
     Stats are best-effort approximations, intended for demonstration
     and for building a 'Men's Boxing Index Score' in Step 2.
     """
+    players_data = load_players(PLAYERS_FILE)
+    write_dataset(HEADERS, players_data, filename, expected_count=30)
 
-    # Define the header (41 columns total)
-    headers = [
-        "player_name",
-        "country",
-        "weight_class",
-        "stance",
-        "years_active",
-        "total_fights",
-        "wins",
-        "losses",
-        "draws",
-        "kos",                  # knockout wins
-        "ko_percentage",
-        "world_titles_held",    # total recognized belts
-        "undisputed_titles",    # # times undisputed champion
-        "lineal_titles",        # # lineal championships
-        "ring_magazine_titles", # # recognized by The Ring
-        "peak_p4p_ranking",     # best pound-for-pound rank (1=best)
-        "signature_win",        # # of widely recognized signature wins
-        "major_upset_wins",     # # fights won as underdog
-        "title_defenses",       
-        "unified_title_defenses",
-        "avg_punches_landed_per_round",
-        "avg_punches_thrown_per_round",
-        "knockdowns_scored",
-        "knockdowns_received",
-        "height_cm",
-        "reach_cm",
-        "age_at_debut",
-        "fights_in_hometown",
-        "doping_tests_passed",
-        "doping_tests_failed",
-        "hall_of_fame_inducted",
-        "major_awards",         # e.g. BWAA fighter of the year
-        "years_as_champion",    # total years holding a recognized belt
-        "notable_rivalries",    # # big rivalry fights
-        "avg_attendance_events",# approximate average attendance
-        "ppv_buys_millions",    # approximate total or top-level PPV buys
-        "longest_win_streak",
-        "earliest_round_ko",
-        "career_earnings_million_usd",
-        "retirement_year",      # 0 if still active
-        "trainer_name"
-    ]
-
-    # Exactly 30 boxers, each with 41 fields
-    # Data is approximate for demonstration.
-    players_data = [
-        {
-            "player_name": "Floyd Mayweather Jr.",
-            "country": "USA",
-            "weight_class": "Welterweight",
-            "stance": "Orthodox",
-            "years_active": 21,
-            "total_fights": 50,
-            "wins": 50,
-            "losses": 0,
-            "draws": 0,
-            "kos": 27,
-            "ko_percentage": 54.0,
-            "world_titles_held": 15,
-            "undisputed_titles": 0,
-            "lineal_titles": 4,
-            "ring_magazine_titles": 3,
-            "peak_p4p_ranking": 1,
-            "signature_win": 8,
-            "major_upset_wins": 2,
-            "title_defenses": 26,
-            "unified_title_defenses": 10,
-            "avg_punches_landed_per_round": 12.0,
-            "avg_punches_thrown_per_round": 30.0,
-            "knockdowns_scored": 25,
-            "knockdowns_received": 1,
-            "height_cm": 173,
-            "reach_cm": 183,
-            "age_at_debut": 19,
-            "fights_in_hometown": 6,
-            "doping_tests_passed": 200,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 0,  # not yet officially, presumably soon
-            "major_awards": 5,
-            "years_as_champion": 14,
-            "notable_rivalries": 4,
-            "avg_attendance_events": 13000,
-            "ppv_buys_millions": 24.0,   # approximate total across major PPVs
-            "longest_win_streak": 50,
-            "earliest_round_ko": 1,
-            "career_earnings_million_usd": 1000.0, # near a billion total
-            "retirement_year": 2017,
-            "trainer_name": "Floyd Mayweather Sr."
-        },
-        {
-            "player_name": "Manny Pacquiao",
-            "country": "Philippines",
-            "weight_class": "Welterweight",
-            "stance": "Southpaw",
-            "years_active": 26,
-            "total_fights": 72,
-            "wins": 62,
-            "losses": 8,
-            "draws": 2,
-            "kos": 39,
-            "ko_percentage": 54.2,
-            "world_titles_held": 13,
-            "undisputed_titles": 0,
-            "lineal_titles": 5,
-            "ring_magazine_titles": 3,
-            "peak_p4p_ranking": 1,
-            "signature_win": 10,
-            "major_upset_wins": 3,
-            "title_defenses": 25,
-            "unified_title_defenses": 5,
-            "avg_punches_landed_per_round": 14.0,
-            "avg_punches_thrown_per_round": 50.0,
-            "knockdowns_scored": 30,
-            "knockdowns_received": 10,
-            "height_cm": 166,
-            "reach_cm": 170,
-            "age_at_debut": 16,
-            "fights_in_hometown": 10,
-            "doping_tests_passed": 180,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 0,  # not yet officially, presumably soon
-            "major_awards": 6,
-            "years_as_champion": 15,
-            "notable_rivalries": 5,
-            "avg_attendance_events": 14000,
-            "ppv_buys_millions": 20.0,
-            "longest_win_streak": 15,
-            "earliest_round_ko": 1,
-            "career_earnings_million_usd": 500.0,
-            "retirement_year": 2021,
-            "trainer_name": "Freddie Roach"
-        },
-        {
-            "player_name": "Muhammad Ali",
-            "country": "USA",
-            "weight_class": "Heavyweight",
-            "stance": "Orthodox",
-            "years_active": 21,
-            "total_fights": 61,
-            "wins": 56,
-            "losses": 5,
-            "draws": 0,
-            "kos": 37,
-            "ko_percentage": 60.7,
-            "world_titles_held": 3,
-            "undisputed_titles": 1,  
-            "lineal_titles": 3,
-            "ring_magazine_titles": 3,
-            "peak_p4p_ranking": 1,
-            "signature_win": 8,
-            "major_upset_wins": 2,
-            "title_defenses": 19,
-            "unified_title_defenses": 0,
-            "avg_punches_landed_per_round": 15.0,
-            "avg_punches_thrown_per_round": 45.0,
-            "knockdowns_scored": 30,
-            "knockdowns_received": 4,
-            "height_cm": 191,
-            "reach_cm": 198,
-            "age_at_debut": 18,
-            "fights_in_hometown": 2,
-            "doping_tests_passed": 0,   # era
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 1,
-            "major_awards": 5,
-            "years_as_champion": 10,
-            "notable_rivalries": 4,
-            "avg_attendance_events": 20000,
-            "ppv_buys_millions": 0.0,   # big closed-circuit era
-            "longest_win_streak": 31,
-            "earliest_round_ko": 1,
-            "career_earnings_million_usd": 50.0,
-            "retirement_year": 1981,
-            "trainer_name": "Angelo Dundee"
-        },
-        {
-            "player_name": "Mike Tyson",
-            "country": "USA",
-            "weight_class": "Heavyweight",
-            "stance": "Orthodox",
-            "years_active": 20,
-            "total_fights": 58,
-            "wins": 50,
-            "losses": 6,
-            "draws": 2,
-            "kos": 44,
-            "ko_percentage": 75.9,
-            "world_titles_held": 5,
-            "undisputed_titles": 1,
-            "lineal_titles": 1,
-            "ring_magazine_titles": 2,
-            "peak_p4p_ranking": 1,
-            "signature_win": 5,
-            "major_upset_wins": 1,
-            "title_defenses": 9,
-            "unified_title_defenses": 9,
-            "avg_punches_landed_per_round": 18.0,
-            "avg_punches_thrown_per_round": 38.0,
-            "knockdowns_scored": 39,
-            "knockdowns_received": 9,
-            "height_cm": 178,
-            "reach_cm": 180,
-            "age_at_debut": 18,
-            "fights_in_hometown": 3,
-            "doping_tests_passed": 5,  # era 
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 1,
-            "major_awards": 4,
-            "years_as_champion": 4,
-            "notable_rivalries": 4,
-            "avg_attendance_events": 16000,
-            "ppv_buys_millions": 12.0,
-            "longest_win_streak": 37,
-            "earliest_round_ko": 1,
-            "career_earnings_million_usd": 400.0,
-            "retirement_year": 2005,
-            "trainer_name": "Cus D'Amato"
-        },
-        {
-            "player_name": "Joe Louis",
-            "country": "USA",
-            "weight_class": "Heavyweight",
-            "stance": "Orthodox",
-            "years_active": 17,
-            "total_fights": 69,
-            "wins": 66,
-            "losses": 3,
-            "draws": 0,
-            "kos": 52,
-            "ko_percentage": 75.4,
-            "world_titles_held": 1,
-            "undisputed_titles": 1,
-            "lineal_titles": 1,
-            "ring_magazine_titles": 1,
-            "peak_p4p_ranking": 1,
-            "signature_win": 6,
-            "major_upset_wins": 2,
-            "title_defenses": 25,
-            "unified_title_defenses": 0,
-            "avg_punches_landed_per_round": 17.0,
-            "avg_punches_thrown_per_round": 40.0,
-            "knockdowns_scored": 40,
-            "knockdowns_received": 3,
-            "height_cm": 188,
-            "reach_cm": 193,
-            "age_at_debut": 20,
-            "fights_in_hometown": 2,
-            "doping_tests_passed": 0,  # era
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 1,
-            "major_awards": 3,
-            "years_as_champion": 12,
-            "notable_rivalries": 2,
-            "avg_attendance_events": 30000, 
-            "ppv_buys_millions": 0.0,
-            "longest_win_streak": 27,
-            "earliest_round_ko": 1,
-            "career_earnings_million_usd": 4.0,
-            "retirement_year": 1951,
-            "trainer_name": "Jack Blackburn"
-        },
-        {
-            "player_name": "Sugar Ray Robinson",
-            "country": "USA",
-            "weight_class": "Welterweight/Middleweight",
-            "stance": "Orthodox",
-            "years_active": 25,
-            "total_fights": 200,
-            "wins": 174,
-            "losses": 19,
-            "draws": 6,
-            "kos": 109,
-            "ko_percentage": 54.5,
-            "world_titles_held": 6,
-            "undisputed_titles": 1,
-            "lineal_titles": 2,
-            "ring_magazine_titles": 2,
-            "peak_p4p_ranking": 1,
-            "signature_win": 10,
-            "major_upset_wins": 2,
-            "title_defenses": 15,
-            "unified_title_defenses": 0,
-            "avg_punches_landed_per_round": 17.5,
-            "avg_punches_thrown_per_round": 45.0,
-            "knockdowns_scored": 80,
-            "knockdowns_received": 7,
-            "height_cm": 180,
-            "reach_cm": 183,
-            "age_at_debut": 19,
-            "fights_in_hometown": 5,
-            "doping_tests_passed": 0, # era
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 1,
-            "major_awards": 5,
-            "years_as_champion": 10,
-            "notable_rivalries": 3,
-            "avg_attendance_events": 15000,
-            "ppv_buys_millions": 0.0,
-            "longest_win_streak": 91,
-            "earliest_round_ko": 1,
-            "career_earnings_million_usd": 4.5,
-            "retirement_year": 1965,
-            "trainer_name": "George Gainford"
-        },
-        {
-            "player_name": "Rocky Marciano",
-            "country": "USA",
-            "weight_class": "Heavyweight",
-            "stance": "Orthodox",
-            "years_active": 8,
-            "total_fights": 49,
-            "wins": 49,
-            "losses": 0,
-            "draws": 0,
-            "kos": 43,
-            "ko_percentage": 87.8,
-            "world_titles_held": 1,
-            "undisputed_titles": 1,
-            "lineal_titles": 1,
-            "ring_magazine_titles": 1,
-            "peak_p4p_ranking": 1,
-            "signature_win": 4,
-            "major_upset_wins": 1,
-            "title_defenses": 6,
-            "unified_title_defenses": 0,
-            "avg_punches_landed_per_round": 20.0,
-            "avg_punches_thrown_per_round": 40.0,
-            "knockdowns_scored": 30,
-            "knockdowns_received": 2,
-            "height_cm": 179,
-            "reach_cm": 173,
-            "age_at_debut": 23,
-            "fights_in_hometown": 2,
-            "doping_tests_passed": 0, # era
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 1,
-            "major_awards": 2,
-            "years_as_champion": 4,
-            "notable_rivalries": 1,
-            "avg_attendance_events": 20000,
-            "ppv_buys_millions": 0.0,
-            "longest_win_streak": 49,
-            "earliest_round_ko": 1,
-            "career_earnings_million_usd": 1.0,
-            "retirement_year": 1955,
-            "trainer_name": "Charlie Goldman"
-        },
-        {
-            "player_name": "Evander Holyfield",
-            "country": "USA",
-            "weight_class": "Cruiserweight/Heavyweight",
-            "stance": "Orthodox",
-            "years_active": 27,
-            "total_fights": 57,
-            "wins": 44,
-            "losses": 10,
-            "draws": 2,
-            "kos": 29,
-            "ko_percentage": 50.9,
-            "world_titles_held": 6,
-            "undisputed_titles": 2, 
-            "lineal_titles": 2,
-            "ring_magazine_titles": 2,
-            "peak_p4p_ranking": 2,
-            "signature_win": 6,
-            "major_upset_wins": 2,
-            "title_defenses": 12,
-            "unified_title_defenses": 3,
-            "avg_punches_landed_per_round": 16.0,
-            "avg_punches_thrown_per_round": 42.0,
-            "knockdowns_scored": 25,
-            "knockdowns_received": 8,
-            "height_cm": 189,
-            "reach_cm": 197,
-            "age_at_debut": 22,
-            "fights_in_hometown": 3,
-            "doping_tests_passed": 10,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 1,
-            "major_awards": 3,
-            "years_as_champion": 10,
-            "notable_rivalries": 3,
-            "avg_attendance_events": 15000,
-            "ppv_buys_millions": 7.0,
-            "longest_win_streak": 28,
-            "earliest_round_ko": 1,
-            "career_earnings_million_usd": 250.0,
-            "retirement_year": 2011,
-            "trainer_name": "Lou Duva"
-        },
-        # ... (Continue adding more real fighters to reach exactly 30) ...
-    ]
-
-    # We'll add placeholders for the remaining to ensure exactly 30
-    while len(players_data) < 30:
-        idx = len(players_data) + 1
-        players_data.append({
-            "player_name": f"Placeholder Fighter {idx}",
-            "country": "CountryX",
-            "weight_class": "Middleweight",
-            "stance": "Orthodox",
-            "years_active": 5,
-            "total_fights": 25,
-            "wins": 23,
-            "losses": 2,
-            "draws": 0,
-            "kos": 14,
-            "ko_percentage": 56.0,
-            "world_titles_held": 1,
-            "undisputed_titles": 0,
-            "lineal_titles": 0,
-            "ring_magazine_titles": 0,
-            "peak_p4p_ranking": 5,
-            "signature_win": 2,
-            "major_upset_wins": 1,
-            "title_defenses": 3,
-            "unified_title_defenses": 0,
-            "avg_punches_landed_per_round": 15.0,
-            "avg_punches_thrown_per_round": 40.0,
-            "knockdowns_scored": 10,
-            "knockdowns_received": 3,
-            "height_cm": 175,
-            "reach_cm": 175,
-            "age_at_debut": 20,
-            "fights_in_hometown": 2,
-            "doping_tests_passed": 20,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 0,
-            "major_awards": 0,
-            "years_as_champion": 2,
-            "notable_rivalries": 1,
-            "avg_attendance_events": 3000,
-            "ppv_buys_millions": 0.1,
-            "longest_win_streak": 12,
-            "earliest_round_ko": 1,
-            "career_earnings_million_usd": 2.5,
-            "retirement_year": 0,
-            "trainer_name": "Trainer Placeholder"
-        })
-
-    # Confirm we have exactly 30
-    if len(players_data) != 30:
-        raise ValueError(f"Expected 30 boxers, got {len(players_data)}")
-
-    # Write out to CSV
-    with open(filename, mode="w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-        for pdata in players_data:
-            # Ensure every field is present
-            for h in headers:
-                if h not in pdata:
-                    pdata[h] = 0
-            writer.writerow(pdata)
 
 if __name__ == "__main__":
     create_mens_boxing_dataset()
@@ -8,6 +8,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import the normalization and plotting helpers
 from sports_index_normalizer import normalize_indexes, plot_top_10_indexes
+from sports_storage import read_table, write_table
+from sports_archetypes import add_archetypes
 
 def calc_mens_boxing_index(row):
     """
@@ -185,7 +187,7 @@ def calc_mens_boxing_index(row):
 
 def main():
     # 1) Load the dataset
-    df = pd.read_csv("mens_boxing_dataset.csv")
+    df = read_table("mens_boxing_dataset.csv")
     
     # 2) Calculate the Men’s Boxing Index Score for each boxer
     df["mens_boxing_index"] = df.apply(calc_mens_boxing_index, axis=1)
@@ -204,8 +206,11 @@ def main():
     # 5) Normalize the index to 0–100
     normalized_df = normalize_indexes(df, name_col='player_name', index_col='mens_boxing_index')
     
+    # Add each athlete's archetype (cluster) and its distance to the centroid
+    normalized_df = add_archetypes(normalized_df, "mens_boxing")
+
     # 6) Save sorted results with normalized scores to CSV
-    normalized_df.to_csv("mens_boxing_index_scored.csv", index=False)
+    write_table(normalized_df, "mens_boxing_index_scored.csv")
     
     # 7) Create the line plot for top 10
     plot_top_10_indexes(
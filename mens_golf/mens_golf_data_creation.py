@@ -1,4 +1,59 @@
-import csv
+import os
+import sys
+
+# Add parent directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sports_player_data import load_players, write_dataset
+
+# One record per player; fields a player does not list are written as 0
+PLAYERS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mens_golf_players.json")
+
+# Define the header (1 player_name + 40 stats = 41 columns)
+HEADERS = [
+    "player_name",
+    "country",
+    "years_active",
+    "total_pga_tour_wins",
+    "total_euro_tour_wins",
+    "total_major_wins",
+    "times_world_no1",
+    "total_weeks_at_no1",
+    "fedex_cup_championships",
+    "runner_ups_in_majors",
+    "top_10_in_majors",
+    "ryder_cups_played",
+    "scoring_average",
+    "average_driving_distance_yards",
+    "leading_money_list_times",
+    "pga_player_of_year_times",
+    "pga_tour_player_of_year_times",
+    "vardon_trophy_times",
+    "byron_nelson_award_times",
+    "career_earnings_million_usd",
+    "doping_tests_passed",
+    "doping_tests_failed",
+    "hall_of_fame_inducted",
+    "signature_tournaments_won",   # e.g., THE PLAYERS, WGC events
+    "seasons_in_top50_world_ranking",
+    "wins_across_all_tours",
+    "runner_ups_total",
+    "avg_putting_strokes_per_round",
+    "hole_in_ones",
+    "top_5_in_majors",
+    "top_3_in_majors",
+    "wins_outside_pga_euro",
+    "wedge_distance_proximity_feet",
+    "strokes_gained_off_tee",
+    "strokes_gained_approach",
+    "strokes_gained_putting",
+    "strokes_gained_tee_to_green",
+    "comebacks_from_54_hole_deficit",
+    "comebacks_final_round_deficit",
+    "retirement_year",      # 0 if still active
+    "coach_name"
+]
+
 
 def create_mens_golf_dataset(filename="mens_golf_dataset.csv"):
     """
@@ -7,334 +62,9 @@ def create_mens_golf_dataset(filename="mens_golf_dataset.csv"):
 
     All data here is approximate or placeholder. 
     """
+    players_data = load_players(PLAYERS_FILE)
+    write_dataset(HEADERS, players_data, filename)
 
-    # Define the header (1 player_name + 40 stats = 41 columns)
-    headers = [
-        "player_name",
-        "country",
-        "years_active",
-        "total_pga_tour_wins",
-        "total_euro_tour_wins",
-        "total_major_wins",
-        "times_world_no1",
-        "total_weeks_at_no1",
-        "fedex_cup_championships",
-        "runner_ups_in_majors",
-        "top_10_in_majors",
-        "ryder_cups_played",
-        "scoring_average",
-        "average_driving_distance_yards",
-        "leading_money_list_times",
-        "pga_player_of_year_times",
-        "pga_tour_player_of_year_times",
-        "vardon_trophy_times",
-        "byron_nelson_award_times",
-        "career_earnings_million_usd",
-        "doping_tests_passed",
-        "doping_tests_failed",
-        "hall_of_fame_inducted",
-        "signature_tournaments_won",   # e.g., THE PLAYERS, WGC events
-        "seasons_in_top50_world_ranking",
-        "wins_across_all_tours",
-        "runner_ups_total",
-        "avg_putting_strokes_per_round",
-        "hole_in_ones",
-        "top_5_in_majors",
-        "top_3_in_majors",
-        "wins_outside_pga_euro",
-        "wedge_distance_proximity_feet",
-        "strokes_gained_off_tee",
-        "strokes_gained_approach",
-        "strokes_gained_putting",
-        "strokes_gained_tee_to_green",
-        "comebacks_from_54_hole_deficit",
-        "comebacks_final_round_deficit",
-        "retirement_year",      # 0 if still active
-        "coach_name"
-    ]
-
-    # List of 30 players, each with 41 fields (player_name + 40 stats).
-    # The stats below are rough approximations or placeholders for demonstration.
-    players_data = [
-        {
-            "player_name": "Tiger Woods",
-            "country": "USA",
-            "years_active": 27,
-            "total_pga_tour_wins": 82,
-            "total_euro_tour_wins": 41,
-            "total_major_wins": 15,
-            "times_world_no1": 11,    # # times reached #1 (some count official vs. in total stints)
-            "total_weeks_at_no1": 683,
-            "fedex_cup_championships": 2,
-            "runner_ups_in_majors": 7,
-            "top_10_in_majors": 41,
-            "ryder_cups_played": 8,
-            "scoring_average": 68.9,
-            "average_driving_distance_yards": 298.0,
-            "leading_money_list_times": 10,
-            "pga_player_of_year_times": 11,
-            "pga_tour_player_of_year_times": 11,
-            "vardon_trophy_times": 9,
-            "byron_nelson_award_times": 9,
-            "career_earnings_million_usd": 120.5,
-            "doping_tests_passed": 40,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 1,
-            "signature_tournaments_won": 18,  # e.g. WGCs, The PLAYERS, etc.
-            "seasons_in_top50_world_ranking": 22,
-            "wins_across_all_tours": 110,
-            "runner_ups_total": 31,
-            "avg_putting_strokes_per_round": 29.1,
-            "hole_in_ones": 20,
-            "top_5_in_majors": 33,
-            "top_3_in_majors": 26,
-            "wins_outside_pga_euro": 10,
-            "wedge_distance_proximity_feet": 17.5,
-            "strokes_gained_off_tee": 1.2,
-            "strokes_gained_approach": 1.9,
-            "strokes_gained_putting": 0.8,
-            "strokes_gained_tee_to_green": 3.1,
-            "comebacks_from_54_hole_deficit": 8,
-            "comebacks_final_round_deficit": 6,
-            "retirement_year": 0,  # still active
-            "coach_name": "Butch Harmon"
-        },
-        {
-            "player_name": "Jack Nicklaus",
-            "country": "USA",
-            "years_active": 44,
-            "total_pga_tour_wins": 73,
-            "total_euro_tour_wins": 9,
-            "total_major_wins": 18,
-            "times_world_no1": 11,   # pre-official ranking era, so 0 or placeholder
-            "total_weeks_at_no1": 468, # pre-OWGR
-            "fedex_cup_championships": 0,
-            "runner_ups_in_majors": 19,
-            "top_10_in_majors": 73,
-            "ryder_cups_played": 6,
-            "scoring_average": 70.8,
-            "average_driving_distance_yards": 275.0,  # era-limited
-            "leading_money_list_times": 8,
-            "pga_player_of_year_times": 5,
-            "pga_tour_player_of_year_times": 5,
-            "vardon_trophy_times": 0,  # introduced in 1937 but let's approximate
-            "byron_nelson_award_times": 0,
-            "career_earnings_million_usd": 9.2,
-            "doping_tests_passed": 0,  # era
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 1,
-            "signature_tournaments_won": 12,
-            "seasons_in_top50_world_ranking": 0,  # pre-OWGR era
-            "wins_across_all_tours": 117, # approximate
-            "runner_ups_total": 58,
-            "avg_putting_strokes_per_round": 29.5,
-            "hole_in_ones": 20,
-            "top_5_in_majors": 56,
-            "top_3_in_majors": 46,
-            "wins_outside_pga_euro": 35,
-            "wedge_distance_proximity_feet": 20.0,
-            "strokes_gained_off_tee": 0.0,
-            "strokes_gained_approach": 0.0,
-            "strokes_gained_putting": 0.0,
-            "strokes_gained_tee_to_green": 0.0,
-            "comebacks_from_54_hole_deficit": 7,
-            "comebacks_final_round_deficit": 10,
-            "retirement_year": 2005,
-            "coach_name": "Jack Grout"
-        },
-        {
-            "player_name": "Arnold Palmer",
-            "country": "USA",
-            "years_active": 51,
-            "total_pga_tour_wins": 62,
-            "total_euro_tour_wins": 2,
-            "total_major_wins": 7,
-            "times_world_no1": 0,
-            "total_weeks_at_no1": 0,
-            "fedex_cup_championships": 0,
-            "runner_ups_in_majors": 10,
-            "top_10_in_majors": 38,
-            "ryder_cups_played": 6,
-            "scoring_average": 71.1,
-            "average_driving_distance_yards": 275.0,
-            "leading_money_list_times": 4,
-            "pga_player_of_year_times": 2,
-            "pga_tour_player_of_year_times": 0,
-            "vardon_trophy_times": 1,
-            "byron_nelson_award_times": 0,
-            "career_earnings_million_usd": 3.6,
-            "doping_tests_passed": 0,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 1,
-            "signature_tournaments_won": 8,
-            "seasons_in_top50_world_ranking": 0,
-            "wins_across_all_tours": 95,  # total across tours
-            "runner_ups_total": 50,
-            "avg_putting_strokes_per_round": 29.8,
-            "hole_in_ones": 20,
-            "top_5_in_majors": 26,
-            "top_3_in_majors": 23,
-            "wins_outside_pga_euro": 20,
-            "wedge_distance_proximity_feet": 25.0,
-            "strokes_gained_off_tee": 0.0,
-            "strokes_gained_approach": 0.0,
-            "strokes_gained_putting": 0.0,
-            "strokes_gained_tee_to_green": 0.0,
-            "comebacks_from_54_hole_deficit": 6,
-            "comebacks_final_round_deficit": 5,
-            "retirement_year": 2006,
-            "coach_name": "Self-taught"
-        },
-        {
-            "player_name": "Gary Player",
-            "country": "South Africa",
-            "years_active": 52,
-            "total_pga_tour_wins": 24,
-            "total_euro_tour_wins": 27,
-            "total_major_wins": 9,
-            "times_world_no1": 0,
-            "total_weeks_at_no1": 0,
-            "fedex_cup_championships": 0,
-            "runner_ups_in_majors": 6,
-            "top_10_in_majors": 44,
-            "ryder_cups_played": 0,  # not from Europe/USA
-            "scoring_average": 71.2,
-            "average_driving_distance_yards": 265.0,
-            "leading_money_list_times": 1,
-            "pga_player_of_year_times": 0,
-            "pga_tour_player_of_year_times": 0,
-            "vardon_trophy_times": 0,
-            "byron_nelson_award_times": 0,
-            "career_earnings_million_usd": 2.0,
-            "doping_tests_passed": 0,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 1,
-            "signature_tournaments_won": 6,
-            "seasons_in_top50_world_ranking": 0,
-            "wins_across_all_tours": 160, # widely reported
-            "runner_ups_total": 44,
-            "avg_putting_strokes_per_round": 29.6,
-            "hole_in_ones": 19,
-            "top_5_in_majors": 33,
-            "top_3_in_majors": 22,
-            "wins_outside_pga_euro": 100,
-            "wedge_distance_proximity_feet": 28.0,
-            "strokes_gained_off_tee": 0.0,
-            "strokes_gained_approach": 0.0,
-            "strokes_gained_putting": 0.0,
-            "strokes_gained_tee_to_green": 0.0,
-            "comebacks_from_54_hole_deficit": 5,
-            "comebacks_final_round_deficit": 6,
-            "retirement_year": 2009,
-            "coach_name": "Self-taught"
-        },
-        {
-            "player_name": "Ben Hogan",
-            "country": "USA",
-            "years_active": 25,
-            "total_pga_tour_wins": 64,
-            "total_euro_tour_wins": 0,
-            "total_major_wins": 9,
-            "times_world_no1": 0,
-            "total_weeks_at_no1": 0,
-            "fedex_cup_championships": 0,
-            "runner_ups_in_majors": 10,
-            "top_10_in_majors": 39,
-            "ryder_cups_played": 3,
-            "scoring_average": 70.4,
-            "average_driving_distance_yards": 265.0,
-            "leading_money_list_times": 5,
-            "pga_player_of_year_times": 0,
-            "pga_tour_player_of_year_times": 0,
-            "vardon_trophy_times": 0,
-            "byron_nelson_award_times": 0,
-            "career_earnings_million_usd": 1.7,
-            "doping_tests_passed": 0,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 1,
-            "signature_tournaments_won": 8,
-            "seasons_in_top50_world_ranking": 0,
-            "wins_across_all_tours": 71,
-            "runner_ups_total": 35,
-            "avg_putting_strokes_per_round": 29.4,
-            "hole_in_ones": 20,
-            "top_5_in_majors": 23,
-            "top_3_in_majors": 18,
-            "wins_outside_pga_euro": 7,
-            "wedge_distance_proximity_feet": 22.0,
-            "strokes_gained_off_tee": 0.0,
-            "strokes_gained_approach": 0.0,
-            "strokes_gained_putting": 0.0,
-            "strokes_gained_tee_to_green": 0.0,
-            "comebacks_from_54_hole_deficit": 4,
-            "comebacks_final_round_deficit": 4,
-            "retirement_year": 1971,
-            "coach_name": "Self-taught"
-        },
-        # ------- Add more real or approximate top golfers until we reach 30 total. -------
-    ]
-
-    # Add placeholders to ensure we have exactly 30
-    # while len(players_data) < 30:
-    #     idx = len(players_data) + 1
-    #     players_data.append({
-    #         "player_name": f"Placeholder Golfer {idx}",
-    #         "country": "CountryY",
-    #         "years_active": 10,
-    #         "total_pga_tour_wins": 2,
-    #         "total_euro_tour_wins": 3,
-    #         "total_major_wins": 0,
-    #         "times_world_no1": 0,
-    #         "total_weeks_at_no1": 0,
-    #         "fedex_cup_championships": 0,
-    #         "runner_ups_in_majors": 1,
-    #         "top_10_in_majors": 4,
-    #         "ryder_cups_played": 0,
-    #         "scoring_average": 71.5,
-    #         "average_driving_distance_yards": 290.0,
-    #         "leading_money_list_times": 0,
-    #         "pga_player_of_year_times": 0,
-    #         "pga_tour_player_of_year_times": 0,
-    #         "vardon_trophy_times": 0,
-    #         "byron_nelson_award_times": 0,
-    #         "career_earnings_million_usd": 1.5,
-    #         "doping_tests_passed": 10,
-    #         "doping_tests_failed": 0,
-    #         "hall_of_fame_inducted": 0,
-    #         "signature_tournaments_won": 1,
-    #         "seasons_in_top50_world_ranking": 2,
-    #         "wins_across_all_tours": 5,
-    #         "runner_ups_total": 3,
-    #         "avg_putting_strokes_per_round": 29.7,
-    #         "hole_in_ones": 5,
-    #         "top_5_in_majors": 0,
-    #         "top_3_in_majors": 0,
-    #         "wins_outside_pga_euro": 2,
-    #         "wedge_distance_proximity_feet": 25.0,
-    #         "strokes_gained_off_tee": 0.4,
-    #         "strokes_gained_approach": 0.2,
-    #         "strokes_gained_putting": 0.1,
-    #         "strokes_gained_tee_to_green": 0.5,
-    #         "comebacks_from_54_hole_deficit": 1,
-    #         "comebacks_final_round_deficit": 1,
-    #         "retirement_year": 0,
-    #         "coach_name": "Placeholder Coach"
-    #     })
-
-    # # Confirm we have exactly 30
-    # if len(players_data) != 30:
-    #     raise ValueError(f"Expected 30 golfers, got {len(players_data)}")
-
-    # Write out to CSV
-    with open(filename, mode="w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-        for pdata in players_data:
-            # Ensure each field is present
-            for h in headers:
-                if h not in pdata:
-                    pdata[h] = 0
-            writer.writerow(pdata)
 
 if __name__ == "__main__":
     create_mens_golf_dataset()
@@ -8,6 +8,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import normalization helpers
 from sports_index_normalizer import normalize_indexes, plot_top_10_indexes
+from sports_storage import read_table, write_table
+from sports_archetypes import add_archetypes
 
 def calc_mens_golf_index(row):
     """
@@ -192,7 +194,7 @@ def calc_mens_golf_index(row):
 
 def main():
     # 1) Load the dataset
-    df = pd.read_csv("mens_golf_dataset.csv")
+    df = read_table("mens_golf_dataset.csv")
     
     # 2) Calculate the Men’s Golf Index Score for each player
     df["mens_golf_index"] = df.apply(calc_mens_golf_index, axis=1)
@@ -211,8 +213,11 @@ def main():
     # 5) Normalize the index scores to 0–100
     normalized_df = normalize_indexes(df, name_col='player_name', index_col='mens_golf_index')
     
+    # Add each athlete's archetype (cluster) and its distance to the centroid
+    normalized_df = add_archetypes(normalized_df, "mens_golf")
+
     # 6) Save the sorted results with normalized scores to a new CSV
-    normalized_df.to_csv("mens_golf_index_scored.csv", index=False)
+    write_table(normalized_df, "mens_golf_index_scored.csv")
     
     # 7) Create a line plot of the top 10
     plot_top_10_indexes(
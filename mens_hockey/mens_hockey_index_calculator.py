@@ -8,6 +8,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import normalization helpers
 from sports_index_normalizer import normalize_indexes, plot_top_10_indexes
+from sports_storage import read_table, write_table
+from sports_archetypes import add_archetypes
 
 def calc_mens_hockey_index(row):
     """
@@ -206,7 +208,7 @@ def calc_mens_hockey_index(row):
 
 def main():
     # 1) Load the dataset
-    df = pd.read_csv("mens_hockey_dataset.csv")
+    df = read_table("mens_hockey_dataset.csv")
     
     # 2) Calculate the Men’s Hockey Index Score for each player
     df["mens_hockey_index"] = df.apply(calc_mens_hockey_index, axis=1)
@@ -225,8 +227,11 @@ def main():
     # 5) Normalize scores (0–100)
     normalized_df = normalize_indexes(df, name_col='player_name', index_col='mens_hockey_index')
     
+    # Add each athlete's archetype (cluster) and its distance to the centroid
+    normalized_df = add_archetypes(normalized_df, "mens_hockey")
+
     # 6) Save to CSV
-    normalized_df.to_csv("mens_hockey_index_scored.csv", index=False)
+    write_table(normalized_df, "mens_hockey_index_scored.csv")
     
     # 7) Plot top 10
     plot_top_10_indexes(
@@ -1,4 +1,70 @@
-import csv
+import os
+import sys
+
+# Add parent directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sports_player_data import load_players, write_dataset
+
+# One record per player; fields a player does not list are written as 0
+PLAYERS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mens_soccer_players.json")
+
+# ------------------------- COLUMN HEADERS (41) -------------------------
+HEADERS = [
+    "player_name",
+    "country",
+    "years_active",
+    # Basic club stats
+    "club_appearances",
+    "club_goals",
+    "club_assists",
+    "club_minutes_played",
+    # Basic international stats
+    "international_caps",
+    "international_goals",
+    "international_assists",
+    "international_minutes_played",
+    # Ratios / per-game metrics
+    "club_goal_ratio",            # goals/club appearances
+    "international_goal_ratio",   # goals/caps
+    # Trophies & accolades
+    "fifa_world_cup_titles",
+    "continental_titles",         # e.g. Euros, Copa América
+    "league_titles",              # e.g. domestic leagues
+    "champions_league_titles",
+    "domestic_cup_titles",        # e.g. FA Cup, Copa del Rey, etc.
+    "major_individual_awards",    # e.g. Ballon d'Or, The Best, etc.
+    "ballon_dor_wins",
+    # Additional performance
+    "hat_tricks",
+    "penalty_goals",
+    "free_kick_goals",
+    "red_cards",
+    "yellow_cards",
+    "man_of_the_match_awards",
+    "captaincy_appearances",
+    # Creative / advanced
+    "key_passes_per_game",
+    "dribbles_completed_per_game",
+    "big_chances_created",
+    "pass_accuracy_percent",
+    # Defensive / GK stats (some legends are defenders/keepers)
+    "clean_sheets",
+    "tackles_won_per_game",
+    "interceptions_per_game",
+    "saves_per_game",            # relevant for keepers, else ~0
+    # Doping & injuries
+    "doping_tests_passed",
+    "doping_tests_failed",
+    "major_injuries_count",
+    # Hall of Fame (some countries / clubs have them)
+    "hall_of_fame_inducted",
+    # Earnings
+    "career_earnings_million_usd",
+    # Additional note: total_trophies might be separate from big ones
+    "total_trophies_won"         # all combined
+]
+
 
 def create_mens_soccer_dataset(filename="mens_soccer_dataset.csv"):
     """
@@ -11,1419 +77,9 @@ def create_mens_soccer_dataset(filename="mens_soccer_dataset.csv"):
     After creation, you'll have a 'mens_soccer_dataset.csv' file with 30 rows,
     each containing 41 columns of data.
     """
+    players_data = load_players(PLAYERS_FILE)
+    write_dataset(HEADERS, players_data, filename, expected_count=30)
 
-    # ------------------------- COLUMN HEADERS (41) -------------------------
-    headers = [
-        "player_name",
-        "country",
-        "years_active",
-        # Basic club stats
-        "club_appearances",
-        "club_goals",
-        "club_assists",
-        "club_minutes_played",
-        # Basic international stats
-        "international_caps",
-        "international_goals",
-        "international_assists",
-        "international_minutes_played",
-        # Ratios / per-game metrics
-        "club_goal_ratio",            # goals/club appearances
-        "international_goal_ratio",   # goals/caps
-        # Trophies & accolades
-        "fifa_world_cup_titles",
-        "continental_titles",         # e.g. Euros, Copa América
-        "league_titles",              # e.g. domestic leagues
-        "champions_league_titles",
-        "domestic_cup_titles",        # e.g. FA Cup, Copa del Rey, etc.
-        "major_individual_awards",    # e.g. Ballon d'Or, The Best, etc.
-        "ballon_dor_wins",
-        # Additional performance
-        "hat_tricks",
-        "penalty_goals",
-        "free_kick_goals",
-        "red_cards",
-        "yellow_cards",
-        "man_of_the_match_awards",
-        "captaincy_appearances",
-        # Creative / advanced
-        "key_passes_per_game",
-        "dribbles_completed_per_game",
-        "big_chances_created",
-        "pass_accuracy_percent",
-        # Defensive / GK stats (some legends are defenders/keepers)
-        "clean_sheets",
-        "tackles_won_per_game",
-        "interceptions_per_game",
-        "saves_per_game",            # relevant for keepers, else ~0
-        # Doping & injuries
-        "doping_tests_passed",
-        "doping_tests_failed",
-        "major_injuries_count",
-        # Hall of Fame (some countries / clubs have them)
-        "hall_of_fame_inducted",
-        # Earnings
-        "career_earnings_million_usd",
-        # Additional note: total_trophies might be separate from big ones
-        "total_trophies_won"         # all combined
-    ]
-
-    # We define exactly 30 players, each with 41 fields.
-    # Stats below are approximate or best-known from public data.
-    # Some older players have incomplete data for advanced metrics => we set them to 0 or minimal.
-
-    players_data = [
-        # 1) Pelé
-        {
-            "player_name": "Pelé",
-            "country": "Brazil",
-            "years_active": 21,  # approx 1956-1977
-            "club_appearances": 694,  # Santos + Cosmos
-            "club_goals": 650,
-            "club_assists": 200,  # approximate
-            "club_minutes_played": 60000, # approx
-            "international_caps": 92,
-            "international_goals": 77,
-            "international_assists": 32,
-            "international_minutes_played": 7000,
-            "club_goal_ratio": 650 / 694,
-            "international_goal_ratio": 77 / 92,
-            "fifa_world_cup_titles": 3,   # 1958, 1962, 1970
-            "continental_titles": 0,      # He never won Copa America
-            "league_titles": 6,           # approx. in Brazilian league
-            "champions_league_titles": 0, # not applicable in that era
-            "domestic_cup_titles": 10,    # e.g. State Championships
-            "major_individual_awards": 5, # e.g. Ballon d'Or honoraries, etc.
-            "ballon_dor_wins": 0,         # not eligible in his era
-            "hat_tricks": 92,            # approx record
-            "penalty_goals": 70,
-            "free_kick_goals": 70,
-            "red_cards": 1,              # contested stat, some say 0
-            "yellow_cards": 5,           # approximate
-            "man_of_the_match_awards": 80, # approximate
-            "captaincy_appearances": 30, 
-            "key_passes_per_game": 1.5, 
-            "dribbles_completed_per_game": 3.0,
-            "big_chances_created": 100, 
-            "pass_accuracy_percent": 82.0, 
-            "clean_sheets": 0, 
-            "tackles_won_per_game": 0.5,
-            "interceptions_per_game": 0.2,
-            "saves_per_game": 0.0, 
-            "doping_tests_passed": 0,  # not standard in his era
-            "doping_tests_failed": 0,
-            "major_injuries_count": 3,
-            "hall_of_fame_inducted": 1, # Brazilian Football Museum, etc.
-            "career_earnings_million_usd": 15.0,
-            "total_trophies_won": 25
-        },
-        # 2) Diego Maradona
-        {
-            "player_name": "Diego Maradona",
-            "country": "Argentina",
-            "years_active": 21, # 1976-1997
-            "club_appearances": 491,
-            "club_goals": 259,
-            "club_assists": 150, # approx
-            "club_minutes_played": 42000,
-            "international_caps": 91,
-            "international_goals": 34,
-            "international_assists": 29,
-            "international_minutes_played": 7000,
-            "club_goal_ratio": 259 / 491,
-            "international_goal_ratio": 34 / 91,
-            "fifa_world_cup_titles": 1,  # 1986
-            "continental_titles": 0,     # No Copa America
-            "league_titles": 3,          # e.g. Napoli 2, Boca 1
-            "champions_league_titles": 0,
-            "domestic_cup_titles": 3,    # e.g. Coppa Italia, others
-            "major_individual_awards": 4, # Golden Ball 1986, etc.
-            "ballon_dor_wins": 0,        # not eligible as non-European
-            "hat_tricks": 20,
-            "penalty_goals": 50,
-            "free_kick_goals": 62,
-            "red_cards": 5,
-            "yellow_cards": 20,
-            "man_of_the_match_awards": 60,
-            "captaincy_appearances": 50,
-            "key_passes_per_game": 2.5,
-            "dribbles_completed_per_game": 4.0,
-            "big_chances_created": 120,
-            "pass_accuracy_percent": 80.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.4,
-            "interceptions_per_game": 0.1,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 10,   # approximate
-            "doping_tests_failed": 1,    # e.g. 1994
-            "major_injuries_count": 4,
-            "hall_of_fame_inducted": 1,  # Arg, Napoli halls, etc.
-            "career_earnings_million_usd": 50.0,
-            "total_trophies_won": 10
-        },
-        # 3) Lionel Messi
-        {
-            "player_name": "Lionel Messi",
-            "country": "Argentina",
-            "years_active": 19,  # 2004-present
-            "club_appearances": 872,  # Barca + PSG (approx late 2023)
-            "club_goals": 715,
-            "club_assists": 340,
-            "club_minutes_played": 70000,
-            "international_caps": 176,
-            "international_goals": 102,
-            "international_assists": 53,
-            "international_minutes_played": 14000,
-            "club_goal_ratio": 715 / 872,
-            "international_goal_ratio": 102 / 176,
-            "fifa_world_cup_titles": 1,   # 2022
-            "continental_titles": 1,      # Copa America 2021
-            "league_titles": 10,          # La Liga
-            "champions_league_titles": 4, 
-            "domestic_cup_titles": 7,     # Copa del Rey, etc.
-            "major_individual_awards": 15, # e.g. The Best, UEFA best, etc. approximate
-            "ballon_dor_wins": 7,
-            "hat_tricks": 56,
-            "penalty_goals": 108,
-            "free_kick_goals": 61,
-            "red_cards": 3,
-            "yellow_cards": 90,
-            "man_of_the_match_awards": 300, # Approx, he's known for a record # of MOTMs
-            "captaincy_appearances": 120,
-            "key_passes_per_game": 2.3,
-            "dribbles_completed_per_game": 4.2,
-            "big_chances_created": 350,
-            "pass_accuracy_percent": 85.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.3,
-            "interceptions_per_game": 0.2,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 25,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 5,
-            "hall_of_fame_inducted": 0,  # not official yet
-            "career_earnings_million_usd": 600.0,
-            "total_trophies_won": 43
-        },
-        # 4) Cristiano Ronaldo
-        {
-            "player_name": "Cristiano Ronaldo",
-            "country": "Portugal",
-            "years_active": 21, # 2002-present
-            "club_appearances": 1050,
-            "club_goals": 840,
-            "club_assists": 230,
-            "club_minutes_played": 82000,
-            "international_caps": 201,
-            "international_goals": 123,
-            "international_assists": 43,
-            "international_minutes_played": 16000,
-            "club_goal_ratio": 840 / 1050,
-            "international_goal_ratio": 123 / 201,
-            "fifa_world_cup_titles": 0,
-            "continental_titles": 1, # Euro 2016
-            "league_titles": 7,      # (3 PL, 2 La Liga, 2 Serie A)
-            "champions_league_titles": 5,
-            "domestic_cup_titles": 6,  # e.g. FA Cup, Copa del Rey, etc.
-            "major_individual_awards": 12, # The Best, etc
-            "ballon_dor_wins": 5,
-            "hat_tricks": 61,
-            "penalty_goals": 145,
-            "free_kick_goals": 58,
-            "red_cards": 11,
-            "yellow_cards": 130,
-            "man_of_the_match_awards": 220,
-            "captaincy_appearances": 150,
-            "key_passes_per_game": 1.9,
-            "dribbles_completed_per_game": 2.5,
-            "big_chances_created": 250,
-            "pass_accuracy_percent": 82.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.4,
-            "interceptions_per_game": 0.2,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 30,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 4,
-            "hall_of_fame_inducted": 0,
-            "career_earnings_million_usd": 1000.0,
-            "total_trophies_won": 34
-        },
-        # 5) Johan Cruyff
-        {
-            "player_name": "Johan Cruyff",
-            "country": "Netherlands",
-            "years_active": 20, # 1964-1984
-            "club_appearances": 663,
-            "club_goals": 291,
-            "club_assists": 180,  # approximate
-            "club_minutes_played": 52000,
-            "international_caps": 48,
-            "international_goals": 33,
-            "international_assists": 15,
-            "international_minutes_played": 4000,
-            "club_goal_ratio": 291 / 663,
-            "international_goal_ratio": 33 / 48,
-            "fifa_world_cup_titles": 0,
-            "continental_titles": 0, # no Euro
-            "league_titles": 9,  # mostly with Ajax + Barca
-            "champions_league_titles": 3, # European Cup with Ajax
-            "domestic_cup_titles": 5, 
-            "major_individual_awards": 6, # 3 Ballon d'Or
-            "ballon_dor_wins": 3,
-            "hat_tricks": 15,
-            "penalty_goals": 40,
-            "free_kick_goals": 25,
-            "red_cards": 2,
-            "yellow_cards": 20,
-            "man_of_the_match_awards": 50,
-            "captaincy_appearances": 40,
-            "key_passes_per_game": 2.7,
-            "dribbles_completed_per_game": 3.1,
-            "big_chances_created": 120,
-            "pass_accuracy_percent": 83.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.5,
-            "interceptions_per_game": 0.3,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 0,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 3,
-            "hall_of_fame_inducted": 1, #some clubs/honors
-            "career_earnings_million_usd": 10.0,
-            "total_trophies_won": 18
-        },
-        # 6) Franz Beckenbauer
-        {
-            "player_name": "Franz Beckenbauer",
-            "country": "Germany",
-            "years_active": 18, # 1964-1982
-            "club_appearances": 572,
-            "club_goals": 80,
-            "club_assists": 90, # approximate
-            "club_minutes_played": 48000,
-            "international_caps": 103,
-            "international_goals": 14,
-            "international_assists": 20,
-            "international_minutes_played": 8000,
-            "club_goal_ratio": 80 / 572,
-            "international_goal_ratio": 14 / 103,
-            "fifa_world_cup_titles": 1, #1974
-            "continental_titles": 1, #Euro 1972
-            "league_titles": 5, # with Bayern
-            "champions_league_titles": 3, # European Cup
-            "domestic_cup_titles": 4,
-            "major_individual_awards": 4, # 2x Ballon d'Or
-            "ballon_dor_wins": 2,
-            "hat_tricks": 0,
-            "penalty_goals": 5,
-            "free_kick_goals": 10,
-            "red_cards": 1,
-            "yellow_cards": 30,
-            "man_of_the_match_awards": 25,
-            "captaincy_appearances": 60,
-            "key_passes_per_game": 1.5,
-            "dribbles_completed_per_game": 0.8,
-            "big_chances_created": 50,
-            "pass_accuracy_percent": 88.0,
-            "clean_sheets": 0,  # was a sweeper
-            "tackles_won_per_game": 2.0,
-            "interceptions_per_game": 2.0,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 0,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 2,
-            "hall_of_fame_inducted": 1,
-            "career_earnings_million_usd": 5.0,
-            "total_trophies_won": 14
-        },
-        # 7) Alfredo Di Stéfano
-        {
-            "player_name": "Alfredo Di Stéfano",
-            "country": "Argentina/Spain",
-            "years_active": 20, # 1945-1966
-            "club_appearances": 521,
-            "club_goals": 376,
-            "club_assists": 120, # approximate
-            "club_minutes_played": 46000,
-            "international_caps": 41, # for Argentina/Spain
-            "international_goals": 29,
-            "international_assists": 10,
-            "international_minutes_played": 3000,
-            "club_goal_ratio": 376 / 521,
-            "international_goal_ratio": 29 / 41,
-            "fifa_world_cup_titles": 0,
-            "continental_titles": 0,
-            "league_titles": 13, # mostly Real Madrid, etc.
-            "champions_league_titles": 5, # European Cup with Real
-            "domestic_cup_titles": 1, # Copa del Rey
-            "major_individual_awards": 5, # 2x Ballon d'Or, etc
-            "ballon_dor_wins": 2,
-            "hat_tricks": 30,
-            "penalty_goals": 50,
-            "free_kick_goals": 20,
-            "red_cards": 2,
-            "yellow_cards": 10,
-            "man_of_the_match_awards": 40,
-            "captaincy_appearances": 20,
-            "key_passes_per_game": 2.4,
-            "dribbles_completed_per_game": 2.0,
-            "big_chances_created": 80,
-            "pass_accuracy_percent": 80.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 1.0,
-            "interceptions_per_game": 1.0,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 0,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 2,
-            "hall_of_fame_inducted": 1,
-            "career_earnings_million_usd": 2.0,
-            "total_trophies_won": 18
-        },
-        # 8) Michel Platini
-        {
-            "player_name": "Michel Platini",
-            "country": "France",
-            "years_active": 15, # 1972-1987
-            "club_appearances": 580,
-            "club_goals": 312,
-            "club_assists": 130,
-            "club_minutes_played": 42000,
-            "international_caps": 72,
-            "international_goals": 41,
-            "international_assists": 20,
-            "international_minutes_played": 5800,
-            "club_goal_ratio": 312 / 580,
-            "international_goal_ratio": 41 / 72,
-            "fifa_world_cup_titles": 0,
-            "continental_titles": 1,  # Euro 1984
-            "league_titles": 3,  # with Juve
-            "champions_league_titles": 1,  # 1985 Juve
-            "domestic_cup_titles": 3,
-            "major_individual_awards": 5, # 3 Ballon d'Or
-            "ballon_dor_wins": 3,
-            "hat_tricks": 10,
-            "penalty_goals": 50,
-            "free_kick_goals": 40,
-            "red_cards": 2,
-            "yellow_cards": 15,
-            "man_of_the_match_awards": 30,
-            "captaincy_appearances": 50,
-            "key_passes_per_game": 2.5,
-            "dribbles_completed_per_game": 1.8,
-            "big_chances_created": 90,
-            "pass_accuracy_percent": 84.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.7,
-            "interceptions_per_game": 0.5,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 0,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 2,
-            "hall_of_fame_inducted": 1,  # he's in some honors
-            "career_earnings_million_usd": 8.0,
-            "total_trophies_won": 10
-        },
-        # 9) Zinedine Zidane
-        {
-            "player_name": "Zinedine Zidane",
-            "country": "France",
-            "years_active": 17, # 1989-2006
-            "club_appearances": 694,
-            "club_goals": 125,
-            "club_assists": 150,
-            "club_minutes_played": 54000,
-            "international_caps": 108,
-            "international_goals": 31,
-            "international_assists": 30,
-            "international_minutes_played": 8000,
-            "club_goal_ratio": 125 / 694,
-            "international_goal_ratio": 31 / 108,
-            "fifa_world_cup_titles": 1, # 1998
-            "continental_titles": 1, # Euro 2000
-            "league_titles": 3, # Juve + Real
-            "champions_league_titles": 1, 
-            "domestic_cup_titles": 4,
-            "major_individual_awards": 6, # Ballon d'Or x1, FIFA WPOTY x3
-            "ballon_dor_wins": 1,
-            "hat_tricks": 1,
-            "penalty_goals": 28,
-            "free_kick_goals": 12,
-            "red_cards": 14, # some well-known incidents
-            "yellow_cards": 70,
-            "man_of_the_match_awards": 40,
-            "captaincy_appearances": 20,
-            "key_passes_per_game": 2.6,
-            "dribbles_completed_per_game": 2.5,
-            "big_chances_created": 150,
-            "pass_accuracy_percent": 88.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.8,
-            "interceptions_per_game": 0.5,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 10,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 2,
-            "hall_of_fame_inducted": 1,
-            "career_earnings_million_usd": 70.0,
-            "total_trophies_won": 15
-        },
-        # 10) Ronaldo Nazário (Brazilian Ronaldo)
-        {
-            "player_name": "Ronaldo Nazario",
-            "country": "Brazil",
-            "years_active": 18, # 1993-2011
-            "club_appearances": 518,
-            "club_goals": 352,
-            "club_assists": 90,
-            "club_minutes_played": 35000,
-            "international_caps": 98,
-            "international_goals": 62,
-            "international_assists": 20,
-            "international_minutes_played": 7000,
-            "club_goal_ratio": 352 / 518,
-            "international_goal_ratio": 62 / 98,
-            "fifa_world_cup_titles": 2, # 1994, 2002
-            "continental_titles": 2, # Copa America
-            "league_titles": 1, # with Real, Inter? Actually 1 La Liga 2003, etc
-            "champions_league_titles": 0,
-            "domestic_cup_titles": 4, # e.g. Copa del Rey, Cup Winners 
-            "major_individual_awards": 5, # Ballon d'Or x2, WPOTY x3
-            "ballon_dor_wins": 2,
-            "hat_tricks": 23,
-            "penalty_goals": 40,
-            "free_kick_goals": 7,
-            "red_cards": 3,
-            "yellow_cards": 30,
-            "man_of_the_match_awards": 50,
-            "captaincy_appearances": 10,
-            "key_passes_per_game": 1.8,
-            "dribbles_completed_per_game": 3.5,
-            "big_chances_created": 70,
-            "pass_accuracy_percent": 82.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.3,
-            "interceptions_per_game": 0.2,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 8,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 5,
-            "hall_of_fame_inducted": 1, # Brazilian Hall, etc
-            "career_earnings_million_usd": 150.0,
-            "total_trophies_won": 12
-        },
-        # (Due to length constraints, we'll continue similarly for all 30, 
-        # but let's demonstrate the pattern with 10 so far.)
-
-        # 11) Ronaldinho
-        {
-            "player_name": "Ronaldinho",
-            "country": "Brazil",
-            "years_active": 17,
-            "club_appearances": 513,
-            "club_goals": 190,
-            "club_assists": 130,
-            "club_minutes_played": 38000,
-            "international_caps": 97,
-            "international_goals": 33,
-            "international_assists": 20,
-            "international_minutes_played": 6500,
-            "club_goal_ratio": 190 / 513,
-            "international_goal_ratio": 33 / 97,
-            "fifa_world_cup_titles": 1,  # 2002
-            "continental_titles": 2,     # Copa America + Confed Cup
-            "league_titles": 2,         # 2 with Barca
-            "champions_league_titles": 1,
-            "domestic_cup_titles": 2,    
-            "major_individual_awards": 4, # Ballon d'Or x1, WPOTY x2
-            "ballon_dor_wins": 1,
-            "hat_tricks": 5,
-            "penalty_goals": 30,
-            "free_kick_goals": 40,
-            "red_cards": 3,
-            "yellow_cards": 40,
-            "man_of_the_match_awards": 45,
-            "captaincy_appearances": 15,
-            "key_passes_per_game": 2.8,
-            "dribbles_completed_per_game": 3.8,
-            "big_chances_created": 120,
-            "pass_accuracy_percent": 85.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.4,
-            "interceptions_per_game": 0.2,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 5,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 2,
-            "hall_of_fame_inducted": 0,
-            "career_earnings_million_usd": 90.0,
-            "total_trophies_won": 13
-        },
-        # 12) Gerd Müller
-        {
-            "player_name": "Gerd Müller",
-            "country": "Germany",
-            "years_active": 15,
-            "club_appearances": 565,
-            "club_goals": 523,
-            "club_assists": 100,
-            "club_minutes_played": 40000,
-            "international_caps": 62,
-            "international_goals": 68,
-            "international_assists": 10,
-            "international_minutes_played": 5200,
-            "club_goal_ratio": 523 / 565,
-            "international_goal_ratio": 68 / 62, # >1
-            "fifa_world_cup_titles": 1,  # 1974
-            "continental_titles": 1,     # Euro 1972
-            "league_titles": 4,
-            "champions_league_titles": 3, # European Cup
-            "domestic_cup_titles": 4,
-            "major_individual_awards": 3, # Golden Boot 1970, Ballon runner-up etc
-            "ballon_dor_wins": 0, 
-            "hat_tricks": 32,
-            "penalty_goals": 40,
-            "free_kick_goals": 5,
-            "red_cards": 0,
-            "yellow_cards": 10,
-            "man_of_the_match_awards": 25,
-            "captaincy_appearances": 10,
-            "key_passes_per_game": 1.2,
-            "dribbles_completed_per_game": 1.5,
-            "big_chances_created": 40,
-            "pass_accuracy_percent": 77.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.4,
-            "interceptions_per_game": 0.2,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 0,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 1,
-            "hall_of_fame_inducted": 1,
-            "career_earnings_million_usd": 3.0,
-            "total_trophies_won": 12
-        },
-        # 13) Eusebio
-        {
-            "player_name": "Eusébio",
-            "country": "Portugal",
-            "years_active": 22, # 1957-1979
-            "club_appearances": 590,
-            "club_goals": 473,
-            "club_assists": 120,
-            "club_minutes_played": 46000,
-            "international_caps": 64,
-            "international_goals": 41,
-            "international_assists": 10,
-            "international_minutes_played": 5000,
-            "club_goal_ratio": 473 / 590,
-            "international_goal_ratio": 41 / 64,
-            "fifa_world_cup_titles": 0,
-            "continental_titles": 0,
-            "league_titles": 11, # with Benfica
-            "champions_league_titles": 1, # 1962
-            "domestic_cup_titles": 5,
-            "major_individual_awards": 3, # Ballon d'Or x1 in 1965, etc
-            "ballon_dor_wins": 1,
-            "hat_tricks": 22,
-            "penalty_goals": 50,
-            "free_kick_goals": 25,
-            "red_cards": 1,
-            "yellow_cards": 10,
-            "man_of_the_match_awards": 30,
-            "captaincy_appearances": 20,
-            "key_passes_per_game": 1.7,
-            "dribbles_completed_per_game": 2.5,
-            "big_chances_created": 60,
-            "pass_accuracy_percent": 78.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.3,
-            "interceptions_per_game": 0.2,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 0,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 2,
-            "hall_of_fame_inducted": 1,
-            "career_earnings_million_usd": 2.0,
-            "total_trophies_won": 17
-        },
-        # 14) Ferenc Puskás
-        {
-            "player_name": "Ferenc Puskás",
-            "country": "Hungary/Spain",
-            "years_active": 23, # 1943-1966
-            "club_appearances": 629,
-            "club_goals": 625,
-            "club_assists": 150,
-            "club_minutes_played": 50000,
-            "international_caps": 85, # Hungary + Spain
-            "international_goals": 84,
-            "international_assists": 20,
-            "international_minutes_played": 7000,
-            "club_goal_ratio": 625 / 629,
-            "international_goal_ratio": 84 / 85,
-            "fifa_world_cup_titles": 0,
-            "continental_titles": 0,
-            "league_titles": 10, # Hungary + Real
-            "champions_league_titles": 3, # European Cup with Real
-            "domestic_cup_titles": 2,
-            "major_individual_awards": 2,
-            "ballon_dor_wins": 0,
-            "hat_tricks": 30,
-            "penalty_goals": 60,
-            "free_kick_goals": 20,
-            "red_cards": 1,
-            "yellow_cards": 5,
-            "man_of_the_match_awards": 25,
-            "captaincy_appearances": 40,
-            "key_passes_per_game": 1.8,
-            "dribbles_completed_per_game": 2.0,
-            "big_chances_created": 70,
-            "pass_accuracy_percent": 80.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.3,
-            "interceptions_per_game": 0.2,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 0,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 2,
-            "hall_of_fame_inducted": 1,
-            "career_earnings_million_usd": 1.0,
-            "total_trophies_won": 15
-        },
-        # For brevity, the pattern continues. We must have 30 total.
-        # We'll add placeholders for players 15 to 30 with approximate stats.
-
-    ]
-
-    # Let's define additional real legends to reach 30 total:
-    more_players = [
-        {
-            "player_name": "Paolo Maldini",
-            "country": "Italy",
-            "years_active": 25,
-            "club_appearances": 1028,
-            "club_goals": 33,
-            "club_assists": 44,
-            "club_minutes_played": 90000,
-            "international_caps": 126,
-            "international_goals": 7,
-            "international_assists": 10,
-            "international_minutes_played": 10000,
-            "club_goal_ratio": 33 / 1028,
-            "international_goal_ratio": 7 / 126,
-            "fifa_world_cup_titles": 0,
-            "continental_titles": 0, # didn't win Euro
-            "league_titles": 7, # AC Milan
-            "champions_league_titles": 5,
-            "domestic_cup_titles": 5,
-            "major_individual_awards": 2,
-            "ballon_dor_wins": 0,
-            "hat_tricks": 0,
-            "penalty_goals": 0,
-            "free_kick_goals": 0,
-            "red_cards": 3,
-            "yellow_cards": 100,
-            "man_of_the_match_awards": 20,
-            "captaincy_appearances": 300,
-            "key_passes_per_game": 0.5,
-            "dribbles_completed_per_game": 0.2,
-            "big_chances_created": 10,
-            "pass_accuracy_percent": 90.0,
-            "clean_sheets": 300, # as defender, approximate
-            "tackles_won_per_game": 2.5,
-            "interceptions_per_game": 2.1,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 10,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 4,
-            "hall_of_fame_inducted": 1, # AC Milan Hall
-            "career_earnings_million_usd": 40.0,
-            "total_trophies_won": 26
-        },
-        {
-            "player_name": "Xavi Hernandez",
-            "country": "Spain",
-            "years_active": 17,
-            "club_appearances": 850,
-            "club_goals": 85,
-            "club_assists": 180,
-            "club_minutes_played": 68000,
-            "international_caps": 133,
-            "international_goals": 13,
-            "international_assists": 25,
-            "international_minutes_played": 10000,
-            "club_goal_ratio": 85 / 850,
-            "international_goal_ratio": 13 / 133,
-            "fifa_world_cup_titles": 1, # 2010
-            "continental_titles": 2, # Euro 2008, 2012
-            "league_titles": 8,
-            "champions_league_titles": 4,
-            "domestic_cup_titles": 3,
-            "major_individual_awards": 4, # e.g. Best playmaker, top 3 Ballon
-            "ballon_dor_wins": 0,
-            "hat_tricks": 0,
-            "penalty_goals": 5,
-            "free_kick_goals": 10,
-            "red_cards": 1,
-            "yellow_cards": 70,
-            "man_of_the_match_awards": 40,
-            "captaincy_appearances": 50,
-            "key_passes_per_game": 3.5,
-            "dribbles_completed_per_game": 1.5,
-            "big_chances_created": 280,
-            "pass_accuracy_percent": 93.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 1.0,
-            "interceptions_per_game": 0.5,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 15,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 2,
-            "hall_of_fame_inducted": 0,
-            "career_earnings_million_usd": 50.0,
-            "total_trophies_won": 31
-        },
-        # ... continue adding until we have 30 total ...
-    ]
-
-    players_data.extend(more_players)
-    # We'll add more to reach 30. For brevity, let's define placeholders 
-    # that represent real legends but with approximate stats:
-
-    additional_legends = [
-        {
-            "player_name": "Andres Iniesta",
-            "country": "Spain",
-            "years_active": 16,
-            "club_appearances": 800,
-            "club_goals": 69,
-            "club_assists": 140,
-            "club_minutes_played": 63000,
-            "international_caps": 131,
-            "international_goals": 13,
-            "international_assists": 27,
-            "international_minutes_played": 9000,
-            "club_goal_ratio": 69 / 800,
-            "international_goal_ratio": 13 / 131,
-            "fifa_world_cup_titles": 1,
-            "continental_titles": 2, 
-            "league_titles": 9,
-            "champions_league_titles": 4,
-            "domestic_cup_titles": 6,
-            "major_individual_awards": 3,
-            "ballon_dor_wins": 0,
-            "hat_tricks": 0,
-            "penalty_goals": 5,
-            "free_kick_goals": 3,
-            "red_cards": 1,
-            "yellow_cards": 50,
-            "man_of_the_match_awards": 35,
-            "captaincy_appearances": 40,
-            "key_passes_per_game": 2.9,
-            "dribbles_completed_per_game": 2.8,
-            "big_chances_created": 220,
-            "pass_accuracy_percent": 91.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.8,
-            "interceptions_per_game": 0.4,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 15,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 4,
-            "hall_of_fame_inducted": 0,
-            "career_earnings_million_usd": 45.0,
-            "total_trophies_won": 37
-        },
-        {
-            "player_name": "George Best",
-            "country": "Northern Ireland",
-            "years_active": 17,
-            "club_appearances": 579,
-            "club_goals": 205,
-            "club_assists": 100,
-            "club_minutes_played": 45000,
-            "international_caps": 37,
-            "international_goals": 9,
-            "international_assists": 5,
-            "international_minutes_played": 3000,
-            "club_goal_ratio": 205 / 579,
-            "international_goal_ratio": 9 / 37,
-            "fifa_world_cup_titles": 0,
-            "continental_titles": 0,
-            "league_titles": 2, # with Man Utd
-            "champions_league_titles": 1, # 1968 European Cup
-            "domestic_cup_titles": 0,
-            "major_individual_awards": 2, # Ballon d'Or 1968
-            "ballon_dor_wins": 1,
-            "hat_tricks": 10,
-            "penalty_goals": 20,
-            "free_kick_goals": 25,
-            "red_cards": 2,
-            "yellow_cards": 30,
-            "man_of_the_match_awards": 25,
-            "captaincy_appearances": 0,
-            "key_passes_per_game": 2.4,
-            "dribbles_completed_per_game": 3.0,
-            "big_chances_created": 80,
-            "pass_accuracy_percent": 78.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.6,
-            "interceptions_per_game": 0.2,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 0,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 3,
-            "hall_of_fame_inducted": 1,
-            "career_earnings_million_usd": 2.0,
-            "total_trophies_won": 5
-        },
-        # We'll just add a few more real quick-lister:
-        {
-            "player_name": "Marco van Basten",
-            "country": "Netherlands",
-            "years_active": 11,
-            "club_appearances": 373,
-            "club_goals": 277,
-            "club_assists": 80,
-            "club_minutes_played": 32000,
-            "international_caps": 58,
-            "international_goals": 24,
-            "international_assists": 10,
-            "international_minutes_played": 4000,
-            "club_goal_ratio": 277 / 373,
-            "international_goal_ratio": 24 / 58,
-            "fifa_world_cup_titles": 0,
-            "continental_titles": 1, # Euro 1988
-            "league_titles": 6,
-            "champions_league_titles": 2,
-            "domestic_cup_titles": 3,
-            "major_individual_awards": 4, # Ballon d'Or x3
-            "ballon_dor_wins": 3,
-            "hat_tricks": 14,
-            "penalty_goals": 25,
-            "free_kick_goals": 12,
-            "red_cards": 2,
-            "yellow_cards": 10,
-            "man_of_the_match_awards": 20,
-            "captaincy_appearances": 15,
-            "key_passes_per_game": 1.8,
-            "dribbles_completed_per_game": 2.2,
-            "big_chances_created": 60,
-            "pass_accuracy_percent": 82.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.5,
-            "interceptions_per_game": 0.3,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 0,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 3,
-            "hall_of_fame_inducted": 1,
-            "career_earnings_million_usd": 8.0,
-            "total_trophies_won": 10
-        },
-        {
-            "player_name": "Lothar Matthäus",
-            "country": "Germany",
-            "years_active": 20,
-            "club_appearances": 782,
-            "club_goals": 204,
-            "club_assists": 100,
-            "club_minutes_played": 62000,
-            "international_caps": 150,
-            "international_goals": 23,
-            "international_assists": 25,
-            "international_minutes_played": 11000,
-            "club_goal_ratio": 204 / 782,
-            "international_goal_ratio": 23 / 150,
-            "fifa_world_cup_titles": 1, # 1990
-            "continental_titles": 0,
-            "league_titles": 7,
-            "champions_league_titles": 1, # 2013 is bayern but he wasn't playing in 2013. So 0 as player? Actually 0 as player. Let's do 0
-            "domestic_cup_titles": 6,
-            "major_individual_awards": 3, # Ballon d'Or 1990? no, he got WPOTY
-            "ballon_dor_wins": 0,
-            "hat_tricks": 2,
-            "penalty_goals": 40,
-            "free_kick_goals": 15,
-            "red_cards": 3,
-            "yellow_cards": 60,
-            "man_of_the_match_awards": 25,
-            "captaincy_appearances": 100,
-            "key_passes_per_game": 1.3,
-            "dribbles_completed_per_game": 1.2,
-            "big_chances_created": 50,
-            "pass_accuracy_percent": 85.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 2.0,
-            "interceptions_per_game": 1.5,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 10,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 3,
-            "hall_of_fame_inducted": 1,
-            "career_earnings_million_usd": 15.0,
-            "total_trophies_won": 12
-        },
-        # We'll keep adding until we hit 30 total. 
-        # For brevity, let's add placeholders that represent real modern or classic players:
-
-    ]
-
-    players_data.extend(additional_legends)
-
-    # We have 10 + 2 + 1 + 1 + 1 + 1 = 16 so far. We must add 14 more to total 30.
-
-    placeholders = [
-        {
-            "player_name": "Bobby Charlton",
-            "country": "England",
-            "years_active": 17,
-            "club_appearances": 758,
-            "club_goals": 249,
-            "club_assists": 100,
-            "club_minutes_played": 60000,
-            "international_caps": 106,
-            "international_goals": 49,
-            "international_assists": 20,
-            "international_minutes_played": 8000,
-            "club_goal_ratio": 249 / 758,
-            "international_goal_ratio": 49 / 106,
-            "fifa_world_cup_titles": 1, # 1966
-            "continental_titles": 0,
-            "league_titles": 3,
-            "champions_league_titles": 1, # 1968 European Cup
-            "domestic_cup_titles": 1,
-            "major_individual_awards": 2,
-            "ballon_dor_wins": 1, # 1966
-            "hat_tricks": 5,
-            "penalty_goals": 30,
-            "free_kick_goals": 10,
-            "red_cards": 0,
-            "yellow_cards": 10,
-            "man_of_the_match_awards": 15,
-            "captaincy_appearances": 20,
-            "key_passes_per_game": 1.5,
-            "dribbles_completed_per_game": 1.0,
-            "big_chances_created": 50,
-            "pass_accuracy_percent": 80.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.6,
-            "interceptions_per_game": 0.4,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 0,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 1,
-            "hall_of_fame_inducted": 1,
-            "career_earnings_million_usd": 2.0,
-            "total_trophies_won": 6
-        },
-        {
-            "player_name": "Roberto Baggio",
-            "country": "Italy",
-            "years_active": 18,
-            "club_appearances": 643,
-            "club_goals": 291,
-            "club_assists": 110,
-            "club_minutes_played": 50000,
-            "international_caps": 56,
-            "international_goals": 27,
-            "international_assists": 15,
-            "international_minutes_played": 4000,
-            "club_goal_ratio": 291 / 643,
-            "international_goal_ratio": 27 / 56,
-            "fifa_world_cup_titles": 0,
-            "continental_titles": 0,
-            "league_titles": 2,
-            "champions_league_titles": 0,
-            "domestic_cup_titles": 2,
-            "major_individual_awards": 3, # Ballon d'Or 1993
-            "ballon_dor_wins": 1,
-            "hat_tricks": 8,
-            "penalty_goals": 68,
-            "free_kick_goals": 35,
-            "red_cards": 3,
-            "yellow_cards": 25,
-            "man_of_the_match_awards": 25,
-            "captaincy_appearances": 10,
-            "key_passes_per_game": 2.0,
-            "dribbles_completed_per_game": 1.8,
-            "big_chances_created": 80,
-            "pass_accuracy_percent": 82.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.4,
-            "interceptions_per_game": 0.2,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 5,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 4,
-            "hall_of_fame_inducted": 1,
-            "career_earnings_million_usd": 25.0,
-            "total_trophies_won": 6
-        },
-        {
-            "player_name": "Rivaldo",
-            "country": "Brazil",
-            "years_active": 19,
-            "club_appearances": 731,
-            "club_goals": 345,
-            "club_assists": 120,
-            "club_minutes_played": 60000,
-            "international_caps": 74,
-            "international_goals": 35,
-            "international_assists": 20,
-            "international_minutes_played": 5400,
-            "club_goal_ratio": 345 / 731,
-            "international_goal_ratio": 35 / 74,
-            "fifa_world_cup_titles": 1, # 2002
-            "continental_titles": 2, # Copa America
-            "league_titles": 3, # with Barca?
-            "champions_league_titles": 0,
-            "domestic_cup_titles": 3,
-            "major_individual_awards": 3, # Ballon d'Or 1999
-            "ballon_dor_wins": 1,
-            "hat_tricks": 10,
-            "penalty_goals": 40,
-            "free_kick_goals": 30,
-            "red_cards": 2,
-            "yellow_cards": 40,
-            "man_of_the_match_awards": 30,
-            "captaincy_appearances": 5,
-            "key_passes_per_game": 2.5,
-            "dribbles_completed_per_game": 3.0,
-            "big_chances_created": 110,
-            "pass_accuracy_percent": 84.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.5,
-            "interceptions_per_game": 0.3,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 5,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 3,
-            "hall_of_fame_inducted": 0,
-            "career_earnings_million_usd": 50.0,
-            "total_trophies_won": 12
-        },
-        {
-            "player_name": "Thierry Henry",
-            "country": "France",
-            "years_active": 20,
-            "club_appearances": 792,
-            "club_goals": 360,
-            "club_assists": 160,
-            "club_minutes_played": 62000,
-            "international_caps": 123,
-            "international_goals": 51,
-            "international_assists": 26,
-            "international_minutes_played": 9800,
-            "club_goal_ratio": 360 / 792,
-            "international_goal_ratio": 51 / 123,
-            "fifa_world_cup_titles": 1, # 1998
-            "continental_titles": 1, # Euro 2000
-            "league_titles": 2, # with Arsenal, Barca
-            "champions_league_titles": 1, # Barca 2009
-            "domestic_cup_titles": 5,
-            "major_individual_awards": 4, # Golden Boots, etc
-            "ballon_dor_wins": 0,
-            "hat_tricks": 14,
-            "penalty_goals": 38,
-            "free_kick_goals": 23,
-            "red_cards": 2,
-            "yellow_cards": 60,
-            "man_of_the_match_awards": 40,
-            "captaincy_appearances": 20,
-            "key_passes_per_game": 2.4,
-            "dribbles_completed_per_game": 2.5,
-            "big_chances_created": 150,
-            "pass_accuracy_percent": 84.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.6,
-            "interceptions_per_game": 0.2,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 8,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 3,
-            "hall_of_fame_inducted": 0,
-            "career_earnings_million_usd": 100.0,
-            "total_trophies_won": 15
-        },
-        {
-            "player_name": "Romário",
-            "country": "Brazil",
-            "years_active": 24,
-            "club_appearances": 800,
-            "club_goals": 690,
-            "club_assists": 120,
-            "club_minutes_played": 60000,
-            "international_caps": 70,
-            "international_goals": 55,
-            "international_assists": 20,
-            "international_minutes_played": 5000,
-            "club_goal_ratio": 690 / 800,
-            "international_goal_ratio": 55 / 70,
-            "fifa_world_cup_titles": 1, # 1994
-            "continental_titles": 2, # Copa America
-            "league_titles": 3,
-            "champions_league_titles": 0,
-            "domestic_cup_titles": 4,
-            "major_individual_awards": 3, # WC Golden Ball 1994
-            "ballon_dor_wins": 0,
-            "hat_tricks": 30,
-            "penalty_goals": 90,
-            "free_kick_goals": 20,
-            "red_cards": 5,
-            "yellow_cards": 40,
-            "man_of_the_match_awards": 40,
-            "captaincy_appearances": 10,
-            "key_passes_per_game": 1.5,
-            "dribbles_completed_per_game": 2.5,
-            "big_chances_created": 60,
-            "pass_accuracy_percent": 78.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.4,
-            "interceptions_per_game": 0.2,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 2,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 4,
-            "hall_of_fame_inducted": 0,
-            "career_earnings_million_usd": 30.0,
-            "total_trophies_won": 10
-        },
-        {
-            "player_name": "Lev Yashin",
-            "country": "Soviet Union",
-            "years_active": 20,
-            "club_appearances": 420,
-            "club_goals": 0, # GK
-            "club_assists": 0,
-            "club_minutes_played": 37000,
-            "international_caps": 74,
-            "international_goals": 0,
-            "international_assists": 0,
-            "international_minutes_played": 6600,
-            "club_goal_ratio": 0.0,
-            "international_goal_ratio": 0.0,
-            "fifa_world_cup_titles": 0,
-            "continental_titles": 1, # Euro 1960
-            "league_titles": 5,
-            "champions_league_titles": 0,
-            "domestic_cup_titles": 3,
-            "major_individual_awards": 2, # Ballon d'Or 1963
-            "ballon_dor_wins": 1,
-            "hat_tricks": 0,
-            "penalty_goals": 0,
-            "free_kick_goals": 0,
-            "red_cards": 0,
-            "yellow_cards": 2,
-            "man_of_the_match_awards": 15,
-            "captaincy_appearances": 20,
-            "key_passes_per_game": 0.0,
-            "dribbles_completed_per_game": 0.0,
-            "big_chances_created": 0,
-            "pass_accuracy_percent": 70.0,
-            "clean_sheets": 200,
-            "tackles_won_per_game": 0.0,
-            "interceptions_per_game": 0.0,
-            "saves_per_game": 5.0,
-            "doping_tests_passed": 0,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 2,
-            "hall_of_fame_inducted": 1,
-            "career_earnings_million_usd": 0.5,
-            "total_trophies_won": 10
-        },
-        {
-            "player_name": "Franco Baresi",
-            "country": "Italy",
-            "years_active": 20,
-            "club_appearances": 719,
-            "club_goals": 33,
-            "club_assists": 20,
-            "club_minutes_played": 58000,
-            "international_caps": 81,
-            "international_goals": 1,
-            "international_assists": 2,
-            "international_minutes_played": 6000,
-            "club_goal_ratio": 33 / 719,
-            "international_goal_ratio": 1 / 81,
-            "fifa_world_cup_titles": 1, # 1982 (didn't play final?), but part of squad
-            "continental_titles": 0,
-            "league_titles": 6,
-            "champions_league_titles": 3,
-            "domestic_cup_titles": 3,
-            "major_individual_awards": 2,
-            "ballon_dor_wins": 0,
-            "hat_tricks": 0,
-            "penalty_goals": 5,
-            "free_kick_goals": 0,
-            "red_cards": 3,
-            "yellow_cards": 40,
-            "man_of_the_match_awards": 10,
-            "captaincy_appearances": 300,
-            "key_passes_per_game": 0.6,
-            "dribbles_completed_per_game": 0.4,
-            "big_chances_created": 20,
-            "pass_accuracy_percent": 89.0,
-            "clean_sheets": 250,
-            "tackles_won_per_game": 2.5,
-            "interceptions_per_game": 2.2,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 5,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 2,
-            "hall_of_fame_inducted": 1,
-            "career_earnings_million_usd": 8.0,
-            "total_trophies_won": 15
-        },
-        {
-            "player_name": "Sergio Ramos",
-            "country": "Spain",
-            "years_active": 18,
-            "club_appearances": 930,
-            "club_goals": 110,
-            "club_assists": 40,
-            "club_minutes_played": 80000,
-            "international_caps": 180,
-            "international_goals": 23,
-            "international_assists": 8,
-            "international_minutes_played": 15000,
-            "club_goal_ratio": 110 / 930,
-            "international_goal_ratio": 23 / 180,
-            "fifa_world_cup_titles": 1, #2010
-            "continental_titles": 2, # Euro 2008, 2012
-            "league_titles": 5,
-            "champions_league_titles": 4,
-            "domestic_cup_titles": 2,
-            "major_individual_awards": 3,
-            "ballon_dor_wins": 0,
-            "hat_tricks": 0,
-            "penalty_goals": 15,
-            "free_kick_goals": 1,
-            "red_cards": 28, # record
-            "yellow_cards": 200,
-            "man_of_the_match_awards": 15,
-            "captaincy_appearances": 120,
-            "key_passes_per_game": 0.4,
-            "dribbles_completed_per_game": 0.3,
-            "big_chances_created": 25,
-            "pass_accuracy_percent": 91.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 2.8,
-            "interceptions_per_game": 2.0,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 20,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 5,
-            "hall_of_fame_inducted": 0,
-            "career_earnings_million_usd": 120.0,
-            "total_trophies_won": 25
-        },
-        {
-            "player_name": "Kylian Mbappé",
-            "country": "France",
-            "years_active": 7,
-            "club_appearances": 300,
-            "club_goals": 220,
-            "club_assists": 100,
-            "club_minutes_played": 22000,
-            "international_caps": 70,
-            "international_goals": 40,
-            "international_assists": 25,
-            "international_minutes_played": 5000,
-            "club_goal_ratio": 220 / 300,
-            "international_goal_ratio": 40 / 70,
-            "fifa_world_cup_titles": 1, #2018
-            "continental_titles": 0,
-            "league_titles": 5, # Ligue 1
-            "champions_league_titles": 0,
-            "domestic_cup_titles": 4,
-            "major_individual_awards": 4,
-            "ballon_dor_wins": 0,
-            "hat_tricks": 10,
-            "penalty_goals": 20,
-            "free_kick_goals": 4,
-            "red_cards": 2,
-            "yellow_cards": 25,
-            "man_of_the_match_awards": 40,
-            "captaincy_appearances": 5,
-            "key_passes_per_game": 2.0,
-            "dribbles_completed_per_game": 3.5,
-            "big_chances_created": 90,
-            "pass_accuracy_percent": 82.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.3,
-            "interceptions_per_game": 0.1,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 10,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 1,
-            "hall_of_fame_inducted": 0,
-            "career_earnings_million_usd": 150.0,
-            "total_trophies_won": 12
-        },
-        {
-            "player_name": "Erling Haaland",
-            "country": "Norway",
-            "years_active": 5,
-            "club_appearances": 200,
-            "club_goals": 170,
-            "club_assists": 35,
-            "club_minutes_played": 15000,
-            "international_caps": 25,
-            "international_goals": 24,
-            "international_assists": 3,
-            "international_minutes_played": 1800,
-            "club_goal_ratio": 170 / 200,
-            "international_goal_ratio": 24 / 25,
-            "fifa_world_cup_titles": 0,
-            "continental_titles": 0,
-            "league_titles": 2, # with Salzburg, Dortmund, Man City
-            "champions_league_titles": 1, # 2023 with City
-            "domestic_cup_titles": 2,
-            "major_individual_awards": 2,
-            "ballon_dor_wins": 0,
-            "hat_tricks": 13,
-            "penalty_goals": 20,
-            "free_kick_goals": 0,
-            "red_cards": 0,
-            "yellow_cards": 10,
-            "man_of_the_match_awards": 25,
-            "captaincy_appearances": 5,
-            "key_passes_per_game": 1.0,
-            "dribbles_completed_per_game": 1.2,
-            "big_chances_created": 40,
-            "pass_accuracy_percent": 77.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.2,
-            "interceptions_per_game": 0.1,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 5,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 2,
-            "hall_of_fame_inducted": 0,
-            "career_earnings_million_usd": 30.0,
-            "total_trophies_won": 5
-        }
-    ]
-
-    players_data.extend(placeholders)
-
-    # Now let's see how many we have total:
-    if len(players_data) != 30:
-        raise ValueError(f"Expected 30 men's soccer players, got {len(players_data)}")
-
-    # ----------------------- WRITE TO CSV -----------------------
-    with open(filename, mode="w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-        for pdata in players_data:
-            # Fill missing fields with 0 if needed
-            for h in headers:
-                if h not in pdata:
-                    pdata[h] = 0
-            writer.writerow(pdata)
 
 if __name__ == "__main__":
     create_mens_soccer_dataset()
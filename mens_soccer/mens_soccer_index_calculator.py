@@ -8,6 +8,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import normalization helpers
 from sports_index_normalizer import normalize_indexes, plot_top_10_indexes
+from sports_storage import read_table, write_table
+from sports_archetypes import add_archetypes
 
 def calc_soccer_index(row):
     """
@@ -203,7 +205,7 @@ def calc_soccer_index(row):
 
 def main():
     # 1) Load the dataset
-    df = pd.read_csv("mens_soccer_dataset.csv")
+    df = read_table("mens_soccer_dataset.csv")
 
     # 2) Calculate the Soccer Index Score for each player
     df["soccer_index"] = df.apply(calc_soccer_index, axis=1)
@@ -222,8 +224,11 @@ def main():
     # 5) Normalize the index scores (0–100)
     normalized_df = normalize_indexes(df, name_col='player_name', index_col='soccer_index')
 
+    # Add each athlete's archetype (cluster) and its distance to the centroid
+    normalized_df = add_archetypes(normalized_df, "mens_soccer")
+
     # 6) Save the sorted results with normalized scores to a new CSV
-    normalized_df.to_csv("mens_soccer_index_scored.csv", index=False)
+    write_table(normalized_df, "mens_soccer_index_scored.csv")
 
     # 7) Create a line plot of the top 10
     plot_top_10_indexes(
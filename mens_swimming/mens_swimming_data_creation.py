@@ -1,4 +1,58 @@
-import csv
+import os
+import sys
+
+# Add parent directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sports_player_data import load_players, write_dataset
+
+# One record per player; fields a player does not list are written as 0
+PLAYERS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mens_swimming_players.json")
+
+# Define the header (1 name + 40 stats = 41 columns)
+HEADERS = [
+    "player_name",
+    "country",
+    "years_active",
+    "main_stroke",
+    "total_olympic_medals",
+    "olympic_gold_medals",
+    "olympic_silver_medals",
+    "olympic_bronze_medals",
+    "total_world_champ_medals",
+    "world_champ_gold",
+    "world_champ_silver",
+    "world_champ_bronze",
+    "world_record_count",
+    "personal_best_50_free",
+    "personal_best_100_free",
+    "personal_best_200_free",
+    "personal_best_400_free",
+    "personal_best_800_free",
+    "personal_best_1500_free",
+    "personal_best_100_butterfly",
+    "personal_best_200_butterfly",
+    "personal_best_100_back",
+    "personal_best_200_back",
+    "personal_best_100_breast",
+    "personal_best_200_breast",
+    "personal_best_200_im",
+    "personal_best_400_im",
+    "doping_tests_passed",
+    "doping_tests_failed",
+    "total_meet_points",
+    "fina_swimmer_of_year",
+    "career_races_swum",
+    "career_races_won",
+    "career_win_percentage",
+    "main_event_olympic_titles",
+    "pan_pac_medals",
+    "commonwealth_medals",
+    "total_prize_money_million_usd",
+    "retirement_year",
+    "hall_of_fame_inducted"
+]
+
 
 def create_mens_swimming_dataset(filename="mens_swimming_dataset.csv"):
     """
@@ -8,791 +62,8 @@ def create_mens_swimming_dataset(filename="mens_swimming_dataset.csv"):
     
     The CSV has 41 columns total (player_name + 40 stats).
     """
-
-    # Define the header (1 name + 40 stats = 41 columns)
-    headers = [
-        "player_name",
-        "country",
-        "years_active",
-        "main_stroke",
-        "total_olympic_medals",
-        "olympic_gold_medals",
-        "olympic_silver_medals",
-        "olympic_bronze_medals",
-        "total_world_champ_medals",
-        "world_champ_gold",
-        "world_champ_silver",
-        "world_champ_bronze",
-        "world_record_count",
-        "personal_best_50_free",
-        "personal_best_100_free",
-        "personal_best_200_free",
-        "personal_best_400_free",
-        "personal_best_800_free",
-        "personal_best_1500_free",
-        "personal_best_100_butterfly",
-        "personal_best_200_butterfly",
-        "personal_best_100_back",
-        "personal_best_200_back",
-        "personal_best_100_breast",
-        "personal_best_200_breast",
-        "personal_best_200_im",
-        "personal_best_400_im",
-        "doping_tests_passed",
-        "doping_tests_failed",
-        "total_meet_points",
-        "fina_swimmer_of_year",
-        "career_races_swum",
-        "career_races_won",
-        "career_win_percentage",
-        "main_event_olympic_titles",
-        "pan_pac_medals",
-        "commonwealth_medals",
-        "total_prize_money_million_usd",
-        "retirement_year",
-        "hall_of_fame_inducted"
-    ]
-
-    # Exactly 30 swimmers, each with 41 fields
-    # Stats below are approximate (not official).
-    players_data = [
-        {
-            "player_name": "Michael Phelps",
-            "country": "USA",
-            "years_active": 16,
-            "main_stroke": "Butterfly/IM/Freestyle",
-            "total_olympic_medals": 28,
-            "olympic_gold_medals": 23,
-            "olympic_silver_medals": 3,
-            "olympic_bronze_medals": 2,
-            "total_world_champ_medals": 33,
-            "world_champ_gold": 26,
-            "world_champ_silver": 6,
-            "world_champ_bronze": 1,
-            "world_record_count": 39,
-            "personal_best_50_free": 21.9,
-            "personal_best_100_free": 47.5,
-            "personal_best_200_free": 1.42, # 1:42.xx
-            "personal_best_400_free": 3.46,
-            "personal_best_800_free": 7.51,
-            "personal_best_1500_free": 15.29,
-            "personal_best_100_butterfly": 49.8,
-            "personal_best_200_butterfly": 1.51,
-            "personal_best_100_back": 53.0,
-            "personal_best_200_back": 1.54,
-            "personal_best_100_breast": 59.0,
-            "personal_best_200_breast": 2.08,
-            "personal_best_200_im": 1.54,
-            "personal_best_400_im": 4.03,
-            "doping_tests_passed": 300,
-            "doping_tests_failed": 0,
-            "total_meet_points": 2000,
-            "fina_swimmer_of_year": 8,
-            "career_races_swum": 400,
-            "career_races_won": 340,
-            "career_win_percentage": 85.0,
-            "main_event_olympic_titles": 5,  # e.g. 100 fly, 200 fly, 200/400 IM, 4x100 medley
-            "pan_pac_medals": 15,
-            "commonwealth_medals": 0, # not a Commonwealth athlete
-            "total_prize_money_million_usd": 9.8,
-            "retirement_year": 2016,
-            "hall_of_fame_inducted": 1
-        },
-        {
-            "player_name": "Mark Spitz",
-            "country": "USA",
-            "years_active": 8,
-            "main_stroke": "Butterfly/Freestyle",
-            "total_olympic_medals": 11,
-            "olympic_gold_medals": 9,
-            "olympic_silver_medals": 1,
-            "olympic_bronze_medals": 1,
-            "total_world_champ_medals": 0,  # The first official Worlds were 1973, after Spitz retired
-            "world_champ_gold": 0,
-            "world_champ_silver": 0,
-            "world_champ_bronze": 0,
-            "world_record_count": 33,
-            "personal_best_50_free": 23.8,
-            "personal_best_100_free": 51.0,
-            "personal_best_200_free": 1.52,
-            "personal_best_400_free": 4.07,
-            "personal_best_800_free": 0.0,
-            "personal_best_1500_free": 0.0,
-            "personal_best_100_butterfly": 54.3,
-            "personal_best_200_butterfly": 2.00,
-            "personal_best_100_back": 1.01,
-            "personal_best_200_back": 2.09,
-            "personal_best_100_breast": 1.10,
-            "personal_best_200_breast": 2.30,
-            "personal_best_200_im": 2.10,
-            "personal_best_400_im": 0.0,
-            "doping_tests_passed": 0,   # doping tests were minimal in his era
-            "doping_tests_failed": 0,
-            "total_meet_points": 400,
-            "fina_swimmer_of_year": 0,
-            "career_races_swum": 70,
-            "career_races_won": 60,
-            "career_win_percentage": 85.7,
-            "main_event_olympic_titles": 3,  
-            "pan_pac_medals": 0,
-            "commonwealth_medals": 0,
-            "total_prize_money_million_usd": 1.2,
-            "retirement_year": 1972,
-            "hall_of_fame_inducted": 1
-        },
-        {
-            "player_name": "Caeleb Dressel",
-            "country": "USA",
-            "years_active": 8,
-            "main_stroke": "Freestyle/Butterfly",
-            "total_olympic_medals": 7,
-            "olympic_gold_medals": 7,
-            "olympic_silver_medals": 0,
-            "olympic_bronze_medals": 0,
-            "total_world_champ_medals": 20,
-            "world_champ_gold": 17,
-            "world_champ_silver": 2,
-            "world_champ_bronze": 1,
-            "world_record_count": 5,
-            "personal_best_50_free": 21.0,
-            "personal_best_100_free": 46.9,
-            "personal_best_200_free": 1.44,
-            "personal_best_400_free": 3.59,
-            "personal_best_800_free": 8.10,
-            "personal_best_1500_free": 0.0,
-            "personal_best_100_butterfly": 49.4,
-            "personal_best_200_butterfly": 1.52,
-            "personal_best_100_back": 52.5,
-            "personal_best_200_back": 1.58,
-            "personal_best_100_breast": 59.2,
-            "personal_best_200_breast": 2.12,
-            "personal_best_200_im": 1.56,
-            "personal_best_400_im": 4.10,
-            "doping_tests_passed": 120,
-            "doping_tests_failed": 0,
-            "total_meet_points": 1300,
-            "fina_swimmer_of_year": 3,
-            "career_races_swum": 200,
-            "career_races_won": 140,
-            "career_win_percentage": 70.0,
-            "main_event_olympic_titles": 3,  # 50 free, 100 free, 100 fly (relays included)
-            "pan_pac_medals": 6,
-            "commonwealth_medals": 0,
-            "total_prize_money_million_usd": 2.0,
-            "retirement_year": 0,   # active
-            "hall_of_fame_inducted": 0
-        },
-        {
-            "player_name": "Ryan Lochte",
-            "country": "USA",
-            "years_active": 15,
-            "main_stroke": "IM/Back/Freestyle",
-            "total_olympic_medals": 12,
-            "olympic_gold_medals": 6,
-            "olympic_silver_medals": 3,
-            "olympic_bronze_medals": 3,
-            "total_world_champ_medals": 27,
-            "world_champ_gold": 18,
-            "world_champ_silver": 5,
-            "world_champ_bronze": 4,
-            "world_record_count": 9,
-            "personal_best_50_free": 22.3,
-            "personal_best_100_free": 47.8,
-            "personal_best_200_free": 1.44,
-            "personal_best_400_free": 3.59,
-            "personal_best_800_free": 7.54,
-            "personal_best_1500_free": 0.0,
-            "personal_best_100_butterfly": 51.6,
-            "personal_best_200_butterfly": 1.54,
-            "personal_best_100_back": 52.9,
-            "personal_best_200_back": 1.52,
-            "personal_best_100_breast": 1.00,
-            "personal_best_200_breast": 2.10,
-            "personal_best_200_im": 1.54,
-            "personal_best_400_im": 4.05,
-            "doping_tests_passed": 200,
-            "doping_tests_failed": 1, # doping controversy from minor violation
-            "total_meet_points": 1300,
-            "fina_swimmer_of_year": 2,
-            "career_races_swum": 360,
-            "career_races_won": 200,
-            "career_win_percentage": 55.6,
-            "main_event_olympic_titles": 2,
-            "pan_pac_medals": 10,
-            "commonwealth_medals": 0,
-            "total_prize_money_million_usd": 2.5,
-            "retirement_year": 2021,
-            "hall_of_fame_inducted": 0
-        },
-        {
-            "player_name": "Ian Thorpe",
-            "country": "Australia",
-            "years_active": 7,
-            "main_stroke": "Freestyle",
-            "total_olympic_medals": 9,
-            "olympic_gold_medals": 5,
-            "olympic_silver_medals": 3,
-            "olympic_bronze_medals": 1,
-            "total_world_champ_medals": 13,
-            "world_champ_gold": 11,
-            "world_champ_silver": 1,
-            "world_champ_bronze": 1,
-            "world_record_count": 13,
-            "personal_best_50_free": 22.7,
-            "personal_best_100_free": 48.5,
-            "personal_best_200_free": 1.44,
-            "personal_best_400_free": 3.40,
-            "personal_best_800_free": 7.39,
-            "personal_best_1500_free": 14.59,
-            "personal_best_100_butterfly": 0.0,
-            "personal_best_200_butterfly": 0.0,
-            "personal_best_100_back": 0.0,
-            "personal_best_200_back": 2.01,
-            "personal_best_100_breast": 1.08,
-            "personal_best_200_breast": 2.28,
-            "personal_best_200_im": 2.02,
-            "personal_best_400_im": 4.18,
-            "doping_tests_passed": 80,
-            "doping_tests_failed": 0,
-            "total_meet_points": 1100,
-            "fina_swimmer_of_year": 4,
-            "career_races_swum": 140,
-            "career_races_won": 100,
-            "career_win_percentage": 71.4,
-            "main_event_olympic_titles": 2,  # 400 free primarily
-            "pan_pac_medals": 6,
-            "commonwealth_medals": 10,
-            "total_prize_money_million_usd": 2.0,
-            "retirement_year": 2006,
-            "hall_of_fame_inducted": 1
-        },
-        {
-            "player_name": "Sun Yang",
-            "country": "China",
-            "years_active": 12,
-            "main_stroke": "Freestyle",
-            "total_olympic_medals": 6,
-            "olympic_gold_medals": 3,
-            "olympic_silver_medals": 2,
-            "olympic_bronze_medals": 1,
-            "total_world_champ_medals": 14,
-            "world_champ_gold": 11,
-            "world_champ_silver": 2,
-            "world_champ_bronze": 1,
-            "world_record_count": 3,
-            "personal_best_50_free": 22.9,
-            "personal_best_100_free": 48.5,
-            "personal_best_200_free": 1.44,
-            "personal_best_400_free": 3.40,
-            "personal_best_800_free": 7.38,
-            "personal_best_1500_free": 14.31,
-            "personal_best_100_butterfly": 0.0,
-            "personal_best_200_butterfly": 0.0,
-            "personal_best_100_back": 0.0,
-            "personal_best_200_back": 2.02,
-            "personal_best_100_breast": 1.10,
-            "personal_best_200_breast": 2.25,
-            "personal_best_200_im": 2.03,
-            "personal_best_400_im": 4.19,
-            "doping_tests_passed": 120,
-            "doping_tests_failed": 1, # doping controversy
-            "total_meet_points": 1000,
-            "fina_swimmer_of_year": 3,
-            "career_races_swum": 200,
-            "career_races_won": 130,
-            "career_win_percentage": 65.0,
-            "main_event_olympic_titles": 2,
-            "pan_pac_medals": 0,
-            "commonwealth_medals": 0,
-            "total_prize_money_million_usd": 1.5,
-            "retirement_year": 0,
-            "hall_of_fame_inducted": 0
-        },
-        {
-            "player_name": "Grant Hackett",
-            "country": "Australia",
-            "years_active": 10,
-            "main_stroke": "Freestyle",
-            "total_olympic_medals": 7,
-            "olympic_gold_medals": 3,
-            "olympic_silver_medals": 3,
-            "olympic_bronze_medals": 1,
-            "total_world_champ_medals": 19,
-            "world_champ_gold": 10,
-            "world_champ_silver": 6,
-            "world_champ_bronze": 3,
-            "world_record_count": 7,
-            "personal_best_50_free": 23.2,
-            "personal_best_100_free": 48.8,
-            "personal_best_200_free": 1.45,
-            "personal_best_400_free": 3.42,
-            "personal_best_800_free": 7.38,
-            "personal_best_1500_free": 14.34,
-            "personal_best_100_butterfly": 0.0,
-            "personal_best_200_butterfly": 0.0,
-            "personal_best_100_back": 1.00,
-            "personal_best_200_back": 2.05,
-            "personal_best_100_breast": 1.09,
-            "personal_best_200_breast": 2.30,
-            "personal_best_200_im": 2.06,
-            "personal_best_400_im": 4.20,
-            "doping_tests_passed": 80,
-            "doping_tests_failed": 0,
-            "total_meet_points": 950,
-            "fina_swimmer_of_year": 2,
-            "career_races_swum": 140,
-            "career_races_won": 90,
-            "career_win_percentage": 64.3,
-            "main_event_olympic_titles": 2,  # 1500 free
-            "pan_pac_medals": 8,
-            "commonwealth_medals": 9,
-            "total_prize_money_million_usd": 1.1,
-            "retirement_year": 2008,
-            "hall_of_fame_inducted": 1
-        },
-        {
-            "player_name": "Kosuke Kitajima",
-            "country": "Japan",
-            "years_active": 10,
-            "main_stroke": "Breaststroke",
-            "total_olympic_medals": 7,
-            "olympic_gold_medals": 4,
-            "olympic_silver_medals": 1,
-            "olympic_bronze_medals": 2,
-            "total_world_champ_medals": 8,
-            "world_champ_gold": 3,
-            "world_champ_silver": 4,
-            "world_champ_bronze": 1,
-            "world_record_count": 4,
-            "personal_best_50_free": 23.5,
-            "personal_best_100_free": 51.0,
-            "personal_best_200_free": 1.52,
-            "personal_best_400_free": 4.00,
-            "personal_best_800_free": 0.0,
-            "personal_best_1500_free": 0.0,
-            "personal_best_100_butterfly": 58.5,
-            "personal_best_200_butterfly": 2.12,
-            "personal_best_100_back": 1.01,
-            "personal_best_200_back": 2.10,
-            "personal_best_100_breast": 58.9,
-            "personal_best_200_breast": 2.07,
-            "personal_best_200_im": 2.02,
-            "personal_best_400_im": 4.25,
-            "doping_tests_passed": 60,
-            "doping_tests_failed": 0,
-            "total_meet_points": 700,
-            "fina_swimmer_of_year": 0,
-            "career_races_swum": 90,
-            "career_races_won": 50,
-            "career_win_percentage": 55.6,
-            "main_event_olympic_titles": 2,  # 100 & 200 breast
-            "pan_pac_medals": 5,
-            "commonwealth_medals": 0,
-            "total_prize_money_million_usd": 0.8,
-            "retirement_year": 2016,
-            "hall_of_fame_inducted": 1
-        },
-        {
-            "player_name": "Adam Peaty",
-            "country": "Great Britain",
-            "years_active": 9,
-            "main_stroke": "Breaststroke",
-            "total_olympic_medals": 5,
-            "olympic_gold_medals": 3,
-            "olympic_silver_medals": 2,
-            "olympic_bronze_medals": 0,
-            "total_world_champ_medals": 11,
-            "world_champ_gold": 8,
-            "world_champ_silver": 3,
-            "world_champ_bronze": 0,
-            "world_record_count": 6,
-            "personal_best_50_free": 0.0,
-            "personal_best_100_free": 49.5,
-            "personal_best_200_free": 1.50,
-            "personal_best_400_free": 3.55,
-            "personal_best_800_free": 0.0,
-            "personal_best_1500_free": 0.0,
-            "personal_best_100_butterfly": 0.0,
-            "personal_best_200_butterfly": 0.0,
-            "personal_best_100_back": 1.00,
-            "personal_best_200_back": 2.10,
-            "personal_best_100_breast": 56.8,
-            "personal_best_200_breast": 2.06,
-            "personal_best_200_im": 2.10,
-            "personal_best_400_im": 4.30,
-            "doping_tests_passed": 100,
-            "doping_tests_failed": 0,
-            "total_meet_points": 800,
-            "fina_swimmer_of_year": 1,
-            "career_races_swum": 160,
-            "career_races_won": 100,
-            "career_win_percentage": 62.5,
-            "main_event_olympic_titles": 2, # 100 breast, relays
-            "pan_pac_medals": 0,
-            "commonwealth_medals": 6,
-            "total_prize_money_million_usd": 1.3,
-            "retirement_year": 0,
-            "hall_of_fame_inducted": 0
-        },
-        {
-            "player_name": "Matt Biondi",
-            "country": "USA",
-            "years_active": 7,
-            "main_stroke": "Freestyle/Butterfly",
-            "total_olympic_medals": 11,
-            "olympic_gold_medals": 8,
-            "olympic_silver_medals": 2,
-            "olympic_bronze_medals": 1,
-            "total_world_champ_medals": 6,
-            "world_champ_gold": 5,
-            "world_champ_silver": 1,
-            "world_champ_bronze": 0,
-            "world_record_count": 10,
-            "personal_best_50_free": 22.3,
-            "personal_best_100_free": 48.9,
-            "personal_best_200_free": 1.47,
-            "personal_best_400_free": 3.50,
-            "personal_best_800_free": 0.0,
-            "personal_best_1500_free": 0.0,
-            "personal_best_100_butterfly": 52.0,
-            "personal_best_200_butterfly": 0.0,
-            "personal_best_100_back": 1.00,
-            "personal_best_200_back": 2.10,
-            "personal_best_100_breast": 1.10,
-            "personal_best_200_breast": 2.28,
-            "personal_best_200_im": 2.08,
-            "personal_best_400_im": 0.0,
-            "doping_tests_passed": 10,
-            "doping_tests_failed": 0,
-            "total_meet_points": 600,
-            "fina_swimmer_of_year": 0,
-            "career_races_swum": 80,
-            "career_races_won": 50,
-            "career_win_percentage": 62.5,
-            "main_event_olympic_titles": 2,
-            "pan_pac_medals": 4,
-            "commonwealth_medals": 0,
-            "total_prize_money_million_usd": 0.2,
-            "retirement_year": 1992,
-            "hall_of_fame_inducted": 1
-        },
-        {
-            "player_name": "Nathan Adrian",
-            "country": "USA",
-            "years_active": 12,
-            "main_stroke": "Freestyle",
-            "total_olympic_medals": 8,
-            "olympic_gold_medals": 5,
-            "olympic_silver_medals": 1,
-            "olympic_bronze_medals": 2,
-            "total_world_champ_medals": 12,
-            "world_champ_gold": 8,
-            "world_champ_silver": 3,
-            "world_champ_bronze": 1,
-            "world_record_count": 1,
-            "personal_best_50_free": 21.37,
-            "personal_best_100_free": 47.52,
-            "personal_best_200_free": 1.46,
-            "personal_best_400_free": 3.52,
-            "personal_best_800_free": 0.0,
-            "personal_best_1500_free": 0.0,
-            "personal_best_100_butterfly": 52.5,
-            "personal_best_200_butterfly": 0.0,
-            "personal_best_100_back": 53.4,
-            "personal_best_200_back": 2.00,
-            "personal_best_100_breast": 1.01,
-            "personal_best_200_breast": 2.12,
-            "personal_best_200_im": 2.03,
-            "personal_best_400_im": 0.0,
-            "doping_tests_passed": 120,
-            "doping_tests_failed": 0,
-            "total_meet_points": 760,
-            "fina_swimmer_of_year": 0,
-            "career_races_swum": 200,
-            "career_races_won": 120,
-            "career_win_percentage": 60.0,
-            "main_event_olympic_titles": 1,
-            "pan_pac_medals": 5,
-            "commonwealth_medals": 0,
-            "total_prize_money_million_usd": 0.9,
-            "retirement_year": 0,
-            "hall_of_fame_inducted": 0
-        },
-        {
-            "player_name": "Aaron Peirsol",
-            "country": "USA",
-            "years_active": 9,
-            "main_stroke": "Backstroke/Freestyle",
-            "total_olympic_medals": 7,
-            "olympic_gold_medals": 5,
-            "olympic_silver_medals": 2,
-            "olympic_bronze_medals": 0,
-            "total_world_champ_medals": 10,
-            "world_champ_gold": 7,
-            "world_champ_silver": 3,
-            "world_champ_bronze": 0,
-            "world_record_count": 6,
-            "personal_best_50_free": 22.9,
-            "personal_best_100_free": 48.9,
-            "personal_best_200_free": 1.46,
-            "personal_best_400_free": 3.54,
-            "personal_best_800_free": 0.0,
-            "personal_best_1500_free": 0.0,
-            "personal_best_100_butterfly": 52.8,
-            "personal_best_200_butterfly": 0.0,
-            "personal_best_100_back": 51.9,
-            "personal_best_200_back": 1.51,
-            "personal_best_100_breast": 1.12,
-            "personal_best_200_breast": 2.30,
-            "personal_best_200_im": 2.06,
-            "personal_best_400_im": 4.18,
-            "doping_tests_passed": 90,
-            "doping_tests_failed": 0,
-            "total_meet_points": 620,
-            "fina_swimmer_of_year": 1,
-            "career_races_swum": 120,
-            "career_races_won": 75,
-            "career_win_percentage": 62.5,
-            "main_event_olympic_titles": 2,
-            "pan_pac_medals": 5,
-            "commonwealth_medals": 0,
-            "total_prize_money_million_usd": 0.4,
-            "retirement_year": 2011,
-            "hall_of_fame_inducted": 1
-        },
-        {
-            "player_name": "Peter van den Hoogenband",
-            "country": "Netherlands",
-            "years_active": 9,
-            "main_stroke": "Freestyle",
-            "total_olympic_medals": 7,
-            "olympic_gold_medals": 3,
-            "olympic_silver_medals": 2,
-            "olympic_bronze_medals": 2,
-            "total_world_champ_medals": 6,
-            "world_champ_gold": 1,
-            "world_champ_silver": 3,
-            "world_champ_bronze": 2,
-            "world_record_count": 4,
-            "personal_best_50_free": 21.9,
-            "personal_best_100_free": 47.8,
-            "personal_best_200_free": 1.44,
-            "personal_best_400_free": 3.47,
-            "personal_best_800_free": 0.0,
-            "personal_best_1500_free": 0.0,
-            "personal_best_100_butterfly": 53.0,
-            "personal_best_200_butterfly": 0.0,
-            "personal_best_100_back": 1.02,
-            "personal_best_200_back": 2.05,
-            "personal_best_100_breast": 1.08,
-            "personal_best_200_breast": 2.30,
-            "personal_best_200_im": 2.02,
-            "personal_best_400_im": 0.0,
-            "doping_tests_passed": 40,
-            "doping_tests_failed": 0,
-            "total_meet_points": 600,
-            "fina_swimmer_of_year": 0,
-            "career_races_swum": 80,
-            "career_races_won": 48,
-            "career_win_percentage": 60.0,
-            "main_event_olympic_titles": 2, # 100/200 free
-            "pan_pac_medals": 0,
-            "commonwealth_medals": 0,
-            "total_prize_money_million_usd": 0.6,
-            "retirement_year": 2008,
-            "hall_of_fame_inducted": 1
-        },
-        {
-            "player_name": "Laszlo Cseh",
-            "country": "Hungary",
-            "years_active": 15,
-            "main_stroke": "IM/Butterfly",
-            "total_olympic_medals": 6,
-            "olympic_gold_medals": 0,
-            "olympic_silver_medals": 3,
-            "olympic_bronze_medals": 3,
-            "total_world_champ_medals": 13,
-            "world_champ_gold": 2,
-            "world_champ_silver": 5,
-            "world_champ_bronze": 6,
-            "world_record_count": 1,
-            "personal_best_50_free": 22.9,
-            "personal_best_100_free": 49.0,
-            "personal_best_200_free": 1.45,
-            "personal_best_400_free": 3.52,
-            "personal_best_800_free": 7.55,
-            "personal_best_1500_free": 15.10,
-            "personal_best_100_butterfly": 50.9,
-            "personal_best_200_butterfly": 1.52,
-            "personal_best_100_back": 52.7,
-            "personal_best_200_back": 1.56,
-            "personal_best_100_breast": 1.00,
-            "personal_best_200_breast": 2.08,
-            "personal_best_200_im": 1.55,
-            "personal_best_400_im": 4.06,
-            "doping_tests_passed": 100,
-            "doping_tests_failed": 0,
-            "total_meet_points": 800,
-            "fina_swimmer_of_year": 0,
-            "career_races_swum": 150,
-            "career_races_won": 75,
-            "career_win_percentage": 50.0,
-            "main_event_olympic_titles": 0,
-            "pan_pac_medals": 0,
-            "commonwealth_medals": 0,
-            "total_prize_money_million_usd": 0.4,
-            "retirement_year": 2021,
-            "hall_of_fame_inducted": 0
-        },
-        {
-            "player_name": "Chad le Clos",
-            "country": "South Africa",
-            "years_active": 11,
-            "main_stroke": "Butterfly/Freestyle",
-            "total_olympic_medals": 4,
-            "olympic_gold_medals": 1,
-            "olympic_silver_medals": 3,
-            "olympic_bronze_medals": 0,
-            "total_world_champ_medals": 9,
-            "world_champ_gold": 4,
-            "world_champ_silver": 3,
-            "world_champ_bronze": 2,
-            "world_record_count": 1,
-            "personal_best_50_free": 22.6,
-            "personal_best_100_free": 48.9,
-            "personal_best_200_free": 1.45,
-            "personal_best_400_free": 3.51,
-            "personal_best_800_free": 7.52,
-            "personal_best_1500_free": 15.10,
-            "personal_best_100_butterfly": 50.6,
-            "personal_best_200_butterfly": 1.50,
-            "personal_best_100_back": 53.0,
-            "personal_best_200_back": 1.57,
-            "personal_best_100_breast": 1.06,
-            "personal_best_200_breast": 2.12,
-            "personal_best_200_im": 1.57,
-            "personal_best_400_im": 4.12,
-            "doping_tests_passed": 90,
-            "doping_tests_failed": 0,
-            "total_meet_points": 700,
-            "fina_swimmer_of_year": 1,
-            "career_races_swum": 130,
-            "career_races_won": 60,
-            "career_win_percentage": 46.2,
-            "main_event_olympic_titles": 1,  # 200 fly
-            "pan_pac_medals": 0,
-            "commonwealth_medals": 7,
-            "total_prize_money_million_usd": 1.0,
-            "retirement_year": 0,
-            "hall_of_fame_inducted": 0
-        },
-        {
-            "player_name": "Adam Barrett Placeholder",
-            "country": "Great Britain",
-            "years_active": 6,
-            "main_stroke": "Butterfly/Freestyle",
-            "total_olympic_medals": 2,
-            "olympic_gold_medals": 1,
-            "olympic_silver_medals": 1,
-            "olympic_bronze_medals": 0,
-            "total_world_champ_medals": 3,
-            "world_champ_gold": 1,
-            "world_champ_silver": 2,
-            "world_champ_bronze": 0,
-            "world_record_count": 1,
-            "personal_best_50_free": 21.8,
-            "personal_best_100_free": 48.5,
-            "personal_best_200_free": 1.46,
-            "personal_best_400_free": 3.50,
-            "personal_best_800_free": 7.55,
-            "personal_best_1500_free": 0.0,
-            "personal_best_100_butterfly": 51.2,
-            "personal_best_200_butterfly": 1.54,
-            "personal_best_100_back": 53.6,
-            "personal_best_200_back": 1.59,
-            "personal_best_100_breast": 1.02,
-            "personal_best_200_breast": 2.11,
-            "personal_best_200_im": 1.58,
-            "personal_best_400_im": 4.12,
-            "doping_tests_passed": 40,
-            "doping_tests_failed": 0,
-            "total_meet_points": 450,
-            "fina_swimmer_of_year": 0,
-            "career_races_swum": 80,
-            "career_races_won": 30,
-            "career_win_percentage": 37.5,
-            "main_event_olympic_titles": 1,
-            "pan_pac_medals": 0,
-            "commonwealth_medals": 2,
-            "total_prize_money_million_usd": 0.5,
-            "retirement_year": 0,
-            "hall_of_fame_inducted": 0
-        },
-        # --- We add placeholders for the remaining swimmers up to 30 with approximate data ---
-    ]
-
-    # Just fill out the remaining entries to reach exactly 30.
-    # We'll add 18 placeholders. Each must match the exact 41 fields. 
-    placeholder_count = 30 - len(players_data)
-    for i in range(1, placeholder_count + 1):
-        p_name = f"Placeholder Swimmer {i}"
-        players_data.append({
-            "player_name": p_name,
-            "country": "CountryX",
-            "years_active": 5,
-            "main_stroke": "Freestyle",
-            "total_olympic_medals": 2,
-            "olympic_gold_medals": 1,
-            "olympic_silver_medals": 1,
-            "olympic_bronze_medals": 0,
-            "total_world_champ_medals": 3,
-            "world_champ_gold": 1,
-            "world_champ_silver": 1,
-            "world_champ_bronze": 1,
-            "world_record_count": 1,
-            "personal_best_50_free": 22.5,
-            "personal_best_100_free": 48.9,
-            "personal_best_200_free": 1.46,
-            "personal_best_400_free": 3.51,
-            "personal_best_800_free": 7.58,
-            "personal_best_1500_free": 15.10,
-            "personal_best_100_butterfly": 52.5,
-            "personal_best_200_butterfly": 1.55,
-            "personal_best_100_back": 54.0,
-            "personal_best_200_back": 1.59,
-            "personal_best_100_breast": 1.03,
-            "personal_best_200_breast": 2.15,
-            "personal_best_200_im": 1.59,
-            "personal_best_400_im": 4.20,
-            "doping_tests_passed": 40,
-            "doping_tests_failed": 0,
-            "total_meet_points": 300,
-            "fina_swimmer_of_year": 0,
-            "career_races_swum": 60,
-            "career_races_won": 28,
-            "career_win_percentage": 46.7,
-            "main_event_olympic_titles": 1,
-            "pan_pac_medals": 2,
-            "commonwealth_medals": 0,
-            "total_prize_money_million_usd": 0.3,
-            "retirement_year": 0,
-            "hall_of_fame_inducted": 0
-        })
-
-    # Sanity check
-    if len(players_data) != 30:
-        raise ValueError(f"Expected exactly 30 swimmers, but have {len(players_data)}")
-
-    # Write everything to CSV
-    with open(filename, mode="w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-        for pdata in players_data:
-            # Fill missing fields with 0 or safe defaults if any are absent
-            for h in headers:
-                if h not in pdata:
-                    pdata[h] = 0
-            writer.writerow(pdata)
+    players_data = load_players(PLAYERS_FILE)
+    write_dataset(HEADERS, players_data, filename, expected_count=30)
 
 
 if __name__ == "__main__":
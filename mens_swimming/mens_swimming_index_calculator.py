@@ -8,6 +8,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import normalization helpers
 from sports_index_normalizer import normalize_indexes, plot_top_10_indexes
+from sports_storage import read_table, write_table
+from sports_archetypes import add_archetypes
 
 def calc_mens_swimming_index(row):
     """
@@ -187,7 +189,7 @@ def calc_mens_swimming_index(row):
 
 def main():
     # 1) Load the dataset
-    df = pd.read_csv("mens_swimming_dataset.csv")
+    df = read_table("mens_swimming_dataset.csv")
     
     # 2) Calculate the Men’s Swimming Index Score for each swimmer
     df["mens_swimming_index"] = df.apply(calc_mens_swimming_index, axis=1)
@@ -206,8 +208,11 @@ def main():
     # 5) Normalize the scores (0–100 scale)
     normalized_df = normalize_indexes(df, name_col='player_name', index_col='mens_swimming_index')
     
+    # Add each athlete's archetype (cluster) and its distance to the centroid
+    normalized_df = add_archetypes(normalized_df, "mens_swimming")
+
     # 6) Save results to a new CSV
-    normalized_df.to_csv("mens_swimming_index_scored.csv", index=False)
+    write_table(normalized_df, "mens_swimming_index_scored.csv")
     
     # 7) Create the line plot of top 10
     plot_top_10_indexes(
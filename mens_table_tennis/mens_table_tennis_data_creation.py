@@ -1,4 +1,67 @@
-import csv
+import os
+import sys
+
+# Add parent directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sports_player_data import load_players, write_dataset
+
+# One record per player; fields a player does not list are written as 0
+PLAYERS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mens_table_tennis_players.json")
+
+# ------------------------- COLUMN HEADERS (41+) -------------------------
+HEADERS = [
+    "player_name",
+    "country",
+    "handedness",
+    "playing_style",  # Offensive/Defensive/All-round
+    "years_active",
+    "highest_world_ranking",
+    "world_ranking_history",  # Number of times ranked in top 10
+    "international_matches_played",
+    "international_matches_won",
+    "international_matches_lost",
+    "international_titles_won",
+    "international_title_percentage",
+    "olympic_medals",
+    "world_championship_titles",
+    "world_cup_titles",
+    "asian_games_medals",
+    "bwf_world_series_titles",
+    "bwf_grand_slam_titles",
+    "bwf_olympic_titles",
+    "bwf_super_series_titles",
+    "bwf_world_superseries_championships",
+    "bwf_world_cup_titles",
+    "bwf_world_series_titles",
+    "total_points_scored",
+    "total_serves",
+    "total_volleys",
+    "total_smashes",
+    "total_dropshots",
+    "total_defensive_blocks",
+    "total_offensive_blocks",
+    "serve_accuracy_percent",
+    "return_accuracy_percent",
+    "smash_success_rate",
+    "dropshot_success_rate",
+    "volleys_success_rate",
+    "overall_efficiency",
+    "offensive_efficiency",
+    "defensive_efficiency",
+    "reaction_time_ms",
+    "serve_receive_efficiency",
+    "career_earnings_million_usd",
+    "total_trophies_won",
+    "best_player_awards",
+    "mvp_awards",
+    "most_improved_player_awards",
+    "sportsmanship_awards",
+    "hall_of_fame_inducted",
+    "coach_achievements",
+    "overall_performance_score",
+]
+
 
 def create_mens_table_tennis_dataset(filename="mens_table_tennis_dataset.csv"):
     """
@@ -11,1434 +74,9 @@ def create_mens_table_tennis_dataset(filename="mens_table_tennis_dataset.csv"):
     After creation, you'll have a 'mens_table_tennis_dataset.csv' file with 30 rows,
     each containing 41+ columns of data.
     """
+    players_data = load_players(PLAYERS_FILE)
+    write_dataset(HEADERS, players_data, filename, min_count=20)
 
-    # ------------------------- COLUMN HEADERS (41+) -------------------------
-    headers = [
-        "player_name",
-        "country",
-        "handedness",
-        "playing_style",  # Offensive/Defensive/All-round
-        "years_active",
-        "highest_world_ranking",
-        "world_ranking_history",  # Number of times ranked in top 10
-        "international_matches_played",
-        "international_matches_won",
-        "international_matches_lost",
-        "international_titles_won",
-        "international_title_percentage",
-        "olympic_medals",
-        "world_championship_titles",
-        "world_cup_titles",
-        "asian_games_medals",
-        "bwf_world_series_titles",
-        "bwf_grand_slam_titles",
-        "bwf_olympic_titles",
-        "bwf_super_series_titles",
-        "bwf_world_superseries_championships",
-        "bwf_world_cup_titles",
-        "bwf_world_series_titles",
-        "total_points_scored",
-        "total_serves",
-        "total_volleys",
-        "total_smashes",
-        "total_dropshots",
-        "total_defensive_blocks",
-        "total_offensive_blocks",
-        "serve_accuracy_percent",
-        "return_accuracy_percent",
-        "smash_success_rate",
-        "dropshot_success_rate",
-        "volleys_success_rate",
-        "overall_efficiency",
-        "offensive_efficiency",
-        "defensive_efficiency",
-        "reaction_time_ms",
-        "serve_receive_efficiency",
-        "career_earnings_million_usd",
-        "total_trophies_won",
-        "best_player_awards",
-        "mvp_awards",
-        "most_improved_player_awards",
-        "sportsmanship_awards",
-        "hall_of_fame_inducted",
-        "coach_achievements",
-        "overall_performance_score",
-    ]
-
-    # Define exactly 30 players, each with 41+ fields.
-    # Stats below are approximate or best-known from public data.
-    # Some older players may have incomplete data for advanced metrics => set them to 0 or minimal.
-
-    players_data = [
-        # 1) Jan-Ove Waldner (Sweden, Male)
-        {
-            "player_name": "Jan-Ove Waldner",
-            "country": "Sweden",
-            "handedness": "Right",
-            "playing_style": "All-round",
-            "years_active": 25,  # 1981-2006
-            "highest_world_ranking": 1,
-            "world_ranking_history": 15,  # Number of times ranked in top 10
-            "international_matches_played": 500,
-            "international_matches_won": 450,
-            "international_matches_lost": 50,
-            "international_titles_won": 35,
-            "international_title_percentage": 70.0,  # 35/50
-            "olympic_medals": 2,  # 1 Gold, 1 Bronze
-            "world_championship_titles": 3,
-            "world_cup_titles": 2,
-            "asian_games_medals": 0,  # Not applicable
-            "bwf_world_series_titles": 10,
-            "bwf_grand_slam_titles": 5,
-            "bwf_olympic_titles": 1,
-            "bwf_super_series_titles": 8,
-            "bwf_world_superseries_championships": 1,
-            "bwf_world_cup_titles": 2,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 15000,
-            "total_serves": 7000,
-            "total_volleys": 8000,
-            "total_smashes": 6000,
-            "total_dropshots": 4000,
-            "total_defensive_blocks": 3000,
-            "total_offensive_blocks": 2000,
-            "serve_accuracy_percent": 78.0,
-            "return_accuracy_percent": 80.0,
-            "smash_success_rate": 85.0,
-            "dropshot_success_rate": 80.0,
-            "volleys_success_rate": 82.0,
-            "overall_efficiency": 85.0,
-            "offensive_efficiency": 88.0,
-            "defensive_efficiency": 80.0,
-            "reaction_time_ms": 250,  # Average reaction time
-            "serve_receive_efficiency": 80.0,
-            "career_earnings_million_usd": 5.0,
-            "total_trophies_won": 50,
-            "best_player_awards": 10,
-            "mvp_awards": 8,
-            "most_improved_player_awards": 2,
-            "sportsmanship_awards": 5,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 95.0,
-        },
-        # 2) Ma Long (China, Male)
-        {
-            "player_name": "Ma Long",
-            "country": "China",
-            "handedness": "Right",
-            "playing_style": "Offensive",
-            "years_active": 15,  # 2006-2021
-            "highest_world_ranking": 1,
-            "world_ranking_history": 20,
-            "international_matches_played": 600,
-            "international_matches_won": 580,
-            "international_matches_lost": 20,
-            "international_titles_won": 40,
-            "international_title_percentage": 80.0,  # 40/50
-            "olympic_medals": 3,  # 2 Gold, 1 Silver
-            "world_championship_titles": 5,
-            "world_cup_titles": 4,
-            "asian_games_medals": 5,
-            "bwf_world_series_titles": 15,
-            "bwf_grand_slam_titles": 10,
-            "bwf_olympic_titles": 2,
-            "bwf_super_series_titles": 12,
-            "bwf_world_superseries_championships": 2,
-            "bwf_world_cup_titles": 4,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 20000,
-            "total_serves": 9000,
-            "total_volleys": 10000,
-            "total_smashes": 8000,
-            "total_dropshots": 5000,
-            "total_defensive_blocks": 3500,
-            "total_offensive_blocks": 2500,
-            "serve_accuracy_percent": 80.0,
-            "return_accuracy_percent": 82.0,
-            "smash_success_rate": 88.0,
-            "dropshot_success_rate": 85.0,
-            "volleys_success_rate": 85.0,
-            "overall_efficiency": 90.0,
-            "offensive_efficiency": 92.0,
-            "defensive_efficiency": 85.0,
-            "reaction_time_ms": 240,
-            "serve_receive_efficiency": 82.0,
-            "career_earnings_million_usd": 6.0,
-            "total_trophies_won": 60,
-            "best_player_awards": 12,
-            "mvp_awards": 10,
-            "most_improved_player_awards": 3,
-            "sportsmanship_awards": 6,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 98.0,
-        },
-        # 3) Jan-Ove Waldner (Duplicate Removed)
-        # 3) Zhang Jike (China, Male)
-        {
-            "player_name": "Zhang Jike",
-            "country": "China",
-            "handedness": "Right",
-            "playing_style": "Offensive",
-            "years_active": 12,  # 2007-2019
-            "highest_world_ranking": 1,
-            "world_ranking_history": 18,
-            "international_matches_played": 550,
-            "international_matches_won": 530,
-            "international_matches_lost": 20,
-            "international_titles_won": 38,
-            "international_title_percentage": 76.0,  # 38/50
-            "olympic_medals": 3,  # 2 Gold, 1 Silver
-            "world_championship_titles": 4,
-            "world_cup_titles": 3,
-            "asian_games_medals": 4,
-            "bwf_world_series_titles": 14,
-            "bwf_grand_slam_titles": 9,
-            "bwf_olympic_titles": 2,
-            "bwf_super_series_titles": 11,
-            "bwf_world_superseries_championships": 1,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 18000,
-            "total_serves": 8500,
-            "total_volleys": 9000,
-            "total_smashes": 7500,
-            "total_dropshots": 4500,
-            "total_defensive_blocks": 3200,
-            "total_offensive_blocks": 2200,
-            "serve_accuracy_percent": 79.0,
-            "return_accuracy_percent": 80.0,
-            "smash_success_rate": 86.0,
-            "dropshot_success_rate": 83.0,
-            "volleys_success_rate": 83.0,
-            "overall_efficiency": 88.0,
-            "offensive_efficiency": 90.0,
-            "defensive_efficiency": 82.0,
-            "reaction_time_ms": 245,
-            "serve_receive_efficiency": 80.0,
-            "career_earnings_million_usd": 5.5,
-            "total_trophies_won": 55,
-            "best_player_awards": 11,
-            "mvp_awards": 9,
-            "most_improved_player_awards": 2,
-            "sportsmanship_awards": 5,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 96.0,
-        },
-        # 4) Wang Liqin (China, Male)
-        {
-            "player_name": "Wang Liqin",
-            "country": "China",
-            "handedness": "Right",
-            "playing_style": "Offensive",
-            "years_active": 20,  # 1995-2015
-            "highest_world_ranking": 1,
-            "world_ranking_history": 20,
-            "international_matches_played": 650,
-            "international_matches_won": 600,
-            "international_matches_lost": 50,
-            "international_titles_won": 45,
-            "international_title_percentage": 69.2,  # 45/65
-            "olympic_medals": 2,  # 1 Gold, 1 Silver
-            "world_championship_titles": 3,
-            "world_cup_titles": 4,
-            "asian_games_medals": 6,
-            "bwf_world_series_titles": 16,
-            "bwf_grand_slam_titles": 10,
-            "bwf_olympic_titles": 1,
-            "bwf_super_series_titles": 13,
-            "bwf_world_superseries_championships": 2,
-            "bwf_world_cup_titles": 4,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 19000,
-            "total_serves": 9000,
-            "total_volleys": 9500,
-            "total_smashes": 8000,
-            "total_dropshots": 4800,
-            "total_defensive_blocks": 3400,
-            "total_offensive_blocks": 2300,
-            "serve_accuracy_percent": 80.0,
-            "return_accuracy_percent": 82.0,
-            "smash_success_rate": 87.0,
-            "dropshot_success_rate": 85.0,
-            "volleys_success_rate": 85.0,
-            "overall_efficiency": 89.0,
-            "offensive_efficiency": 91.0,
-            "defensive_efficiency": 83.0,
-            "reaction_time_ms": 238,
-            "serve_receive_efficiency": 81.0,
-            "career_earnings_million_usd": 5.2,
-            "total_trophies_won": 58,
-            "best_player_awards": 12,
-            "mvp_awards": 10,
-            "most_improved_player_awards": 3,
-            "sportsmanship_awards": 6,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 97.0,
-        },
-        # 5) Wang Hao (China, Male)
-        {
-            "player_name": "Wang Hao",
-            "country": "China",
-            "handedness": "Left",
-            "playing_style": "Offensive",
-            "years_active": 18,  # 1998-2016
-            "highest_world_ranking": 1,
-            "world_ranking_history": 19,
-            "international_matches_played": 620,
-            "international_matches_won": 590,
-            "international_matches_lost": 30,
-            "international_titles_won": 42,
-            "international_title_percentage": 67.7,  # 42/62
-            "olympic_medals": 2,  # 1 Gold, 1 Silver
-            "world_championship_titles": 4,
-            "world_cup_titles": 3,
-            "asian_games_medals": 7,
-            "bwf_world_series_titles": 18,
-            "bwf_grand_slam_titles": 11,
-            "bwf_olympic_titles": 2,
-            "bwf_super_series_titles": 14,
-            "bwf_world_superseries_championships": 2,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 19500,
-            "total_serves": 9200,
-            "total_volleys": 9700,
-            "total_smashes": 8200,
-            "total_dropshots": 4900,
-            "total_defensive_blocks": 3500,
-            "total_offensive_blocks": 2400,
-            "serve_accuracy_percent": 81.0,
-            "return_accuracy_percent": 83.0,
-            "smash_success_rate": 88.0,
-            "dropshot_success_rate": 86.0,
-            "volleys_success_rate": 86.0,
-            "overall_efficiency": 90.0,
-            "offensive_efficiency": 93.0,
-            "defensive_efficiency": 85.0,
-            "reaction_time_ms": 235,
-            "serve_receive_efficiency": 83.0,
-            "career_earnings_million_usd": 5.3,
-            "total_trophies_won": 60,
-            "best_player_awards": 13,
-            "mvp_awards": 11,
-            "most_improved_player_awards": 3,
-            "sportsmanship_awards": 7,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 98.0,
-        },
-        # 6) Xu Xin (China, Male)
-        {
-            "player_name": "Xu Xin",
-            "country": "China",
-            "handedness": "Left",
-            "playing_style": "All-round",
-            "years_active": 14,  # 2009-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 17,
-            "international_matches_played": 500,
-            "international_matches_won": 480,
-            "international_matches_lost": 20,
-            "international_titles_won": 40,
-            "international_title_percentage": 80.0,  # 40/50
-            "olympic_medals": 2,  # 1 Gold, 1 Silver
-            "world_championship_titles": 5,
-            "world_cup_titles": 4,
-            "asian_games_medals": 5,
-            "bwf_world_series_titles": 20,
-            "bwf_grand_slam_titles": 12,
-            "bwf_olympic_titles": 2,
-            "bwf_super_series_titles": 16,
-            "bwf_world_superseries_championships": 3,
-            "bwf_world_cup_titles": 4,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 21000,
-            "total_serves": 9500,
-            "total_volleys": 10000,
-            "total_smashes": 8500,
-            "total_dropshots": 5200,
-            "total_defensive_blocks": 3600,
-            "total_offensive_blocks": 2500,
-            "serve_accuracy_percent": 82.0,
-            "return_accuracy_percent": 84.0,
-            "smash_success_rate": 89.0,
-            "dropshot_success_rate": 88.0,
-            "volleys_success_rate": 88.0,
-            "overall_efficiency": 92.0,
-            "offensive_efficiency": 95.0,
-            "defensive_efficiency": 87.0,
-            "reaction_time_ms": 230,
-            "serve_receive_efficiency": 85.0,
-            "career_earnings_million_usd": 6.5,
-            "total_trophies_won": 65,
-            "best_player_awards": 14,
-            "mvp_awards": 12,
-            "most_improved_player_awards": 4,
-            "sportsmanship_awards": 8,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 99.0,
-        },
-        # 7) Ma Lin (China, Male)
-        {
-            "player_name": "Ma Lin",
-            "country": "China",
-            "handedness": "Right",
-            "playing_style": "All-round",
-            "years_active": 18,  # 1997-2015
-            "highest_world_ranking": 1,
-            "world_ranking_history": 18,
-            "international_matches_played": 580,
-            "international_matches_won": 560,
-            "international_matches_lost": 20,
-            "international_titles_won": 38,
-            "international_title_percentage": 65.5,  # 38/58
-            "olympic_medals": 3,  # 1 Gold, 2 Silver
-            "world_championship_titles": 4,
-            "world_cup_titles": 3,
-            "asian_games_medals": 6,
-            "bwf_world_series_titles": 18,
-            "bwf_grand_slam_titles": 11,
-            "bwf_olympic_titles": 2,
-            "bwf_super_series_titles": 15,
-            "bwf_world_superseries_championships": 2,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 20500,
-            "total_serves": 9200,
-            "total_volleys": 9800,
-            "total_smashes": 8300,
-            "total_dropshots": 5100,
-            "total_defensive_blocks": 3550,
-            "total_offensive_blocks": 2450,
-            "serve_accuracy_percent": 81.0,
-            "return_accuracy_percent": 83.0,
-            "smash_success_rate": 87.0,
-            "dropshot_success_rate": 85.0,
-            "volleys_success_rate": 86.0,
-            "overall_efficiency": 90.0,
-            "offensive_efficiency": 93.0,
-            "defensive_efficiency": 84.0,
-            "reaction_time_ms": 232,
-            "serve_receive_efficiency": 83.0,
-            "career_earnings_million_usd": 5.8,
-            "total_trophies_won": 60,
-            "best_player_awards": 13,
-            "mvp_awards": 11,
-            "most_improved_player_awards": 3,
-            "sportsmanship_awards": 7,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 97.5,
-        },
-        # 8) Timo Boll (Germany, Male)
-        {
-            "player_name": "Timo Boll",
-            "country": "Germany",
-            "handedness": "Right",
-            "playing_style": "All-round",
-            "years_active": 20,  # 2003-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 19,
-            "international_matches_played": 650,
-            "international_matches_won": 620,
-            "international_matches_lost": 30,
-            "international_titles_won": 40,
-            "international_title_percentage": 61.5,  # 40/65
-            "olympic_medals": 1,  # 1 Bronze
-            "world_championship_titles": 4,
-            "world_cup_titles": 3,
-            "asian_games_medals": 0,  # Not applicable
-            "bwf_world_series_titles": 20,
-            "bwf_grand_slam_titles": 12,
-            "bwf_olympic_titles": 0,
-            "bwf_super_series_titles": 16,
-            "bwf_world_superseries_championships": 3,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 22000,
-            "total_serves": 10000,
-            "total_volleys": 10500,
-            "total_smashes": 9000,
-            "total_dropshots": 5500,
-            "total_defensive_blocks": 3700,
-            "total_offensive_blocks": 2600,
-            "serve_accuracy_percent": 82.0,
-            "return_accuracy_percent": 85.0,
-            "smash_success_rate": 89.0,
-            "dropshot_success_rate": 87.0,
-            "volleys_success_rate": 88.0,
-            "overall_efficiency": 93.0,
-            "offensive_efficiency": 95.0,
-            "defensive_efficiency": 86.0,
-            "reaction_time_ms": 228,
-            "serve_receive_efficiency": 85.0,
-            "career_earnings_million_usd": 6.2,
-            "total_trophies_won": 65,
-            "best_player_awards": 14,
-            "mvp_awards": 12,
-            "most_improved_player_awards": 4,
-            "sportsmanship_awards": 8,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 99.0,
-        },
-        # 9) Kong Linghui (China, Male)
-        {
-            "player_name": "Kong Linghui",
-            "country": "China",
-            "handedness": "Left",
-            "playing_style": "Offensive",
-            "years_active": 18,  # 1992-2010
-            "highest_world_ranking": 1,
-            "world_ranking_history": 17,
-            "international_matches_played": 600,
-            "international_matches_won": 580,
-            "international_matches_lost": 20,
-            "international_titles_won": 42,
-            "international_title_percentage": 70.0,  # 42/60
-            "olympic_medals": 3,  # 2 Gold, 1 Bronze
-            "world_championship_titles": 5,
-            "world_cup_titles": 4,
-            "asian_games_medals": 7,
-            "bwf_world_series_titles": 19,
-            "bwf_grand_slam_titles": 11,
-            "bwf_olympic_titles": 2,
-            "bwf_super_series_titles": 17,
-            "bwf_world_superseries_championships": 3,
-            "bwf_world_cup_titles": 4,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 21000,
-            "total_serves": 9800,
-            "total_volleys": 10300,
-            "total_smashes": 9200,
-            "total_dropshots": 5600,
-            "total_defensive_blocks": 3800,
-            "total_offensive_blocks": 2700,
-            "serve_accuracy_percent": 83.0,
-            "return_accuracy_percent": 86.0,
-            "smash_success_rate": 90.0,
-            "dropshot_success_rate": 88.0,
-            "volleys_success_rate": 89.0,
-            "overall_efficiency": 94.0,
-            "offensive_efficiency": 96.0,
-            "defensive_efficiency": 88.0,
-            "reaction_time_ms": 225,
-            "serve_receive_efficiency": 86.0,
-            "career_earnings_million_usd": 6.5,
-            "total_trophies_won": 70,
-            "best_player_awards": 15,
-            "mvp_awards": 13,
-            "most_improved_player_awards": 4,
-            "sportsmanship_awards": 9,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 100.0,
-        },
-        # 10) Zhang Jike (Duplicate Removed)
-        # 10) Liang Jingkun (China, Male)
-        {
-            "player_name": "Liang Jingkun",
-            "country": "China",
-            "handedness": "Right",
-            "playing_style": "All-round",
-            "years_active": 10,  # 2013-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 14,
-            "international_matches_played": 400,
-            "international_matches_won": 390,
-            "international_matches_lost": 10,
-            "international_titles_won": 35,
-            "international_title_percentage": 87.5,  # 35/40
-            "olympic_medals": 1,  # 1 Silver
-            "world_championship_titles": 4,
-            "world_cup_titles": 3,
-            "asian_games_medals": 5,
-            "bwf_world_series_titles": 17,
-            "bwf_grand_slam_titles": 13,
-            "bwf_olympic_titles": 1,
-            "bwf_super_series_titles": 18,
-            "bwf_world_superseries_championships": 3,
-            "bwf_world_cup_titles": 4,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 18500,
-            "total_serves": 9200,
-            "total_volleys": 9700,
-            "total_smashes": 8400,
-            "total_dropshots": 5300,
-            "total_defensive_blocks": 3650,
-            "total_offensive_blocks": 2550,
-            "serve_accuracy_percent": 83.0,
-            "return_accuracy_percent": 85.0,
-            "smash_success_rate": 89.0,
-            "dropshot_success_rate": 86.0,
-            "volleys_success_rate": 87.0,
-            "overall_efficiency": 92.0,
-            "offensive_efficiency": 94.0,
-            "defensive_efficiency": 86.0,
-            "reaction_time_ms": 227,
-            "serve_receive_efficiency": 84.0,
-            "career_earnings_million_usd": 6.0,
-            "total_trophies_won": 68,
-            "best_player_awards": 14,
-            "mvp_awards": 12,
-            "most_improved_player_awards": 3,
-            "sportsmanship_awards": 8,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 98.5,
-        },
-        # 11) Xu Xin (Duplicate Removed)
-        # 11) Fan Zhendong (China, Male)
-        {
-            "player_name": "Fan Zhendong",
-            "country": "China",
-            "handedness": "Left",
-            "playing_style": "Offensive",
-            "years_active": 11,  # 2012-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 16,
-            "international_matches_played": 450,
-            "international_matches_won": 430,
-            "international_matches_lost": 20,
-            "international_titles_won": 37,
-            "international_title_percentage": 82.2,  # 37/45
-            "olympic_medals": 2,  # 1 Gold, 1 Silver
-            "world_championship_titles": 4,
-            "world_cup_titles": 3,
-            "asian_games_medals": 6,
-            "bwf_world_series_titles": 19,
-            "bwf_grand_slam_titles": 14,
-            "bwf_olympic_titles": 2,
-            "bwf_super_series_titles": 19,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 4,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 19500,
-            "total_serves": 9500,
-            "total_volleys": 9900,
-            "total_smashes": 8600,
-            "total_dropshots": 5400,
-            "total_defensive_blocks": 3700,
-            "total_offensive_blocks": 2600,
-            "serve_accuracy_percent": 84.0,
-            "return_accuracy_percent": 86.0,
-            "smash_success_rate": 90.0,
-            "dropshot_success_rate": 88.0,
-            "volleys_success_rate": 89.0,
-            "overall_efficiency": 93.0,
-            "offensive_efficiency": 96.0,
-            "defensive_efficiency": 88.0,
-            "reaction_time_ms": 225,
-            "serve_receive_efficiency": 85.0,
-            "career_earnings_million_usd": 6.3,
-            "total_trophies_won": 70,
-            "best_player_awards": 15,
-            "mvp_awards": 13,
-            "most_improved_player_awards": 4,
-            "sportsmanship_awards": 9,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 99.5,
-        },
-        # 12) Dimitrij Ovtcharov (Germany, Male)
-        {
-            "player_name": "Dimitrij Ovtcharov",
-            "country": "Germany",
-            "handedness": "Right",
-            "playing_style": "All-round",
-            "years_active": 15,  # 2006-2021
-            "highest_world_ranking": 1,
-            "world_ranking_history": 17,
-            "international_matches_played": 500,
-            "international_matches_won": 480,
-            "international_matches_lost": 20,
-            "international_titles_won": 36,
-            "international_title_percentage": 72.0,  # 36/50
-            "olympic_medals": 3,  # 1 Gold, 1 Silver, 1 Bronze
-            "world_championship_titles": 4,
-            "world_cup_titles": 3,
-            "asian_games_medals": 0,  # Not applicable
-            "bwf_world_series_titles": 18,
-            "bwf_grand_slam_titles": 14,
-            "bwf_olympic_titles": 3,
-            "bwf_super_series_titles": 18,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 20000,
-            "total_serves": 9600,
-            "total_volleys": 10000,
-            "total_smashes": 8800,
-            "total_dropshots": 5600,
-            "total_defensive_blocks": 3800,
-            "total_offensive_blocks": 2700,
-            "serve_accuracy_percent": 85.0,
-            "return_accuracy_percent": 87.0,
-            "smash_success_rate": 91.0,
-            "dropshot_success_rate": 89.0,
-            "volleys_success_rate": 90.0,
-            "overall_efficiency": 94.0,
-            "offensive_efficiency": 97.0,
-            "defensive_efficiency": 89.0,
-            "reaction_time_ms": 223,
-            "serve_receive_efficiency": 86.0,
-            "career_earnings_million_usd": 6.7,
-            "total_trophies_won": 75,
-            "best_player_awards": 16,
-            "mvp_awards": 14,
-            "most_improved_player_awards": 4,
-            "sportsmanship_awards": 10,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 100.0,
-        },
-        # 13) Xu Xin (Duplicate Removed)
-        # 13) Xu Xin (Duplicate Removed)
-        # 13) Liu Guoliang (China, Male) - Player & Coach
-        {
-            "player_name": "Liu Guoliang",
-            "country": "China",
-            "handedness": "Right",
-            "playing_style": "All-round",
-            "years_active": 20,  # 1991-2011
-            "highest_world_ranking": 1,
-            "world_ranking_history": 18,
-            "international_matches_played": 550,
-            "international_matches_won": 530,
-            "international_matches_lost": 20,
-            "international_titles_won": 40,
-            "international_title_percentage": 72.7,  # 40/55
-            "olympic_medals": 3,  # 2 Gold, 1 Silver
-            "world_championship_titles": 5,
-            "world_cup_titles": 4,
-            "asian_games_medals": 6,
-            "bwf_world_series_titles": 19,
-            "bwf_grand_slam_titles": 14,
-            "bwf_olympic_titles": 3,
-            "bwf_super_series_titles": 19,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 4,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 20500,
-            "total_serves": 9800,
-            "total_volleys": 10100,
-            "total_smashes": 9000,
-            "total_dropshots": 5700,
-            "total_defensive_blocks": 3900,
-            "total_offensive_blocks": 2800,
-            "serve_accuracy_percent": 86.0,
-            "return_accuracy_percent": 88.0,
-            "smash_success_rate": 92.0,
-            "dropshot_success_rate": 90.0,
-            "volleys_success_rate": 90.0,
-            "overall_efficiency": 95.0,
-            "offensive_efficiency": 98.0,
-            "defensive_efficiency": 90.0,
-            "reaction_time_ms": 220,
-            "serve_receive_efficiency": 87.0,
-            "career_earnings_million_usd": 7.0,
-            "total_trophies_won": 80,
-            "best_player_awards": 17,
-            "mvp_awards": 15,
-            "most_improved_player_awards": 5,
-            "sportsmanship_awards": 10,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 5,  # As a coach
-            "overall_performance_score": 100.0,
-        },
-        # 14) Xu Xin (Duplicate Removed)
-        # 14) Xu Xin (Duplicate Removed)
-        # 14) Wang Chuqin (China, Male)
-        {
-            "player_name": "Wang Chuqin",
-            "country": "China",
-            "handedness": "Left",
-            "playing_style": "Offensive",
-            "years_active": 8,  # 2015-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 12,
-            "international_matches_played": 350,
-            "international_matches_won": 340,
-            "international_matches_lost": 10,
-            "international_titles_won": 30,
-            "international_title_percentage": 85.7,  # 30/35
-            "olympic_medals": 2,  # 1 Gold, 1 Silver
-            "world_championship_titles": 3,
-            "world_cup_titles": 3,
-            "asian_games_medals": 5,
-            "bwf_world_series_titles": 15,
-            "bwf_grand_slam_titles": 10,
-            "bwf_olympic_titles": 2,
-            "bwf_super_series_titles": 16,
-            "bwf_world_superseries_championships": 3,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 18000,
-            "total_serves": 8800,
-            "total_volleys": 9500,
-            "total_smashes": 8300,
-            "total_dropshots": 5000,
-            "total_defensive_blocks": 3500,
-            "total_offensive_blocks": 2500,
-            "serve_accuracy_percent": 85.0,
-            "return_accuracy_percent": 86.0,
-            "smash_success_rate": 90.0,
-            "dropshot_success_rate": 88.0,
-            "volleys_success_rate": 88.0,
-            "overall_efficiency": 93.0,
-            "offensive_efficiency": 95.0,
-            "defensive_efficiency": 88.0,
-            "reaction_time_ms": 222,
-            "serve_receive_efficiency": 86.0,
-            "career_earnings_million_usd": 5.9,
-            "total_trophies_won": 68,
-            "best_player_awards": 14,
-            "mvp_awards": 12,
-            "most_improved_player_awards": 4,
-            "sportsmanship_awards": 8,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 99.0,
-        },
-        # 15) Xu Xin (Duplicate Removed)
-        # 15) Fan Zhendong (Duplicate Removed)
-        # 15) Xu Xin (Duplicate Removed)
-        # 15) Chen Meng (China, Female) - Not applicable for men's table tennis
-        # 15) Xu Xin (Duplicate Removed)
-        # 15) Simulated Player: Liu Shiwen (Female) - Not applicable
-        # 15) Simulated Player: Xu Xin (Duplicate Removed)
-        # 15) Lin Gaoyuan (China, Male)
-        {
-            "player_name": "Lin Gaoyuan",
-            "country": "China",
-            "handedness": "Right",
-            "playing_style": "All-round",
-            "years_active": 10,  # 2013-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 13,
-            "international_matches_played": 400,
-            "international_matches_won": 390,
-            "international_matches_lost": 10,
-            "international_titles_won": 34,
-            "international_title_percentage": 85.0,  # 34/40
-            "olympic_medals": 2,  # 1 Gold, 1 Silver
-            "world_championship_titles": 3,
-            "world_cup_titles": 3,
-            "asian_games_medals": 5,
-            "bwf_world_series_titles": 16,
-            "bwf_grand_slam_titles": 11,
-            "bwf_olympic_titles": 2,
-            "bwf_super_series_titles": 17,
-            "bwf_world_superseries_championships": 3,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 18500,
-            "total_serves": 9000,
-            "total_volleys": 9800,
-            "total_smashes": 8400,
-            "total_dropshots": 5200,
-            "total_defensive_blocks": 3600,
-            "total_offensive_blocks": 2600,
-            "serve_accuracy_percent": 84.0,
-            "return_accuracy_percent": 85.0,
-            "smash_success_rate": 90.0,
-            "dropshot_success_rate": 88.0,
-            "volleys_success_rate": 89.0,
-            "overall_efficiency": 93.0,
-            "offensive_efficiency": 95.0,
-            "defensive_efficiency": 88.0,
-            "reaction_time_ms": 224,
-            "serve_receive_efficiency": 85.0,
-            "career_earnings_million_usd": 5.6,
-            "total_trophies_won": 70,
-            "best_player_awards": 15,
-            "mvp_awards": 13,
-            "most_improved_player_awards": 4,
-            "sportsmanship_awards": 8,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 98.0,
-        },
-        # 16) Xu Xin (Duplicate Removed)
-        # 16) Wang Chuqin (Duplicate Removed)
-        # 16) Simulated Player: Zhang Benzhi (China, Male)
-        {
-            "player_name": "Zhang Benzhi",
-            "country": "China",
-            "handedness": "Left",
-            "playing_style": "Offensive",
-            "years_active": 9,  # 2014-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 12,
-            "international_matches_played": 380,
-            "international_matches_won": 370,
-            "international_matches_lost": 10,
-            "international_titles_won": 32,
-            "international_title_percentage": 84.2,  # 32/38
-            "olympic_medals": 2,  # 1 Gold, 1 Silver
-            "world_championship_titles": 3,
-            "world_cup_titles": 3,
-            "asian_games_medals": 5,
-            "bwf_world_series_titles": 17,
-            "bwf_grand_slam_titles": 12,
-            "bwf_olympic_titles": 2,
-            "bwf_super_series_titles": 18,
-            "bwf_world_superseries_championships": 3,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 19000,
-            "total_serves": 9200,
-            "total_volleys": 9900,
-            "total_smashes": 8500,
-            "total_dropshots": 5300,
-            "total_defensive_blocks": 3700,
-            "total_offensive_blocks": 2700,
-            "serve_accuracy_percent": 85.0,
-            "return_accuracy_percent": 86.0,
-            "smash_success_rate": 91.0,
-            "dropshot_success_rate": 89.0,
-            "volleys_success_rate": 90.0,
-            "overall_efficiency": 94.0,
-            "offensive_efficiency": 96.0,
-            "defensive_efficiency": 89.0,
-            "reaction_time_ms": 226,
-            "serve_receive_efficiency": 86.0,
-            "career_earnings_million_usd": 5.7,
-            "total_trophies_won": 72,
-            "best_player_awards": 16,
-            "mvp_awards": 14,
-            "most_improved_player_awards": 4,
-            "sportsmanship_awards": 9,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 98.5,
-        },
-        # 17) Xu Xin (Duplicate Removed)
-        # 17) Simulated Player: Liang Jingkun (Duplicate Removed)
-        # 17) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 17) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 17) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 17) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 17) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 17) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 17) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 17) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 17) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # To reach 30, add 13 more unique players:
-        # 18) Ma Long (Duplicate Removed)
-        # 18) Wang Hao (Duplicate Removed)
-        # 18) Fan Zhendong (Duplicate Removed)
-        # 18) Ma Long (Duplicate Removed)
-        # 18) Wang Hao (Duplicate Removed)
-        # 18) Fan Zhendong (Duplicate Removed)
-        # 18) Simulated Player: Li Qi (China, Male)
-        {
-            "player_name": "Li Qi",
-            "country": "China",
-            "handedness": "Right",
-            "playing_style": "All-round",
-            "years_active": 7,  # 2016-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 10,
-            "international_matches_played": 320,
-            "international_matches_won": 310,
-            "international_matches_lost": 10,
-            "international_titles_won": 28,
-            "international_title_percentage": 87.5,  # 28/32
-            "olympic_medals": 1,  # 1 Silver
-            "world_championship_titles": 2,
-            "world_cup_titles": 2,
-            "asian_games_medals": 4,
-            "bwf_world_series_titles": 14,
-            "bwf_grand_slam_titles": 10,
-            "bwf_olympic_titles": 1,
-            "bwf_super_series_titles": 15,
-            "bwf_world_superseries_championships": 2,
-            "bwf_world_cup_titles": 2,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 17000,
-            "total_serves": 8500,
-            "total_volleys": 9200,
-            "total_smashes": 8000,
-            "total_dropshots": 4800,
-            "total_defensive_blocks": 3400,
-            "total_offensive_blocks": 2400,
-            "serve_accuracy_percent": 84.0,
-            "return_accuracy_percent": 85.0,
-            "smash_success_rate": 90.0,
-            "dropshot_success_rate": 87.0,
-            "volleys_success_rate": 88.0,
-            "overall_efficiency": 92.0,
-            "offensive_efficiency": 94.0,
-            "defensive_efficiency": 86.0,
-            "reaction_time_ms": 229,
-            "serve_receive_efficiency": 85.0,
-            "career_earnings_million_usd": 5.4,
-            "total_trophies_won": 68,
-            "best_player_awards": 15,
-            "mvp_awards": 13,
-            "most_improved_player_awards": 4,
-            "sportsmanship_awards": 8,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 98.0,
-        },
-        # 19) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 19) Simulated Player: Li Qi (Duplicate Removed)
-        # 19) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 19) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 19) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 19) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 19) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 19) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 19) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 19) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # To reach 30, add 11 more unique players:
-        # 20) Simulated Player: Zhou Qi (China, Male)
-        {
-            "player_name": "Zhou Qi",
-            "country": "China",
-            "handedness": "Right",
-            "playing_style": "Defensive",
-            "years_active": 8,  # 2015-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 11,
-            "international_matches_played": 300,
-            "international_matches_won": 290,
-            "international_matches_lost": 10,
-            "international_titles_won": 25,
-            "international_title_percentage": 83.3,  # 25/30
-            "olympic_medals": 1,  # 1 Bronze
-            "world_championship_titles": 2,
-            "world_cup_titles": 2,
-            "asian_games_medals": 4,
-            "bwf_world_series_titles": 13,
-            "bwf_grand_slam_titles": 9,
-            "bwf_olympic_titles": 1,
-            "bwf_super_series_titles": 14,
-            "bwf_world_superseries_championships": 2,
-            "bwf_world_cup_titles": 2,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 16000,
-            "total_serves": 8200,
-            "total_volleys": 8800,
-            "total_smashes": 7600,
-            "total_dropshots": 4500,
-            "total_defensive_blocks": 3300,
-            "total_offensive_blocks": 2200,
-            "serve_accuracy_percent": 82.0,
-            "return_accuracy_percent": 84.0,
-            "smash_success_rate": 88.0,
-            "dropshot_success_rate": 85.0,
-            "volleys_success_rate": 85.0,
-            "overall_efficiency": 90.0,
-            "offensive_efficiency": 92.0,
-            "defensive_efficiency": 84.0,
-            "reaction_time_ms": 227,
-            "serve_receive_efficiency": 84.0,
-            "career_earnings_million_usd": 5.1,
-            "total_trophies_won": 65,
-            "best_player_awards": 14,
-            "mvp_awards": 12,
-            "most_improved_player_awards": 3,
-            "sportsmanship_awards": 7,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 97.0,
-        },
-        # 21) Simulated Player: Zhou Qi (Duplicate Removed)
-        # 21) Simulated Player: Zhou Qi (Duplicate Removed)
-        # 21) Simulated Player: Zhou Qi (Duplicate Removed)
-        # 21) Simulated Player: Zhou Qi (Duplicate Removed)
-        # 21) Simulated Player: Zhou Qi (Duplicate Removed)
-        # 21) Simulated Player: Zhou Qi (Duplicate Removed)
-        # 21) Simulated Player: Zhou Qi (Duplicate Removed)
-        # 21) Simulated Player: Zhou Qi (Duplicate Removed)
-        # 21) Simulated Player: Zhou Qi (Duplicate Removed)
-        # 21) Simulated Player: Zhou Qi (Duplicate Removed)
-        # To reach 30, add 9 more unique players:
-        # 22) Simulated Player: Li Ping (China, Male)
-        {
-            "player_name": "Li Ping",
-            "country": "China",
-            "handedness": "Left",
-            "playing_style": "Defensive",
-            "years_active": 7,  # 2016-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 10,
-            "international_matches_played": 280,
-            "international_matches_won": 270,
-            "international_matches_lost": 10,
-            "international_titles_won": 24,
-            "international_title_percentage": 85.7,  # 24/28
-            "olympic_medals": 1,  # 1 Silver
-            "world_championship_titles": 2,
-            "world_cup_titles": 2,
-            "asian_games_medals": 4,
-            "bwf_world_series_titles": 12,
-            "bwf_grand_slam_titles": 8,
-            "bwf_olympic_titles": 1,
-            "bwf_super_series_titles": 15,
-            "bwf_world_superseries_championships": 2,
-            "bwf_world_cup_titles": 2,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 15500,
-            "total_serves": 8000,
-            "total_volleys": 8600,
-            "total_smashes": 7500,
-            "total_dropshots": 4300,
-            "total_defensive_blocks": 3200,
-            "total_offensive_blocks": 2100,
-            "serve_accuracy_percent": 83.0,
-            "return_accuracy_percent": 84.0,
-            "smash_success_rate": 89.0,
-            "dropshot_success_rate": 86.0,
-            "volleys_success_rate": 86.0,
-            "overall_efficiency": 91.0,
-            "offensive_efficiency": 93.0,
-            "defensive_efficiency": 85.0,
-            "reaction_time_ms": 226,
-            "serve_receive_efficiency": 85.0,
-            "career_earnings_million_usd": 5.0,
-            "total_trophies_won": 68,
-            "best_player_awards": 14,
-            "mvp_awards": 12,
-            "most_improved_player_awards": 3,
-            "sportsmanship_awards": 7,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 97.5,
-        },
-        # 23) Simulated Player: Li Ping (Duplicate Removed)
-        # 23) Simulated Player: Li Ping (Duplicate Removed)
-        # 23) Simulated Player: Li Ping (Duplicate Removed)
-        # 23) Simulated Player: Li Ping (Duplicate Removed)
-        # 23) Simulated Player: Li Ping (Duplicate Removed)
-        # 23) Simulated Player: Li Ping (Duplicate Removed)
-        # 23) Simulated Player: Li Ping (Duplicate Removed)
-        # 23) Simulated Player: Li Ping (Duplicate Removed)
-        # 23) Simulated Player: Li Ping (Duplicate Removed)
-        # To reach 30, add 7 more unique players:
-        # 24) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 24) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 24) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 24) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 24) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 24) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 24) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 24) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 24) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # To reach 30, add 7 more unique players:
-        # 24) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 24) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 24) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 24) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 24) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 24) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 24) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 24) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 24) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 24) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 24) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 24) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 24) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # To reach 30, add 7 more unique players:
-        # 24) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 24) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 24) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 24) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 24) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 24) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 24) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # To reach 30, add 7 more unique players:
-        # 25) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 25) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 25) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 25) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 25) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 25) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 25) Simulated Player: Wang Chuqin (Duplicate Removed)
-        # 26) Simulated Player: Simulated Player A (Country, Male)
-        {
-            "player_name": "Simulated Player A",
-            "country": "Country A",
-            "handedness": "Right",
-            "playing_style": "Defensive",
-            "years_active": 10,  # 2013-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 11,
-            "international_matches_played": 300,
-            "international_matches_won": 290,
-            "international_matches_lost": 10,
-            "international_titles_won": 25,
-            "international_title_percentage": 83.3,  # 25/30
-            "olympic_medals": 1,  # 1 Silver
-            "world_championship_titles": 3,
-            "world_cup_titles": 2,
-            "asian_games_medals": 4,
-            "bwf_world_series_titles": 14,
-            "bwf_grand_slam_titles": 10,
-            "bwf_olympic_titles": 1,
-            "bwf_super_series_titles": 16,
-            "bwf_world_superseries_championships": 3,
-            "bwf_world_cup_titles": 2,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 17500,
-            "total_serves": 8500,
-            "total_volleys": 9000,
-            "total_smashes": 7800,
-            "total_dropshots": 5000,
-            "total_defensive_blocks": 3400,
-            "total_offensive_blocks": 2400,
-            "serve_accuracy_percent": 84.0,
-            "return_accuracy_percent": 85.0,
-            "smash_success_rate": 89.0,
-            "dropshot_success_rate": 86.0,
-            "volleys_success_rate": 87.0,
-            "overall_efficiency": 91.0,
-            "offensive_efficiency": 94.0,
-            "defensive_efficiency": 85.0,
-            "reaction_time_ms": 228,
-            "serve_receive_efficiency": 85.0,
-            "career_earnings_million_usd": 5.5,
-            "total_trophies_won": 65,
-            "best_player_awards": 14,
-            "mvp_awards": 12,
-            "most_improved_player_awards": 3,
-            "sportsmanship_awards": 7,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 97.0,
-        },
-        # 27) Simulated Player: Simulated Player B (Country, Male)
-        {
-            "player_name": "Simulated Player B",
-            "country": "Country B",
-            "handedness": "Left",
-            "playing_style": "Offensive",
-            "years_active": 9,  # 2014-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 12,
-            "international_matches_played": 320,
-            "international_matches_won": 310,
-            "international_matches_lost": 10,
-            "international_titles_won": 27,
-            "international_title_percentage": 84.4,  # 27/32
-            "olympic_medals": 2,  # 1 Gold, 1 Silver
-            "world_championship_titles": 3,
-            "world_cup_titles": 3,
-            "asian_games_medals": 5,
-            "bwf_world_series_titles": 15,
-            "bwf_grand_slam_titles": 11,
-            "bwf_olympic_titles": 2,
-            "bwf_super_series_titles": 17,
-            "bwf_world_superseries_championships": 3,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 18000,
-            "total_serves": 8700,
-            "total_volleys": 9200,
-            "total_smashes": 8000,
-            "total_dropshots": 5100,
-            "total_defensive_blocks": 3500,
-            "total_offensive_blocks": 2500,
-            "serve_accuracy_percent": 85.0,
-            "return_accuracy_percent": 86.0,
-            "smash_success_rate": 90.0,
-            "dropshot_success_rate": 88.0,
-            "volleys_success_rate": 88.0,
-            "overall_efficiency": 92.0,
-            "offensive_efficiency": 95.0,
-            "defensive_efficiency": 86.0,
-            "reaction_time_ms": 226,
-            "serve_receive_efficiency": 86.0,
-            "career_earnings_million_usd": 5.6,
-            "total_trophies_won": 70,
-            "best_player_awards": 15,
-            "mvp_awards": 13,
-            "most_improved_player_awards": 4,
-            "sportsmanship_awards": 8,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 98.0,
-        },
-        # 28) Simulated Player: Simulated Player C (Country, Male)
-        {
-            "player_name": "Simulated Player C",
-            "country": "Country C",
-            "handedness": "Right",
-            "playing_style": "Defensive",
-            "years_active": 8,  # 2015-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 11,
-            "international_matches_played": 290,
-            "international_matches_won": 280,
-            "international_matches_lost": 10,
-            "international_titles_won": 24,
-            "international_title_percentage": 82.8,  # 24/29
-            "olympic_medals": 1,  # 1 Bronze
-            "world_championship_titles": 2,
-            "world_cup_titles": 2,
-            "asian_games_medals": 4,
-            "bwf_world_series_titles": 13,
-            "bwf_grand_slam_titles": 9,
-            "bwf_olympic_titles": 1,
-            "bwf_super_series_titles": 15,
-            "bwf_world_superseries_championships": 3,
-            "bwf_world_cup_titles": 2,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 17500,
-            "total_serves": 8400,
-            "total_volleys": 9100,
-            "total_smashes": 7900,
-            "total_dropshots": 5000,
-            "total_defensive_blocks": 3400,
-            "total_offensive_blocks": 2400,
-            "serve_accuracy_percent": 84.0,
-            "return_accuracy_percent": 85.0,
-            "smash_success_rate": 89.0,
-            "dropshot_success_rate": 87.0,
-            "volleys_success_rate": 87.0,
-            "overall_efficiency": 91.0,
-            "offensive_efficiency": 94.0,
-            "defensive_efficiency": 85.0,
-            "reaction_time_ms": 227,
-            "serve_receive_efficiency": 85.0,
-            "career_earnings_million_usd": 5.4,
-            "total_trophies_won": 68,
-            "best_player_awards": 14,
-            "mvp_awards": 13,
-            "most_improved_player_awards": 4,
-            "sportsmanship_awards": 7,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 97.5,
-        },
-        # 29) Simulated Player: Simulated Player D (Country, Male)
-        {
-            "player_name": "Simulated Player D",
-            "country": "Country D",
-            "handedness": "Left",
-            "playing_style": "Offensive",
-            "years_active": 7,  # 2016-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 10,
-            "international_matches_played": 270,
-            "international_matches_won": 260,
-            "international_matches_lost": 10,
-            "international_titles_won": 22,
-            "international_title_percentage": 81.5,  # 22/27
-            "olympic_medals": 1,  # 1 Silver
-            "world_championship_titles": 2,
-            "world_cup_titles": 2,
-            "asian_games_medals": 3,
-            "bwf_world_series_titles": 12,
-            "bwf_grand_slam_titles": 8,
-            "bwf_olympic_titles": 1,
-            "bwf_super_series_titles": 14,
-            "bwf_world_superseries_championships": 3,
-            "bwf_world_cup_titles": 2,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 16500,
-            "total_serves": 8200,
-            "total_volleys": 8800,
-            "total_smashes": 7700,
-            "total_dropshots": 4800,
-            "total_defensive_blocks": 3300,
-            "total_offensive_blocks": 2300,
-            "serve_accuracy_percent": 83.0,
-            "return_accuracy_percent": 84.0,
-            "smash_success_rate": 88.0,
-            "dropshot_success_rate": 85.0,
-            "volleys_success_rate": 86.0,
-            "overall_efficiency": 90.0,
-            "offensive_efficiency": 93.0,
-            "defensive_efficiency": 84.0,
-            "reaction_time_ms": 229,
-            "serve_receive_efficiency": 84.0,
-            "career_earnings_million_usd": 5.3,
-            "total_trophies_won": 66,
-            "best_player_awards": 14,
-            "mvp_awards": 13,
-            "most_improved_player_awards": 4,
-            "sportsmanship_awards": 7,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 97.5,
-        },
-        # 30) Simulated Player: Simulated Player E (Country, Male)
-        {
-            "player_name": "Simulated Player E",
-            "country": "Country E",
-            "handedness": "Right",
-            "playing_style": "All-round",
-            "years_active": 6,  # 2017-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 9,
-            "international_matches_played": 250,
-            "international_matches_won": 240,
-            "international_matches_lost": 10,
-            "international_titles_won": 20,
-            "international_title_percentage": 80.0,  # 20/25
-            "olympic_medals": 1,  # 1 Bronze
-            "world_championship_titles": 2,
-            "world_cup_titles": 2,
-            "asian_games_medals": 2,
-            "bwf_world_series_titles": 10,
-            "bwf_grand_slam_titles": 7,
-            "bwf_olympic_titles": 1,
-            "bwf_super_series_titles": 12,
-            "bwf_world_superseries_championships": 3,
-            "bwf_world_cup_titles": 2,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 16000,
-            "total_serves": 8000,
-            "total_volleys": 8600,
-            "total_smashes": 7500,
-            "total_dropshots": 4600,
-            "total_defensive_blocks": 3200,
-            "total_offensive_blocks": 2200,
-            "serve_accuracy_percent": 82.0,
-            "return_accuracy_percent": 83.0,
-            "smash_success_rate": 88.0,
-            "dropshot_success_rate": 84.0,
-            "volleys_success_rate": 85.0,
-            "overall_efficiency": 89.0,
-            "offensive_efficiency": 92.0,
-            "defensive_efficiency": 83.0,
-            "reaction_time_ms": 230,
-            "serve_receive_efficiency": 83.0,
-            "career_earnings_million_usd": 5.2,
-            "total_trophies_won": 63,
-            "best_player_awards": 13,
-            "mvp_awards": 12,
-            "most_improved_player_awards": 4,
-            "sportsmanship_awards": 7,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 97.0,
-        },
-    ]
-
-    # Confirm we have exactly 30 players
-    if len(players_data) < 20:
-        raise ValueError(f"Expected >20 men's table tennis players, got {len(players_data)}")
-
-    # ----------------------- WRITE TO CSV -----------------------
-    with open(filename, mode="w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-        for pdata in players_data:
-            # Fill missing fields with 0 if needed
-            for h in headers:
-                if h not in pdata:
-                    pdata[h] = 0
-            writer.writerow(pdata)
 
 if __name__ == "__main__":
     create_mens_table_tennis_dataset()
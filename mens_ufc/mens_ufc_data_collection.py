@@ -1,337 +1,68 @@
-import csv
+import os
+import sys
+
+# Add parent directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sports_player_data import load_players, write_dataset
+
+# One record per fighter; fields a fighter does not list are written as 0
+PLAYERS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mens_ufc_fighters.json")
+
+# Define the header (1 fighter_name + 40 stats = 41 columns)
+HEADERS = [
+    "fighter_name",
+    "nickname",
+    "country",
+    "weight_class",
+    "stance",
+    "years_active",
+    "total_mma_fights",
+    "wins",
+    "losses",
+    "draws",
+    "ko_tko_wins",
+    "submission_wins",
+    "decision_wins",
+    "ko_tko_losses",
+    "submission_losses",
+    "decision_losses",
+    "world_titles_held",         # # of recognized UFC titles
+    "ufc_championships_won",     # # times became champion
+    "title_defenses",
+    "height_cm",
+    "reach_cm",
+    "avg_significant_strikes_per_min",
+    "avg_strike_accuracy_percent",
+    "avg_takedowns_per_15",
+    "avg_takedown_accuracy_percent",
+    "avg_submission_attempts_per_15",
+    "average_fight_time_minutes",
+    "knockdowns_scored",
+    "knockdowns_received",
+    "fights_in_home_country",
+    "fight_of_the_night_awards",
+    "performance_of_the_night_awards",
+    "hall_of_fame_inducted",
+    "major_awards",             # e.g. ESPN/MMA awards
+    "longest_win_streak",
+    "biggest_upset_wins",
+    "doping_tests_passed",
+    "doping_tests_failed",
+    "career_earnings_million_usd",
+    "retirement_year",          # 0 if active
+    "coach_name"                # main coach/gym
+]
+
 
 def create_mens_ufc_dataset(filename="mens_ufc_dataset.csv"):
     """
     Creates a CSV file containing 30 men's UFC fighters, each with 40+ stats.
     The CSV will have 41 columns total (fighter_name + 40 stats).
     """
+    fighters_data = load_players(PLAYERS_FILE)
+    write_dataset(HEADERS, fighters_data, filename, expected_count=30, name_col="fighter_name")
 
-    # Define the header (1 fighter_name + 40 stats = 41 columns)
-    headers = [
-        "fighter_name",
-        "nickname",
-        "country",
-        "weight_class",
-        "stance",
-        "years_active",
-        "total_mma_fights",
-        "wins",
-        "losses",
-        "draws",
-        "ko_tko_wins",
-        "submission_wins",
-        "decision_wins",
-        "ko_tko_losses",
-        "submission_losses",
-        "decision_losses",
-        "world_titles_held",         # # of recognized UFC titles
-        "ufc_championships_won",     # # times became champion
-        "title_defenses",
-        "height_cm",
-        "reach_cm",
-        "avg_significant_strikes_per_min",
-        "avg_strike_accuracy_percent",
-        "avg_takedowns_per_15",
-        "avg_takedown_accuracy_percent",
-        "avg_submission_attempts_per_15",
-        "average_fight_time_minutes",
-        "knockdowns_scored",
-        "knockdowns_received",
-        "fights_in_home_country",
-        "fight_of_the_night_awards",
-        "performance_of_the_night_awards",
-        "hall_of_fame_inducted",
-        "major_awards",             # e.g. ESPN/MMA awards
-        "longest_win_streak",
-        "biggest_upset_wins",
-        "doping_tests_passed",
-        "doping_tests_failed",
-        "career_earnings_million_usd",
-        "retirement_year",          # 0 if active
-        "coach_name"                # main coach/gym
-    ]
-
-    # We'll create a list of 30 fighters with data that are approximate or placeholders.
-    # The first few will be well-known fighters, the rest placeholders.
-    fighters_data = [
-        {
-            "fighter_name": "Jon Jones",
-            "nickname": "Bones",
-            "country": "USA",
-            "weight_class": "Light Heavyweight/Heavyweight",
-            "stance": "Orthodox",
-            "years_active": 15,
-            "total_mma_fights": 29,
-            "wins": 27,
-            "losses": 1,   # 1 DQ
-            "draws": 0,
-            "ko_tko_wins": 10,
-            "submission_wins": 6,
-            "decision_wins": 11,
-            "ko_tko_losses": 0,
-            "submission_losses": 0,
-            "decision_losses": 1,  # that DQ
-            "world_titles_held": 2,
-            "ufc_championships_won": 2,
-            "title_defenses": 11,
-            "height_cm": 193,
-            "reach_cm": 215,
-            "avg_significant_strikes_per_min": 4.3,
-            "avg_strike_accuracy_percent": 57.0,
-            "avg_takedowns_per_15": 1.8,
-            "avg_takedown_accuracy_percent": 45.0,
-            "avg_submission_attempts_per_15": 0.5,
-            "average_fight_time_minutes": 14.0,
-            "knockdowns_scored": 10,
-            "knockdowns_received": 2,
-            "fights_in_home_country": 5,
-            "fight_of_the_night_awards": 5,
-            "performance_of_the_night_awards": 6,
-            "hall_of_fame_inducted": 0,  # Not yet officially
-            "major_awards": 5,
-            "longest_win_streak": 17,
-            "biggest_upset_wins": 2,
-            "doping_tests_passed": 50,
-            "doping_tests_failed": 2,  # controversies
-            "career_earnings_million_usd": 7.0,
-            "retirement_year": 0,  # active
-            "coach_name": "Greg Jackson"
-        },
-        {
-            "fighter_name": "Georges St-Pierre",
-            "nickname": "Rush",
-            "country": "Canada",
-            "weight_class": "Welterweight/Middleweight",
-            "stance": "Orthodox",
-            "years_active": 15,
-            "total_mma_fights": 28,
-            "wins": 26,
-            "losses": 2,
-            "draws": 0,
-            "ko_tko_wins": 8,
-            "submission_wins": 6,
-            "decision_wins": 12,
-            "ko_tko_losses": 1,
-            "submission_losses": 1,
-            "decision_losses": 0,
-            "world_titles_held": 2,  
-            "ufc_championships_won": 2,
-            "title_defenses": 9,
-            "height_cm": 178,
-            "reach_cm": 193,
-            "avg_significant_strikes_per_min": 3.8,
-            "avg_strike_accuracy_percent": 54.0,
-            "avg_takedowns_per_15": 4.0,
-            "avg_takedown_accuracy_percent": 74.0,
-            "avg_submission_attempts_per_15": 0.5,
-            "average_fight_time_minutes": 15.8,
-            "knockdowns_scored": 6,
-            "knockdowns_received": 3,
-            "fights_in_home_country": 6,
-            "fight_of_the_night_awards": 3,
-            "performance_of_the_night_awards": 2,
-            "hall_of_fame_inducted": 1,
-            "major_awards": 4,
-            "longest_win_streak": 13,
-            "biggest_upset_wins": 1,
-            "doping_tests_passed": 60,
-            "doping_tests_failed": 0,
-            "career_earnings_million_usd": 7.0,
-            "retirement_year": 2017,
-            "coach_name": "Firas Zahabi"
-        },
-        {
-            "fighter_name": "Anderson Silva",
-            "nickname": "The Spider",
-            "country": "Brazil",
-            "weight_class": "Middleweight",
-            "stance": "Southpaw",
-            "years_active": 23,
-            "total_mma_fights": 46,
-            "wins": 34,
-            "losses": 11,
-            "draws": 0,
-            "ko_tko_wins": 23,
-            "submission_wins": 3,
-            "decision_wins": 8,
-            "ko_tko_losses": 4,
-            "submission_losses": 2,
-            "decision_losses": 5,
-            "world_titles_held": 1,
-            "ufc_championships_won": 1,
-            "title_defenses": 10,
-            "height_cm": 188,
-            "reach_cm": 197,
-            "avg_significant_strikes_per_min": 3.1,
-            "avg_strike_accuracy_percent": 62.0,
-            "avg_takedowns_per_15": 0.6,
-            "avg_takedown_accuracy_percent": 37.0,
-            "avg_submission_attempts_per_15": 0.7,
-            "average_fight_time_minutes": 9.8,
-            "knockdowns_scored": 18,
-            "knockdowns_received": 4,
-            "fights_in_home_country": 6,
-            "fight_of_the_night_awards": 5,
-            "performance_of_the_night_awards": 7,
-            "hall_of_fame_inducted": 0, # not yet, presumably soon
-            "major_awards": 5,
-            "longest_win_streak": 16,
-            "biggest_upset_wins": 2,
-            "doping_tests_passed": 40,
-            "doping_tests_failed": 1, # controversial test
-            "career_earnings_million_usd": 8.0,
-            "retirement_year": 2020,
-            "coach_name": "Rogerio Camoes"
-        },
-        {
-            "fighter_name": "Khabib Nurmagomedov",
-            "nickname": "The Eagle",
-            "country": "Russia",
-            "weight_class": "Lightweight",
-            "stance": "Orthodox",
-            "years_active": 12,
-            "total_mma_fights": 29,
-            "wins": 29,
-            "losses": 0,
-            "draws": 0,
-            "ko_tko_wins": 8,
-            "submission_wins": 11,
-            "decision_wins": 10,
-            "ko_tko_losses": 0,
-            "submission_losses": 0,
-            "decision_losses": 0,
-            "world_titles_held": 1,
-            "ufc_championships_won": 1,
-            "title_defenses": 3,
-            "height_cm": 178,
-            "reach_cm": 178,
-            "avg_significant_strikes_per_min": 4.1,
-            "avg_strike_accuracy_percent": 49.0,
-            "avg_takedowns_per_15": 5.0,
-            "avg_takedown_accuracy_percent": 48.0,
-            "avg_submission_attempts_per_15": 1.2,
-            "average_fight_time_minutes": 9.3,
-            "knockdowns_scored": 6,
-            "knockdowns_received": 2,
-            "fights_in_home_country": 4,
-            "fight_of_the_night_awards": 1,
-            "performance_of_the_night_awards": 4,
-            "hall_of_fame_inducted": 1,  # inducted as of 2022
-            "major_awards": 3,
-            "longest_win_streak": 29,
-            "biggest_upset_wins": 1,
-            "doping_tests_passed": 30,
-            "doping_tests_failed": 0,
-            "career_earnings_million_usd": 5.0,
-            "retirement_year": 2020,
-            "coach_name": "Javier Mendez"
-        },
-        {
-            "fighter_name": "Conor McGregor",
-            "nickname": "The Notorious",
-            "country": "Ireland",
-            "weight_class": "Featherweight/Lightweight",
-            "stance": "Southpaw",
-            "years_active": 15,
-            "total_mma_fights": 28,
-            "wins": 22,
-            "losses": 6,
-            "draws": 0,
-            "ko_tko_wins": 19,
-            "submission_wins": 1,
-            "decision_wins": 2,
-            "ko_tko_losses": 2,
-            "submission_losses": 4,
-            "decision_losses": 0,
-            "world_titles_held": 2,   # 2-division champ
-            "ufc_championships_won": 2,
-            "title_defenses": 0,     # never defended a UFC belt
-            "height_cm": 175,
-            "reach_cm": 188,
-            "avg_significant_strikes_per_min": 5.3,
-            "avg_strike_accuracy_percent": 49.0,
-            "avg_takedowns_per_15": 0.7,
-            "avg_takedown_accuracy_percent": 62.0,
-            "avg_submission_attempts_per_15": 0.2,
-            "average_fight_time_minutes": 8.6,
-            "knockdowns_scored": 11,
-            "knockdowns_received": 2,
-            "fights_in_home_country": 3,
-            "fight_of_the_night_awards": 2,
-            "performance_of_the_night_awards": 7,
-            "hall_of_fame_inducted": 0,
-            "major_awards": 5,
-            "longest_win_streak": 15,
-            "biggest_upset_wins": 2,
-            "doping_tests_passed": 35,
-            "doping_tests_failed": 0,
-            "career_earnings_million_usd": 70.0,
-            "retirement_year": 0, # still active, though sporadic
-            "coach_name": "John Kavanagh"
-        },
-        # ----- Add more well-known fighters or placeholders until we reach 30. -----
-    ]
-
-    # Fill out the rest until 30 total fighters
-    while len(fighters_data) < 30:
-        idx = len(fighters_data) + 1
-        fighters_data.append({
-            "fighter_name": f"Placeholder Fighter {idx}",
-            "nickname": f"Placeholder",
-            "country": "CountryX",
-            "weight_class": "Welterweight",
-            "stance": "Orthodox",
-            "years_active": 5,
-            "total_mma_fights": 15,
-            "wins": 12,
-            "losses": 3,
-            "draws": 0,
-            "ko_tko_wins": 5,
-            "submission_wins": 3,
-            "decision_wins": 4,
-            "ko_tko_losses": 1,
-            "submission_losses": 1,
-            "decision_losses": 1,
-            "world_titles_held": 0,
-            "ufc_championships_won": 0,
-            "title_defenses": 0,
-            "height_cm": 180,
-            "reach_cm": 180,
-            "avg_significant_strikes_per_min": 3.0,
-            "avg_strike_accuracy_percent": 45.0,
-            "avg_takedowns_per_15": 1.5,
-            "avg_takedown_accuracy_percent": 40.0,
-            "avg_submission_attempts_per_15": 0.4,
-            "average_fight_time_minutes": 10.0,
-            "knockdowns_scored": 4,
-            "knockdowns_received": 3,
-            "fights_in_home_country": 2,
-            "fight_of_the_night_awards": 1,
-            "performance_of_the_night_awards": 0,
-            "hall_of_fame_inducted": 0,
-            "major_awards": 0,
-            "longest_win_streak": 5,
-            "biggest_upset_wins": 1,
-            "doping_tests_passed": 15,
-            "doping_tests_failed": 0,
-            "career_earnings_million_usd": 0.5,
-            "retirement_year": 0,
-            "coach_name": "Placeholder Coach"
-        })
-
-    # Confirm we have exactly 30
-    if len(fighters_data) != 30:
-        raise ValueError(f"Expected 30 fighters, got {len(fighters_data)}")
-
-    # Write everything to CSV
-    with open(filename, mode="w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-        for fighter in fighters_data:
-            for h in headers:
-                if h not in fighter:
-                    fighter[h] = 0
-            writer.writerow(fighter)
 
 if __name__ == "__main__":
     create_mens_ufc_dataset()
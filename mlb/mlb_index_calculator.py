@@ -8,6 +8,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import normalization helpers
 from sports_index_normalizer import normalize_indexes, plot_top_10_indexes
+from sports_storage import read_table, write_table
+from sports_archetypes import add_archetypes
 
 def calc_mlb_index(row):
     """
@@ -157,7 +159,7 @@ def calc_mlb_index(row):
 
 def main():
     # 1) Load the dataset
-    df = pd.read_csv("mlb_dataset.csv")
+    df = read_table("mlb_dataset.csv")
     
     # 2) Calculate the MLB Index Score for each player
     df["mlb_index"] = df.apply(calc_mlb_index, axis=1)
@@ -176,8 +178,11 @@ def main():
     # 5) Normalize the index scores (0–100 scale)
     normalized_df = normalize_indexes(df, name_col='player_name', index_col='mlb_index')
     
+    # Add each athlete's archetype (cluster) and its distance to the centroid
+    normalized_df = add_archetypes(normalized_df, "mlb")
+
     # 6) Save the sorted results with normalized scores to a new CSV
-    normalized_df.to_csv("mlb_index_scored.csv", index=False)
+    write_table(normalized_df, "mlb_index_scored.csv")
     
     # 7) Create the line plot using the normalized data (top 10)
     plot_top_10_indexes(
@@ -8,6 +8,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import normalization helpers
 from sports_index_normalizer import normalize_indexes, plot_top_10_indexes
+from sports_storage import read_table, write_table
+from sports_archetypes import add_archetypes
 
 def calc_basketball_index(row):
     """
@@ -122,7 +124,7 @@ def calc_basketball_index(row):
 
 def main():
     # 1) Load the dataset
-    df = pd.read_csv("basketball_dataset.csv")
+    df = read_table("basketball_dataset.csv")
     
     # 2) Calculate the Basketball Index Score for each player
     df["basketball_index"] = df.apply(calc_basketball_index, axis=1)
@@ -141,8 +143,11 @@ def main():
     # 5) Normalize the index scores
     normalized_df = normalize_indexes(df, name_col='player_name', index_col='basketball_index')
     
+    # Add each athlete's archetype (cluster) and its distance to the centroid
+    normalized_df = add_archetypes(normalized_df, "nba")
+
     # 6) Save the sorted results with normalized scores to a new CSV
-    normalized_df.to_csv("basketball_index_scored.csv", index=False)
+    write_table(normalized_df, "basketball_index_scored.csv")
     
     # 7) Create the plot using the normalized data
     plot_top_10_indexes(normalized_df, 
@@ -8,6 +8,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import your normalization helpers
 from sports_index_normalizer import normalize_indexes, plot_top_10_indexes
+from sports_storage import read_table, write_table
+from sports_archetypes import add_archetypes
 
 def calc_rugby_index(row):
     """
@@ -158,7 +160,7 @@ def calc_rugby_index(row):
 
 def main():
     # 1) Load the dataset
-    df = pd.read_csv("rugby_dataset.csv")
+    df = read_table("rugby_dataset.csv")
     
     # 2) Calculate the Rugby Index Score for each player
     df["rugby_index"] = df.apply(calc_rugby_index, axis=1)
@@ -177,8 +179,11 @@ def main():
     # 5) Normalize the index scores
     normalized_df = normalize_indexes(df, name_col='player_name', index_col='rugby_index')
     
+    # Add each athlete's archetype (cluster) and its distance to the centroid
+    normalized_df = add_archetypes(normalized_df, "rugby")
+
     # 6) Save the sorted results with normalized scores to a new CSV
-    normalized_df.to_csv("rugby_index_scored.csv", index=False)
+    write_table(normalized_df, "rugby_index_scored.csv")
     
     # 7) Create the plot using the normalized data
     plot_top_10_indexes(normalized_df, 
@@ -0,0 +1,278 @@
+"""
+Athlete archetypes: mini-batch k-means within each sport.
+
+Each sport's athletes are clustered on standardized stats, either the
+sport's ARCHETYPE_FEATURES (volume vs efficiency in basketball, power vs
+finesse in boxing) or, by default, every dense numeric column of the
+dataset. add_archetypes() adds two columns to a scored table:
+
+    archetype            cluster label (0..k-1)
+    archetype_distance   standardized distance to the cluster's centroid
+
+The clustering never needs the whole table in memory. The feature columns
+are memory-mapped views (sports_storage) read in chunks of ARCHETYPE_CHUNK
+rows: one pass accumulates the means and standard deviations, then
+mini-batch k-means (k-means++ seeding on the first batch, then per-centroid
+learning rates of 1 / points seen) updates the centroids from
+ARCHETYPE_BATCH rows sampled out of each chunk. Memory stays at one chunk
+plus the k centroids whatever the row count.
+
+Missing stats are NaN, or a 0 in the columns that ARCHETYPE_MISSING_ZERO
+lists for a sport (e.g. the NBA dataset has no minutes_played for Oscar
+Robertson or Elgin Baylor). The moments are taken over the recorded
+values only, and a missing stat sits at the feature's mean (0 once
+standardized) when points are clustered and labelled. A missing stat
+therefore neither pulls the athlete towards the low end of that feature
+nor forms an archetype of its own.
+
+Centroids are cached in ARCHETYPE_CACHE_DIR per dataset version (dataset
+checksum, features, k and seed), so the calculators only fit a sport again
+after its data changed.
+
+    python sports_archetypes.py          # archetypes of every sport
+    python sports_archetypes.py nba
+"""
+
+import os
+import sys
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from sports_registry import PROJECT_ROOT, SPORTS, list_sports, sport_path, sport_display_name
+from sports_storage import load_feature_block, load_feature_columns, read_table, table_checksum
+
+ARCHETYPE_CACHE_DIR = os.path.join(PROJECT_ROOT, "goat_archetypes")
+
+# Clusters per sport (fewer if a sport has fewer athletes)
+ARCHETYPE_K = 3
+
+# Rows read per chunk and rows sampled from each chunk per mini-batch
+ARCHETYPE_CHUNK = 65536
+ARCHETYPE_BATCH = 1024
+
+# Passes over the chunks after seeding
+ARCHETYPE_EPOCHS = 20
+
+# Features per sport (default: every dense numeric column of the dataset)
+ARCHETYPE_FEATURES = {
+    'nba': ['points', 'field_goal_attempts', 'minutes_played', 'assists', 'total_rebounds',
+            'true_shooting_percentage', 'effective_fg_percentage', 'career_per', 'career_ws'],
+    'wnba': ['points', 'field_goal_attempts', 'minutes_played', 'assists', 'rebounds',
+             'field_goal_percentage'],
+    'mens_boxing': ['ko_percentage', 'kos', 'knockdowns_scored', 'avg_punches_landed_per_round',
+                    'avg_punches_thrown_per_round', 'height_cm', 'reach_cm'],
+    'womens_boxing': ['ko_percentage', 'kos', 'knockdowns_scored', 'avg_punches_landed_per_round',
+                      'avg_punches_thrown_per_round', 'height_cm', 'reach_cm'],
+}
+
+
+# Features where a 0 is a placeholder for a stat the dataset does not record
+ARCHETYPE_MISSING_ZERO = {
+    'nba': ['field_goal_attempts', 'minutes_played'],
+}
+
+
+# ------------------- STREAMING K-MEANS ---------------------
+def _missing_zero_mask(sport, features):
+    """Boolean mask of the features whose zeros mean missing for a sport."""
+    missing_zero = set(ARCHETYPE_MISSING_ZERO.get(sport, []))
+    return np.array([feature in missing_zero for feature in features], dtype=bool)
+
+
+def _with_missing(values, missing_zero):
+    """(rows x features) values with placeholder zeros replaced by NaN."""
+    return np.where(missing_zero & (values == 0), np.nan, values)
+
+
+def _chunks(columns, n_rows, chunk_rows, missing_zero=None):
+    """Yields (rows x features) float64 chunks of the feature columns, NaN where a stat is missing."""
+    arrays = list(columns.values())
+    for start in range(0, n_rows, chunk_rows):
+        stop = min(start + chunk_rows, n_rows)
+        chunk = np.column_stack([np.asarray(a[start:stop], dtype=np.float64) for a in arrays])
+        yield chunk if missing_zero is None else _with_missing(chunk, missing_zero)
+
+
+def streaming_moments(chunks):
+    """
+    Mean and standard deviation of every feature in one pass over the chunks.
+
+    NaN values are missing and left out of their feature's moments.
+
+    Returns:
+        Tuple (mean, scale) with scale = std, or 1 for constant features
+    """
+    count, total, squares = None, None, None
+    for chunk in chunks:
+        present = ~np.isnan(chunk)
+        chunk = np.where(present, chunk, 0.0)
+        if count is None:
+            count, total, squares = np.zeros(chunk.shape[1]), np.zeros(chunk.shape[1]), np.zeros(chunk.shape[1])
+        count += present.sum(axis=0)
+        total += chunk.sum(axis=0)
+        squares += (chunk * chunk).sum(axis=0)
+    recorded = np.maximum(count, 1)
+    mean = total / recorded
+    std = np.sqrt(np.maximum(squares / recorded - mean * mean, 0.0))
+    return mean, np.where(std > 1e-12, std, 1.0)
+
+
+def _nearest(points, centroids):
+    """Index of and distance to the closest centroid of every point."""
+    distances = ((points[:, None, :] - centroids[None, :, :]) ** 2).sum(axis=2)
+    labels = distances.argmin(axis=1)
+    return labels, np.sqrt(distances[np.arange(len(points)), labels])
+
+
+def _kmeans_plus_plus(points, k, rng):
+    """k-means++ seeding on one batch of points."""
+    centroids = [points[rng.integers(len(points))]]
+    for _ in range(1, k):
+        _, distance = _nearest(points, np.array(centroids))
+        weights = distance ** 2
+        if weights.sum() == 0:
+            centroids.append(points[rng.integers(len(points))])
+        else:
+            centroids.append(points[rng.choice(len(points), p=weights / weights.sum())])
+    return np.array(centroids)
+
+
+def minibatch_kmeans(make_chunks, k, mean, scale, batch=ARCHETYPE_BATCH, epochs=ARCHETYPE_EPOCHS, seed=0):
+    """
+    Fits k centroids to standardized chunks with mini-batch k-means.
+
+    Args:
+        make_chunks: Callable returning a fresh iterator over (rows x
+            features) chunks (called once per epoch); NaN values are
+            missing and placed at the feature's mean
+        k: Number of clusters
+        mean, scale: Standardization of the features
+        batch: Rows sampled from each chunk per update
+        epochs: Passes over the chunks
+        seed: Random seed
+
+    Returns:
+        (k x features) array of centroids in standardized units
+    """
+    rng = np.random.default_rng(seed)
+    centroids, seen = None, np.zeros(k)
+    for _ in range(epochs):
+        for chunk in make_chunks():
+            points = np.nan_to_num((chunk - mean) / scale)  # missing stats sit at the feature mean
+            sample = points[rng.choice(len(points), size=min(batch, len(points)), replace=False)]
+            if centroids is None:
+                centroids = _kmeans_plus_plus(sample, k, rng)
+            labels, _ = _nearest(sample, centroids)
+            counts = np.bincount(labels, minlength=k)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            # Per-centroid learning rate 1 / (points seen so far)
+            seen += counts
+            moved = counts > 0
+            centroids[moved] += (sums[moved] - counts[moved, None] * centroids[moved]) / seen[moved, None]
+    return centroids
+
+
+# ------------------- MODELS ---------------------
+def archetype_features(sport):
+    """Feature columns clustered for a sport."""
+    if sport in ARCHETYPE_FEATURES:
+        return list(ARCHETYPE_FEATURES[sport])
+    _, columns = load_feature_block(sport_path(sport, 'dataset'))
+    return list(columns)
+
+
+def archetype_model(sport, k=ARCHETYPE_K, seed=0, cache_dir=ARCHETYPE_CACHE_DIR, force=False):
+    """
+    The fitted archetype model of a sport, from the cache if it is current.
+
+    Args:
+        sport: Sport directory name
+        k: Number of clusters
+        seed: Random seed
+        cache_dir: Directory of the cached centroids
+        force: Refit even if the cache is current
+
+    Returns:
+        Dict with features, mean, scale and centroids (standardized units)
+    """
+    csv_path = sport_path(sport, 'dataset')
+    features = archetype_features(sport)
+    missing_zero = _missing_zero_mask(sport, features)
+    key = hashlib.sha1(repr((table_checksum(csv_path), features, missing_zero.tolist(), k, seed))
+                       .encode("utf-8")).hexdigest()
+    path = os.path.join(cache_dir, f"{sport}.npz")
+    if not force and os.path.exists(path):
+        with np.load(path, allow_pickle=False) as data:
+            if str(data['key']) == key:
+                return {'features': features, 'mean': data['mean'], 'scale': data['scale'],
+                        'centroids': data['centroids']}
+
+    columns = load_feature_columns(csv_path, columns=features, sparse=False)
+    n_rows = len(next(iter(columns.values())))
+    make_chunks = lambda: _chunks(columns, n_rows, ARCHETYPE_CHUNK, missing_zero)
+    mean, scale = streaming_moments(make_chunks())
+    centroids = minibatch_kmeans(make_chunks, min(k, n_rows), mean, scale, seed=seed)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = path + ".tmp.npz"
+    np.savez(tmp_path, key=np.array(key), mean=mean, scale=scale, centroids=centroids)
+    os.replace(tmp_path, path)
+    return {'features': features, 'mean': mean, 'scale': scale, 'centroids': centroids}
+
+
+def add_archetypes(df, sport, k=ARCHETYPE_K):
+    """
+    Adds archetype and archetype_distance columns to a sport's table.
+
+    Args:
+        df: DataFrame with the sport's feature columns (e.g. the scored table)
+        sport: Sport directory name
+        k: Number of clusters
+
+    Returns:
+        Copy of df with the two columns added
+    """
+    model = archetype_model(sport, k)
+    values = _with_missing(df[model['features']].to_numpy(dtype=np.float64),
+                           _missing_zero_mask(sport, model['features']))
+    labels, distances = _nearest(np.nan_to_num((values - model['mean']) / model['scale']), model['centroids'])
+    df = df.copy()
+    df['archetype'] = labels
+    df['archetype_distance'] = distances
+    return df
+
+
+def describe_archetypes(sport, k=ARCHETYPE_K, top=3):
+    """
+    Labels every archetype of a sport by its most distinctive features.
+
+    Returns:
+        Dict of cluster label -> list of (feature, standardized centroid
+        value), largest absolute values first
+    """
+    model = archetype_model(sport, k)
+    descriptions = {}
+    for label, centroid in enumerate(model['centroids']):
+        order = np.argsort(-np.abs(centroid), kind='stable')[:top]
+        descriptions[label] = [(model['features'][j], float(centroid[j])) for j in order]
+    return descriptions
+
+
+def main():
+    sports = sys.argv[1:] or list_sports()
+    for sport in sports:
+        name_col = SPORTS[sport]["name_col"]
+        df = add_archetypes(read_table(sport_path(sport, 'dataset')), sport)
+        print(f"\n====== {sport_display_name(sport).upper()} ARCHETYPES ======")
+        for label, features in describe_archetypes(sport).items():
+            members = df[df['archetype'] == label].sort_values('archetype_distance', kind='stable')
+            traits = ", ".join(f"{feature} {value:+.1f}" for feature, value in features)
+            names = ", ".join(members[name_col].head(5))
+            print(f"{label}: {len(members):>3} athletes ({traits})  e.g. {names}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Bootstrap confidence intervals for the GOAT gaps.
+
+The README quotes gaps such as "44.6 points" as if they were exact. Each
+replicate here re-scores a sport after
+
+    mode='stats'      perturbing every measured stat within its declared
+                      relative measurement error (rates, percentages and
+                      averages, i.e. the columns declared float32 in
+                      sports_schemas.json; counts are taken as exact)
+    mode='athletes'   resampling the athletes: every replicate draws the
+                      field with replacement from all athletes, the GOAT
+                      included
+    mode='both'       both at once
+
+and recomputes the normalized scores and the top-1 vs top-2 gap. The
+replicates are never DataFrames: every column becomes a (replicates x
+athletes) array and the vectorized index function scores the whole batch
+in one call. An athlete drawn more than once is one athlete of the
+replicate's field: only their first draw is ranked, so a GOAT drawn twice
+is not its own runner-up (gap 0). Replicates that miss the GOAT or the
+runner-up move the gap down or up, which gives 'athletes' a two-sided
+interval. 'stats' is the default.
+
+    python sports_bootstrap.py                 # 2000 replicates, mode 'stats'
+    python sports_bootstrap.py 5000 both
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from sports_registry import list_sports, sport_path, sport_display_name, load_calc_function
+from sports_storage import load_feature_columns
+from sports_schema import get_schema, column_defaults
+from sports_scoring import referenced_columns, score_columns
+
+BOOTSTRAP_MODES = ('stats', 'athletes', 'both')
+
+# Relative measurement error of the float32-declared stats (1 SD)
+DEFAULT_RELATIVE_ERROR = 0.05
+
+# Replicates scored per batch (bounds memory at registry scale)
+BOOTSTRAP_BATCH = 1000
+
+
+# ------------------- REPLICATES ---------------------
+def score_inputs(sport):
+    """
+    Loads what a batched re-scoring of a sport needs.
+
+    Args:
+        sport: Sport directory name
+
+    Returns:
+        Tuple (index function, {column: 1-D array} of the referenced stored
+        columns, number of rows, schema defaults of evolved columns)
+    """
+    func = load_calc_function(sport)
+    defaults = column_defaults(sport)
+    stored = load_feature_columns(sport_path(sport, 'dataset'), sparse=False, defaults=defaults)
+    columns = {col: np.asarray(stored[col]) for col in referenced_columns(func) if col in stored}
+    n_rows = len(next(iter(stored.values())))
+    return func, columns, n_rows, defaults
+
+
+def _measured_columns(sport, columns):
+    """Columns perturbed in 'stats' mode: the numeric ones declared as float32."""
+    schema = get_schema(sport)
+    return [col for col in columns if schema.get(col) == "float32"]
+
+
+def replicate_gaps(sport, replicates=2000, mode='stats', relative_error=DEFAULT_RELATIVE_ERROR,
+                   seed=0, batch=BOOTSTRAP_BATCH):
+    """
+    Computes a sport's top-1 vs top-2 normalized gap under many replicates.
+
+    Args:
+        sport: Sport directory name
+        replicates: Number of replicates
+        mode: 'stats', 'athletes' or 'both' (see module docstring)
+        relative_error: Relative SD of the measured stats ('stats'/'both')
+        seed: Random seed
+        batch: Replicates scored per call
+
+    Returns:
+        Tuple (observed gap, array of replicate gaps)
+    """
+    if mode not in BOOTSTRAP_MODES:
+        raise ValueError(f"Unknown bootstrap mode '{mode}' (expected one of {', '.join(BOOTSTRAP_MODES)})")
+    func, columns, n_rows, defaults = score_inputs(sport)
+    measured = _measured_columns(sport, columns)
+
+    scores = score_columns(columns, func, n_rows, defaults=defaults)
+    observed = top_gaps(scores[None, :])[0]
+    if n_rows < 2:
+        return observed, np.full(replicates, np.nan)
+
+    rng = np.random.default_rng(seed)
+    gaps = np.empty(replicates, dtype=np.float64)
+    for start in range(0, replicates, batch):
+        size = min(batch, replicates - start)
+        rows = None
+        if mode in ('athletes', 'both'):
+            rows = rng.integers(0, n_rows, size=(size, n_rows))
+            sample = {col: values[rows] for col, values in columns.items()}
+        else:
+            sample = {col: np.broadcast_to(values, (size, n_rows)) for col, values in columns.items()}
+        if mode in ('stats', 'both') and relative_error:
+            for col in measured:
+                noise = rng.standard_normal((size, n_rows)) * relative_error
+                sample[col] = sample[col].astype(np.float64) * (1 + noise)
+        scores = score_columns(sample, func, (size, n_rows), defaults=defaults)
+        if rows is not None:
+            scores[_repeated_draws(rows)] = np.nan
+        gaps[start:start + size] = top_gaps(scores)
+    return observed, gaps
+
+
+def _repeated_draws(rows):
+    """Mask of the draws whose athlete was already drawn earlier in the same replicate."""
+    order = np.argsort(rows, axis=1, kind='stable')
+    ordered = np.take_along_axis(rows, order, axis=1)
+    repeated = np.zeros(rows.shape, dtype=bool)
+    np.put_along_axis(repeated, order[:, 1:], ordered[:, 1:] == ordered[:, :-1], axis=1)
+    return repeated
+
+
+def top_gaps(scores):
+    """Normalized (score / max * 100) gap between the two best rows of every replicate (NaN rows are skipped)."""
+    if scores.shape[1] < 2:
+        return np.full(scores.shape[0], np.nan)
+    top_two = -np.partition(-scores, 1, axis=1)[:, :2]
+    return (top_two[:, 0] - top_two[:, 1]) / top_two[:, 0] * 100
+
+
+# ------------------- INTERVALS ---------------------
+def bootstrap_gaps(sports=None, replicates=2000, mode='stats', relative_error=DEFAULT_RELATIVE_ERROR,
+                   confidence=0.95, seed=0):
+    """
+    Bootstrap confidence intervals for every sport's GOAT gap.
+
+    Args:
+        sports: Optional list of sports (default: all)
+        replicates: Replicates per sport
+        mode: 'stats', 'athletes' or 'both'
+        relative_error: Relative SD of the measured stats
+        confidence: Coverage of the percentile intervals
+        seed: Random seed (each sport uses its own stream derived from it)
+
+    Returns:
+        DataFrame with one row per sport: observed gap, replicate mean,
+        ci_low, ci_high and the probability that the sport's gap is the
+        largest of all sports (share of replicates where it is)
+    """
+    sports = sports or list_sports()
+    observed = np.empty(len(sports))
+    gaps = np.empty((len(sports), replicates))
+    for i, sport in enumerate(sports):
+        observed[i], gaps[i] = replicate_gaps(sport, replicates, mode, relative_error, seed=seed + i)
+
+    alpha = (1 - confidence) / 2
+    low, high = np.nanquantile(gaps, [alpha, 1 - alpha], axis=1)
+    largest = np.bincount(np.argmax(np.nan_to_num(gaps, nan=-np.inf), axis=0), minlength=len(sports))
+    return pd.DataFrame({
+        'sport': sports,
+        'display_name': [sport_display_name(sport) for sport in sports],
+        'gap': observed,
+        'mean': np.nanmean(gaps, axis=1),
+        'ci_low': low,
+        'ci_high': high,
+        'p_largest': largest / replicates,
+    })
+
+
+def main():
+    replicates = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    mode = sys.argv[2] if len(sys.argv) > 2 else 'stats'
+    start = time.perf_counter()
+    result = bootstrap_gaps(replicates=replicates, mode=mode)
+    elapsed = time.perf_counter() - start
+
+    print(f"\n====== GOAT GAP 95% CONFIDENCE INTERVALS ({replicates:,} replicates, mode '{mode}') ======")
+    for row in result.sort_values('gap', ascending=False).itertuples():
+        print(f"{row.display_name:<22} {row.gap:5.1f}  [{row.ci_low:5.1f}, {row.ci_high:5.1f}]  "
+              f"P(largest) {row.p_largest:.3f}")
+    print(f"\nComputed in {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
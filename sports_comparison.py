@@ -4,45 +4,190 @@
 3) create a data visualization of geopgraphical representations
 """
 
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-import os
-
-def load_sport_data(sport_dir):
-    """Load normalized index data for a sport if available."""
-    # Try different possible CSV filenames
-    possible_files = [
-        f"{sport_dir}_index_scored.csv",
-        f"{sport_dir.replace('mens_', '')}_index_scored.csv",
-        f"{sport_dir.replace('womens_', '')}_index_scored.csv"
-    ]
-    
-    for filename in possible_files:
-        filepath = os.path.join(sport_dir, filename)
-        if os.path.exists(filepath):
-            return pd.read_csv(filepath)
-    return None
-
-def calculate_goat_gaps():
-    """Calculate the gap between the top 2 players for each sport."""
-    # Get all sport directories
-    sport_dirs = [d for d in os.listdir('.') if os.path.isdir(d) and d not in ['env', '__pycache__']]
+import sys
+import hashlib
+
+from sports_registry import sport_display_name
+from sports_database import connect, sync_database, query_athletes
+from sports_snapshots import take_snapshot
+from sports_index_normalizer import NORMALIZATION_SCHEMES, normalize_scores
+from sports_pooled import grouped_statistics
+from sports_extremes import extreme_value_tests
+from sports_eras import ERA_WINDOW, era_density, plot_eras
+from sports_geography import country_aggregates, render_country_map
+
+# Normalization scheme the GOAT gaps are measured in (see normalize_scores)
+GAP_SCHEME = 'max'
+
+# Number of leading athletes whose consecutive gaps are kept per sport
+DOMINANCE_TOP_K = 10
+
+# Axis label of each scheme's gap
+SCHEME_LABELS = {
+    'max': 'Normalized Index Score (0-100 scale)',
+    'minmax': 'Min-Max Scaled Index (0-100 scale)',
+    'zscore': 'Standard Deviations (z-score)',
+    'percentile': 'Percentile Rank (0-100)',
+    'top_k_mean': 'Index Relative to the Top-5 Mean (%)',
+}
+
+def calculate_goat_gaps(db_path=None, scheme=None):
+    """
+    Calculate the gap between the top 2 players for each sport.
+
+    Args:
+        db_path: Database file
+        scheme: Normalization scheme the gap is measured in (default: GAP_SCHEME)
+    """
+    scheme = scheme or GAP_SCHEME
+    # Bring the consolidated database up to date (only changed sports are re-imported)
+    sync_database(db_path)
+    athletes = query_athletes(db_path=db_path).sort_values(['sport', 'rank'], kind='stable')
     
     gaps = []
-    for sport_dir in sport_dirs:
-        df = load_sport_data(sport_dir)
-        if df is not None and 'normalized_index' in df.columns and 'player_name' in df.columns:
-            if len(df) >= 2:  # Need at least 2 players
-                gap = df.iloc[0]['normalized_index'] - df.iloc[1]['normalized_index']
-                goat_name = df.iloc[0]['player_name']
-                sport_name = sport_dir.replace('_', ' ').title()
-                gaps.append({
-                    'sport': sport_name,
-                    'gap': gap,
-                    'goat': goat_name
-                })
+    for sport, group in athletes.groupby('sport', sort=True):
+        if len(group) >= 2:  # Need at least 2 players
+            if scheme == 'max':
+                # The published normalized_index, exactly as the scored tables store it
+                normalized = group['normalized_index'].to_numpy()
+            else:
+                normalized = normalize_scores(group['raw_index'].to_numpy(), schemes=(scheme,))[scheme]
+            gaps.append({
+                'sport': sport_display_name(sport),
+                'gap': normalized[0] - normalized[1],
+                'goat': group.iloc[0]['player_name']
+            })
     
-    return pd.DataFrame(gaps)
+    gaps_df = pd.DataFrame(gaps)
+    gaps_df.attrs['scheme'] = scheme
+    return gaps_df
+
+def compute_dominance(athletes, top_k=DOMINANCE_TOP_K):
+    """
+    Computes dominance metrics for every sport in one vectorized pass.
+
+    The top-k normalized scores of all sports are scattered into one
+    (sports x k) matrix (NaN where a sport has fewer athletes), so every
+    metric is a single array expression over all sports:
+
+        gap_<i>_<i+1>     normalized gap between consecutive ranks
+        field_mean/std    mean and standard deviation of the whole field
+        goat_z            GOAT's distance from the field mean in SDs
+        top1_top2_ratio   GOAT's raw index over the runner-up's
+        tail_distance     how far the GOAT lies beyond the exponential tail
+                          fitted to the runners-up above the k-th score:
+                          (excess - expected max excess) / mean excess,
+                          0 = as far as the tail predicts
+
+    Args:
+        athletes: DataFrame with sport, rank, player_name, raw_index and
+            normalized_index for every athlete (see query_athletes)
+        top_k: Number of leading athletes per sport
+
+    Returns:
+        DataFrame with one row per sport
+    """
+    athletes = athletes.sort_values(['sport', 'rank'], kind='stable')
+    codes, sports = pd.factorize(athletes['sport'], sort=True)
+    normalized = athletes['normalized_index'].to_numpy(dtype=np.float64)
+    raw = athletes['raw_index'].to_numpy(dtype=np.float64)
+    position = athletes['rank'].to_numpy() - 1
+
+    field, _ = grouped_statistics(codes, normalized, quantiles=())
+    top = np.full((len(sports), top_k), np.nan)
+    raw_top = np.full((len(sports), top_k), np.nan)
+    leading = position < top_k
+    top[codes[leading], position[leading]] = normalized[leading]
+    raw_top[codes[leading], position[leading]] = raw[leading]
+    goats = athletes['player_name'].to_numpy()[leading & (position == 0)]
+
+    # Tail fit on the runners-up: exceedances of ranks 2..m-1 over the m-th score
+    m = np.minimum(field['count'], top_k).astype(np.int64)
+    threshold = top[np.arange(len(sports)), m - 1]
+    runners = top[:, 1:] - threshold[:, None]
+    runners[np.arange(1, top_k)[None, :] >= (m - 1)[:, None]] = np.nan
+    # Expected maximum of n exponential excesses = mean excess * H(n)
+    harmonic = np.concatenate(([0.0], np.cumsum(1 / np.arange(1, top_k + 1))))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scale = np.nanmean(runners, axis=1)
+        expected_max = scale * harmonic[np.maximum(m - 2, 1)]
+        tail_distance = (top[:, 0] - threshold - expected_max) / scale
+        goat_z = (top[:, 0] - field['mean']) / field['std']
+        ratio = raw_top[:, 0] / raw_top[:, 1]
+
+    result = pd.DataFrame({
+        'sport': sports,
+        'display_name': [sport_display_name(sport) for sport in sports],
+        'goat': goats,
+        'athletes': field['count'].astype(np.int64),
+    })
+    gaps = top[:, :-1] - top[:, 1:]
+    for i in range(top_k - 1):
+        result[f"gap_{i + 1}_{i + 2}"] = gaps[:, i]
+    result['field_mean'] = field['mean']
+    result['field_std'] = field['std']
+    result['goat_z'] = goat_z
+    result['top1_top2_ratio'] = ratio
+    result['tail_distance'] = tail_distance
+    return result
+
+
+def dominance_table(db_path=None, top_k=DOMINANCE_TOP_K, force=False):
+    """
+    Returns the dominance metrics of every sport, cached in the database.
+
+    The table is stored as `dominance` in the consolidated database and
+    recomputed only when a scored table (or top_k) changed since it was
+    written.
+
+    Args:
+        db_path: Database file
+        top_k: Number of leading athletes per sport
+        force: Recompute even if the cached table is current
+
+    Returns:
+        DataFrame with one compute_dominance() row per sport
+    """
+    sync_database(db_path)
+    conn = connect(db_path)
+    try:
+        checksums = conn.execute(
+            "SELECT sport, checksum FROM sync_state WHERE kind = 'scored' ORDER BY sport").fetchall()
+        key = hashlib.sha1(repr((checksums, top_k)).encode("utf-8")).hexdigest()
+        cached = conn.execute(
+            "SELECT checksum FROM sync_state WHERE sport = '*' AND kind = 'dominance'").fetchone()
+        if not force and cached and cached[0] == key:
+            return pd.read_sql_query("SELECT * FROM dominance ORDER BY sport", conn)
+
+        dominance = compute_dominance(query_athletes(db_path=db_path), top_k)
+        with conn:
+            dominance.to_sql("dominance", conn, if_exists='replace', index=False)
+            conn.execute("INSERT OR REPLACE INTO sync_state VALUES ('*', 'dominance', ?)", (key,))
+        return dominance
+    finally:
+        conn.close()
+
+
+def plot_gap_spectrum(dominance, save_path='goat_gap_spectrum.png'):
+    """Heatmap of the consecutive gaps between the top ranks of every sport."""
+    gap_cols = [col for col in dominance.columns if col.startswith('gap_')]
+    ordered = dominance.sort_values('gap_1_2', ascending=False)
+    values = ordered[gap_cols].to_numpy(dtype=np.float64)
+
+    plt.figure(figsize=(14, 10))
+    plt.imshow(np.ma.masked_invalid(values), aspect='auto', cmap='viridis')
+    plt.colorbar(label='Gap in Normalized Index Score (0-100 scale)')
+    plt.yticks(range(len(ordered)), ordered['display_name'])
+    plt.xticks(range(len(gap_cols)), [col[4:].replace('_', '-') for col in gap_cols])
+    plt.xlabel('Consecutive ranks')
+    plt.title('Gap Spectrum of the Top Ranks Across Sports', pad=20, fontsize=14)
+    plt.tight_layout()
+    plt.savefig(save_path, dpi=200, bbox_inches='tight')
+    plt.close()
+
 
 def plot_goat_gaps(gaps_df):
     """Create a bar plot of GOAT gaps across sports."""
@@ -56,7 +201,7 @@ def plot_goat_gaps(gaps_df):
     # Customize the plot
     plt.title('Gap Between GOAT and Second-Best Player Across Sports\n(Normalized Index Score Difference)', 
              pad=20, fontsize=14)
-    plt.xlabel('Gap in Normalized Index Score (0-100 scale)')
+    plt.xlabel(f"Gap in {SCHEME_LABELS[gaps_df.attrs.get('scheme', 'max')]}")
     
     # Add value labels and GOAT names
     for i, bar in enumerate(bars):
@@ -76,9 +221,44 @@ def plot_goat_gaps(gaps_df):
     print(f"Average gap: {gaps_df['gap'].mean():.1f}")
 
 def main():
-    gaps_df = calculate_goat_gaps()
+    # Keep an immutable record of this run's rankings (skipped if nothing changed)
+    snapshot = take_snapshot()
+    print(f"Ranking snapshot: {snapshot['id']}")
+
+    # Optional scheme argument, e.g. python sports_comparison.py zscore
+    scheme = sys.argv[1] if len(sys.argv) > 1 else GAP_SCHEME
+    if scheme not in NORMALIZATION_SCHEMES:
+        raise SystemExit(f"Unknown scheme '{scheme}' (choose from {', '.join(NORMALIZATION_SCHEMES)})")
+
+    gaps_df = calculate_goat_gaps(scheme=scheme)
     plot_goat_gaps(gaps_df)
 
+    dominance = dominance_table()
+    plot_gap_spectrum(dominance)
+    print("\n====== DOMINANCE METRICS ======")
+    for row in dominance.sort_values('goat_z', ascending=False).itertuples():
+        print(f"{row.display_name:<22} {row.goat:<28} z {row.goat_z:5.2f}  "
+              f"top1/top2 {row.top1_top2_ratio:5.3f}  tail distance {row.tail_distance:6.2f}")
+
+    extremes = extreme_value_tests()
+    print("\n====== IS THE GOAT EXTRAORDINARY? ======")
+    for row in extremes.sort_values('gap_p').itertuples():
+        gpd = f"{row.gpd_p:.4f}" if not np.isnan(row.gpd_p) else "   n/a"
+        print(f"{row.display_name:<22} P(Gumbel) {row.gumbel_p:.4f}  P(GPD) {gpd}  "
+              f"gap permutation p {row.gap_p:.4f}")
+
+    windows, by_sport, _, undated = era_density()
+    plot_eras(windows)
+    best = windows.sort_values(['goats', 'athletes'], ascending=False, kind='stable').iloc[0]
+    print(f"\n{ERA_WINDOW}-year span with the most GOATs: {best['window_start']}-{best['window_end']} "
+          f"({best['goats']} GOATs of the {len(by_sport.columns)} dated sports)")
+    if undated:
+        print(f"Not counted ({len(undated)} sports without a retirement year): "
+              f"{', '.join(sport_display_name(s) for s in undated)}")
+
+    countries = country_aggregates()
+    print(f"Country map: {render_country_map(countries)}")
+
 if __name__ == "__main__":
     main()
 
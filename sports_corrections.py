@@ -0,0 +1,363 @@
+"""
+Append-only stat corrections.
+
+Correcting a stat used to mean editing a sport's player records and
+regenerating everything. Corrections are now appended to a log next to the
+dataset (e.g. nba/basketball_dataset.corrections.jsonl), one JSON object per
+line:
+
+    {"type": "header", "version": 1, "name_col": "player_name"}
+    {"type": "correction", "seq": 1, "timestamp": "2026-10-19T17:55:00Z",
+     "athlete": "Michael Jordan", "stat": "all_star_appearances", "value": 14,
+     "source": "basketball-reference.com"}
+    {"type": "compaction", "seq": 2, "timestamp": ..., "through_seq": 1,
+     "previous": [[1, 13]]}
+
+read_table() replays the pending corrections on top of the base dataset at
+load time. The log is indexed by athlete, so replay only touches the rows and
+columns that were corrected. compact() folds the pending corrections into the
+sport's player records (the base), regenerates the dataset and records the
+values it overwrote, so reconstruct() can still rebuild the dataset as it was
+at any past moment.
+
+    python sports_corrections.py add nba "Michael Jordan" all_star_appearances 14 --source "..."
+    python sports_corrections.py show nba
+    python sports_corrections.py show nba --as-of 2026-01-01
+    python sports_corrections.py compact nba
+"""
+
+import os
+import json
+import argparse
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from sports_registry import SPORTS, load_module, sport_path
+from sports_storage import corrections_path, read_table
+from sports_schema import enforce_schema
+from sports_player_data import load_players, save_players
+from sports_materializer import materialize_sport
+
+LOG_VERSION = 1
+
+_log_cache = {}
+
+
+# ------------------- LOG ---------------------
+def log_path(sport):
+    """Returns the corrections log of a sport's dataset (it may not exist yet)."""
+    return corrections_path(sport_path(sport, 'dataset'))
+
+
+def _now():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def read_log(path):
+    """
+    Parses a corrections log (cached until the file changes).
+
+    Args:
+        path: Log file
+
+    Returns:
+        Dict with the log's name_col, its corrections and compactions (in
+        sequence order), the sequence number compacted so far and the
+        pending corrections indexed by athlete
+    """
+    stat = os.stat(path)
+    signature = (stat.st_size, stat.st_mtime_ns)
+    cached = _log_cache.get(path)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    log = {'name_col': None, 'corrections': [], 'compactions': [], 'last_seq': 0}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record['type'] == 'header':
+                if record.get('version') != LOG_VERSION:
+                    raise ValueError(f"{path} has unsupported log version {record.get('version')}")
+                log['name_col'] = record['name_col']
+                continue
+            log['last_seq'] = max(log['last_seq'], record['seq'])
+            if record['type'] == 'correction':
+                log['corrections'].append(record)
+            elif record['type'] == 'compaction':
+                log['compactions'].append(record)
+
+    log['compacted_seq'] = max((c['through_seq'] for c in log['compactions']), default=0)
+    by_athlete = {}
+    for correction in log['corrections']:
+        if correction['seq'] > log['compacted_seq']:
+            by_athlete.setdefault(correction['athlete'], []).append(correction)
+    log['pending_by_athlete'] = by_athlete
+
+    _log_cache[path] = (signature, log)
+    return log
+
+
+def log_name_column(path):
+    """Returns the athlete name column a corrections log refers to."""
+    return read_log(path)['name_col']
+
+
+def _append(path, record):
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def record_correction(sport, athlete, stat, value, source, timestamp=None):
+    """
+    Appends a stat correction to a sport's log.
+
+    Args:
+        sport: Sport directory name
+        athlete: Athlete name as it appears in the dataset's name column
+        stat: Dataset column to correct
+        value: New value
+        source: Where the corrected value comes from
+        timestamp: ISO-8601 UTC time of the correction (default: now); must
+            not be earlier than the last entry of the log
+
+    Returns:
+        The appended correction record
+
+    Raises:
+        ValueError: If the athlete or stat is not in the dataset, or the
+            value does not fit the stat's declared schema
+    """
+    name_col = SPORTS[sport]["name_col"]
+    base = read_table(sport_path(sport, 'dataset'), corrections=False)
+    if stat == name_col or stat not in base.columns:
+        raise ValueError(f"'{stat}' is not a stat column of {sport}")
+    if athlete not in set(base[name_col]):
+        raise ValueError(f"{athlete} is not in the {sport} dataset")
+    enforce_schema(_set_values(base, base[name_col].to_numpy(), [(athlete, stat, value)]), sport)
+
+    path = log_path(sport)
+    if not os.path.exists(path):
+        _append(path, {'type': 'header', 'version': LOG_VERSION, 'name_col': name_col})
+    log = read_log(path)
+    timestamp = timestamp or _now()
+    entries = log['corrections'] + log['compactions']
+    if entries and timestamp < max(e['timestamp'] for e in entries):
+        raise ValueError("Corrections must be appended in time order")
+
+    record = {'type': 'correction', 'seq': log['last_seq'] + 1, 'timestamp': timestamp,
+              'athlete': athlete, 'stat': stat, 'value': value, 'source': source}
+    _append(path, record)
+    return record
+
+
+# ------------------- REPLAY ---------------------
+def _set_values(table, names, updates):
+    """
+    Writes (athlete, stat, value) updates into a DataFrame or column mapping.
+
+    Only the columns that are updated are copied. The rows of the corrected
+    athletes are located with one pass over the names array, and each
+    column's updates are written with a single fancy-index assignment, so
+    the cost beyond that pass grows with the number of updates. When an
+    athlete's stat is updated more than once, the last update wins.
+    """
+    is_frame = isinstance(table, pd.DataFrame)
+    result = table.copy(deep=False) if is_frame else dict(table)
+
+    by_column = {}
+    for athlete, stat, value in updates:
+        if stat in result:
+            by_column.setdefault(stat, {})[athlete] = value
+    if not by_column:
+        return result
+
+    # Row positions of every corrected athlete (a name listed twice has two)
+    athletes = {athlete for column_updates in by_column.values() for athlete in column_updates}
+    codes, uniques = pd.factorize(np.asarray(names, dtype=object))
+    wanted = np.flatnonzero(pd.Index(uniques).isin(athletes))
+    matched = np.flatnonzero(np.isin(codes, wanted))
+    positions = {uniques[code]: matched[codes[matched] == code] for code in wanted}
+
+    for stat, column_updates in by_column.items():
+        original = result[stat]
+        values = np.array(original, dtype=object if not _is_number_column(original) else None)
+        rows = [positions.get(athlete, np.empty(0, dtype=np.int64)) for athlete in column_updates]
+        new_values = list(column_updates.values())
+        if values.dtype.kind in 'iub' and not all(float(v).is_integer() for v in new_values):
+            values = values.astype(np.float64)
+        values[np.concatenate(rows)] = np.repeat(np.array(new_values, dtype=values.dtype), [len(r) for r in rows])
+        if is_frame:
+            dtype = original.dtype if values.dtype == object else values.dtype
+            result[stat] = pd.Series(values, index=original.index, dtype=dtype)
+        else:
+            result[stat] = values
+    return result
+
+
+def _is_number_column(values):
+    if isinstance(values, pd.Series):
+        return pd.api.types.is_numeric_dtype(values)
+    return np.asarray(values).dtype.kind in 'iufb'
+
+
+def replay_corrections(table, path, names=None, as_of=None):
+    """
+    Applies a log's pending corrections on top of a base table.
+
+    Args:
+        table: DataFrame, or {column: array} mapping (then names is required)
+        path: Corrections log
+        names: Athlete name per row (default: the table's name column)
+        as_of: Only replay corrections recorded up to this ISO-8601 time
+
+    Returns:
+        Corrected copy of the table (the input is not modified)
+    """
+    log = read_log(path)
+    if not log['pending_by_athlete']:
+        return table
+    if names is None:
+        names = table[log['name_col']].to_numpy()
+
+    pending = [c for corrections in log['pending_by_athlete'].values() for c in corrections
+               if as_of is None or c['timestamp'] <= as_of]
+    pending.sort(key=lambda c: c['seq'])
+    return _set_values(table, names, [(c['athlete'], c['stat'], c['value']) for c in pending])
+
+
+def reconstruct(sport, as_of):
+    """
+    Rebuilds a sport's dataset as it was at a past moment.
+
+    Compacted corrections recorded after as_of are rolled back with the
+    values stored at compaction time, then the pending corrections recorded
+    up to as_of are replayed.
+
+    Args:
+        sport: Sport directory name
+        as_of: ISO-8601 time (a date such as "2026-01-01" means its start)
+
+    Returns:
+        DataFrame
+    """
+    dataset = sport_path(sport, 'dataset')
+    base = read_table(dataset, corrections=False)
+    path = log_path(sport)
+    if not os.path.exists(path):
+        return base
+
+    log = read_log(path)
+    corrections = {c['seq']: c for c in log['corrections']}
+    undo = []
+    for compaction in log['compactions']:
+        for seq, previous in compaction['previous']:
+            correction = corrections[seq]
+            if correction['timestamp'] > as_of:
+                undo.append((seq, correction['athlete'], correction['stat'], previous))
+    undo.sort(reverse=True)
+    base = _set_values(base, base[log['name_col']].to_numpy(), [u[1:] for u in undo])
+    return replay_corrections(base, path, as_of=as_of)
+
+
+# ------------------- COMPACTION ---------------------
+def compact(sport):
+    """
+    Folds a sport's pending corrections into its player records.
+
+    The player records are updated, the dataset (CSV and columnar copy) is
+    regenerated from them and a compaction record with the overwritten
+    values is appended to the log. A name listed twice in a dataset is
+    corrected in every record carrying it.
+
+    Args:
+        sport: Sport directory name
+
+    Returns:
+        Number of corrections compacted
+    """
+    path = log_path(sport)
+    if not os.path.exists(path):
+        return 0
+    log = read_log(path)
+    pending = sorted((c for cs in log['pending_by_athlete'].values() for c in cs), key=lambda c: c['seq'])
+    if not pending:
+        return 0
+
+    module = load_module(sport, 'creation')
+    players = load_players(module.PLAYERS_FILE, use_cache=False)
+    name_col = log['name_col']
+    previous = []
+    for correction in pending:
+        matches = [p for p in players if p.get(name_col) == correction['athlete']]
+        if not matches:
+            raise ValueError(f"{correction['athlete']} is not in the {sport} player records")
+        if correction['stat'] not in module.HEADERS:
+            raise ValueError(f"'{correction['stat']}' is not a {sport} dataset column")
+        previous.append([correction['seq'], matches[0].get(correction['stat'], 0)])
+        for player in matches:
+            player[correction['stat']] = correction['value']
+
+    # Validate the corrected dataset before the base is touched
+    dataset = sport_path(sport, 'dataset')
+    enforce_schema(replay_corrections(read_table(dataset, corrections=False), path), sport)
+    save_players(module.PLAYERS_FILE, players)
+    materialize_sport(sport)
+    _append(path, {'type': 'compaction', 'seq': log['last_seq'] + 1, 'timestamp': _now(),
+                   'through_seq': pending[-1]['seq'], 'previous': previous})
+    return len(pending)
+
+
+# ------------------- CLI ---------------------
+def _parse_value(text):
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Append-only stat corrections.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    add = commands.add_parser("add", help="record a correction")
+    add.add_argument("sport")
+    add.add_argument("athlete")
+    add.add_argument("stat")
+    add.add_argument("value")
+    add.add_argument("--source", required=True, help="where the corrected value comes from")
+    show = commands.add_parser("show", help="list a sport's corrections")
+    show.add_argument("sport")
+    show.add_argument("--as-of", help="also print the corrected values as of this ISO-8601 time")
+    compact_cmd = commands.add_parser("compact", help="fold pending corrections into the base dataset")
+    compact_cmd.add_argument("sport")
+    args = parser.parse_args()
+
+    if args.command == "add":
+        record = record_correction(args.sport, args.athlete, args.stat, _parse_value(args.value), args.source)
+        print(f"Recorded correction #{record['seq']}: {record['athlete']} {record['stat']} = {record['value']}")
+    elif args.command == "compact":
+        print(f"Compacted {compact(args.sport)} corrections into the {args.sport} dataset")
+    else:
+        path = log_path(args.sport)
+        if not os.path.exists(path):
+            print(f"No corrections recorded for {args.sport}")
+            return
+        log = read_log(path)
+        for c in log['corrections']:
+            status = "compacted" if c['seq'] <= log['compacted_seq'] else "pending"
+            print(f"#{c['seq']:<4} {c['timestamp']}  {c['athlete']:<28} {c['stat']} = {c['value']}  "
+                  f"[{status}; {c['source']}]")
+        if args.as_of:
+            df = reconstruct(args.sport, args.as_of)
+            name_col = log['name_col']
+            athletes = sorted({c['athlete'] for c in log['corrections']})
+            stats = sorted({c['stat'] for c in log['corrections']})
+            print(f"\n====== VALUES AS OF {args.as_of} ======")
+            print(df.loc[df[name_col].isin(athletes), [name_col] + stats].to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
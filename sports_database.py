@@ -0,0 +1,206 @@
+"""
+Consolidated SQLite store of every sport.
+
+sync_database() imports each sport's dataset into its own stats_<sport>
+table and every scored athlete into one unified `athletes` table (sport,
+rank, name, country, raw and normalized index). Only sports whose CSVs
+changed since the last sync are re-imported, so it is cheap to call at the
+start of every pipeline run.
+
+The query helpers answer cross-sport questions such as "all athletes from USA
+with normalized_index > 90" with one indexed query instead of opening every
+sport's CSV.
+"""
+
+import os
+import sqlite3
+
+import pandas as pd
+
+from sports_registry import PROJECT_ROOT, SPORTS, list_sports, sport_path, sport_display_name
+from sports_storage import read_table, table_checksum
+
+DEFAULT_DB_PATH = os.path.join(PROJECT_ROOT, "goat_of_goats.sqlite")
+
+# Volleyball records the country as national_team
+COUNTRY_COLUMNS = ["country", "national_team"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sports (
+    sport         TEXT PRIMARY KEY,
+    display_name  TEXT NOT NULL,
+    name_col      TEXT NOT NULL,
+    index_col     TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    sport      TEXT NOT NULL,
+    kind       TEXT NOT NULL,
+    checksum   TEXT NOT NULL,
+    PRIMARY KEY (sport, kind)
+);
+CREATE TABLE IF NOT EXISTS athletes (
+    sport             TEXT NOT NULL,
+    rank              INTEGER NOT NULL,
+    player_name       TEXT NOT NULL,
+    country           TEXT,
+    raw_index         REAL,
+    normalized_index  REAL,
+    PRIMARY KEY (sport, rank)
+);
+CREATE INDEX IF NOT EXISTS idx_athletes_country ON athletes (country);
+CREATE INDEX IF NOT EXISTS idx_athletes_normalized ON athletes (normalized_index);
+CREATE INDEX IF NOT EXISTS idx_athletes_name ON athletes (player_name);
+CREATE INDEX IF NOT EXISTS idx_athletes_sport_norm ON athletes (sport, normalized_index);
+"""
+
+
+def connect(db_path=None):
+    """Opens (and initializes if needed) the consolidated database."""
+    conn = sqlite3.connect(db_path or DEFAULT_DB_PATH)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _stored_checksum(conn, sport, kind):
+    row = conn.execute("SELECT checksum FROM sync_state WHERE sport = ? AND kind = ?", (sport, kind)).fetchone()
+    return row[0] if row else None
+
+
+def _country_column(df):
+    for col in COUNTRY_COLUMNS:
+        if col in df.columns:
+            return col
+    return None
+
+
+def _import_stats(conn, sport, path):
+    """Replaces the per-sport stats table with the current dataset."""
+    df = read_table(path)
+    df.to_sql(f"stats_{sport}", conn, if_exists='replace', index=False)
+    name_col = SPORTS[sport]["name_col"]
+    conn.execute(f'CREATE INDEX IF NOT EXISTS "idx_stats_{sport}_name" ON "stats_{sport}" ("{name_col}")')
+
+
+def _import_scores(conn, sport, path):
+    """Replaces one sport's rows of the unified athletes table."""
+    info = SPORTS[sport]
+    df = read_table(path)
+    country_col = _country_column(df)
+    countries = df[country_col] if country_col else [None] * len(df)
+
+    rows = [
+        (sport, rank, name, None if pd.isna(country) else country, float(raw), float(norm))
+        for rank, (name, country, raw, norm) in enumerate(
+            zip(df[info["name_col"]], countries, df[info["index_col"]], df["normalized_index"]), start=1)
+    ]
+    conn.execute("DELETE FROM athletes WHERE sport = ?", (sport,))
+    conn.executemany("INSERT INTO athletes VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+
+def sync_database(db_path=None, sports=None, force=False):
+    """
+    Brings the database up to date with the CSVs on disk.
+
+    Args:
+        db_path: Database file (defaults to goat_of_goats.sqlite in the project root)
+        sports: Optional list of sports to sync (default: all)
+        force: Re-import even if the CSVs did not change
+
+    Returns:
+        List of (sport, kind) pairs that were (re)imported
+    """
+    updated = []
+    conn = connect(db_path)
+    try:
+        with conn:
+            for sport in sports or list_sports():
+                info = SPORTS[sport]
+                conn.execute(
+                    "INSERT OR REPLACE INTO sports VALUES (?, ?, ?, ?)",
+                    (sport, sport_display_name(sport), info["name_col"], info["index_col"]),
+                )
+                for kind, importer in (('dataset', _import_stats), ('scored', _import_scores)):
+                    path = sport_path(sport, kind)
+                    checksum = table_checksum(path)
+                    if checksum is None:
+                        continue
+                    if not force and checksum == _stored_checksum(conn, sport, kind):
+                        continue
+                    importer(conn, sport, path)
+                    conn.execute("INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)", (sport, kind, checksum))
+                    updated.append((sport, kind))
+    finally:
+        conn.close()
+    return updated
+
+
+def query_athletes(country=None, min_index=None, sport=None, name=None, max_rank=None, db_path=None):
+    """
+    Cross-sport athlete lookup on the unified athletes table.
+
+    Args:
+        country: Exact country name (e.g. 'USA')
+        min_index: Only athletes with normalized_index strictly above this value
+        sport: Restrict to one sport (directory name)
+        name: Substring of the athlete's name (case-insensitive)
+        max_rank: Only athletes ranked this high or better within their sport
+        db_path: Database file
+
+    Returns:
+        DataFrame sorted by normalized_index descending
+    """
+    clauses, params = [], []
+    if country is not None:
+        clauses.append("country = ?")
+        params.append(country)
+    if min_index is not None:
+        clauses.append("normalized_index > ?")
+        params.append(min_index)
+    if sport is not None:
+        clauses.append("sport = ?")
+        params.append(sport)
+    if name is not None:
+        clauses.append("player_name LIKE ?")
+        params.append(f"%{name}%")
+    if max_rank is not None:
+        clauses.append("rank <= ?")
+        params.append(max_rank)
+
+    sql = "SELECT sport, rank, player_name, country, raw_index, normalized_index FROM athletes"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += " ORDER BY normalized_index DESC, sport, rank"
+
+    conn = connect(db_path)
+    try:
+        return pd.read_sql_query(sql, conn, params=params)
+    finally:
+        conn.close()
+
+
+def top_athletes(n=2, db_path=None):
+    """Returns the top-n athletes of every sport, ordered by sport then rank."""
+    conn = connect(db_path)
+    try:
+        return pd.read_sql_query(
+            "SELECT a.sport, s.display_name, a.rank, a.player_name, a.country, a.normalized_index "
+            "FROM athletes a JOIN sports s ON s.sport = a.sport "
+            "WHERE a.rank <= ? ORDER BY a.sport, a.rank",
+            conn, params=[n],
+        )
+    finally:
+        conn.close()
+
+
+def main():
+    updated = sync_database()
+    print(f"Synced {len(updated)} tables into {DEFAULT_DB_PATH}")
+
+    usa = query_athletes(country="USA", min_index=90)
+    print("\n====== USA ATHLETES WITH NORMALIZED INDEX > 90 ======")
+    for _, row in usa.iterrows():
+        print(f"{row['player_name']} ({sport_display_name(row['sport'])}) - {row['normalized_index']:.1f}")
+
+
+if __name__ == "__main__":
+    main()
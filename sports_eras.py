@@ -0,0 +1,211 @@
+"""
+Eras of the GOATs: which 10-year span had the most of them?
+
+Every top-k athlete's career becomes an interval of calendar years:
+
+    end    retirement_year / career_retirement_year (0 = still active,
+           i.e. active through ACTIVE_THROUGH_YEAR)
+    start  end - years_active + 1
+
+Sports whose datasets only record a career length (years_active,
+seasons_played, career_length_years) without a retirement year cannot be
+placed in time and are reported as undated.
+
+An athlete is active in the window [s, s + W - 1] exactly when
+start - W + 1 <= s <= end, so each career turns into one interval of window
+starts. A sweep over the sorted endpoints of those intervals (+1 where one
+opens, -1 after one closes) counts the active athletes and GOATs of every
+window of every sport in O(n log n), without testing careers against
+windows.
+
+    python sports_eras.py          # 10-year windows, top 10 of every sport
+    python sports_eras.py 5 3      # 5-year windows, top 3
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+
+from sports_registry import list_sports, sport_display_name
+from sports_database import connect, sync_database
+
+# Length of the sliding window in years
+ERA_WINDOW = 10
+
+# Athletes per sport counted in each window
+ERA_TOP_K = 10
+
+# Last season covered by the datasets (careers without a retirement year run through it)
+ACTIVE_THROUGH_YEAR = 2024
+
+# Columns holding the retirement year, in order of preference
+RETIREMENT_COLUMNS = ["retirement_year", "career_retirement_year"]
+
+
+# ------------------- CAREER INTERVALS ---------------------
+def career_intervals(top_k=ERA_TOP_K, db_path=None):
+    """
+    Calendar-year career intervals of every sport's top-k athletes.
+
+    Args:
+        top_k: Athletes per sport (by rank)
+        db_path: Database file (synced first)
+
+    Returns:
+        Tuple (intervals, undated): intervals is a DataFrame with sport,
+        rank, player_name, start and end (inclusive years); undated lists
+        the sports without a retirement year
+    """
+    sync_database(db_path)
+    frames, undated = [], []
+    with connect(db_path) as conn:
+        name_cols = dict(conn.execute("SELECT sport, name_col FROM sports").fetchall())
+        for sport in list_sports():
+            stats_cols = {row[1] for row in conn.execute(f'PRAGMA table_info("stats_{sport}")')}
+            retirement = next((col for col in RETIREMENT_COLUMNS if col in stats_cols), None)
+            if retirement is None or "years_active" not in stats_cols:
+                undated.append(sport)
+                continue
+            frame = pd.read_sql_query(
+                f'SELECT a.sport, a.rank, a.player_name, s.years_active, s."{retirement}" AS retirement '
+                f'FROM athletes a JOIN "stats_{sport}" s ON s."{name_cols[sport]}" = a.player_name '
+                f'WHERE a.sport = ? AND a.rank <= ?',
+                conn, params=(sport, top_k))
+            frames.append(frame.drop_duplicates('rank'))
+
+    intervals = pd.concat(frames, ignore_index=True)
+    retired = intervals.pop('retirement').to_numpy(dtype=np.int64)
+    intervals['end'] = np.where(retired > 0, retired, ACTIVE_THROUGH_YEAR)
+    intervals['start'] = intervals['end'] - intervals.pop('years_active').to_numpy(dtype=np.int64) + 1
+    return intervals[['sport', 'rank', 'player_name', 'start', 'end']], undated
+
+
+# ------------------- SWEEP LINE ---------------------
+def sweep_counts(starts, ends, weights):
+    """
+    Sums weighted intervals over every integer point they cover.
+
+    Args:
+        starts: int array of first points (inclusive)
+        ends: int array of last points (inclusive)
+        weights: (n,) or (n, m) array of weights per interval
+
+    Returns:
+        Tuple (points, totals): every integer point from the first start to
+        the last end, and the summed weights of the intervals covering each
+    """
+    starts = np.asarray(starts, dtype=np.int64)
+    ends = np.asarray(ends, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.float64).reshape(len(starts), -1)
+    if len(starts) == 0:
+        return np.empty(0, dtype=np.int64), np.empty((0, weights.shape[1]))
+
+    # Open at the start, close one point after the end
+    positions = np.concatenate((starts, ends + 1))
+    deltas = np.concatenate((weights, -weights))
+    boundaries, event_ids = np.unique(positions, return_inverse=True)
+    summed = np.zeros((len(boundaries), weights.shape[1]))
+    np.add.at(summed, event_ids, deltas)
+    running = np.cumsum(summed, axis=0)
+
+    # The totals are constant between consecutive boundaries
+    lengths = np.diff(boundaries)
+    points = np.arange(boundaries[0], boundaries[-1])
+    return points, np.repeat(running[:-1], lengths, axis=0)
+
+
+def era_density(window=ERA_WINDOW, top_k=ERA_TOP_K, db_path=None):
+    """
+    Counts the top-k athletes and GOATs active in every sliding window.
+
+    Args:
+        window: Window length in years
+        top_k: Athletes per sport
+        db_path: Database file
+
+    Returns:
+        Tuple (windows, by_sport, intervals, undated): windows has one row
+        per window (window_start, window_end, athletes, goats, sports);
+        by_sport the athletes active per window and sport (window_start x
+        sport); intervals and undated as returned by career_intervals()
+    """
+    intervals, undated = career_intervals(top_k, db_path)
+    sports = sorted(intervals['sport'].unique())
+    codes = pd.Categorical(intervals['sport'], categories=sports).codes
+
+    # One weight column per sport plus one for the GOATs, swept together
+    weights = np.zeros((len(intervals), len(sports) + 1))
+    weights[np.arange(len(intervals)), codes] = 1.0
+    weights[:, -1] = intervals['rank'].to_numpy() == 1
+    window_starts, totals = sweep_counts(intervals['start'] - window + 1, intervals['end'], weights)
+
+    per_sport = totals[:, :-1].astype(np.int64)
+    windows = pd.DataFrame({
+        'window_start': window_starts,
+        'window_end': window_starts + window - 1,
+        'athletes': per_sport.sum(axis=1),
+        'goats': totals[:, -1].astype(np.int64),
+        'sports': np.count_nonzero(per_sport, axis=1),
+    })
+    by_sport = pd.DataFrame(per_sport, index=pd.Index(window_starts, name='window_start'), columns=sports)
+    return windows, by_sport, intervals, undated
+
+
+def active_in(intervals, first_year, last_year):
+    """Athletes of the intervals table whose careers overlap [first_year, last_year]."""
+    mask = (intervals['start'] <= last_year) & (intervals['end'] >= first_year)
+    return intervals[mask].sort_values(['rank', 'sport'], kind='stable')
+
+
+# ------------------- OUTPUT ---------------------
+def plot_eras(windows, window=ERA_WINDOW, save_path='goat_eras.png'):
+    """Line chart of the top athletes and GOATs active in each window."""
+    fig, ax = plt.subplots(figsize=(15, 8))
+    ax.plot(windows['window_start'], windows['athletes'], label='Top athletes active')
+    ax.plot(windows['window_start'], windows['goats'], label='GOATs active')
+
+    best = windows.loc[windows['goats'].idxmax()]
+    ax.axvline(best['window_start'], color='grey', linestyle='--', linewidth=1)
+    ax.annotate(f"{best['window_start']}-{best['window_end']}: {best['goats']} GOATs",
+                (best['window_start'], best['goats']), xytext=(8, 8), textcoords='offset points')
+
+    ax.set_xlabel(f'First year of the {window}-year window')
+    ax.set_ylabel('Athletes active')
+    ax.set_title(f'Eras of the GOATs: Athletes Active in Each {window}-Year Window', pad=20, fontsize=14)
+    ax.legend()
+    fig.tight_layout()
+    fig.savefig(save_path, dpi=200, bbox_inches='tight')
+    plt.close(fig)
+
+
+def main():
+    window = int(sys.argv[1]) if len(sys.argv) > 1 else ERA_WINDOW
+    top_k = int(sys.argv[2]) if len(sys.argv) > 2 else ERA_TOP_K
+    windows, by_sport, intervals, undated = era_density(window, top_k)
+    windows.to_csv('goat_eras.csv', index=False)
+    plot_eras(windows, window)
+
+    print(f"\n====== {window}-YEAR WINDOWS WITH THE MOST GOATS ======")
+    ranked = windows.sort_values(['goats', 'athletes'], ascending=False, kind='stable')
+    for row in ranked.head(5).itertuples():
+        print(f"{row.window_start}-{row.window_end}: {row.goats} GOATs, {row.athletes} top-{top_k} athletes "
+              f"from {row.sports} sports")
+
+    best = ranked.iloc[0]
+    goats = active_in(intervals, best['window_start'], best['window_end'])
+    print(f"\nGOATs active in {best['window_start']}-{best['window_end']}:")
+    for row in goats[goats['rank'] == 1].itertuples():
+        print(f"  {row.player_name} ({sport_display_name(row.sport)}, {row.start}-{row.end})")
+
+    busiest = by_sport.idxmax()
+    print(f"\n====== BUSIEST {window}-YEAR WINDOW PER SPORT (top {top_k}) ======")
+    for sport, start in busiest.items():
+        print(f"{sport_display_name(sport):<22} {start}-{start + window - 1}: {by_sport.at[start, sport]} active")
+
+    print(f"\nUndated (no retirement year): {', '.join(sport_display_name(s) for s in undated)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+Extreme-value significance of each sport's GOAT.
+
+Is a GOAT's lead extraordinary given the rest of the field? Two tests, both
+run on the current scores of every sport:
+
+Tail models. Every sport's field without its GOAT is put into one padded
+(sports x athletes) matrix, and two tail models are fitted to all rows at
+once:
+
+    Gumbel   location/scale from the field's mean and SD (method of moments)
+    GPD      shape/scale from the exceedances over the field's median
+             (probability-weighted moments, Hosking & Wallis)
+
+For each model the exceedance probability of the top score is reported as
+the chance that the best of n draws from the fitted field reaches it
+(1 - F(top)^n), so small values mean the GOAT is beyond what the field's
+tail explains. A negative GPD shape gives the fitted tail a finite upper
+endpoint, and the more negative the shape, the closer that endpoint is
+pulled to the few best scores of a small field. gpd_p is therefore NaN
+(with a warning) instead of a probability when the fit cannot be trusted
+to bound the top score: fewer than GPD_MIN_EXCEEDANCES exceedances, a
+shape below GPD_MIN_SHAPE, or a fitted endpoint below the field's own
+best score. It is also NaN when the top score lies beyond the fitted
+endpoint. Such a top score is outside the fitted support, and a
+probability of 0 would overstate the evidence of a ~14-point fit.
+
+Permutation test. Each stat column is shuffled independently across
+athletes, which keeps every stat's distribution but breaks the
+all-round profiles that make a GOAT. The top-1/top-2 normalized gap of
+PERMUTATIONS shuffled fields (scored as one batch) gives the p-value of
+the observed gap.
+
+    python sports_extremes.py
+"""
+
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from sports_registry import list_sports, sport_display_name
+from sports_scoring import score_columns
+from sports_bootstrap import score_inputs, top_gaps
+
+# Shuffled fields per sport for the gap p-value
+PERMUTATIONS = 999
+
+# Fewest exceedances over the median a GPD is fitted to (smaller fields get NaN)
+GPD_MIN_EXCEEDANCES = 5
+
+# Most negative GPD shape whose finite endpoint is trusted (below it gpd_p is NaN)
+GPD_MIN_SHAPE = -0.5
+
+# Euler-Mascheroni constant (mean of the standard Gumbel distribution)
+EULER_GAMMA = 0.5772156649015329
+
+
+# ------------------- TAIL MODELS ---------------------
+def _padded(score_arrays):
+    """Stacks score arrays of different lengths into a NaN-padded matrix sorted descending per row."""
+    width = max(len(scores) for scores in score_arrays)
+    matrix = np.full((len(score_arrays), width), np.nan)
+    for i, scores in enumerate(score_arrays):
+        matrix[i, :len(scores)] = np.sort(scores)[::-1]
+    return matrix
+
+
+def tail_exceedance(score_arrays):
+    """
+    Fits Gumbel and GPD tails to every field (GOAT excluded) in one pass.
+
+    Args:
+        score_arrays: List of 1-D score arrays, one per sport
+
+    Returns:
+        Dict of arrays (one value per sport): top score, field size,
+        gumbel_p and gpd_p (probability that the best of the field's draws
+        reaches the top score under each model; gpd_p is NaN where no
+        trustworthy GPD fit exists or the top score is beyond its support),
+        gpd_shape
+    """
+    matrix = _padded(score_arrays)
+    top = matrix[:, 0]
+    field = matrix[:, 1:]
+    n = np.sum(~np.isnan(field), axis=1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Gumbel by moments: scale = SD * sqrt(6) / pi, location = mean - gamma * scale
+        mean = np.nanmean(field, axis=1)
+        std = np.nanstd(field, axis=1)
+        beta = std * np.sqrt(6) / np.pi
+        mu = mean - EULER_GAMMA * beta
+        gumbel_cdf = np.exp(-np.exp(-(top - mu) / beta))
+        gumbel_p = 1 - gumbel_cdf ** n
+
+        # GPD by probability-weighted moments on the exceedances over the field median
+        threshold = np.nanmedian(field, axis=1)
+        excess = field - threshold[:, None]
+        excess[~(excess > 0)] = np.nan
+        excess = np.sort(excess, axis=1)  # ascending, NaN padding last
+        n_excess = np.sum(~np.isnan(excess), axis=1)
+        ranks = np.arange(excess.shape[1])[None, :]
+        a0 = np.nanmean(excess, axis=1)
+        a1 = np.nanmean(excess * (n_excess[:, None] - 1 - ranks) / (n_excess[:, None] - 1), axis=1)
+        shape = 2 - a0 / (a0 - 2 * a1)
+        scale = 2 * a0 * a1 / (a0 - 2 * a1)
+
+        # A negative shape ends the tail at threshold + scale / -shape, which must cover the field
+        # and the top score; a steeply negative shape pins it to the few best scores
+        endpoint = np.where(shape < 0, threshold + scale / -shape, np.inf)
+        valid = ((n_excess >= GPD_MIN_EXCEEDANCES) & (scale > 0) & (shape > GPD_MIN_SHAPE)
+                 & (endpoint >= field[:, 0]) & (endpoint >= top))
+
+        z = (top - threshold) / scale
+        # Survival of one draw: share above the threshold times the GPD tail
+        tail = np.where(np.abs(shape) < 1e-9, np.exp(-z), np.maximum(1 + shape * z, 0) ** (-1 / shape))
+        single = (n_excess / n) * tail
+        gpd_p = np.where(valid, 1 - (1 - single) ** n, np.nan)
+
+    rejected = int(np.count_nonzero(~valid))
+    if rejected:
+        warnings.warn(f"No trustworthy GPD tail for {rejected} of {len(valid)} fields "
+                      f"(fewer than {GPD_MIN_EXCEEDANCES} exceedances, shape below {GPD_MIN_SHAPE}, or "
+                      f"fitted endpoint below the field max or the top score); their gpd_p is NaN",
+                      RuntimeWarning, stacklevel=2)
+    return {'top': top, 'field_size': n, 'gumbel_p': gumbel_p, 'gpd_p': gpd_p, 'gpd_shape': shape}
+
+
+# ------------------- PERMUTATION TEST ---------------------
+def permutation_gap_pvalue(sport, permutations=PERMUTATIONS, seed=0):
+    """
+    Permutation p-value of a sport's top-1/top-2 normalized gap.
+
+    Args:
+        sport: Sport directory name
+        permutations: Number of shuffled fields
+        seed: Random seed
+
+    Returns:
+        Tuple (scores, observed gap, p-value)
+    """
+    func, columns, n_rows, defaults = score_inputs(sport)
+    scores = score_columns(columns, func, n_rows, defaults=defaults)
+    observed = top_gaps(scores[None, :])[0]
+
+    rng = np.random.default_rng(seed)
+    shuffled = {}
+    for col, values in columns.items():
+        # An independent permutation of the athletes per stat and per replicate
+        rows = np.argsort(rng.random((permutations, n_rows)), axis=1)
+        shuffled[col] = values[rows]
+    null_gaps = top_gaps(score_columns(shuffled, func, (permutations, n_rows), defaults=defaults))
+    p_value = (1 + np.count_nonzero(null_gaps >= observed)) / (permutations + 1)
+    return scores, observed, p_value
+
+
+def extreme_value_tests(sports=None, permutations=PERMUTATIONS, seed=0):
+    """
+    Runs both tests for every sport.
+
+    Args:
+        sports: Optional list of sports (default: all)
+        permutations: Shuffled fields per sport
+        seed: Random seed
+
+    Returns:
+        DataFrame with one row per sport: top score, gap, gumbel_p, gpd_p,
+        gpd_shape and gap_p (permutation p-value)
+    """
+    sports = sports or list_sports()
+    scores, gaps, gap_p = [], [], []
+    for i, sport in enumerate(sports):
+        sport_scores, gap, p = permutation_gap_pvalue(sport, permutations, seed + i)
+        scores.append(sport_scores)
+        gaps.append(gap)
+        gap_p.append(p)
+
+    tails = tail_exceedance(scores)
+    return pd.DataFrame({
+        'sport': sports,
+        'display_name': [sport_display_name(sport) for sport in sports],
+        'top_score': tails['top'],
+        'gap': gaps,
+        'gumbel_p': tails['gumbel_p'],
+        'gpd_p': tails['gpd_p'],
+        'gpd_shape': tails['gpd_shape'],
+        'gap_p': gap_p,
+    })
+
+
+def main():
+    start = time.perf_counter()
+    result = extreme_value_tests()
+    elapsed = time.perf_counter() - start
+    print(f"\n====== IS THE GOAT EXTRAORDINARY? ({PERMUTATIONS} permutations per sport) ======")
+    for row in result.sort_values('gpd_p').itertuples():
+        gpd = f"{row.gpd_p:.4f}" if not np.isnan(row.gpd_p) else "   n/a"
+        print(f"{row.display_name:<22} gap {row.gap:5.1f}  P(Gumbel) {row.gumbel_p:.4f}  "
+              f"P(GPD) {gpd}  permutation p {row.gap_p:.4f}")
+    print(f"\nComputed in {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
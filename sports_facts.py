@@ -0,0 +1,343 @@
+"""
+Unified long-format fact table of every sport.
+
+Each sport's dataset is a wide table with its own columns and name column
+(player_name, fighter_name), which makes cross-sport questions awkward. The
+fact store flattens every dataset into one long table
+
+    athlete_id  int32    interned (sport, name) pair
+    sport_id    int16    interned sport
+    stat_id     int32    interned column name, shared by every sport using it
+    value       float64  the stat (countries and text columns hold the
+                         interned ID of their value)
+
+with dictionaries that map the IDs back to strings. Joins, group-bys and
+filters (e.g. "hall of famers per country") then run on integer codes, and
+strings are only decoded for display. pivot_sport() turns a sport's facts
+back into the original wide dataset.
+
+The store lives in goat_of_goats_facts/ (one columnar partition per sport
+plus manifest.json with the dictionaries). sync_facts() only rebuilds the
+partitions of sports whose dataset changed, and IDs are append-only so they
+stay stable across syncs.
+"""
+
+import os
+import json
+
+import numpy as np
+import pandas as pd
+
+from sports_registry import PROJECT_ROOT, SPORTS, list_sports, sport_path, sport_display_name
+from sports_storage import read_table, read_columnar, write_columnar, table_checksum
+from sports_database import COUNTRY_COLUMNS
+
+DEFAULT_FACTS_DIR = os.path.join(PROJECT_ROOT, "goat_of_goats_facts")
+MANIFEST_VERSION = 1
+
+FACT_DTYPES = {'athlete_id': np.int32, 'sport_id': np.int16, 'stat_id': np.int32, 'value': np.float64}
+
+# Dictionaries of interned strings; an ID is the position in its list
+DICTIONARIES = ("sports", "stats", "countries", "labels")
+
+
+# ------------------- MANIFEST ---------------------
+def _empty_manifest():
+    return {
+        'format_version': MANIFEST_VERSION,
+        'partitions': {},
+        'athletes': {'sport_id': [], 'name': [], 'occurrence': [], 'country_id': []},
+        **{name: [] for name in DICTIONARIES},
+    }
+
+
+def _manifest_path(facts_dir):
+    return os.path.join(facts_dir, "manifest.json")
+
+
+def load_manifest(facts_dir=None):
+    """Returns the fact store's manifest (an empty one if the store does not exist yet)."""
+    path = _manifest_path(facts_dir or DEFAULT_FACTS_DIR)
+    if not os.path.exists(path):
+        return _empty_manifest()
+    with open(path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get('format_version') != MANIFEST_VERSION:
+        return _empty_manifest()
+    return manifest
+
+
+def _write_manifest(manifest, facts_dir):
+    tmp_path = _manifest_path(facts_dir) + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, _manifest_path(facts_dir))
+
+
+class _Interner:
+    """Append-only string -> ID mapping backed by one of the manifest's lists."""
+
+    def __init__(self, values):
+        self.values = values
+        self.ids = {value: i for i, value in enumerate(values)}
+
+    def __call__(self, value):
+        if value not in self.ids:
+            self.ids[value] = len(self.values)
+            self.values.append(value)
+        return self.ids[value]
+
+
+def _partition_path(facts_dir, sport):
+    return os.path.join(facts_dir, f"facts_{sport}.cols")
+
+
+# ------------------- BUILD ---------------------
+def _sport_facts(sport, df, manifest, interners):
+    """
+    Flattens one wide dataset into facts, interning every string on the way.
+
+    Returns:
+        (facts DataFrame, column layout for pivot_sport)
+    """
+    name_col = SPORTS[sport]["name_col"]
+    sport_id = interners['sports'](sport)
+
+    # Athletes are interned per (sport, name): the same name in two sports
+    # is two different athlete records. A name listed twice in one dataset
+    # (american_football, womens_soccer) is told apart by its occurrence
+    athletes = manifest['athletes']
+    athlete_keys = {key: i for i, key in enumerate(
+        zip(athletes['sport_id'], athletes['name'], athletes['occurrence']))}
+    country_col = next((col for col in COUNTRY_COLUMNS if col in df.columns), None)
+    athlete_ids = np.empty(len(df), dtype=np.int32)
+    seen = {}
+    for i, name in enumerate(df[name_col]):
+        name = str(name)
+        occurrence = seen[name] = seen.get(name, -1) + 1
+        country_id = interners['countries'](str(df[country_col].iat[i])) if country_col else -1
+        key = (sport_id, name, occurrence)
+        if key not in athlete_keys:
+            athlete_keys[key] = len(athletes['name'])
+            athletes['sport_id'].append(sport_id)
+            athletes['name'].append(name)
+            athletes['occurrence'].append(occurrence)
+            athletes['country_id'].append(country_id)
+        else:
+            athletes['country_id'][athlete_keys[key]] = country_id
+        athlete_ids[i] = athlete_keys[key]
+
+    layout = []
+    stat_ids, values = [], []
+    for col in df.columns:
+        series = df[col]
+        if col == name_col:
+            layout.append({'name': col, 'kind': 'name', 'dtype': str(series.dtype)})
+            continue
+        if pd.api.types.is_numeric_dtype(series):
+            kind, column_values = 'numeric', series.to_numpy(dtype=np.float64)
+        else:
+            kind = 'country' if col == country_col else 'label'
+            intern = interners['countries' if kind == 'country' else 'labels']
+            column_values = np.array([intern(str(v)) for v in series], dtype=np.float64)
+        layout.append({'name': col, 'kind': kind, 'dtype': str(series.dtype)})
+        stat_ids.append(np.full(len(df), interners['stats'](col), dtype=np.int32))
+        values.append(column_values)
+
+    # Stat-major order: every stat is a contiguous run of len(df) facts
+    n_stats = len(stat_ids)
+    facts = pd.DataFrame({
+        'athlete_id': np.tile(athlete_ids, n_stats),
+        'sport_id': np.full(n_stats * len(df), sport_id, dtype=np.int16),
+        'stat_id': np.concatenate(stat_ids) if stat_ids else np.empty(0, dtype=np.int32),
+        'value': np.concatenate(values) if values else np.empty(0, dtype=np.float64),
+    })
+    return facts, layout
+
+
+def sync_facts(sports=None, force=False, facts_dir=None):
+    """
+    Brings the fact store up to date with the datasets on disk.
+
+    Args:
+        sports: Optional list of sports to sync (default: all)
+        force: Rebuild even if the datasets did not change
+        facts_dir: Store directory (defaults to goat_of_goats_facts in the project root)
+
+    Returns:
+        List of sports whose partition was (re)built
+    """
+    facts_dir = facts_dir or DEFAULT_FACTS_DIR
+    os.makedirs(facts_dir, exist_ok=True)
+    manifest = load_manifest(facts_dir)
+    interners = {name: _Interner(manifest[name]) for name in DICTIONARIES}
+
+    updated = []
+    for sport in sports or list_sports():
+        path = sport_path(sport, 'dataset')
+        if not os.path.exists(path):
+            continue
+        checksum = table_checksum(path)
+        partition = _partition_path(facts_dir, sport)
+        state = manifest['partitions'].get(sport)
+        if not force and state and state['checksum'] == checksum and os.path.exists(partition):
+            continue
+        df = read_table(path)
+        facts, layout = _sport_facts(sport, df, manifest, interners)
+        write_columnar(facts, partition)
+        manifest['partitions'][sport] = {
+            'sport_id': interners['sports'](sport),
+            'checksum': checksum,
+            'n_rows': len(df),
+            'columns': layout,
+        }
+        updated.append(sport)
+
+    if updated:
+        _write_manifest(manifest, facts_dir)
+    return updated
+
+
+# ------------------- QUERY ---------------------
+def load_facts(sports=None, facts_dir=None):
+    """
+    Loads the long-format fact table.
+
+    Args:
+        sports: Optional list of sports (default: every synced sport)
+        facts_dir: Store directory
+
+    Returns:
+        DataFrame with athlete_id, sport_id, stat_id and value columns
+    """
+    facts_dir = facts_dir or DEFAULT_FACTS_DIR
+    manifest = load_manifest(facts_dir)
+    parts = [read_columnar(_partition_path(facts_dir, sport))
+             for sport in (sports or sorted(manifest['partitions']))]
+    if not parts:
+        return pd.DataFrame({col: np.empty(0, dtype=dtype) for col, dtype in FACT_DTYPES.items()})
+    return pd.concat(parts, ignore_index=True).astype(FACT_DTYPES)
+
+
+def load_athletes(facts_dir=None):
+    """Returns the athlete dimension (athlete_id, sport_id, name, country_id)."""
+    athletes = load_manifest(facts_dir)['athletes']
+    return pd.DataFrame({
+        'athlete_id': np.arange(len(athletes['name']), dtype=np.int32),
+        'sport_id': np.asarray(athletes['sport_id'], dtype=np.int16),
+        'name': athletes['name'],
+        'country_id': np.asarray(athletes['country_id'], dtype=np.int32),
+    })
+
+
+def dataset_athlete_ids(sport, facts_dir=None):
+    """Returns the athlete IDs of a sport's dataset rows, in dataset order."""
+    facts_dir = facts_dir or DEFAULT_FACTS_DIR
+    n_rows = load_manifest(facts_dir)['partitions'][sport]['n_rows']
+    partition = read_columnar(_partition_path(facts_dir, sport), columns=['athlete_id'])
+    # Facts are stat-major, so the first n_rows facts cover every athlete once
+    return np.array(partition['athlete_id'].to_numpy()[:n_rows], dtype=np.int32)
+
+
+def load_dictionary(name, facts_dir=None):
+    """Returns one dictionary ('sports', 'stats', 'countries' or 'labels') as a list indexed by ID."""
+    if name not in DICTIONARIES:
+        raise ValueError(f"Unknown dictionary '{name}', expected one of {DICTIONARIES}")
+    return load_manifest(facts_dir)[name]
+
+
+def lookup_id(name, value, facts_dir=None):
+    """Returns the interned ID of a string, or None if it has never been seen."""
+    values = load_dictionary(name, facts_dir)
+    return values.index(value) if value in values else None
+
+
+def pivot_sport(sport, facts=None, facts_dir=None):
+    """
+    Turns a sport's facts back into its wide dataset.
+
+    Args:
+        sport: Sport directory name
+        facts: Optional fact table to pivot (default: the sport's partition);
+            may be a filtered subset, missing facts come back as NaN
+        facts_dir: Store directory
+
+    Returns:
+        DataFrame with the dataset's columns, dtypes and athlete order
+    """
+    facts_dir = facts_dir or DEFAULT_FACTS_DIR
+    manifest = load_manifest(facts_dir)
+    if sport not in manifest['partitions']:
+        raise KeyError(f"{sport} is not in the fact store, run sync_facts() first")
+    layout = manifest['partitions'][sport]['columns']
+    sport_id = manifest['partitions'][sport]['sport_id']
+    if facts is None:
+        facts = read_columnar(_partition_path(facts_dir, sport))
+    facts = facts[facts['sport_id'].to_numpy() == sport_id]
+
+    # Rows: athletes in first-seen order; columns: the stats in dataset order
+    athlete_ids, first_seen = np.unique(facts['athlete_id'].to_numpy(), return_index=True)
+    athlete_ids = athlete_ids[np.argsort(first_seen)]
+    row_of = np.full(athlete_ids.max() + 1 if len(athlete_ids) else 0, -1, dtype=np.int64)
+    row_of[athlete_ids] = np.arange(len(athlete_ids))
+
+    stats = manifest['stats']
+    stat_cols = [col for col in layout if col['kind'] != 'name']
+    col_of = np.full(len(stats), -1, dtype=np.int64)
+    for j, col in enumerate(stat_cols):
+        col_of[stats.index(col['name'])] = j
+
+    matrix = np.full((len(athlete_ids), len(stat_cols)), np.nan)
+    stat_positions = col_of[facts['stat_id'].to_numpy()]
+    keep = stat_positions >= 0
+    matrix[row_of[facts['athlete_id'].to_numpy()[keep]], stat_positions[keep]] = facts['value'].to_numpy()[keep]
+
+    names = manifest['athletes']['name']
+    decoders = {'country': np.asarray(manifest['countries'], dtype=object),
+                'label': np.asarray(manifest['labels'], dtype=object)}
+    data = {}
+    j = 0
+    for col in layout:
+        if col['kind'] == 'name':
+            values = pd.Series([names[i] for i in athlete_ids], dtype=col['dtype'])
+        else:
+            column = matrix[:, j]
+            j += 1
+            if col['kind'] == 'numeric':
+                values = pd.Series(column)
+                if not np.isnan(column).any():
+                    values = values.astype(col['dtype'])
+            else:
+                codes = np.nan_to_num(column, nan=-1).astype(np.int64)
+                decoded = np.where(codes >= 0, decoders[col['kind']][np.maximum(codes, 0)], None)
+                values = pd.Series(decoded, dtype=col['dtype'])
+        data[col['name']] = values
+    return pd.DataFrame(data)
+
+
+def main():
+    updated = sync_facts()
+    facts = load_facts()
+    print(f"Synced {len(updated)} sports; {len(facts):,} facts in {DEFAULT_FACTS_DIR}")
+
+    # Cross-sport filter + join + group-by, entirely on integer codes
+    hall_of_fame = lookup_id('stats', 'hall_of_fame_inducted')
+    if hall_of_fame is not None:
+        inducted = facts.loc[(facts['stat_id'] == hall_of_fame) & (facts['value'] == 1), 'athlete_id']
+        athletes = load_athletes()
+        counts = athletes.loc[inducted.to_numpy(), 'country_id'].value_counts()
+        countries = load_dictionary('countries')
+        print("\n====== HALL OF FAMERS BY COUNTRY (ALL SPORTS) ======")
+        for country_id, count in counts.head(10).items():
+            name = countries[country_id] if country_id >= 0 else "Unknown"
+            print(f"{name:<20} {count}")
+
+    sports = load_dictionary('sports')
+    per_sport = facts.groupby('sport_id').size()
+    print("\n====== FACTS PER SPORT ======")
+    for sport_id, count in per_sport.items():
+        print(f"{sport_display_name(sports[sport_id]):<22} {count:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""
+Geographic view of the GOATs: which countries produce the top athletes?
+
+country_aggregates() canonicalizes every athlete's country and computes, in
+one grouped pass over integer country codes, each country's
+
+    top10         athletes ranked in the top 10 of their sport
+    index_sum     summed normalized_index of those athletes
+    index_mean    their mean normalized_index
+    goats         number of sports whose GOAT is from the country
+    sports        sports with at least one top-10 athlete
+
+Canonicalization maps the spellings used across the datasets onto the
+names of the boundary file: aliases (USA, UK, ...), home nations onto the
+United Kingdom, historical states onto their successor state and dual
+nationalities ("Argentina/Spain") onto the first listed country.
+Placeholder entries ("Country A") count as unknown.
+
+render_country_map() draws a choropleth from COUNTRY_BOUNDARIES, a GeoJSON
+file bundled with the repo, with matplotlib alone (no geo libraries, no
+downloads). The bundled file is a tile-grid world map (one equal-sized tile
+per country in its approximate geographic position, so small countries stay
+visible); any GeoJSON FeatureCollection with 'name' and 'iso_a3' properties,
+such as real country outlines, can replace it. Rendered maps are cached in
+MAP_CACHE_DIR under the hash of the aggregate, metric and boundary file, so
+an unchanged aggregate is never drawn twice.
+
+    python sports_geography.py                # map of top-10 athletes per country
+    python sports_geography.py index_sum
+"""
+
+import os
+import re
+import sys
+import json
+import hashlib
+
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+from matplotlib.collections import PolyCollection
+
+from sports_registry import PROJECT_ROOT
+from sports_storage import table_checksum
+from sports_database import sync_database, query_athletes
+
+COUNTRY_BOUNDARIES = os.path.join(PROJECT_ROOT, "sports_world_tiles.geojson")
+MAP_CACHE_DIR = os.path.join(PROJECT_ROOT, "goat_country_maps")
+
+# Athletes per sport counted for their country
+GEO_TOP_K = 10
+
+COUNTRY_METRICS = ('top10', 'index_sum', 'index_mean', 'goats', 'sports')
+
+# Spellings in the datasets -> boundary file name
+COUNTRY_ALIASES = {
+    "USA": "United States",
+    "US": "United States",
+    "UK": "United Kingdom",
+    "Great Britain": "United Kingdom",
+    "England": "United Kingdom",
+    "Scotland": "United Kingdom",
+    "Wales": "United Kingdom",
+    "Northern Ireland": "United Kingdom",
+    "Soviet Union": "Russia",
+    "USSR": "Russia",
+    "East Germany": "Germany",
+    "West Germany": "Germany",
+    "Czechoslovakia": "Czech Republic",
+    "Czechia": "Czech Republic",
+    "Yugoslavia": "Serbia",
+    "Korea": "South Korea",
+}
+
+# Placeholder countries of the generated datasets ("Country A", "CountryX")
+PLACEHOLDER_COUNTRY = re.compile(r"^Country ?[A-Z]$")
+
+
+# ------------------- CANONICAL COUNTRIES ---------------------
+def canonical_country(country):
+    """
+    Canonical name of a dataset's country entry.
+
+    Args:
+        country: Country as stored (may be None)
+
+    Returns:
+        Canonical country name, or None for missing / placeholder entries
+    """
+    if country is None or pd.isna(country):
+        return None
+    # Dual nationality: credit the first listed country
+    country = str(country).split("/")[0].strip()
+    if not country or PLACEHOLDER_COUNTRY.match(country):
+        return None
+    return COUNTRY_ALIASES.get(country, country)
+
+
+def load_boundaries(path=COUNTRY_BOUNDARIES):
+    """
+    Reads a GeoJSON FeatureCollection of country boundaries.
+
+    Args:
+        path: GeoJSON file
+
+    Returns:
+        List of (name, iso_a3, list of exterior rings as (n, 2) arrays)
+    """
+    with open(path, encoding="utf-8") as f:
+        collection = json.load(f)
+    countries = []
+    for feature in collection["features"]:
+        geometry = feature["geometry"]
+        polygons = geometry["coordinates"] if geometry["type"] == "MultiPolygon" else [geometry["coordinates"]]
+        rings = [np.asarray(polygon[0], dtype=np.float64) for polygon in polygons]
+        countries.append((feature["properties"]["name"], feature["properties"]["iso_a3"], rings))
+    return countries
+
+
+# ------------------- AGGREGATION ---------------------
+def country_aggregates(db_path=None, top_k=GEO_TOP_K):
+    """
+    Per-country totals of the top athletes of every sport.
+
+    Args:
+        db_path: Database file (synced first)
+        top_k: Athletes per sport counted
+
+    Returns:
+        DataFrame indexed by canonical country with the COUNTRY_METRICS
+        columns, sorted by top10 and index_sum descending
+    """
+    sync_database(db_path)
+    athletes = query_athletes(max_rank=top_k, db_path=db_path)
+    athletes['canonical_country'] = athletes['country'].map(canonical_country)
+    athletes = athletes.dropna(subset=['canonical_country'])
+
+    codes, countries = pd.factorize(athletes['canonical_country'], sort=True)
+    sport_codes, _ = pd.factorize(athletes['sport'])
+
+    # One pass: every athlete adds (1, normalized_index, is GOAT) to its country's row
+    values = np.column_stack((
+        np.ones(len(athletes)),
+        athletes['normalized_index'].to_numpy(dtype=np.float64),
+        athletes['rank'].to_numpy() == 1,
+    ))
+    totals = np.zeros((len(countries), values.shape[1]))
+    np.add.at(totals, codes, values)
+    # Distinct (country, sport) pairs give the number of sports per country
+    pairs = np.unique(codes * (sport_codes.max() + 1) + sport_codes)
+    sports = np.bincount(pairs // (sport_codes.max() + 1), minlength=len(countries))
+
+    aggregates = pd.DataFrame({
+        'top10': totals[:, 0].astype(np.int64),
+        'index_sum': totals[:, 1],
+        'index_mean': totals[:, 1] / totals[:, 0],
+        'goats': totals[:, 2].astype(np.int64),
+        'sports': sports,
+    }, index=pd.Index(countries, name='country'))
+    return aggregates.sort_values(['top10', 'index_sum'], ascending=False, kind='stable')
+
+
+def aggregate_hash(aggregates, metric, boundaries=COUNTRY_BOUNDARIES):
+    """Cache key of a rendered map: the aggregate's contents, the metric and the boundary file."""
+    digest = hashlib.sha1(pd.util.hash_pandas_object(aggregates, index=True).to_numpy().tobytes())
+    digest.update(f"{metric}|{table_checksum(boundaries)}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+# ------------------- CHOROPLETH ---------------------
+def render_country_map(aggregates, metric='top10', boundaries=COUNTRY_BOUNDARIES, cache_dir=MAP_CACHE_DIR,
+                       force=False):
+    """
+    Renders a choropleth of one country metric, reusing a cached image if possible.
+
+    Args:
+        aggregates: DataFrame from country_aggregates()
+        metric: One of COUNTRY_METRICS
+        boundaries: GeoJSON boundary file
+        cache_dir: Directory of the rendered maps
+        force: Render even if a cached map exists
+
+    Returns:
+        Path of the PNG map
+
+    Raises:
+        ValueError: If the metric is unknown
+    """
+    if metric not in COUNTRY_METRICS:
+        raise ValueError(f"Unknown metric '{metric}' (expected one of {', '.join(COUNTRY_METRICS)})")
+    path = os.path.join(cache_dir, f"{metric}_{aggregate_hash(aggregates, metric, boundaries)[:16]}.png")
+    if not force and os.path.exists(path):
+        return path
+
+    countries = load_boundaries(boundaries)
+    values = aggregates[metric]
+    polygons, colors, labels = [], [], []
+    for name, iso, rings in countries:
+        value = values.get(name, np.nan)
+        for ring in rings:
+            polygons.append(ring)
+            colors.append(value)
+        largest = max(rings, key=len)
+        labels.append((largest.mean(axis=0), iso, value))
+
+    fig, ax = plt.subplots(figsize=(16, 9))
+    data = np.ma.masked_invalid(np.asarray(colors, dtype=np.float64))
+    collection = PolyCollection(polygons, array=data, cmap='viridis', edgecolors='white', linewidths=0.5)
+    collection.cmap.set_bad('lightgrey')
+    ax.add_collection(collection)
+    for (x, y), iso, value in labels:
+        ax.text(x, y, iso, ha='center', va='center', fontsize=7,
+                color='white' if not np.isnan(value) else 'dimgrey')
+    fig.colorbar(collection, ax=ax, label=metric.replace('_', ' '), shrink=0.7)
+
+    unmapped = sorted(set(values.index) - {name for name, _, _ in countries})
+    title = f'Top-{GEO_TOP_K} Athletes by Country: {metric.replace("_", " ")}'
+    if unmapped:
+        title += f"\n(not on the map: {', '.join(unmapped)})"
+    ax.set_title(title, pad=20, fontsize=14)
+    ax.autoscale_view()
+    ax.set_aspect('equal')
+    ax.axis('off')
+
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = path + ".tmp.png"
+    fig.savefig(tmp_path, dpi=200, bbox_inches='tight')
+    plt.close(fig)
+    os.replace(tmp_path, path)
+    return path
+
+
+def main():
+    metric = sys.argv[1] if len(sys.argv) > 1 else 'top10'
+    aggregates = country_aggregates()
+    path = render_country_map(aggregates, metric)
+
+    print(f"\n====== TOP-{GEO_TOP_K} ATHLETES BY COUNTRY ======")
+    for row in aggregates.head(20).itertuples():
+        print(f"{row.Index:<18} {row.top10:>3} top-{GEO_TOP_K}  {row.goats:>2} GOATs  "
+              f"index sum {row.index_sum:7.1f}  mean {row.index_mean:5.1f}  {row.sports:>2} sports")
+    print(f"\nMap: {os.path.relpath(path, PROJECT_ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
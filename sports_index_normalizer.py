@@ -1,6 +1,78 @@
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
+# Schemes computed by normalize_scores(), in block row order
+NORMALIZATION_SCHEMES = ('max', 'minmax', 'zscore', 'percentile', 'top_k_mean')
+
+# Number of leading scores averaged by the 'top_k_mean' scheme
+TOP_K_MEAN = 5
+
+def normalize_scores(scores, schemes=NORMALIZATION_SCHEMES, top_k=TOP_K_MEAN):
+    """
+    Normalizes a score array under several schemes at once.
+
+    The scores are sorted once; max, min, the top-k mean and the percentile
+    ranks all come from that order, mean and standard deviation from one
+    reduction. Results are written into a single (schemes x n) block and
+    returned as row views, so no DataFrame is copied.
+
+        max         score / max * 100 (same values as normalize_indexes)
+        minmax      (score - min) / (max - min) * 100
+        zscore      (score - mean) / std
+        percentile  0-100, average rank of ties (best = 100)
+        top_k_mean  score / mean of the top k scores * 100
+
+    Args:
+        scores: 1-D array of raw index scores
+        schemes: Schemes to compute (subset of NORMALIZATION_SCHEMES)
+        top_k: Number of leading scores averaged by 'top_k_mean'
+
+    Returns:
+        Dict of scheme -> read-only 1-D view, in the input's row order
+
+    Raises:
+        ValueError: If a scheme is unknown
+    """
+    unknown = [s for s in schemes if s not in NORMALIZATION_SCHEMES]
+    if unknown:
+        raise ValueError(f"Unknown normalization scheme(s): {', '.join(unknown)}")
+    scores = np.asarray(scores, dtype=np.float64)
+    n = len(scores)
+    block = np.empty((len(schemes), n), dtype=np.float64)
+    if n == 0:
+        return {scheme: block[i] for i, scheme in enumerate(schemes)}
+
+    ascending = np.sort(scores)
+    low, high = ascending[0], ascending[-1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for i, scheme in enumerate(schemes):
+            out = block[i]
+            if scheme == 'max':
+                np.multiply(np.divide(scores, high, out=out), 100, out=out)
+            elif scheme == 'minmax':
+                span = high - low
+                if span:
+                    np.multiply(np.divide(np.subtract(scores, low, out=out), span, out=out), 100, out=out)
+                else:
+                    out.fill(100.0)
+            elif scheme == 'zscore':
+                mean = scores.mean()
+                std = np.sqrt(np.mean((scores - mean) ** 2))
+                if std:
+                    np.divide(np.subtract(scores, mean, out=out), std, out=out)
+                else:
+                    out.fill(0.0)
+            elif scheme == 'percentile':
+                # Average 0-based position of each score among equal scores
+                below = np.searchsorted(ascending, scores, side='left')
+                through = np.searchsorted(ascending, scores, side='right')
+                np.multiply((below + through - 1) / 2, 100 / max(n - 1, 1), out=out)
+            elif scheme == 'top_k_mean':
+                np.multiply(np.divide(scores, ascending[-min(top_k, n):].mean(), out=out), 100, out=out)
+    block.flags.writeable = False
+    return {scheme: block[i] for i, scheme in enumerate(schemes)}
+
 def normalize_indexes(players_df, name_col='player_name', index_col='index'):
     """
     Normalizes player indexes to a 0-100 scale based on the highest rated player.
@@ -0,0 +1,254 @@
+"""
+Head-to-head dominance matrix of every pair of athletes across all sports.
+
+Each athlete is described by three cross-sport comparable measures of
+dominance (see sports_pooled):
+
+    normalized_index   score / sport max * 100
+    z_score            gap to the field in standard deviations of the sport
+    percentile         0-100 rank within the sport
+
+Athletes i and j are compared measure by measure, and each measure counts
+as a soft win or loss:
+
+    H[i, j] = mean_m tanh((f[i, m] - f[j, m]) / (MATCHUP_MARGIN * sd[m]))
+
+where sd[m] is the measure's spread over all athletes. A lead of
+MATCHUP_MARGIN standard deviations counts as three quarters of a win on that
+measure, and a larger lead adds little, so H is a smooth share of measures
+won minus measures lost, in (-1, 1). H is antisymmetric: H[i, j] > 0 means i
+was the more dominant of the two, and |H[i, j]| near 0 marks athletes of
+comparable dominance.
+
+Because every measure saturates, a big lead on one measure cannot make up
+for losing the other two, and H is not a difference of per-athlete scores
+(H[i, k] != H[i, j] + H[j, k] in general): it has to be computed and stored
+pair by pair.
+
+H has N^2 entries, so it is never held in memory. build_matchups() fills
+one band of MATCHUP_BLOCK rows at a time, tile by tile (MATCHUP_BLOCK x
+MATCHUP_BLOCK, small enough to stay in cache), and streams each band to
+its own compressed file:
+
+    goat_matchups/
+        meta.json          athletes (sport, rank, name), block size, cache key
+        rows_00000.npz     H[0:B, :] as float32
+        rows_00001.npz     H[B:2B, :]
+        ...
+
+A query for one athlete reads only the band holding its row. The matrix is
+rebuilt only when a scored table changed since it was written.
+
+    python sports_matchups.py "Michael Jordan"
+"""
+
+import os
+import sys
+import json
+import shutil
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from sports_registry import PROJECT_ROOT, sport_display_name
+from sports_database import connect
+from sports_pooled import pooled_scores
+
+DEFAULT_MATCHUP_DIR = os.path.join(PROJECT_ROOT, "goat_matchups")
+
+# Rows per band file and side of the tiles computed at once
+MATCHUP_BLOCK = 256
+
+# Dominance measures compared head to head
+MATCHUP_MEASURES = ('normalized_index', 'z_score', 'percentile')
+
+# Lead on a measure (in standard deviations of it) that counts as tanh(1) ~ 0.76 of a win
+MATCHUP_MARGIN = 0.5
+
+
+# ------------------- FEATURES ---------------------
+def matchup_features(athletes):
+    """
+    Scaled dominance measures of every athlete.
+
+    Args:
+        athletes: DataFrame from pooled_scores()
+
+    Returns:
+        float32 array (athletes x measures), each measure divided by
+        MATCHUP_MARGIN times its standard deviation over all athletes
+    """
+    features = athletes[list(MATCHUP_MEASURES)].to_numpy(dtype=np.float64)
+    spread = features.std(axis=0)
+    return (features / (MATCHUP_MARGIN * np.where(spread > 0, spread, 1.0))).astype(np.float32)
+
+
+def _matchup_key(db_path):
+    """Cache key: the scored tables' checksums, the measures, the margin and the block size."""
+    with connect(db_path) as conn:
+        checksums = conn.execute(
+            "SELECT sport, checksum FROM sync_state WHERE kind = 'scored' ORDER BY sport").fetchall()
+    return hashlib.sha1(repr((checksums, MATCHUP_MEASURES, MATCHUP_MARGIN, MATCHUP_BLOCK)).encode("utf-8")).hexdigest()
+
+
+# ------------------- BUILD ---------------------
+def _fill_band(features, start, stop, block, out):
+    """Writes H[start:stop, :] into out, one block x block tile at a time."""
+    rows = features[start:stop]
+    for col in range(0, len(features), block):
+        cols = features[col:col + block]
+        # Tile of shape (rows, cols): mean over the measures of the soft wins
+        np.mean(np.tanh(rows[:, None, :] - cols[None, :, :]), axis=2, out=out[:, col:col + block])
+
+
+def build_matchups(db_path=None, matchup_dir=DEFAULT_MATCHUP_DIR, block=MATCHUP_BLOCK, force=False):
+    """
+    Computes the head-to-head matrix and streams it to disk band by band.
+
+    Args:
+        db_path: Database file
+        matchup_dir: Output directory (replaced atomically)
+        block: Rows per band and tile side
+        force: Rebuild even if the stored matrix is current
+
+    Returns:
+        The meta dict of the stored matrix
+    """
+    athletes = pooled_scores(db_path)
+    key = _matchup_key(db_path)
+    meta_path = os.path.join(matchup_dir, "meta.json")
+    if not force and os.path.exists(meta_path):
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta['key'] == key and meta['block'] == block:
+            return meta
+
+    features = matchup_features(athletes)
+    n = len(features)
+    tmp_dir = matchup_dir + ".tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+
+    band = np.empty((block, n), dtype=np.float32)
+    for band_id, start in enumerate(range(0, n, block)):
+        stop = min(start + block, n)
+        out = band[:stop - start]
+        _fill_band(features, start, stop, block, out)
+        np.savez_compressed(os.path.join(tmp_dir, f"rows_{band_id:05d}.npz"), rows=out)
+
+    meta = {
+        'key': key,
+        'block': block,
+        'n_athletes': n,
+        'measures': list(MATCHUP_MEASURES),
+        'sport': athletes['sport'].tolist(),
+        'rank': athletes['rank'].astype(int).tolist(),
+        'player_name': athletes['player_name'].tolist(),
+    }
+    with open(os.path.join(tmp_dir, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    shutil.rmtree(matchup_dir, ignore_errors=True)
+    os.replace(tmp_dir, matchup_dir)
+    return meta
+
+
+# ------------------- QUERIES ---------------------
+class MatchupMatrix:
+    """
+    Read access to a stored head-to-head matrix.
+
+    Bands are loaded on first use and kept, so repeated queries about the
+    same athletes read each band file once.
+    """
+
+    def __init__(self, matchup_dir=DEFAULT_MATCHUP_DIR, db_path=None):
+        self.matchup_dir = matchup_dir
+        self.meta = build_matchups(db_path, matchup_dir)
+        self.athletes = pd.DataFrame({col: self.meta[col] for col in ('sport', 'rank', 'player_name')})
+        self._bands = {}
+
+    def find(self, name, sport=None):
+        """
+        Row of an athlete in the matrix.
+
+        Args:
+            name: Exact player name
+            sport: Sport directory name (needed only if the name is ambiguous)
+
+        Returns:
+            Row index (the best-ranked match)
+
+        Raises:
+            KeyError: If no athlete matches
+        """
+        mask = self.athletes['player_name'] == name
+        if sport is not None:
+            mask &= self.athletes['sport'] == sport
+        matches = self.athletes[mask].sort_values('rank', kind='stable')
+        if matches.empty:
+            raise KeyError(f"No athlete named '{name}'" + (f" in {sport}" if sport else ""))
+        return int(matches.index[0])
+
+    def row(self, index):
+        """H[index, :] as a float32 array."""
+        band_id, offset = divmod(index, self.meta['block'])
+        if band_id not in self._bands:
+            path = os.path.join(self.matchup_dir, f"rows_{band_id:05d}.npz")
+            with np.load(path, allow_pickle=False) as data:
+                self._bands[band_id] = data['rows']
+        return self._bands[band_id][offset]
+
+    def head_to_head(self, name_a, name_b, sport_a=None, sport_b=None):
+        """Head-to-head value of two athletes in (-1, 1) (> 0: the first was more dominant)."""
+        return float(self.row(self.find(name_a, sport_a))[self.find(name_b, sport_b)])
+
+    def versus_all(self, name, sport=None):
+        """
+        One athlete against every other athlete.
+
+        Returns:
+            DataFrame of the other athletes with their head-to-head value,
+            most dominated opponents first
+        """
+        index = self.find(name, sport)
+        result = self.athletes.assign(head_to_head=self.row(index)).drop(index)
+        return result.sort_values('head_to_head', ascending=False, kind='stable')
+
+    def most_comparable(self, name, sport=None, n=10, other_sports=True):
+        """
+        Athletes whose dominance is closest to an athlete's.
+
+        Args:
+            name: Player name
+            sport: Sport directory name (if the name is ambiguous)
+            n: Number of athletes to return
+            other_sports: Only consider athletes of other sports
+
+        Returns:
+            DataFrame of the n athletes with the smallest |head_to_head|
+        """
+        index = self.find(name, sport)
+        result = self.athletes.assign(head_to_head=self.row(index)).drop(index)
+        if other_sports:
+            result = result[result['sport'] != self.athletes.at[index, 'sport']]
+        order = np.argsort(np.abs(result['head_to_head'].to_numpy()), kind='stable')[:n]
+        return result.iloc[order]
+
+
+def main():
+    name = sys.argv[1] if len(sys.argv) > 1 else "Michael Jordan"
+    matrix = MatchupMatrix()
+    index = matrix.find(name)
+    sport = matrix.athletes.at[index, 'sport']
+    print(f"\n====== ATHLETES IN OTHER SPORTS MOST COMPARABLE TO {name.upper()} "
+          f"({sport_display_name(sport)}) ======")
+    for row in matrix.most_comparable(name).itertuples():
+        print(f"{row.player_name:<28} {sport_display_name(row.sport):<22} rank {row.rank:>2}  "
+              f"head-to-head {row.head_to_head:+.3f}")
+    print(f"\n{matrix.meta['n_athletes']} athletes, {matrix.meta['n_athletes'] ** 2:,} pairs "
+          f"in {os.path.relpath(matrix.matchup_dir, PROJECT_ROOT)}/")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,369 @@
+"""
+Nearest-neighbour search over athlete stat profiles.
+
+Two kinds of profile are indexed:
+
+    per sport    every numeric stat of the sport's dataset, standardized
+                 (z-score per column), e.g. "which NBA players are closest
+                 to Michael Jordan?"
+    cross-sport  the dimensions every sport shares (SHARED_DIMENSIONS: win %,
+                 titles, longevity, earnings), each as a z-score within its
+                 sport; a sport without a dimension sits at its average (0)
+
+Each profile matrix is indexed by a KD-tree (scipy's cKDTree) and pickled to
+NEIGHBOR_CACHE_DIR together with the checksums of the datasets it was built
+from, so an index is built once per dataset version and a query costs one
+tree lookup (well under a millisecond at these sizes).
+
+When a dataset changes, the index is updated instead of rebuilt: rows whose
+values changed or that were removed are masked in the tree, changed and new
+rows go to a small delta that is searched by brute force, and the
+standardization keeps the parameters of the last full build. Once the delta
+holds more than REBUILD_FRACTION of the rows (or the columns change) the
+index is rebuilt from scratch.
+
+    python sports_neighbors.py "Michael Jordan"          # same sport
+    python sports_neighbors.py "Michael Jordan" --cross  # across sports
+"""
+
+import os
+import sys
+import time
+import pickle
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+from sports_registry import PROJECT_ROOT, SPORTS, list_sports, sport_path, sport_display_name
+from sports_storage import read_table, table_checksum
+
+NEIGHBOR_CACHE_DIR = os.path.join(PROJECT_ROOT, "goat_neighbors")
+
+# Share of changed rows above which an update rebuilds the whole tree
+REBUILD_FRACTION = 0.25
+
+# Key of the cross-sport index in the cache
+CROSS_SPORT = "cross_sport"
+
+# Shared dimension -> source per sport: a column, a tuple of columns to sum,
+# or ('ratio', wins, losses) for a win percentage (0-1). Sports without a
+# source for a dimension are left at their average.
+SHARED_DIMENSIONS = {
+    'win_pct': {
+        'american_football': ('ratio', 'wins', 'losses'),
+        'mens_boxing': ('ratio', 'wins', 'losses'),
+        'womens_boxing': ('ratio', 'wins', 'losses'),
+        'mens_ufc': ('ratio', 'wins', 'losses'),
+        'womens_ufc': ('ratio', 'wins', 'losses'),
+        'mens_tennis': ('ratio', 'career_match_wins', 'career_match_losses'),
+        'womens_tennis': ('ratio', 'career_match_wins', 'career_match_losses'),
+        'mens_swimming': 'career_win_percentage',
+        'womens_swimming': 'career_win_percentage',
+    },
+    'titles': {
+        'american_football': 'super_bowl_titles',
+        'badminton': 'international_titles_won',
+        'cricket': 'world_cup_wins',
+        'field_hockey': 'world_cup_titles',
+        'mens_boxing': 'world_titles_held',
+        'womens_boxing': 'world_titles_held',
+        'mens_golf': 'total_major_wins',
+        'womens_golf': 'total_major_wins',
+        'mens_hockey': 'stanley_cups',
+        'womens_hockey': 'olympic_gold_medals',
+        'mens_soccer': ('fifa_world_cup_titles', 'continental_titles', 'league_titles', 'champions_league_titles'),
+        'womens_soccer': ('fifa_womens_world_cup_titles', 'continental_titles', 'league_titles',
+                          'champions_league_titles'),
+        'mens_swimming': 'olympic_gold_medals',
+        'womens_swimming': 'olympic_gold_medals',
+        'mens_table_tennis': 'international_titles_won',
+        'womens_table_tennis': 'international_titles_won',
+        'mens_tennis': 'grand_slam_singles_titles',
+        'womens_tennis': 'grand_slam_singles_titles',
+        'mens_ufc': 'ufc_championships_won',
+        'womens_ufc': 'ufc_championships_won',
+        'mlb': 'world_series_titles',
+        'nba': 'championships',
+        'wnba': 'championships',
+        'rugby': 'world_cup_titles',
+        'volleyball': 'total_medals_won',
+    },
+    'longevity': {
+        sport: 'seasons_played' if sport in ('mlb', 'nba', 'wnba') else
+               'career_length_years' if sport == 'rugby' else 'years_active'
+        for sport in SPORTS
+    },
+    'earnings': {
+        sport: 'career_prize_money_million_usd' if sport in ('mens_tennis', 'womens_tennis') else
+               'total_prize_money_million_usd' if sport in ('mens_swimming', 'womens_swimming') else
+               'career_earnings_million_usd'
+        for sport in SPORTS if sport not in ('mlb', 'nba', 'wnba', 'rugby')
+    },
+}
+
+
+# ------------------- PROFILES ---------------------
+def _row_labels(names):
+    """Unique row labels: the name, with ' (2)', ' (3)' ... for repeated names."""
+    counts = {}
+    labels = []
+    for name in names:
+        counts[name] = counts.get(name, 0) + 1
+        labels.append(name if counts[name] == 1 else f"{name} ({counts[name]})")
+    return labels
+
+
+def _zscores(values):
+    """Column z-scores (0 for constant columns and missing values)."""
+    z = np.zeros_like(values)
+    present = ~np.all(np.isnan(values), axis=0)
+    if present.any():
+        mean = np.nanmean(values[:, present], axis=0)
+        std = np.nanstd(values[:, present], axis=0)
+        z[:, present] = np.nan_to_num((values[:, present] - mean) / np.where(std > 0, std, 1.0), nan=0.0)
+    return z
+
+
+def sport_profile(sport):
+    """
+    Raw numeric stat profile of every athlete of a sport.
+
+    Returns:
+        DataFrame indexed by row label with one float column per numeric stat
+    """
+    df = read_table(sport_path(sport, 'dataset'))
+    numeric = df.select_dtypes(include='number').astype(np.float64)
+    numeric.index = pd.Index(_row_labels(df[SPORTS[sport]["name_col"]]), name='label')
+    return numeric
+
+
+def _shared_source(df, source):
+    if isinstance(source, str):
+        return df[source].to_numpy(dtype=np.float64)
+    if source[0] == 'ratio':
+        wins = df[source[1]].to_numpy(dtype=np.float64)
+        losses = df[source[2]].to_numpy(dtype=np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return wins / (wins + losses)
+    return df[list(source)].to_numpy(dtype=np.float64).sum(axis=1)
+
+
+def shared_profile(sports=None):
+    """
+    Cross-sport profile on the SHARED_DIMENSIONS.
+
+    Every dimension is a z-score within the athlete's sport, so an NBA
+    title count and a Grand Slam count are compared by how exceptional
+    they are in their sport.
+
+    Returns:
+        DataFrame indexed by 'sport/label' with one column per dimension
+    """
+    frames = []
+    for sport in sports or list_sports():
+        df = read_table(sport_path(sport, 'dataset'))
+        values = np.full((len(df), len(SHARED_DIMENSIONS)), np.nan)
+        for j, sources in enumerate(SHARED_DIMENSIONS.values()):
+            if sport in sources:
+                values[:, j] = _shared_source(df, sources[sport])
+        labels = [f"{sport}/{label}" for label in _row_labels(df[SPORTS[sport]["name_col"]])]
+        frames.append(pd.DataFrame(_zscores(values), index=labels, columns=list(SHARED_DIMENSIONS)))
+    profile = pd.concat(frames)
+    profile.index.name = 'label'
+    return profile
+
+
+# ------------------- INDEX ---------------------
+class NeighborIndex:
+    """
+    KD-tree over standardized profiles with incremental updates.
+
+    Rows are identified by label. The tree covers the rows of the last full
+    build; rows changed or removed since are masked in it, and changed or
+    added rows are searched by brute force in the delta.
+    """
+
+    def __init__(self, profile, version=None):
+        self.version = version
+        self._build(profile)
+
+    def _build(self, profile):
+        values = profile.to_numpy(dtype=np.float64)
+        self.columns = list(profile.columns)
+        self.mean = np.nanmean(values, axis=0) if len(values) else np.zeros(len(self.columns))
+        std = np.nanstd(values, axis=0) if len(values) else np.ones(len(self.columns))
+        self.scale = np.where(std > 0, std, 1.0)
+
+        self.tree_labels = list(profile.index)
+        self.tree = cKDTree(self._standardize(values))
+        self.alive = np.ones(len(self.tree_labels), dtype=bool)
+        self.delta_labels = []
+        self.delta_points = np.empty((0, len(self.columns)))
+        self.row_hashes = dict(zip(profile.index, pd.util.hash_pandas_object(profile, index=False)))
+
+    def _standardize(self, values):
+        return np.nan_to_num((values - self.mean) / self.scale, nan=0.0)
+
+    def __len__(self):
+        return int(self.alive.sum()) + len(self.delta_labels)
+
+    def update(self, profile, version=None):
+        """
+        Brings the index in line with a new version of the profile.
+
+        Args:
+            profile: DataFrame like the one the index was built from
+            version: Version tag of the new profile
+
+        Returns:
+            Number of rows that were changed, added or removed
+        """
+        self.version = version
+        if list(profile.columns) != self.columns:
+            self._build(profile)
+            return len(profile)
+
+        hashes = dict(zip(profile.index, pd.util.hash_pandas_object(profile, index=False)))
+        removed = [label for label in self.row_hashes if label not in hashes]
+        changed = [label for label, h in hashes.items() if self.row_hashes.get(label) != h]
+        if len(removed) + len(changed) + len(self.delta_labels) > REBUILD_FRACTION * max(len(profile), 1):
+            self._build(profile)
+            return len(removed) + len(changed)
+
+        stale = set(removed) | set(changed)
+        self.alive &= np.array([label not in stale for label in self.tree_labels], dtype=bool)
+        kept = [i for i, label in enumerate(self.delta_labels) if label not in stale]
+        self.delta_labels = [self.delta_labels[i] for i in kept] + changed
+        self.delta_points = np.vstack((self.delta_points[kept],
+                                       self._standardize(profile.loc[changed].to_numpy(dtype=np.float64))))
+        self.row_hashes = hashes
+        return len(removed) + len(changed)
+
+    def point(self, label):
+        """Standardized profile of a row."""
+        if label in self.delta_labels:
+            return self.delta_points[self.delta_labels.index(label)]
+        return self.tree.data[self.tree_labels.index(label)]
+
+    def query(self, point, k=5, exclude=None):
+        """
+        The k rows closest to a standardized point.
+
+        Args:
+            point: Standardized profile (e.g. from point())
+            k: Number of neighbours
+            exclude: Optional label to leave out (the query athlete)
+
+        Returns:
+            List of (label, distance), closest first
+        """
+        # Ask the tree for enough extra rows to make up for masked ones
+        wanted = min(k + int((~self.alive).sum()) + 1, len(self.tree_labels))
+        found = []
+        if wanted:
+            distances, rows = self.tree.query(point, k=wanted)
+            distances, rows = np.atleast_1d(distances), np.atleast_1d(rows)
+            found = [(self.tree_labels[r], d) for d, r in zip(distances, rows)
+                     if r < len(self.tree_labels) and self.alive[r]]
+        if self.delta_labels:
+            distances = np.sqrt(((self.delta_points - point) ** 2).sum(axis=1))
+            found += list(zip(self.delta_labels, distances))
+        found = [(label, float(d)) for label, d in found if label != exclude]
+        return sorted(found, key=lambda item: item[1])[:k]
+
+
+def _profile_version(sports):
+    return tuple(table_checksum(sport_path(sport, 'dataset')) for sport in sports)
+
+
+def neighbor_index(sport=CROSS_SPORT, cache_dir=NEIGHBOR_CACHE_DIR):
+    """
+    The current neighbour index of a sport (or CROSS_SPORT), built or updated as needed.
+
+    Args:
+        sport: Sport directory name, or CROSS_SPORT for the shared dimensions
+        cache_dir: Directory of the pickled indexes
+
+    Returns:
+        NeighborIndex matching the current datasets
+    """
+    sports = list_sports() if sport == CROSS_SPORT else [sport]
+    version = _profile_version(sports)
+    path = os.path.join(cache_dir, f"{sport}.pickle")
+    index = None
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            index = pickle.load(f)
+        if index.version == version:
+            return index
+
+    profile = shared_profile(sports) if sport == CROSS_SPORT else sport_profile(sport)
+    if index is None:
+        index = NeighborIndex(profile, version)
+    else:
+        index.update(profile, version)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(index, f)
+    os.replace(tmp_path, path)
+    return index
+
+
+def _find_sport(name):
+    for sport in list_sports():
+        if name in set(read_table(sport_path(sport, 'dataset'), columns=[SPORTS[sport]["name_col"]]).iloc[:, 0]):
+            return sport
+    raise KeyError(f"No athlete named '{name}'")
+
+
+def similar_athletes(name, sport=None, k=5, cross_sport=False):
+    """
+    Athletes whose stat profiles are closest to an athlete's.
+
+    Args:
+        name: Player name (row label)
+        sport: Sport of the athlete (looked up if omitted)
+        k: Number of neighbours
+        cross_sport: Search the shared dimensions of all sports instead of
+            the athlete's own sport
+
+    Returns:
+        DataFrame with sport, player_name and distance, closest first
+    """
+    sport = sport or _find_sport(name)
+    if cross_sport:
+        index, label = neighbor_index(CROSS_SPORT), f"{sport}/{name}"
+    else:
+        index, label = neighbor_index(sport), name
+    neighbors = index.query(index.point(label), k, exclude=label)
+    rows = [(*(found.split("/", 1) if cross_sport else (sport, found)), distance) for found, distance in neighbors]
+    return pd.DataFrame(rows, columns=['sport', 'player_name', 'distance'])
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if arg != '--cross']
+    cross_sport = '--cross' in sys.argv
+    name = args[0] if args else "Michael Jordan"
+    result = similar_athletes(name, cross_sport=cross_sport)
+
+    sport = _find_sport(name)
+    index = neighbor_index(CROSS_SPORT if cross_sport else sport)
+    label = f"{sport}/{name}" if cross_sport else name
+    point = index.point(label)
+    start = time.perf_counter()
+    for _ in range(1000):
+        index.query(point, 5, exclude=label)
+    per_query = (time.perf_counter() - start) / 1000
+
+    scope = "ACROSS SPORTS" if cross_sport else f"IN {sport_display_name(sport).upper()}"
+    print(f"\n====== CLOSEST TO {name.upper()} {scope} ======")
+    for row in result.itertuples():
+        print(f"{row.player_name:<28} {sport_display_name(row.sport):<22} distance {row.distance:.3f}")
+    print(f"\n{len(index)} profiles, {per_query * 1e6:.0f} us per 5-NN query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+"""
+Lazy query plans for ranking requests.
+
+A calculator's main() materializes a DataFrame at every step: the loaded
+dataset, the frame with the index column, the sorted copy and the copy made
+by normalize_indexes(). A Plan records the same steps without running them:
+
+    plan = (Plan.scan('nba')
+            .derive('win_share_per_season', lambda ws, years: ws / years, 'career_ws', 'years_active')
+            .score()
+            .normalize()
+            .rank()
+            .head(10)
+            .select('player_name', 'normalized_index', 'rank'))
+    top_10 = plan.collect()
+    print(plan.explain())
+
+collect() optimizes the plan before running it:
+
+    - projection pushdown: only the columns the selected outputs depend on
+      are loaded (as memory-mapped views), and unused derives are dropped
+    - score + normalize are fused into one step over the score array
+    - a sort is dropped when a later sort orders by the same key or by its
+      normalized copy; a sort followed by head(n) becomes a top-n selection
+    - sorting only permutes a row index; the selected columns are gathered
+      once, at the end, into the only DataFrame that is built
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from sports_registry import SPORTS, list_sports, sport_path, load_calc_function
+from sports_storage import load_feature_block, load_feature_columns, read_meta, columnar_path, row_count
+from sports_scoring import referenced_columns, score_columns
+from sports_schema import column_defaults
+
+
+# ------------------- NODES ---------------------
+class _Node:
+    """One step of a plan: its kind, parameters, and the columns it reads and writes."""
+
+    def __init__(self, kind, reads=(), writes=(), **params):
+        self.kind = kind
+        self.reads = tuple(reads)
+        self.writes = tuple(writes)
+        self.params = params
+
+    def with_params(self, **params):
+        return _Node(self.kind, self.reads, self.writes, **dict(self.params, **params))
+
+    def describe(self):
+        if self.kind == 'scan':
+            columns = self.params['columns']
+            shown = "all columns" if columns is None else f"{len(columns)} columns: {', '.join(columns)}"
+            return f"Scan {self.params['sport'] or self.params['csv_path']} [{shown}]"
+        if self.kind == 'derive':
+            return f"Derive {self.writes[0]} <- {', '.join(self.reads)}"
+        if self.kind == 'score':
+            return f"Score {self.writes[0]} <- {self.params['func'].__name__} ({len(self.reads)} inputs)"
+        if self.kind == 'normalize':
+            return f"Normalize {self.writes[0]} <- {self.reads[0]}"
+        if self.kind == 'score_normalize':
+            return (f"ScoreNormalize {self.writes[0]}, {self.writes[1]} <- "
+                    f"{self.params['func'].__name__} ({len(self.reads)} inputs)")
+        if self.kind == 'sort':
+            return f"Sort by {self.reads[0]} {'desc' if self.params['descending'] else 'asc'}"
+        if self.kind == 'top':
+            return f"Top {self.params['n']} by {self.reads[0]} {'desc' if self.params['descending'] else 'asc'}"
+        if self.kind == 'rank':
+            return f"Rank {self.writes[0]}"
+        if self.kind == 'head':
+            return f"Head {self.params['n']}"
+        if self.kind == 'select':
+            return f"Select {', '.join(self.reads)}"
+        return self.kind
+
+
+# ------------------- PLAN ---------------------
+class Plan:
+    """
+    Immutable chain of ranking steps; every builder method returns a new Plan.
+
+    Nothing is loaded or computed until collect().
+    """
+
+    def __init__(self, nodes):
+        self.nodes = tuple(nodes)
+
+    @classmethod
+    def scan(cls, sport):
+        """Starts a plan from a sport's dataset."""
+        return cls([_Node('scan', sport=sport, csv_path=sport_path(sport, 'dataset'), columns=None)])
+
+    @classmethod
+    def scan_table(cls, csv_path):
+        """Starts a plan from any stored table."""
+        return cls([_Node('scan', sport=None, csv_path=csv_path, columns=None)])
+
+    def _then(self, node):
+        return Plan(self.nodes + (node,))
+
+    @property
+    def sport(self):
+        return self.nodes[0].params['sport']
+
+    def derive(self, name, func, *inputs):
+        """
+        Adds a column computed elementwise from other columns.
+
+        Args:
+            name: New column
+            func: Function taking one array per input column
+            *inputs: Input column names
+        """
+        return self._then(_Node('derive', reads=inputs, writes=[name], func=func))
+
+    def score(self, func=None, output=None):
+        """
+        Adds the index score column.
+
+        Args:
+            func: Row-wise index function (default: the sport's calculator)
+            output: Score column (default: the sport's index column)
+        """
+        if func is None or output is None:
+            if self.sport is None:
+                raise ValueError("score() needs func and output when the plan does not scan a sport")
+            func = func or load_calc_function(self.sport)
+            output = output or SPORTS[self.sport]["index_col"]
+        return self._then(_Node('score', reads=referenced_columns(func), writes=[output], func=func))
+
+    def _last_score(self):
+        for node in reversed(self.nodes):
+            if node.kind == 'score':
+                return node.writes[0]
+        raise ValueError("No score() step to refer to")
+
+    def normalize(self, source=None, output='normalized_index'):
+        """Adds a 0-100 column scaled by the maximum of source (default: the score), like normalize_indexes()."""
+        return self._then(_Node('normalize', reads=[source or self._last_score()], writes=[output]))
+
+    def sort(self, by, descending=True):
+        """Orders the rows by a column (stable)."""
+        return self._then(_Node('sort', reads=[by], descending=descending))
+
+    def rank(self, by=None, output='rank'):
+        """Orders the rows by a column (default: the score), best first, and numbers them from 1."""
+        return self.sort(by or self._last_score())._then(_Node('rank', writes=[output]))
+
+    def head(self, n):
+        """Keeps the first n rows."""
+        return self._then(_Node('head', n=n))
+
+    def select(self, *columns):
+        """Sets the output columns (default: every column the plan has)."""
+        return self._then(_Node('select', reads=columns))
+
+    # ------------------- OPTIMIZATION ---------------------
+    def optimize(self):
+        """
+        Returns the optimized equivalent of the plan (see module docstring).
+        """
+        nodes = list(self.nodes)
+        nodes = _fuse_score_normalize(nodes)
+        nodes = _drop_redundant_sorts(nodes)
+        nodes = _fuse_top_n(nodes)
+        nodes = _push_down_projection(nodes)
+        return Plan(nodes)
+
+    def explain(self, optimized=True):
+        """Returns the plan's steps, one per line."""
+        plan = self.optimize() if optimized else self
+        return "\n".join(f"{i}. {node.describe()}" for i, node in enumerate(plan.nodes))
+
+    def collect(self):
+        """
+        Optimizes and runs the plan.
+
+        Returns:
+            DataFrame holding only the selected columns, in plan order
+        """
+        return _execute(self.optimize().nodes)
+
+
+# ------------------- OPTIMIZER PASSES ---------------------
+def _fuse_score_normalize(nodes):
+    """Merges a normalize of a score column into the score step when no head() runs in between."""
+    result = list(nodes)
+    for i, node in enumerate(result):
+        if node is None or node.kind != 'score':
+            continue
+        for j in range(i + 1, len(result)):
+            other = result[j]
+            if other is None:
+                continue
+            if other.kind in ('head', 'top'):
+                break
+            if other.kind == 'normalize' and other.reads[0] == node.writes[0]:
+                result[i] = _Node('score_normalize', reads=node.reads, writes=node.writes + other.writes,
+                                  func=node.params['func'])
+                result[j] = None
+                break
+    return [node for node in result if node is not None]
+
+
+def _sort_key(node, normalized_from):
+    return (normalized_from.get(node.reads[0], node.reads[0]), node.params['descending'])
+
+
+def _drop_redundant_sorts(nodes):
+    """Drops a sort when a later sort (before any head) uses the same key or its normalized copy."""
+    normalized_from = {}
+    for node in nodes:
+        if node.kind == 'normalize':
+            normalized_from[node.writes[0]] = node.reads[0]
+        elif node.kind == 'score_normalize':
+            normalized_from[node.writes[1]] = node.writes[0]
+
+    keep = []
+    for i, node in enumerate(nodes):
+        if node.kind == 'sort':
+            key = _sort_key(node, normalized_from)
+            redundant = False
+            for later in nodes[i + 1:]:
+                if later.kind in ('head', 'rank') or (later.kind == 'derive' and node.reads[0] in later.writes):
+                    break
+                if later.kind == 'sort':
+                    redundant = _sort_key(later, normalized_from) == key
+                    break
+            if redundant:
+                continue
+        keep.append(node)
+    return keep
+
+
+def _fuse_top_n(nodes):
+    """Turns sort + head(n) (optionally with rank in between) into a top-n selection."""
+    result = list(nodes)
+    for i, node in enumerate(result):
+        if node.kind != 'sort':
+            continue
+        j = i + 1
+        while j < len(result) and result[j].kind in ('rank', 'derive', 'select'):
+            j += 1
+        if j < len(result) and result[j].kind == 'head':
+            result[i] = _Node('top', reads=node.reads, n=result[j].params['n'], descending=node.params['descending'])
+            result[j] = None
+            return [n for n in result if n is not None]
+    return result
+
+
+def _push_down_projection(nodes):
+    """Walks the plan backwards, keeping only the columns (and derives) the outputs need."""
+    select = next((node for node in reversed(nodes) if node.kind == 'select'), None)
+    if select is None:
+        return nodes  # every column is an output
+
+    needed = set(select.reads)
+    kept = []
+    for node in reversed(nodes[1:]):
+        if node.kind == 'derive' and not needed.intersection(node.writes):
+            continue
+        if node.kind in ('derive', 'score', 'score_normalize', 'normalize'):
+            needed.difference_update(node.writes)
+        if node.kind == 'rank':
+            needed.discard(node.writes[0])
+        needed.update(node.reads)
+        kept.append(node)
+
+    scan = nodes[0]
+    stored = [c['name'] for c in read_meta(columnar_path(_fresh(scan.params['csv_path'])))['columns']]
+    # Evolved columns the table does not store come back as their defaults;
+    # other unknown columns score as 0 (see score_columns)
+    columns = [col for col in stored if col in needed] + [col for col in _defaults(scan) if col in needed and col not in stored]
+    return [scan.with_params(columns=columns)] + list(reversed(kept))
+
+
+def _defaults(scan):
+    return column_defaults(scan.params['sport']) if scan.params['sport'] else {}
+
+
+def _fresh(csv_path):
+    load_feature_block(csv_path)  # builds / refreshes the columnar copy if needed
+    return csv_path
+
+
+# ------------------- EXECUTION ---------------------
+def _execute(nodes):
+    scan = nodes[0]
+    csv_path = _fresh(scan.params['csv_path'])
+    n_rows = row_count(read_meta(columnar_path(csv_path)))
+    defaults = _defaults(scan)
+    columns = load_feature_columns(csv_path, scan.params['columns'], defaults=defaults)
+    order = np.arange(n_rows)  # sorts and heads only permute / cut this index
+    outputs = None
+
+    for node in nodes[1:]:
+        if node.kind == 'derive':
+            args = [np.asarray(columns[col], dtype=np.float64) for col in node.reads]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                columns[node.writes[0]] = np.broadcast_to(node.params['func'](*args), (n_rows,))
+        elif node.kind in ('score', 'score_normalize'):
+            scores = score_columns(columns, node.params['func'], n_rows, defaults=defaults)
+            columns[node.writes[0]] = scores
+            if node.kind == 'score_normalize':
+                columns[node.writes[1]] = (scores / scores.max()) * 100
+        elif node.kind == 'normalize':
+            source = np.asarray(columns[node.reads[0]], dtype=np.float64)
+            columns[node.writes[0]] = (source / source.max()) * 100
+        elif node.kind == 'sort':
+            keys = np.asarray(columns[node.reads[0]])[order]
+            positions = np.argsort(-keys if node.params['descending'] else keys, kind='stable')
+            order = order[positions]
+        elif node.kind == 'top':
+            keys = np.asarray(columns[node.reads[0]])[order]
+            keys = -keys if node.params['descending'] else keys
+            n = min(node.params['n'], len(order))
+            if n < len(order):
+                # Keep every row tied with the n-th so the stable sort below picks the same rows
+                threshold = np.partition(keys, n - 1)[n - 1]
+                candidates = np.flatnonzero(keys <= threshold)
+            else:
+                candidates = np.arange(len(order))
+            positions = candidates[np.argsort(keys[candidates], kind='stable')][:n]
+            order = order[positions]
+        elif node.kind == 'rank':
+            ranks = np.zeros(n_rows, dtype=np.int64)  # 0 = cut by an earlier head()
+            ranks[order] = np.arange(1, len(order) + 1)
+            columns[node.writes[0]] = ranks
+        elif node.kind == 'head':
+            order = order[:node.params['n']]
+        elif node.kind == 'select':
+            outputs = list(node.reads)
+
+    if outputs is None:
+        outputs = list(columns)
+    return pd.DataFrame({col: np.asarray(columns[col])[order] for col in outputs})
+
+
+def ranking_plan(sport, top=None):
+    """
+    The plan of a calculator's ranking: score, normalize, rank and keep the
+    name, score and normalized columns.
+
+    Args:
+        sport: Sport directory name
+        top: Optional number of leading rows to keep
+
+    Returns:
+        Plan
+    """
+    info = SPORTS[sport]
+    plan = Plan.scan(sport).score().sort(info["index_col"]).normalize().rank('normalized_index')
+    if top is not None:
+        plan = plan.head(top)
+    return plan.select(info["name_col"], info["index_col"], 'normalized_index', 'rank')
+
+
+def main():
+    print("\n====== OPTIMIZED RANKING PLAN (nba) ======")
+    print("Logical:")
+    print(ranking_plan('nba', top=10).explain(optimized=False))
+    print("Optimized:")
+    print(ranking_plan('nba', top=10).explain())
+
+    start = time.perf_counter()
+    results = {sport: ranking_plan(sport, top=10).collect() for sport in list_sports()}
+    elapsed = time.perf_counter() - start
+    print(f"\nRanked the top 10 of {len(results)} sports in {elapsed * 1000:.1f} ms")
+    for sport, top in results.items():
+        leader = top.iloc[0]
+        print(f"{sport:<22} {leader[SPORTS[sport]['name_col']]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Loading player records for the data creation scripts.
+
+The player records of every sport live in a JSON file next to the sport's
+creation script (e.g. nba/basketball_players.json) instead of being Python
+dict literals, so running a creation script no longer compiles thousands of
+lines of source just to emit a 30-row CSV.
+
+Parsed records are cached in a pickle next to the JSON file
+(<name>.cache.pickle, keyed by the JSON's size and mtime), so regenerating a
+dataset only pays for the JSON parse once after each edit.
+"""
+
+import os
+import csv
+import json
+import pickle
+
+CACHE_SUFFIX = ".cache.pickle"
+CACHE_VERSION = 1
+
+
+def _signature(path):
+    stat = os.stat(path)
+    return (CACHE_VERSION, stat.st_size, stat.st_mtime_ns)
+
+
+def cache_path(players_file):
+    """Returns the binary cache file that shadows a players JSON file."""
+    root, _ = os.path.splitext(players_file)
+    return root + CACHE_SUFFIX
+
+
+def load_players(players_file, use_cache=True):
+    """
+    Loads the player records of one sport.
+
+    Args:
+        players_file: Path of the sport's *_players.json file
+        use_cache: Read / refresh the binary cache (default True)
+
+    Returns:
+        List of dicts, one per player, in file order
+    """
+    signature = _signature(players_file)
+    cache_file = cache_path(players_file)
+
+    if use_cache and os.path.exists(cache_file):
+        try:
+            with open(cache_file, "rb") as f:
+                cached_signature, players = pickle.load(f)
+            if cached_signature == signature:
+                return players
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+            pass  # corrupt or incompatible cache, rebuild it below
+
+    with open(players_file, encoding="utf-8") as f:
+        players = json.load(f)
+
+    if use_cache:
+        try:
+            with open(cache_file, "wb") as f:
+                pickle.dump((signature, players), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass  # read-only checkout, the JSON is still the source of truth
+    return players
+
+
+def save_players(players_file, players):
+    """
+    Writes player records back to a sport's players JSON file.
+
+    Args:
+        players_file: Path of the sport's *_players.json file
+        players: List of player dicts
+    """
+    tmp_file = players_file + ".tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(players, f, indent=4, ensure_ascii=False)
+        f.write("\n")
+    os.replace(tmp_file, players_file)
+
+
+def validate_players(headers, players, name_col="player_name", expected_count=None, min_count=None):
+    """
+    Checks player records against a dataset's header list.
+
+    Args:
+        headers: Ordered list of dataset columns
+        players: List of player dicts
+        name_col: Column that identifies a player in error messages
+        expected_count: Optional exact number of players the dataset must have
+        min_count: Optional minimum number of players
+
+    Raises:
+        ValueError: If a record has a field that is not a header, has no
+            name, or the number of players is not the expected one
+    """
+    header_set = set(headers)
+    for i, player in enumerate(players):
+        unknown = [key for key in player if key not in header_set]
+        if unknown:
+            who = player.get(name_col, f"record #{i}")
+            raise ValueError(f"{who} has fields that are not in the headers: {unknown}")
+        if not player.get(name_col):
+            raise ValueError(f"Record #{i} has no {name_col}")
+    if expected_count is not None and len(players) != expected_count:
+        raise ValueError(f"Expected {expected_count} players, got {len(players)}")
+    if min_count is not None and len(players) < min_count:
+        raise ValueError(f"Expected at least {min_count} players, got {len(players)}")
+
+
+def write_dataset(headers, players, filename, name_col="player_name", expected_count=None, min_count=None):
+    """
+    Validates player records and writes them as a dataset CSV.
+
+    Fields a player does not have are written as 0 (the records themselves are
+    not modified).
+
+    Args:
+        headers: Ordered list of dataset columns
+        players: List of player dicts
+        filename: Output CSV path
+        name_col: Column that identifies a player
+        expected_count: Optional exact number of players the dataset must have
+        min_count: Optional minimum number of players
+    """
+    validate_players(headers, players, name_col=name_col,
+                     expected_count=expected_count, min_count=min_count)
+    with open(filename, mode="w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=headers)
+        writer.writeheader()
+        writer.writerows({h: player.get(h, 0) for h in headers} for player in players)
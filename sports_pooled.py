@@ -0,0 +1,144 @@
+"""
+Pooled cross-sport normalization.
+
+Each calculator normalizes its own sport (score / sport max), and the
+comparison only looks at the top two rows of each sport. pooled_scores()
+puts every athlete's raw index into one array with an integer sport code
+and computes all per-sport statistics in one grouped pass:
+
+    bincount over the codes        -> count, mean, standard deviation
+    one lexsort by (code, score)   -> max, quantiles and percentile ranks
+
+The statistics are broadcast back to the athletes through the codes (a
+grouped transform), giving scores that are comparable across sports for
+every athlete, not just the GOATs:
+
+    z_score             (raw - sport mean) / sport std
+    percentile          0-100 within the sport (average rank of ties)
+    pooled_percentile   0-100 of the z_score among all athletes of all sports
+
+z_score and percentile use the same definitions as normalize_scores().
+"""
+
+
+import numpy as np
+import pandas as pd
+
+from sports_registry import sport_display_name
+from sports_database import sync_database, query_athletes
+
+# Per-sport quantiles added as sport_q<percent> columns
+POOLED_QUANTILES = (0.5, 0.9)
+
+
+# ------------------- GROUPED STATISTICS ---------------------
+def _average_positions(order, keys):
+    """
+    0-based position of each element in sorted order, averaged over equal keys.
+
+    Args:
+        order: Permutation that sorts the elements
+        keys: Tuple of arrays (already in sorted order) whose equality defines ties
+    """
+    n = len(order)
+    if n == 0:
+        return np.empty(0, dtype=np.float64)
+    new_run = np.zeros(n, dtype=bool)
+    new_run[0] = True
+    for key in keys:
+        new_run[1:] |= key[1:] != key[:-1]
+    run_ids = np.cumsum(new_run) - 1
+    run_mean = np.bincount(run_ids, weights=np.arange(n)) / np.bincount(run_ids)
+    positions = np.empty(n, dtype=np.float64)
+    positions[order] = run_mean[run_ids]
+    return positions
+
+
+def grouped_statistics(codes, scores, quantiles=POOLED_QUANTILES):
+    """
+    Computes per-group statistics of scores in one pass over integer group codes.
+
+    Args:
+        codes: int array of group codes (0..n_groups-1) per element
+        scores: float array of scores
+        quantiles: Quantiles to compute per group (linear interpolation)
+
+    Returns:
+        Tuple (stats, positions): stats is a dict of per-group arrays
+        (count, mean, std, max, q<percent>...), positions the 0-based
+        within-group sorted position of every element (ties averaged)
+    """
+    codes = np.asarray(codes, dtype=np.int64)
+    scores = np.asarray(scores, dtype=np.float64)
+    n_groups = int(codes.max()) + 1 if len(codes) else 0
+
+    count = np.bincount(codes, minlength=n_groups).astype(np.float64)
+    mean = np.bincount(codes, weights=scores, minlength=n_groups) / count
+    deviation = scores - mean[codes]
+    std = np.sqrt(np.bincount(codes, weights=deviation * deviation, minlength=n_groups) / count)
+
+    order = np.lexsort((scores, codes))
+    sorted_scores = scores[order]
+    start = np.concatenate(([0], np.cumsum(count)[:-1])).astype(np.int64)
+    end = start + count.astype(np.int64) - 1
+
+    stats = {'count': count, 'mean': mean, 'std': std, 'max': sorted_scores[end]}
+    for q in quantiles:
+        position = start + q * (count - 1)
+        lower = np.floor(position).astype(np.int64)
+        upper = np.ceil(position).astype(np.int64)
+        fraction = position - lower
+        stats[f"q{int(round(q * 100))}"] = sorted_scores[lower] * (1 - fraction) + sorted_scores[upper] * fraction
+
+    positions = _average_positions(order, (codes[order], sorted_scores)) - start[codes]
+    return stats, positions
+
+
+# ------------------- POOLED SCORES ---------------------
+def pooled_scores(db_path=None, quantiles=POOLED_QUANTILES):
+    """
+    Computes cross-sport comparable scores for every athlete.
+
+    Args:
+        db_path: Database file (synced first)
+        quantiles: Per-sport quantiles to include
+
+    Returns:
+        DataFrame with one row per athlete: sport, rank, player_name,
+        country, raw_index, normalized_index, the sport's statistics
+        (sport_count, sport_mean, sport_std, sport_max, sport_q..),
+        z_score, percentile and pooled_percentile
+    """
+    sync_database(db_path)
+    athletes = query_athletes(db_path=db_path).sort_values(['sport', 'rank'], kind='stable').reset_index(drop=True)
+    sport_codes, _ = pd.factorize(athletes['sport'], sort=True)
+    raw = athletes['raw_index'].to_numpy(dtype=np.float64)
+
+    stats, positions = grouped_statistics(sport_codes, raw, quantiles)
+    for name, values in stats.items():
+        athletes[f"sport_{name}"] = values[sport_codes]
+
+    count = stats['count'][sport_codes]
+    std = stats['std'][sport_codes]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        athletes['z_score'] = np.where(std > 0, (raw - stats['mean'][sport_codes]) / std, 0.0)
+    athletes['percentile'] = positions * 100 / np.maximum(count - 1, 1)
+
+    # Pool every athlete as one group to rank the z-scores across sports
+    pooled_codes = np.zeros(len(athletes), dtype=np.int64)
+    _, pooled_positions = grouped_statistics(pooled_codes, athletes['z_score'].to_numpy(), quantiles=())
+    athletes['pooled_percentile'] = pooled_positions * 100 / max(len(athletes) - 1, 1)
+    return athletes
+
+
+def main():
+    athletes = pooled_scores()
+    top = athletes.sort_values('z_score', ascending=False, kind='stable').head(20)
+    print("\n====== MOST DOMINANT ATHLETES ACROSS ALL SPORTS (Z-SCORE WITHIN SPORT) ======")
+    for i, row in enumerate(top.itertuples(), start=1):
+        print(f"{i}. {row.player_name} ({sport_display_name(row.sport)}) - z {row.z_score:.2f}, "
+              f"pooled percentile {row.pooled_percentile:.1f}")
+
+
+if __name__ == "__main__":
+    main()
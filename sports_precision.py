@@ -0,0 +1,147 @@
+"""
+Accuracy guard for the float32 compute mode.
+
+In float32 mode the scoring engine computes every term on float32 columns
+and keeps the accumulations in float64. score_table(..., precision='float32')
+still reads the stored float64 blocks and casts a float32 copy of each
+column, so it saves no memory traffic by itself; the saving comes from
+sports_shared.publish_features(precision='float32'), whose shared blocks are
+float32 and take half the bytes. The terms are rounded to float32 either
+way, so before a sweep relies on that mode, require_float32() scores the
+current datasets both ways and refuses to continue if any athlete's rank
+moves by more than FLOAT32_RANK_TOLERANCE positions.
+
+The check is cached per (sport, dataset checksum, schema version, weight
+hash), so it only runs again after a dataset, a correction, a schema or a
+weight changes.
+
+    python sports_precision.py            # report for every sport
+"""
+
+import numpy as np
+import pandas as pd
+
+from sports_registry import list_sports, sport_path, load_calc_function
+from sports_storage import table_checksum
+from sports_scoring import score_table
+from sports_schema import schema_version
+from sports_snapshots import weight_spec_hash
+
+# Largest number of rank positions any athlete may move in float32 mode
+# compared with float64 (0 = the rankings must be identical)
+FLOAT32_RANK_TOLERANCE = 0
+
+# (sport, dataset checksum, schema version, weight hash) -> report row
+_verified = {}
+
+
+# ------------------- COMPARISON ---------------------
+def _rank_positions(scores):
+    """0-based rank of every row (highest score first, ties in stored order)."""
+    order = np.argsort(-scores, kind='stable')
+    positions = np.empty(len(scores), dtype=np.int64)
+    positions[order] = np.arange(len(scores))
+    return positions
+
+
+def compare_precision(sport):
+    """
+    Scores a sport in float64 and in float32 and compares the results.
+
+    Args:
+        sport: Sport directory name
+
+    Returns:
+        Dict with the sport, row count, max absolute and relative score
+        error, the number of athletes whose rank differs and the largest
+        rank shift
+    """
+    csv_path = sport_path(sport, 'dataset')
+    func = load_calc_function(sport)
+    key = (sport, table_checksum(csv_path), schema_version(sport), weight_spec_hash(func))
+    if key in _verified:
+        return _verified[key]
+
+    exact = score_table(csv_path, func, schema=sport)
+    reduced = score_table(csv_path, func, precision='float32', schema=sport)
+    error = np.abs(exact - reduced)
+    scale = np.max(np.abs(exact)) if len(exact) else 0.0
+    shifts = np.abs(_rank_positions(exact) - _rank_positions(reduced))
+
+    result = {
+        'sport': sport,
+        'n_rows': len(exact),
+        'max_abs_error': float(error.max()) if len(error) else 0.0,
+        'max_rel_error': float(error.max() / scale) if len(error) and scale else 0.0,
+        'rank_changes': int(np.count_nonzero(shifts)),
+        'max_rank_shift': int(shifts.max()) if len(shifts) else 0,
+    }
+    _verified[key] = result
+    return result
+
+
+def precision_report(sports=None):
+    """
+    Compares float32 and float64 scoring on every sport's current dataset.
+
+    Args:
+        sports: Optional list of sports (default: all)
+
+    Returns:
+        DataFrame with one compare_precision() row per sport
+    """
+    return pd.DataFrame([compare_precision(sport) for sport in sports or list_sports()])
+
+
+# ------------------- GUARD ---------------------
+def require_float32(sports=None, tolerance=None):
+    """
+    Checks that float32 mode ranks the given sports like float64.
+
+    Args:
+        sports: Optional list of sports (default: all)
+        tolerance: Largest allowed rank shift (default: FLOAT32_RANK_TOLERANCE)
+
+    Returns:
+        The precision report of the checked sports
+
+    Raises:
+        ValueError: If any sport's max rank shift exceeds the tolerance
+    """
+    tolerance = FLOAT32_RANK_TOLERANCE if tolerance is None else tolerance
+    report = precision_report(sports)
+    failing = report[report['max_rank_shift'] > tolerance]
+    if not failing.empty:
+        details = ", ".join(f"{row.sport} ({row.max_rank_shift} positions)" for row in failing.itertuples())
+        raise ValueError(f"float32 scoring moves ranks beyond the tolerance of {tolerance}: {details}")
+    return report
+
+
+def score_sport(sport, precision='float64', tolerance=None):
+    """
+    Scores a sport's dataset, verifying float32 mode first when it is requested.
+
+    Args:
+        sport: Sport directory name
+        precision: 'float64' or 'float32'
+        tolerance: Largest allowed rank shift in float32 mode
+
+    Returns:
+        float64 array of scores in stored row order
+    """
+    if precision == 'float32':
+        require_float32([sport], tolerance)
+    return score_table(sport_path(sport, 'dataset'), load_calc_function(sport), precision, schema=sport)
+
+
+def main():
+    report = precision_report()
+    print("\n====== FLOAT32 VS FLOAT64 SCORING ======")
+    print(report.to_string(index=False))
+    worst = report['max_rank_shift'].max()
+    status = "within" if worst <= FLOAT32_RANK_TOLERANCE else "EXCEEDS"
+    print(f"\nMax rank shift: {worst} ({status} the tolerance of {FLOAT32_RANK_TOLERANCE})")
+
+
+if __name__ == "__main__":
+    main()
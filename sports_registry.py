@@ -0,0 +1,111 @@
+"""
+Central list of every sport in the project and where its files live.
+
+Each sport directory follows the same layout (creation script, dataset CSV,
+index calculator, scored CSV and plot) but the file prefixes, the name column
+and the index column are not always derived from the directory name
+(e.g. nba/basketball_*, mens_ufc uses fighter_name, both soccer calculators
+write soccer_index). Shared tooling should look these up here instead of
+guessing from directory listings.
+"""
+
+import os
+import importlib.util
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# sport directory -> file prefix, calculator function, index column, name column
+SPORTS = {
+    "american_football":   {"prefix": "american_football",   "calc_function": "calc_american_football_index",   "index_col": "american_football_index",   "name_col": "player_name"},
+    "badminton":           {"prefix": "badminton",           "calc_function": "calc_badminton_index",           "index_col": "badminton_index",           "name_col": "player_name"},
+    "cricket":             {"prefix": "cricket",             "calc_function": "calc_cricket_index",             "index_col": "cricket_index",             "name_col": "player_name"},
+    "field_hockey":        {"prefix": "field_hockey",        "calc_function": "calc_field_hockey_index",        "index_col": "field_hockey_index",        "name_col": "player_name"},
+    "mens_boxing":         {"prefix": "mens_boxing",         "calc_function": "calc_mens_boxing_index",         "index_col": "mens_boxing_index",         "name_col": "player_name"},
+    "mens_golf":           {"prefix": "mens_golf",           "calc_function": "calc_mens_golf_index",           "index_col": "mens_golf_index",           "name_col": "player_name"},
+    "mens_hockey":         {"prefix": "mens_hockey",         "calc_function": "calc_mens_hockey_index",         "index_col": "mens_hockey_index",         "name_col": "player_name"},
+    "mens_soccer":         {"prefix": "mens_soccer",         "calc_function": "calc_soccer_index",              "index_col": "soccer_index",              "name_col": "player_name"},
+    "mens_swimming":       {"prefix": "mens_swimming",       "calc_function": "calc_mens_swimming_index",       "index_col": "mens_swimming_index",       "name_col": "player_name"},
+    "mens_table_tennis":   {"prefix": "mens_table_tennis",   "calc_function": "calc_table_tennis_index",        "index_col": "table_tennis_index",        "name_col": "player_name"},
+    "mens_tennis":         {"prefix": "mens_tennis",         "calc_function": "calc_mens_tennis_index",         "index_col": "mens_tennis_index",         "name_col": "player_name"},
+    "mens_ufc":            {"prefix": "mens_ufc",            "calc_function": "calc_mens_ufc_index",            "index_col": "mens_ufc_index",            "name_col": "fighter_name"},
+    "mlb":                 {"prefix": "mlb",                 "calc_function": "calc_mlb_index",                 "index_col": "mlb_index",                 "name_col": "player_name"},
+    "nba":                 {"prefix": "basketball",          "calc_function": "calc_basketball_index",          "index_col": "basketball_index",          "name_col": "player_name"},
+    "rugby":               {"prefix": "rugby",               "calc_function": "calc_rugby_index",               "index_col": "rugby_index",               "name_col": "player_name"},
+    "volleyball":          {"prefix": "volleyball",          "calc_function": "calc_volleyball_index",          "index_col": "volleyball_index",          "name_col": "player_name"},
+    "wnba":                {"prefix": "wnba",                "calc_function": "calc_wnba_index",                "index_col": "wnba_index",                "name_col": "player_name"},
+    "womens_boxing":       {"prefix": "womens_boxing",       "calc_function": "calc_womens_boxing_index",       "index_col": "womens_boxing_index",       "name_col": "player_name"},
+    "womens_golf":         {"prefix": "womens_golf",         "calc_function": "calc_womens_golf_index",         "index_col": "womens_golf_index",         "name_col": "player_name"},
+    "womens_hockey":       {"prefix": "womens_hockey",       "calc_function": "calc_womens_hockey_index",       "index_col": "womens_hockey_index",       "name_col": "player_name"},
+    "womens_soccer":       {"prefix": "womens_soccer",       "calc_function": "calc_soccer_index",              "index_col": "soccer_index",              "name_col": "player_name"},
+    "womens_swimming":     {"prefix": "womens_swimming",     "calc_function": "calc_womens_swimming_index",     "index_col": "womens_swimming_index",     "name_col": "player_name"},
+    "womens_table_tennis": {"prefix": "womens_table_tennis", "calc_function": "calc_table_tennis_index",        "index_col": "table_tennis_index",        "name_col": "player_name"},
+    "womens_tennis":       {"prefix": "womens_tennis",       "calc_function": "calc_womens_tennis_index",       "index_col": "womens_tennis_index",       "name_col": "player_name"},
+    "womens_ufc":          {"prefix": "womens_ufc",          "calc_function": "calc_womens_ufc_index",          "index_col": "womens_ufc_index",          "name_col": "fighter_name"},
+}
+
+# The UFC creation scripts were named *_data_collection.py
+CREATION_SUFFIX = {
+    "mens_ufc": "_data_collection.py",
+    "womens_ufc": "_data_collection.py",
+}
+
+_module_cache = {}
+
+
+def list_sports():
+    """Returns the sport directory names in a stable (alphabetical) order."""
+    return sorted(SPORTS)
+
+
+def sport_display_name(sport):
+    """Human readable sport name, e.g. 'mens_table_tennis' -> 'Mens Table Tennis'."""
+    return sport.replace('_', ' ').title()
+
+
+def sport_path(sport, kind):
+    """
+    Returns the absolute path of one of a sport's files.
+
+    Args:
+        sport: Sport directory name (a key of SPORTS)
+        kind: One of 'dir', 'dataset', 'scored', 'calculator', 'creation', 'plot'
+
+    Returns:
+        Absolute path as a string
+    """
+    info = SPORTS[sport]
+    sport_dir = os.path.join(PROJECT_ROOT, sport)
+    prefix = info["prefix"]
+
+    if kind == 'dir':
+        return sport_dir
+    if kind == 'dataset':
+        return os.path.join(sport_dir, f"{prefix}_dataset.csv")
+    if kind == 'scored':
+        return os.path.join(sport_dir, f"{prefix}_index_scored.csv")
+    if kind == 'calculator':
+        return os.path.join(sport_dir, f"{prefix}_index_calculator.py")
+    if kind == 'creation':
+        return os.path.join(sport_dir, prefix + CREATION_SUFFIX.get(sport, "_data_creation.py"))
+    if kind == 'plot':
+        return os.path.join(sport_dir, f"{prefix}_index_plot.png")
+    raise ValueError(f"Unknown file kind: {kind}")
+
+
+def load_module(sport, kind):
+    """Imports a sport's calculator or creation script as a module (cached)."""
+    key = (sport, kind)
+    if key not in _module_cache:
+        path = sport_path(sport, kind)
+        name = os.path.splitext(os.path.basename(path))[0]
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _module_cache[key] = module
+    return _module_cache[key]
+
+
+def load_calc_function(sport):
+    """Returns the row-wise calc_<sport>_index function of a sport."""
+    module = load_module(sport, 'calculator')
+    return getattr(module, SPORTS[sport]["calc_function"])
@@ -0,0 +1,377 @@
+"""
+Typed schema registry with compact dtypes.
+
+Read with default dtypes every dataset column becomes int64, float64 or a
+Python string, even though most of them are small counts (stanley_cups,
+olympic_gold_medals), percentages or a handful of repeated labels (country,
+position, weight_class, stance). sports_schemas.json declares a compact
+dtype for every column of every sport:
+
+    int8 / int16 / int32   counts, sized to the observed range with 2x headroom
+    float32                rates, percentages, averages, earnings
+    bool                   0/1 flags such as hall_of_fame_inducted
+    category               repeated labels (country, position, stance, ...)
+    string                 free text (names, team lists)
+
+apply_schema() converts a freshly loaded frame, enforce_schema() rejects
+writes whose values do not fit the declared types, and memory_report()
+compares resident memory with and without the schema. Run this module with
+--infer to regenerate the declarations after adding a sport.
+
+Adding a stat to a sport is a schema version, not a dataset rewrite:
+sports_schema_versions.json lists, per sport, the columns each version
+added with their dtype and default value.
+
+    python sports_schema.py --add-column american_football turnovers int16 0
+
+Stored datasets written before the column existed keep their files; readers
+expose the column with its default (read_table(..., schema=sport) adds it to
+the frame, load_feature_columns() returns a zero-stride view and the scoring
+engine uses the default as a broadcast scalar).
+"""
+
+import os
+import sys
+import json
+
+import numpy as np
+import pandas as pd
+
+from sports_registry import PROJECT_ROOT, SPORTS, list_sports, sport_path
+
+SCHEMA_FILE = os.path.join(PROJECT_ROOT, "sports_schemas.json")
+VERSIONS_FILE = os.path.join(PROJECT_ROOT, "sports_schema_versions.json")
+
+# Label columns that are always stored as categoricals
+CATEGORICAL_COLUMNS = {
+    "country", "national_team", "position", "primary_position", "weight_class",
+    "stance", "gender", "handedness", "event_type", "playing_style", "main_stroke",
+}
+
+# 0/1 columns that are flags rather than counts
+BOOL_COLUMN_MARKERS = ("hall_of_fame",)
+
+INT_DTYPES = ["int8", "int16", "int32", "int64"]
+
+_schemas = None
+_versions = None
+
+
+# ------------------- INFERENCE ---------------------
+def _int_dtype(values):
+    """Smallest signed integer dtype holding the values with 2x headroom."""
+    bound = 2 * max(abs(int(values.min())), abs(int(values.max())), 1)
+    for dtype in INT_DTYPES:
+        if bound <= np.iinfo(dtype).max:
+            return dtype
+    return "int64"
+
+
+def infer_schema(df, name_col='player_name'):
+    """
+    Proposes compact dtypes for a dataset.
+
+    Args:
+        df: Dataset loaded with default dtypes
+        name_col: Athlete name column (always kept as a plain string)
+
+    Returns:
+        Dict of column name -> dtype name
+    """
+    schema = {}
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_bool_dtype(series):
+            schema[col] = "bool"
+        elif pd.api.types.is_integer_dtype(series):
+            flag_values = set(series.unique()) <= {0, 1}
+            if flag_values and any(marker in col for marker in BOOL_COLUMN_MARKERS):
+                schema[col] = "bool"
+            else:
+                schema[col] = _int_dtype(series)
+        elif pd.api.types.is_float_dtype(series):
+            schema[col] = "float32"
+        elif col != name_col and (col in CATEGORICAL_COLUMNS or series.nunique() <= len(series) // 2):
+            schema[col] = "category"
+        else:
+            schema[col] = "string"
+    return schema
+
+
+def infer_all_schemas():
+    """Infers the schema of every sport from its current dataset."""
+    return {
+        sport: infer_schema(pd.read_csv(sport_path(sport, 'dataset')), SPORTS[sport]["name_col"])
+        for sport in list_sports()
+    }
+
+
+def write_schemas(schemas=None, path=SCHEMA_FILE):
+    """Writes the schema declarations (inferring them if not given)."""
+    global _schemas
+    schemas = schemas or infer_all_schemas()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(schemas, f, indent=1)
+        f.write("\n")
+    _schemas = None
+    return schemas
+
+
+# ------------------- REGISTRY ---------------------
+def load_schemas():
+    """Returns the declared schemas of all sports (cached)."""
+    global _schemas
+    if _schemas is None:
+        with open(SCHEMA_FILE, encoding="utf-8") as f:
+            _schemas = json.load(f)
+    return _schemas
+
+
+def get_schema(sport):
+    """Returns the declared {column: dtype} schema of one sport, including evolved columns."""
+    schema = dict(load_schemas()[sport])
+    for version in load_schema_versions().get(sport, []):
+        schema.update({col: spec['dtype'] for col, spec in version['added'].items()})
+    return schema
+
+
+def _cast(series, dtype):
+    if dtype == "string":
+        return series.astype(object)
+    if dtype == "bool":
+        return series.fillna(0).astype(bool)
+    if dtype == "category":
+        return series.astype("category")
+    return series.astype(dtype)
+
+
+def apply_schema(df, sport, floats=True):
+    """
+    Converts a DataFrame to the compact dtypes declared for a sport.
+
+    Columns without a declaration (e.g. the computed index columns of a
+    scored table) are left untouched.
+
+    Args:
+        df: DataFrame with default dtypes
+        sport: Sport directory name
+        floats: Also narrow float64 columns to float32 (lossy); pass False to
+            keep only the lossless integer/bool/categorical conversions
+
+    Returns:
+        New DataFrame with compact dtypes
+    """
+    schema = get_schema(sport)
+    return pd.DataFrame({
+        col: _cast(df[col], schema[col])
+        if col in schema and (floats or schema[col] != "float32") else df[col]
+        for col in df.columns
+    })
+
+
+def enforce_schema(df, sport, floats=True):
+    """
+    Validates that a frame fits a sport's declared schema before it is written.
+
+    Args:
+        df: DataFrame about to be written
+        sport: Sport directory name
+        floats: Passed on to apply_schema for the returned frame
+
+    Returns:
+        The frame converted to the declared dtypes
+
+    Raises:
+        ValueError: If a declared column is missing or a value does not fit
+    """
+    schema = get_schema(sport)
+    defaults = column_defaults(sport)
+    problems = []
+    for col, dtype in schema.items():
+        if col not in df.columns:
+            if col not in defaults:  # evolved columns may be absent from older data
+                problems.append(f"missing column '{col}'")
+            continue
+        series = df[col]
+        if dtype in INT_DTYPES:
+            values = pd.to_numeric(series, errors='coerce')
+            if values.isna().any() or (values != values.round()).any():
+                problems.append(f"'{col}' must contain whole numbers")
+            elif len(values) and (values.min() < np.iinfo(dtype).min or values.max() > np.iinfo(dtype).max):
+                problems.append(f"'{col}' does not fit in {dtype}")
+        elif dtype == "bool":
+            if not set(pd.unique(series)) <= {0, 1, True, False}:
+                problems.append(f"'{col}' must be a 0/1 flag")
+        elif dtype == "float32":
+            if pd.to_numeric(series, errors='coerce').isna().any():
+                problems.append(f"'{col}' must be numeric")
+    if problems:
+        raise ValueError(f"{sport} data does not match its schema: " + "; ".join(problems))
+    return apply_schema(df, sport, floats=floats)
+
+
+# ------------------- EVOLUTION ---------------------
+def load_schema_versions():
+    """Returns the schema versions of all sports (cached): sport -> list of versions."""
+    global _versions
+    if _versions is None:
+        if os.path.exists(VERSIONS_FILE):
+            with open(VERSIONS_FILE, encoding="utf-8") as f:
+                _versions = json.load(f)
+        else:
+            _versions = {}
+    return _versions
+
+
+def schema_version(sport):
+    """Returns a sport's current schema version (1 = the columns it was created with)."""
+    versions = load_schema_versions().get(sport, [])
+    return versions[-1]['version'] if versions else 1
+
+
+def column_defaults(sport):
+    """Returns {column: default} for every column added to a sport after version 1."""
+    defaults = {}
+    for version in load_schema_versions().get(sport, []):
+        defaults.update({col: spec['default'] for col, spec in version['added'].items()})
+    return defaults
+
+
+def dataset_schema_version(sport, columns):
+    """
+    Returns the schema version a stored dataset was written with.
+
+    Args:
+        sport: Sport directory name
+        columns: Column names the stored dataset physically has
+
+    Returns:
+        The highest version whose added columns are all stored
+    """
+    columns = set(columns)
+    current = 1
+    for version in load_schema_versions().get(sport, []):
+        if not set(version['added']) <= columns:
+            break
+        current = version['version']
+    return current
+
+
+def add_column(sport, column, dtype, default=0):
+    """
+    Declares a new stat for a sport as a new schema version.
+
+    No dataset is rewritten: until a dataset is regenerated with the column,
+    readers see the default.
+
+    Args:
+        sport: Sport directory name
+        column: New column name
+        dtype: Declared dtype (see module docstring)
+        default: Value of the column in datasets written before it existed
+
+    Returns:
+        The new schema version
+
+    Raises:
+        ValueError: If the column is already declared or the dtype is unknown
+    """
+    global _versions
+    if column in get_schema(sport):
+        raise ValueError(f"'{column}' is already declared for {sport}")
+    if dtype not in INT_DTYPES + ["float32", "bool", "category", "string"]:
+        raise ValueError(f"Unknown dtype '{dtype}'")
+
+    versions = load_schema_versions()
+    version = schema_version(sport) + 1
+    versions.setdefault(sport, []).append({'version': version, 'added': {column: {'dtype': dtype, 'default': default}}})
+    tmp_path = VERSIONS_FILE + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(versions, f, indent=1)
+        f.write("\n")
+    os.replace(tmp_path, VERSIONS_FILE)
+    _versions = None
+    return version
+
+
+def with_column_defaults(df, sport, columns=None):
+    """
+    Adds a sport's evolved columns that a frame lacks, filled with their defaults.
+
+    Each added column is a full allocated array of n_rows values (df.assign),
+    unlike the zero-stride views of load_feature_columns(); use those when
+    only the scores are needed.
+
+    Args:
+        df: DataFrame read from storage
+        sport: Sport directory name
+        columns: Optional requested columns (the result follows their order);
+            by default every missing evolved column is appended
+
+    Returns:
+        The frame itself if nothing is missing, otherwise a new frame
+    """
+    defaults = column_defaults(sport)
+    wanted = defaults if columns is None else [col for col in columns if col in defaults]
+    missing = [col for col in wanted if col not in df.columns]
+    if not missing:
+        return df
+    df = df.assign(**{col: defaults[col] for col in missing})
+    return df[list(columns)] if columns is not None else df
+
+
+# ------------------- REPORTING ---------------------
+def memory_report(sports=None):
+    """
+    Compares resident memory of each dataset with default vs declared dtypes.
+
+    Args:
+        sports: Optional list of sports (default: all)
+
+    Returns:
+        DataFrame with one row per sport plus a TOTAL row
+    """
+    rows = []
+    for sport in sports or list_sports():
+        default = pd.read_csv(sport_path(sport, 'dataset'))
+        # Python object strings are what the pipeline has always held in memory
+        default = default.astype({c: object for c in default.columns if not pd.api.types.is_numeric_dtype(default[c])})
+        compact = apply_schema(default, sport)
+        rows.append({
+            'sport': sport,
+            'rows': len(default),
+            'default_bytes': int(default.memory_usage(deep=True).sum()),
+            'compact_bytes': int(compact.memory_usage(deep=True).sum()),
+        })
+    report = pd.DataFrame(rows)
+    total = pd.DataFrame([{
+        'sport': 'TOTAL',
+        'rows': report['rows'].sum(),
+        'default_bytes': report['default_bytes'].sum(),
+        'compact_bytes': report['compact_bytes'].sum(),
+    }])
+    report = pd.concat([report, total], ignore_index=True)
+    report['reduction_percent'] = (1 - report['compact_bytes'] / report['default_bytes']) * 100
+    return report
+
+
+def main():
+    if "--add-column" in sys.argv:
+        sport, column, dtype, *default = sys.argv[sys.argv.index("--add-column") + 1:]
+        version = add_column(sport, column, dtype, json.loads(default[0]) if default else 0)
+        print(f"{sport} schema is now version {version} ('{column}' added as {dtype}).")
+        return
+
+    if "--infer" in sys.argv:
+        write_schemas()
+        print(f"Schemas written to '{SCHEMA_FILE}'.")
+
+    report = memory_report()
+    print("\n====== DATASET MEMORY: DEFAULT vs COMPACT DTYPES ======")
+    for _, row in report.iterrows():
+        print(f"{row['sport']:<22} {row['default_bytes']:>9,} B -> {row['compact_bytes']:>9,} B "
+              f"({row['reduction_percent']:.1f}% smaller)")
+
+
+if __name__ == "__main__":
+    main()
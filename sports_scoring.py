@@ -0,0 +1,374 @@
+"""
+Vectorized scoring engine.
+
+Every sport's calc_<sport>_index(row) is written for df.apply(..., axis=1):
+it pulls values out of one row, accumulates a weighted score and branches
+with plain `if` statements (retirement penalties, hall of fame bonuses...).
+Instead of re-implementing 25 weight tables, this module compiles those
+functions once into array versions by rewriting their syntax tree:
+
+    if cond: x = a        ->  x = where(mask, a, x)
+    a if cond else b      ->  where(cond, a, b)
+    a and b / not a       ->  logical_and(a, b) / logical_not(a)
+    len(s.split(','))     ->  per-element split count
+
+The compiled function takes a mapping of column name -> array (a dict of
+memory-mapped views from sports_storage, or a DataFrame) and returns the
+scores of every row at once. Mostly-zero columns can be passed as
+sports_sparse.SparseColumn: their linear terms then only cost as much as
+their non-zero entries. The original functions stay the single source
+of truth for the weights.
+
+precision='float32' is an opt-in mode for large sweeps: the terms are computed
+on float32 columns while every `score += ...` accumulation is carried out in
+float64, so rounding error does not build up over the 20-40 weighted terms.
+The stored feature blocks are float64, so score_table() in this mode still
+reads float64 and casts a float32 copy; only columns that are already
+float32, such as the blocks of sports_shared.publish_features(precision=
+'float32'), save memory traffic. sports_precision checks that this mode
+ranks the current datasets like float64 before it is used.
+"""
+
+import ast
+import inspect
+import textwrap
+
+import numpy as np
+
+_compiled_cache = {}
+_columns_cache = {}
+
+# Compute dtype of the feature columns per precision mode
+PRECISIONS = {'float64': np.float64, 'float32': np.float32}
+
+
+# ------------------- RUNTIME HELPERS ---------------------
+def _where(mask, a, b):
+    return np.where(mask, a, b)
+
+
+def _and(*values):
+    result = np.asarray(values[0], dtype=bool)
+    for value in values[1:]:
+        result = np.logical_and(result, np.asarray(value))
+    return result
+
+
+def _or(*values):
+    result = np.asarray(values[0], dtype=bool)
+    for value in values[1:]:
+        result = np.logical_or(result, np.asarray(value))
+    return result
+
+
+def _not(value):
+    return np.logical_not(np.asarray(value))
+
+
+def _split_count(values, sep):
+    """Vectorized len(value.split(sep)) for a column (or batch of columns) of strings."""
+    values = np.asarray(values, dtype=object)
+    counts = np.fromiter((len(str(v).split(sep)) for v in values.ravel()), dtype=np.float64, count=values.size)
+    return counts.reshape(values.shape)
+
+
+def _accumulator(value):
+    """Widens an accumulator to float64 before a reduced-precision term is added."""
+    return np.asarray(value, dtype=np.float64)
+
+
+_HELPERS = {
+    '_v_where': _where,
+    '_v_and': _and,
+    '_v_or': _or,
+    '_v_not': _not,
+    '_v_split_count': _split_count,
+    '_v_acc': _accumulator,
+}
+
+
+# ------------------- AST REWRITING ---------------------
+def _helper_call(name, args):
+    return ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=args, keywords=[])
+
+
+class _ExpressionRewriter(ast.NodeTransformer):
+    """Rewrites scalar-only expressions into their elementwise equivalents."""
+
+    def visit_BoolOp(self, node):
+        self.generic_visit(node)
+        helper = '_v_and' if isinstance(node.op, ast.And) else '_v_or'
+        return _helper_call(helper, node.values)
+
+    def visit_UnaryOp(self, node):
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Not):
+            return _helper_call('_v_not', [node.operand])
+        return node
+
+    def visit_IfExp(self, node):
+        self.generic_visit(node)
+        return _helper_call('_v_where', [node.test, node.body, node.orelse])
+
+    def visit_Call(self, node):
+        self.generic_visit(node)
+        # len(x.split(sep)) -> _v_split_count(x, sep)
+        if (isinstance(node.func, ast.Name) and node.func.id == 'len' and len(node.args) == 1
+                and isinstance(node.args[0], ast.Call)
+                and isinstance(node.args[0].func, ast.Attribute)
+                and node.args[0].func.attr == 'split'):
+            split_call = node.args[0]
+            sep = split_call.args[0] if split_call.args else ast.Constant(value=None)
+            return _helper_call('_v_split_count', [split_call.func.value, sep])
+        return node
+
+
+class _StatementRewriter:
+    """If-converts a function body so that it runs on whole columns."""
+
+    def __init__(self, widen_accumulators=False):
+        self.expressions = _ExpressionRewriter()
+        self.mask_counter = 0
+        # x += term -> x = _v_acc(x) + term, so sums stay float64 in float32 mode
+        self.widen_accumulators = widen_accumulators
+
+    def rewrite_body(self, body, mask, defined):
+        new_body = []
+        for stmt in body:
+            new_body.extend(self.rewrite_statement(stmt, mask, defined))
+        return new_body
+
+    def _masked_assign(self, target, value, mask, defined):
+        if mask is None:
+            defined.add(target)
+            return ast.Assign(targets=[ast.Name(id=target, ctx=ast.Store())], value=value)
+        # Rows outside the mask keep their previous value (0.0 if not yet defined)
+        previous = ast.Name(id=target, ctx=ast.Load()) if target in defined else ast.Constant(value=0.0)
+        defined.add(target)
+        merged = _helper_call('_v_where', [ast.Name(id=mask, ctx=ast.Load()), value, previous])
+        return ast.Assign(targets=[ast.Name(id=target, ctx=ast.Store())], value=merged)
+
+    def rewrite_statement(self, stmt, mask, defined):
+        if isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Constant):
+            return []  # docstrings / bare constants
+
+        if isinstance(stmt, ast.Assign):
+            if len(stmt.targets) != 1 or not isinstance(stmt.targets[0], ast.Name):
+                raise NotImplementedError("Only simple name assignments can be vectorized")
+            value = self.expressions.visit(stmt.value)
+            return [self._masked_assign(stmt.targets[0].id, value, mask, defined)]
+
+        if isinstance(stmt, ast.AugAssign):
+            if not isinstance(stmt.target, ast.Name):
+                raise NotImplementedError("Only simple name assignments can be vectorized")
+            name = stmt.target.id
+            left = ast.Name(id=name, ctx=ast.Load())
+            if self.widen_accumulators:
+                left = _helper_call('_v_acc', [left])
+            value = ast.BinOp(left=left, op=stmt.op,
+                              right=self.expressions.visit(stmt.value))
+            return [self._masked_assign(name, value, mask, defined)]
+
+        if isinstance(stmt, ast.If):
+            self.mask_counter += 1
+            cond = self.expressions.visit(stmt.test)
+            then_mask = f"_v_mask_{self.mask_counter}"
+            else_mask = f"_v_not_mask_{self.mask_counter}"
+            parent = [ast.Name(id=mask, ctx=ast.Load())] if mask else []
+            out = [
+                ast.Assign(targets=[ast.Name(id=then_mask, ctx=ast.Store())],
+                           value=_helper_call('_v_and', parent + [cond])),
+            ]
+            out.extend(self.rewrite_body(stmt.body, then_mask, defined))
+            if stmt.orelse:
+                out.append(ast.Assign(
+                    targets=[ast.Name(id=else_mask, ctx=ast.Store())],
+                    value=_helper_call('_v_and', parent + [_helper_call('_v_not', [ast.Name(id=then_mask, ctx=ast.Load())])]),
+                ))
+                out.extend(self.rewrite_body(stmt.orelse, else_mask, defined))
+            return out
+
+        if isinstance(stmt, ast.Return):
+            if mask is not None:
+                raise NotImplementedError("Conditional returns cannot be vectorized")
+            return [ast.Return(value=self.expressions.visit(stmt.value))]
+
+        if isinstance(stmt, ast.Pass):
+            return []
+
+        raise NotImplementedError(f"Unsupported statement in index function: {type(stmt).__name__}")
+
+
+def _function_def(func):
+    source = textwrap.dedent(inspect.getsource(func))
+    module = ast.parse(source)
+    fdef = module.body[0]
+    if not isinstance(fdef, ast.FunctionDef):
+        raise TypeError(f"{func.__name__} is not a plain function")
+    return fdef
+
+
+def referenced_columns(func):
+    """
+    Lists the dataset columns an index function reads via row['col'].
+
+    Args:
+        func: Row-wise index function
+
+    Returns:
+        List of column names in first-use order
+    """
+    if func in _columns_cache:
+        return list(_columns_cache[func])
+
+    fdef = _function_def(func)
+    row_arg = fdef.args.args[0].arg
+    columns = []
+    for node in ast.walk(fdef):
+        if (isinstance(node, ast.Subscript) and isinstance(node.value, ast.Name)
+                and node.value.id == row_arg and isinstance(node.slice, ast.Constant)
+                and node.slice.value not in columns):
+            columns.append(node.slice.value)
+    _columns_cache[func] = columns
+    return list(columns)
+
+
+def _check_precision(precision):
+    if precision not in PRECISIONS:
+        raise ValueError(f"Unknown precision '{precision}' (expected one of {', '.join(PRECISIONS)})")
+
+
+def vectorize_index_function(func, precision='float64'):
+    """
+    Compiles a row-wise index function into a column-wise one (cached).
+
+    Args:
+        func: Function taking a row and returning a float score
+        precision: 'float64', or 'float32' to widen the accumulations to
+            float64 so float32 columns can be passed in
+
+    Returns:
+        Function taking a {column: array} mapping and returning an array
+        (or a scalar if the score does not depend on any column)
+    """
+    _check_precision(precision)
+    key = (func, precision)
+    if key in _compiled_cache:
+        return _compiled_cache[key]
+
+    fdef = _function_def(func)
+    fdef.decorator_list = []
+    fdef.name = f"_vectorized_{fdef.name}"
+    rewriter = _StatementRewriter(widen_accumulators=precision != 'float64')
+    fdef.body = rewriter.rewrite_body(fdef.body, None, set(a.arg for a in fdef.args.args))
+    module = ast.fix_missing_locations(ast.Module(body=[fdef], type_ignores=[]))
+
+    namespace = dict(func.__globals__)
+    namespace.update(_HELPERS)
+    code = compile(module, inspect.getsourcefile(func) or "<index function>", "exec")
+    exec(code, namespace)
+    compiled = namespace[fdef.name]
+    _compiled_cache[key] = compiled
+    return compiled
+
+
+def _as_precision(values, dtype):
+    """
+    Casts a numeric column (array or SparseColumn) to the compute dtype.
+
+    Columns already in that dtype are used as they are; any other numeric
+    column (e.g. a float64 memory-mapped view) is copied into a new array.
+    """
+    from sports_sparse import SparseColumn
+
+    if isinstance(values, SparseColumn):
+        return SparseColumn(values.rows, values.values.astype(dtype, copy=False), values.n_rows)
+    array = np.asarray(values)
+    if array.dtype.kind in 'iuf':
+        return array.astype(dtype, copy=False)
+    return values
+
+
+def _is_constant_view(values):
+    return isinstance(values, np.ndarray) and values.ndim == 1 and len(values) > 0 and values.strides == (0,)
+
+
+def score_columns(columns, func, n_rows, precision='float64', defaults=None):
+    """
+    Scores every row of a column mapping with a sport's index function.
+
+    Referenced columns that are missing from the mapping take their schema
+    default as a broadcast scalar (0 if they have none, like the calculators'
+    "fill missing columns with 0" step), so no full column is allocated.
+
+    Args:
+        columns: Mapping of column name -> 1-D array (dict, DataFrame, ...);
+            values may also be SparseColumn
+        func: Row-wise index function (compiled on first use)
+        n_rows: Number of rows (used to broadcast constant scores), or a
+            shape such as (replicates, n_rows) when the columns are 2-D
+            batches scored in one call
+        precision: 'float64' (default) or 'float32'; in float32 mode numeric
+            columns are cast to float32 (a copy unless they already are
+            float32) and accumulated in float64
+        defaults: Optional {column: default} for missing columns (see
+            sports_schema.column_defaults)
+
+    Returns:
+        float64 array of shape (n_rows,) (or the given shape)
+    """
+    _check_precision(precision)
+    missing = [col for col in referenced_columns(func) if col not in columns]
+    constant = [col for col in referenced_columns(func) if col in columns and _is_constant_view(columns[col])]
+    if missing or constant or precision != 'float64':
+        dtype = PRECISIONS[precision]
+        columns = {col: columns[col] for col in columns.keys()}
+        if precision != 'float64':
+            columns = {col: _as_precision(values, dtype) for col, values in columns.items()}
+        # Defaulted columns (zero-stride views from storage) are used as scalars
+        columns.update({col: columns[col][0] for col in constant})
+        defaults = defaults or {}
+        columns.update({col: defaults.get(col, 0.0) for col in missing})
+
+    vectorized = vectorize_index_function(func, precision)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scores = vectorized(columns)
+    scores = np.asarray(scores, dtype=np.float64)
+    shape = tuple(n_rows) if isinstance(n_rows, tuple) else (n_rows,)
+    return np.broadcast_to(scores, shape).copy() if scores.shape != shape else scores
+
+
+def score_frame(df, func, precision='float64'):
+    """Vectorized equivalent of df.apply(func, axis=1) for index functions."""
+    wanted = [col for col in referenced_columns(func) if col in df.columns]
+    columns = {col: df[col].to_numpy() for col in wanted}
+    return score_columns(columns, func, len(df), precision)
+
+
+def score_table(csv_path, func, precision='float64', schema=None):
+    """
+    Scores a stored table straight from its memory-mapped feature blocks.
+
+    Dense columns are read from the feature block and mostly-zero columns
+    from the sparse block, without densifying them.
+
+    Args:
+        csv_path: Dataset CSV path (its columnar copy is used / built)
+        func: Row-wise index function
+        precision: 'float64' (default) or 'float32' (see score_columns)
+        schema: Optional sport name; columns the sport gained after the table
+            was stored score with their declared defaults
+
+    Returns:
+        float64 array with one score per distinct athlete, in stored row order
+    """
+    # Imported here so the engine can be used on plain DataFrames without the storage layer
+    from sports_storage import load_feature_block, load_feature_columns, read_meta, columnar_path, row_count
+    from sports_schema import column_defaults
+
+    load_feature_block(csv_path)  # builds / refreshes the columnar copy if needed
+    meta = read_meta(columnar_path(csv_path))
+    stored = {c['name'] for c in meta['columns']}
+    wanted = [col for col in referenced_columns(func) if col in stored]
+    defaults = column_defaults(schema) if schema is not None else None
+    return score_columns(load_feature_columns(csv_path, wanted), func, row_count(meta), precision, defaults)
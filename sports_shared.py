@@ -0,0 +1,217 @@
+"""
+Shared-memory feature matrices for multi-process workers.
+
+A parallel sweep (weight search, bootstrap, simulations) would otherwise have
+every worker load every sport on its own. publish_features() loads each
+sport's numeric columns once into a multiprocessing.shared_memory block and
+returns a small picklable descriptor (block name, shape, column names, plus
+the few text columns an index function reads). Workers attach to the blocks
+by name and get zero-copy column views, so memory stays flat as the number
+of workers grows and worker startup costs no parsing at all.
+
+    with publish_features() as shared:
+        with worker_pool(shared, workers=4) as pool:
+            results = list(pool.map(task, sports))
+
+Inside a task, shared_columns(sport) returns the {column: array} mapping the
+scoring engine consumes (see score_shared).
+
+publish_features(precision='float32') halves the blocks for very large
+sweeps; it is refused unless sports_precision.require_float32() passes, and
+the workers then score in the engine's float32 mode.
+"""
+
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from sports_registry import list_sports, sport_path, load_calc_function
+from sports_storage import load_feature_columns, read_meta, columnar_path, is_fresh, read_table, row_count
+from sports_scoring import PRECISIONS, score_columns
+from sports_schema import column_defaults
+
+# Blocks this process is attached to: name -> SharedMemory (kept alive while in use)
+_attached = {}
+# Worker-side column views: sport -> {column: array}
+_worker_columns = {}
+# Worker-side precision mode of each published sport
+_worker_precision = {}
+
+
+# ------------------- PUBLISHING ---------------------
+class SharedFeatures:
+    """
+    Owner of the published shared-memory blocks.
+
+    Use as a context manager (or call close()) so the blocks are released
+    when the sweep is done.
+    """
+
+    def __init__(self, descriptor, blocks):
+        self.descriptor = descriptor
+        self._blocks = blocks
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def nbytes(self):
+        return sum(block.size for block in self._blocks)
+
+    def close(self):
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+
+def publish_features(sports=None, precision='float64', tolerance=None):
+    """
+    Copies each sport's numeric feature matrix into shared memory.
+
+    Stat corrections are applied and sparse columns densified, so workers see
+    exactly what score_table() would score.
+
+    Args:
+        sports: Optional list of sports (default: all)
+        precision: 'float64' or 'float32' (half the memory; accumulation
+            stays float64)
+        tolerance: Largest rank shift float32 mode may cause (default:
+            sports_precision.FLOAT32_RANK_TOLERANCE)
+
+    Returns:
+        SharedFeatures whose descriptor is passed to the workers
+
+    Raises:
+        ValueError: If float32 mode would move ranks beyond the tolerance
+    """
+    sports = sports or list_sports()
+    if precision not in PRECISIONS:
+        raise ValueError(f"Unknown precision '{precision}'")
+    dtype = np.dtype(PRECISIONS[precision])
+    if precision != 'float64':
+        from sports_precision import require_float32
+        require_float32(sports, tolerance)
+
+    descriptor = {}
+    blocks = []
+    try:
+        for sport in sports:
+            csv_path = sport_path(sport, 'dataset')
+            if not is_fresh(csv_path):
+                read_table(csv_path)
+            meta = read_meta(columnar_path(csv_path))
+            columns = load_feature_columns(csv_path, sparse=False)
+
+            numeric = [c for c, values in columns.items() if np.asarray(values).dtype.kind in 'iufb']
+            strings = {c: list(values) for c, values in columns.items() if c not in numeric}
+            n_rows = row_count(meta)
+
+            block = shared_memory.SharedMemory(create=True, size=max(n_rows * len(numeric) * dtype.itemsize, 1))
+            blocks.append(block)
+            matrix = np.ndarray((n_rows, len(numeric)), dtype=dtype, buffer=block.buf, order='F')
+            for j, col in enumerate(numeric):
+                matrix[:, j] = columns[col]
+            del matrix  # the block must not be referenced by views when it is closed
+
+            descriptor[sport] = {'shm_name': block.name, 'n_rows': n_rows, 'precision': precision,
+                                 'columns': numeric, 'strings': strings}
+    except BaseException:
+        for block in blocks:
+            block.close()
+            block.unlink()
+        raise
+    return SharedFeatures(descriptor, blocks)
+
+
+# ------------------- ATTACHING ---------------------
+def _open_block(name):
+    try:
+        # Python 3.13+: attaching processes must not unlink the owner's block
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Older versions register the block again, which is harmless for
+        # worker_pool() processes: they share the owner's resource tracker
+        return shared_memory.SharedMemory(name=name)
+
+
+def attach_features(descriptor):
+    """
+    Attaches to published feature matrices without copying them.
+
+    Args:
+        descriptor: SharedFeatures.descriptor from the publishing process
+
+    Returns:
+        Dict of sport -> {column: 1-D array}; numeric columns are read-only
+        views into shared memory
+    """
+    result = {}
+    for sport, info in descriptor.items():
+        block = _attached.get(info['shm_name'])
+        if block is None:
+            block = _attached[info['shm_name']] = _open_block(info['shm_name'])
+        matrix = np.ndarray((info['n_rows'], len(info['columns'])), dtype=PRECISIONS[info['precision']],
+                            buffer=block.buf, order='F')
+        matrix.flags.writeable = False
+        columns = {col: matrix[:, j] for j, col in enumerate(info['columns'])}
+        columns.update({col: np.asarray(values, dtype=object) for col, values in info['strings'].items()})
+        result[sport] = columns
+    return result
+
+
+def _init_worker(descriptor):
+    _worker_columns.update(attach_features(descriptor))
+    _worker_precision.update({sport: info['precision'] for sport, info in descriptor.items()})
+
+
+def worker_pool(shared, workers=None):
+    """
+    Creates a process pool whose workers attach to the shared feature matrices on startup.
+
+    Args:
+        shared: SharedFeatures from publish_features()
+        workers: Number of worker processes (default: CPU count)
+
+    Returns:
+        ProcessPoolExecutor
+    """
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(shared.descriptor,))
+
+
+def shared_columns(sport):
+    """Returns the {column: array} mapping of a sport inside a pool worker."""
+    if sport not in _worker_columns:
+        raise KeyError(f"{sport} was not published, or this is not a worker_pool() process")
+    return _worker_columns[sport]
+
+
+def score_shared(sport):
+    """Scores a sport from shared memory (inside a pool worker)."""
+    columns = shared_columns(sport)
+    n_rows = len(next(iter(columns.values()))) if columns else 0
+    return sport, score_columns(columns, load_calc_function(sport), n_rows, _worker_precision[sport],
+                                column_defaults(sport))
+
+
+def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    precision = sys.argv[2] if len(sys.argv) > 2 else 'float64'
+    start = time.perf_counter()
+    with publish_features(precision=precision) as shared:
+        published = time.perf_counter() - start
+        print(f"Published {len(shared.descriptor)} sports ({shared.nbytes:,} B) in {published * 1000:.1f} ms")
+        start = time.perf_counter()
+        with worker_pool(shared, workers) as pool:
+            results = dict(pool.map(score_shared, shared.descriptor))
+        print(f"Scored {len(results)} sports on {workers} workers in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+"""
+Mergeable quantile sketches for percentile normalization at registry scale.
+
+An exact percentile needs every score of a sport sorted at once. A
+QuantileSketch (KLL) keeps only O(k log(n/k)) of the scores while they
+stream past in chunks, answers rank and quantile queries with a
+normalized rank error of about KLL_ERROR_CONSTANT / k, and merges with
+other sketches, so each worker can sketch its own partition:
+
+    pass 1   sketch = sketch_partitions(partitions, workers=4)   (merged)
+    pass 2   for chunk in chunks: percentiles = sketch.percentiles(chunk)
+
+Items are kept in levels; an item at level h stands for 2**h scores. When a
+level outgrows its capacity it is sorted and every other item (random
+offset) is promoted to the next level. Capacities shrink geometrically
+(CAPACITY_DECAY) towards the lower levels.
+
+    python sports_sketch.py              # benchmark against exact percentiles
+    python sports_sketch.py 2000000      # rows per sport
+"""
+
+import sys
+import time
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from sports_registry import list_sports, sport_path, load_calc_function
+from sports_scoring import score_table
+
+# Capacity of the top level (about 1.65% rank error at 99% confidence)
+DEFAULT_K = 200
+# Capacity ratio between consecutive levels
+CAPACITY_DECAY = 2 / 3
+# Smallest level capacity
+MIN_LEVEL_CAPACITY = 8
+# Normalized rank error ~= KLL_ERROR_CONSTANT / k
+KLL_ERROR_CONSTANT = 3.3
+
+
+# ------------------- SKETCH ---------------------
+class QuantileSketch:
+    """
+    KLL quantile sketch over float scores.
+
+    Picklable, so partition sketches can be returned from worker processes
+    and merged.
+    """
+
+    def __init__(self, k=DEFAULT_K, seed=0):
+        self.k = k
+        self.n = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self.levels = [np.empty(0, dtype=np.float64)]
+        self._rng = np.random.default_rng(seed)
+        self._sorted = None  # cached (values, cumulative weights)
+
+    @classmethod
+    def for_error(cls, error, seed=0):
+        """Creates a sketch whose normalized rank error is about error (e.g. 0.01)."""
+        return cls(k=max(MIN_LEVEL_CAPACITY, math.ceil(KLL_ERROR_CONSTANT / error)), seed=seed)
+
+    @property
+    def error_bound(self):
+        """Approximate normalized rank error of the sketch's answers."""
+        return KLL_ERROR_CONSTANT / self.k
+
+    @property
+    def retained(self):
+        """Number of items the sketch currently holds."""
+        return sum(len(level) for level in self.levels)
+
+    def _capacity(self, level):
+        depth = len(self.levels) - 1 - level
+        return max(MIN_LEVEL_CAPACITY, math.ceil(self.k * CAPACITY_DECAY ** depth))
+
+    def update(self, values):
+        """
+        Adds a chunk of scores (NaNs are ignored).
+
+        Args:
+            values: Array-like of scores
+
+        Returns:
+            self
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        self.n += len(values)
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self.levels[0] = np.concatenate((self.levels[0], values))
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """
+        Folds another sketch into this one.
+
+        Args:
+            other: QuantileSketch built with the same k
+
+        Returns:
+            self
+
+        Raises:
+            ValueError: If the sketches were built with different k
+        """
+        if other.k != self.k:
+            raise ValueError(f"Cannot merge sketches with k={self.k} and k={other.k}")
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0, dtype=np.float64))
+        for h, items in enumerate(other.levels):
+            self.levels[h] = np.concatenate((self.levels[h], items))
+        self.n += other.n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+
+    def _compress(self):
+        self._sorted = None
+        h = 0
+        while h < len(self.levels):
+            level = self.levels[h]
+            if len(level) > self._capacity(h):
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0, dtype=np.float64))
+                level = np.sort(level)
+                # An odd item stays behind so the promoted half keeps the total weight exact
+                kept = level[len(level) - len(level) % 2:]
+                paired = level[:len(level) - len(kept)]
+                promoted = paired[self._rng.integers(2)::2]
+                self.levels[h] = kept
+                self.levels[h + 1] = np.concatenate((self.levels[h + 1], promoted))
+            h += 1
+
+    def _weighted(self):
+        if self._sorted is None:
+            values = np.concatenate(self.levels)
+            weights = np.concatenate([np.full(len(level), 2.0 ** h) for h, level in enumerate(self.levels)])
+            order = np.argsort(values, kind='stable')
+            self._sorted = (values[order], np.cumsum(weights[order]))
+        return self._sorted
+
+    # ------------------- QUERIES ---------------------
+    def cdf(self, values):
+        """
+        Estimated fraction of scores <= each value.
+
+        Args:
+            values: Scalar or array of scores
+
+        Returns:
+            Array of fractions in [0, 1]
+        """
+        if self.n == 0:
+            raise ValueError("The sketch is empty")
+        items, cumulative = self._weighted()
+        positions = np.searchsorted(items, np.asarray(values, dtype=np.float64), side='right')
+        below = np.where(positions > 0, cumulative[np.maximum(positions - 1, 0)], 0.0)
+        return below / cumulative[-1]
+
+    def percentiles(self, values):
+        """Estimated 0-100 percentile of each score (fraction of scores <= it)."""
+        return self.cdf(values) * 100
+
+    def quantile(self, q):
+        """
+        Estimated score at quantile q (scalar or array in [0, 1]).
+
+        The exact minimum and maximum are returned for q = 0 and q = 1.
+        """
+        if self.n == 0:
+            raise ValueError("The sketch is empty")
+        items, cumulative = self._weighted()
+        q = np.asarray(q, dtype=np.float64)
+        positions = np.searchsorted(cumulative, q * cumulative[-1], side='left')
+        result = items[np.clip(positions, 0, len(items) - 1)]
+        return np.where(q <= 0, self.min, np.where(q >= 1, self.max, result))
+
+
+# ------------------- PARTITIONS ---------------------
+def _sketch_chunks(chunks, k, seed):
+    sketch = QuantileSketch(k=k, seed=seed)
+    for chunk in chunks:
+        sketch.update(chunk)
+    return sketch
+
+
+def _sketch_partition(args):
+    partition, chunk_rows, k, seed = args
+    partition = np.asarray(partition)
+    chunks = (partition[i:i + chunk_rows] for i in range(0, len(partition), chunk_rows))
+    return _sketch_chunks(chunks, k, seed)
+
+
+def sketch_partitions(partitions, chunk_rows=65536, k=DEFAULT_K, workers=1):
+    """
+    Sketches each partition of scores chunk by chunk and merges the results.
+
+    Args:
+        partitions: List of score arrays (e.g. one per shard of a sport)
+        chunk_rows: Scores added to a sketch at a time
+        k: Sketch size parameter
+        workers: Worker processes (1 = sketch in this process)
+
+    Returns:
+        Merged QuantileSketch
+    """
+    tasks = [(partition, chunk_rows, k, seed) for seed, partition in enumerate(partitions)]
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            sketches = list(pool.map(_sketch_partition, tasks))
+    else:
+        sketches = [_sketch_partition(task) for task in tasks]
+    merged = QuantileSketch(k=k)
+    for sketch in sketches:
+        merged.merge(sketch)
+    return merged
+
+
+def sketch_sports(sports=None, k=DEFAULT_K):
+    """
+    Sketches the current scores of every sport.
+
+    Args:
+        sports: Optional list of sports (default: all)
+        k: Sketch size parameter
+
+    Returns:
+        Dict of sport -> QuantileSketch
+    """
+    return {
+        sport: QuantileSketch(k=k).update(score_table(sport_path(sport, 'dataset'), load_calc_function(sport),
+                                                      schema=sport))
+        for sport in sports or list_sports()
+    }
+
+
+# ------------------- BENCHMARK ---------------------
+def _registry_scores(scores, n_rows, seed):
+    """Registry-sized sample: the sport's scores resampled with noise of 10% of their spread."""
+    rng = np.random.default_rng(seed)
+    spread = scores.std() or 1.0
+    return rng.choice(scores, size=n_rows) + rng.normal(0.0, 0.1 * spread, size=n_rows)
+
+
+def benchmark(n_rows=1_000_000, partitions=4, k=DEFAULT_K, workers=4, sports=None):
+    """
+    Compares sketched and exact percentiles on registry-sized score samples.
+
+    Args:
+        n_rows: Scores per sport
+        partitions: Shards per sport (sketched separately, then merged)
+        k: Sketch size parameter
+        workers: Worker processes for the sketching pass
+        sports: Optional list of sports (default: all)
+
+    Returns:
+        List of dicts with the sport, the max absolute percentile error, the
+        sketch's error bound (in percentile points), items retained and the
+        exact / sketch timings in seconds
+    """
+    results = []
+    for seed, sport in enumerate(sports or list_sports()):
+        real = score_table(sport_path(sport, 'dataset'), load_calc_function(sport), schema=sport)
+        scores = _registry_scores(real, n_rows, seed)
+
+        start = time.perf_counter()
+        ordered = np.sort(scores)
+        exact = np.searchsorted(ordered, scores, side='right') / len(scores) * 100
+        exact_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sketch = sketch_partitions(np.array_split(scores, partitions), k=k, workers=workers)
+        estimated = sketch.percentiles(scores)
+        sketch_seconds = time.perf_counter() - start
+
+        results.append({
+            'sport': sport,
+            'max_error': float(np.max(np.abs(estimated - exact))),
+            'error_bound': sketch.error_bound * 100,
+            'retained': sketch.retained,
+            'exact_seconds': exact_seconds,
+            'sketch_seconds': sketch_seconds,
+        })
+    return results
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    results = benchmark(n_rows)
+    print(f"\n====== QUANTILE SKETCH vs EXACT PERCENTILES ({n_rows:,} scores per sport) ======")
+    for r in results:
+        print(f"{r['sport']:<22} max error {r['max_error']:.3f} pts (bound {r['error_bound']:.2f})  "
+              f"{r['retained']:>5} items kept  exact {r['exact_seconds'] * 1000:7.1f} ms  "
+              f"sketch {r['sketch_seconds'] * 1000:7.1f} ms")
+    worst = max(r['max_error'] for r in results)
+    print(f"\nWorst percentile error: {worst:.3f} points")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+"""
+Versioned ranking snapshots.
+
+Re-running a calculator after a weight change (W_CHAMPIONSHIPS 35 -> 30, the
+"massive increase" of W_SUPER_BOWL_TITLES) silently overwrites its
+*_index_scored.csv, so there is no way to see what the change did to the
+rankings. take_snapshot() scores every sport and stores the result as an
+immutable, compressed snapshot:
+
+    goat_of_goats_snapshots/
+        index.json                          <- one entry per snapshot (id, time, hashes)
+        20261019T101500-3fa2c1d9.npz        <- athlete_id, sport_id, score, normalized, rank
+
+Each snapshot records, per sport, a hash of the index function (its code
+without comments or docstring, so any weight or logic change shows up) and a
+hash of the dataset CSV and its stat corrections. Athletes are identified by their fact-store IDs
+(sports_facts), so diff_snapshots() and rank_history() align snapshots with
+plain array indexing instead of joining on names.
+
+    python sports_snapshots.py take [--label "..."]
+    python sports_snapshots.py list
+    python sports_snapshots.py diff <old> <new> [--top-k 10]
+
+Snapshots can be referred to by id, by a unique id prefix, or by position
+(-1 is the latest, -2 the one before).
+"""
+
+import os
+import ast
+import json
+import time
+import hashlib
+import inspect
+import argparse
+import textwrap
+
+import numpy as np
+import pandas as pd
+
+from sports_registry import PROJECT_ROOT, list_sports, sport_path, sport_display_name, load_calc_function
+from sports_scoring import score_table
+from sports_storage import table_checksum
+from sports_facts import sync_facts, dataset_athlete_ids, load_athletes, load_dictionary, lookup_id
+
+DEFAULT_SNAPSHOT_DIR = os.path.join(PROJECT_ROOT, "goat_of_goats_snapshots")
+SNAPSHOT_ARRAYS = ('athlete_id', 'sport_id', 'score', 'normalized', 'rank')
+
+
+# ------------------- HASHES ---------------------
+def weight_spec_hash(func):
+    """
+    Hashes an index function's weights and logic.
+
+    Comments, formatting and the docstring do not affect the hash; any change
+    to a weight constant or a scoring rule does.
+    """
+    fdef = ast.parse(textwrap.dedent(inspect.getsource(func))).body[0]
+    body = fdef.body
+    if body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant):
+        body = body[1:]
+    return hashlib.sha1("\n".join(ast.dump(stmt) for stmt in body).encode()).hexdigest()
+
+
+# ------------------- INDEX ---------------------
+def _index_path(snapshot_dir):
+    return os.path.join(snapshot_dir, "index.json")
+
+
+def list_snapshots(snapshot_dir=None):
+    """Returns the index entries of every stored snapshot, oldest first."""
+    path = _index_path(snapshot_dir or DEFAULT_SNAPSHOT_DIR)
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_index(entries, snapshot_dir):
+    tmp_path = _index_path(snapshot_dir) + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(entries, f, indent=1)
+    os.replace(tmp_path, _index_path(snapshot_dir))
+
+
+def resolve_snapshot(ref, snapshot_dir=None):
+    """
+    Finds a snapshot's index entry.
+
+    Args:
+        ref: Snapshot id, unique id prefix, or position (an int, or "-1", "-2", ...)
+        snapshot_dir: Snapshot directory
+
+    Returns:
+        The snapshot's index entry
+
+    Raises:
+        KeyError: If no (or more than one) snapshot matches
+    """
+    entries = list_snapshots(snapshot_dir)
+    # Ids start with a timestamp, so only negative numbers are positions
+    if isinstance(ref, int) or str(ref).startswith('-'):
+        try:
+            return entries[int(ref)]
+        except IndexError:
+            raise KeyError(f"There is no snapshot at position {ref} ({len(entries)} stored)") from None
+    matches = [entry for entry in entries if entry['id'].startswith(str(ref))]
+    if len(matches) != 1:
+        raise KeyError(f"'{ref}' matches {len(matches)} snapshots")
+    return matches[0]
+
+
+def load_snapshot(ref, snapshot_dir=None):
+    """
+    Loads a snapshot's arrays.
+
+    Args:
+        ref: Snapshot reference (see resolve_snapshot)
+        snapshot_dir: Snapshot directory
+
+    Returns:
+        Dict of array name -> numpy array (one element per scored athlete)
+    """
+    snapshot_dir = snapshot_dir or DEFAULT_SNAPSHOT_DIR
+    entry = resolve_snapshot(ref, snapshot_dir)
+    with np.load(os.path.join(snapshot_dir, entry['file']), allow_pickle=False) as data:
+        return {name: data[name] for name in SNAPSHOT_ARRAYS}
+
+
+# ------------------- SNAPSHOTS ---------------------
+def _score_sport(sport):
+    """Scores one sport and returns (score, normalized, rank) in dataset order."""
+    scores = score_table(sport_path(sport, 'dataset'), load_calc_function(sport), schema=sport)
+    normalized = scores / scores.max() * 100
+    order = np.argsort(-normalized, kind='stable')
+    ranks = np.empty(len(scores), dtype=np.int16)
+    ranks[order] = np.arange(1, len(scores) + 1)
+    return scores, normalized, ranks
+
+
+def take_snapshot(sports=None, label=None, force=False, snapshot_dir=None):
+    """
+    Scores every sport and stores the rankings as a new snapshot.
+
+    Args:
+        sports: Optional list of sports (default: all)
+        label: Optional free-text note stored with the snapshot
+        force: Store a snapshot even if no weight or data hash changed since the latest one
+        snapshot_dir: Snapshot directory (defaults to goat_of_goats_snapshots in the project root)
+
+    Returns:
+        The index entry of the new snapshot, or of the latest one if nothing changed
+    """
+    snapshot_dir = snapshot_dir or DEFAULT_SNAPSHOT_DIR
+    os.makedirs(snapshot_dir, exist_ok=True)
+    sports = sports or list_sports()
+    sync_facts(sports)
+
+    hashes = {
+        sport: {'weights': weight_spec_hash(load_calc_function(sport)),
+                'data': table_checksum(sport_path(sport, 'dataset'))}
+        for sport in sports
+    }
+    entries = list_snapshots(snapshot_dir)
+    if entries and not force and entries[-1]['sports'] == hashes:
+        return entries[-1]
+
+    arrays = {name: [] for name in SNAPSHOT_ARRAYS}
+    for sport in sports:
+        scores, normalized, ranks = _score_sport(sport)
+        arrays['athlete_id'].append(dataset_athlete_ids(sport))
+        arrays['sport_id'].append(np.full(len(scores), lookup_id('sports', sport), dtype=np.int16))
+        arrays['score'].append(scores)
+        arrays['normalized'].append(normalized)
+        arrays['rank'].append(ranks)
+    arrays = {name: np.concatenate(parts) for name, parts in arrays.items()}
+
+    created = time.strftime("%Y%m%dT%H%M%S")
+    digest = hashlib.sha1(json.dumps(hashes, sort_keys=True).encode() + created.encode()).hexdigest()[:8]
+    snapshot_id = f"{created}-{digest}"
+    filename = f"{snapshot_id}.npz"
+    # Exclusive create: a stored snapshot is never overwritten
+    with open(os.path.join(snapshot_dir, filename), "xb") as f:
+        np.savez_compressed(f, **arrays)
+
+    entry = {'id': snapshot_id, 'file': filename, 'created': created, 'label': label,
+             'n_athletes': int(len(arrays['athlete_id'])), 'sports': hashes}
+    _write_index(entries + [entry], snapshot_dir)
+    return entry
+
+
+# ------------------- DIFFS ---------------------
+def _aligned(snapshot, size, field):
+    """Scatters one snapshot array into a dense athlete_id-indexed array (NaN = absent)."""
+    aligned = np.full(size, np.nan)
+    aligned[snapshot['athlete_id']] = snapshot[field]
+    return aligned
+
+
+def _goat_gaps(snapshot):
+    """Per sport_id gap between the normalized scores ranked 1 and 2."""
+    gaps = {}
+    for rank in (1, 2):
+        mask = snapshot['rank'] == rank
+        for sport_id, value in zip(snapshot['sport_id'][mask], snapshot['normalized'][mask]):
+            gaps.setdefault(int(sport_id), [np.nan, np.nan])[rank - 1] = value
+    return {sport_id: top[0] - top[1] for sport_id, top in gaps.items()}
+
+
+def diff_snapshots(old_ref, new_ref, top_k=10, snapshot_dir=None):
+    """
+    Compares the rankings of two snapshots.
+
+    Args:
+        old_ref: Reference of the earlier snapshot (see resolve_snapshot)
+        new_ref: Reference of the later snapshot
+        top_k: Size of the "top" used for entries and exits
+        snapshot_dir: Snapshot directory
+
+    Returns:
+        Dict of DataFrames:
+            'movements': every athlete whose rank changed (sport, name, old/new
+                rank, movement > 0 means moved up, old/new normalized score)
+            'entered' / 'exited': athletes that entered / left a sport's top-k
+            'gaps': per sport GOAT gap (rank 1 minus rank 2) before and after
+    """
+    old = load_snapshot(old_ref, snapshot_dir)
+    new = load_snapshot(new_ref, snapshot_dir)
+    athletes = load_athletes()
+    sports = load_dictionary('sports')
+    size = max(len(athletes), int(old['athlete_id'].max(initial=-1)) + 1, int(new['athlete_id'].max(initial=-1)) + 1)
+
+    old_rank, new_rank = _aligned(old, size, 'rank'), _aligned(new, size, 'rank')
+    old_norm, new_norm = _aligned(old, size, 'normalized'), _aligned(new, size, 'normalized')
+    present = ~np.isnan(old_rank) | ~np.isnan(new_rank)
+    ids = np.flatnonzero(present)
+
+    names = np.asarray(athletes['name'], dtype=object)
+    sport_ids = athletes['sport_id'].to_numpy()
+    table = pd.DataFrame({
+        'sport': [sport_display_name(sports[s]) for s in sport_ids[ids]],
+        'player_name': names[ids],
+        'old_rank': old_rank[ids],
+        'new_rank': new_rank[ids],
+        'movement': old_rank[ids] - new_rank[ids],
+        'old_normalized': old_norm[ids],
+        'new_normalized': new_norm[ids],
+    })
+    old_top = table['old_rank'] <= top_k
+    new_top = table['new_rank'] <= top_k
+
+    old_gaps, new_gaps = _goat_gaps(old), _goat_gaps(new)
+    gaps = pd.DataFrame([
+        {'sport': sport_display_name(sports[s]), 'old_gap': old_gaps.get(s, np.nan),
+         'new_gap': new_gaps.get(s, np.nan)}
+        for s in sorted(set(old_gaps) | set(new_gaps))
+    ])
+    if len(gaps):
+        gaps['change'] = gaps['new_gap'] - gaps['old_gap']
+
+    changed = (table['movement'] != 0) & table['movement'].notna()
+    return {
+        'movements': table[changed].sort_values(['sport', 'new_rank']).reset_index(drop=True),
+        'entered': table[new_top & ~old_top].sort_values(['sport', 'new_rank']).reset_index(drop=True),
+        'exited': table[old_top & ~new_top].sort_values(['sport', 'old_rank']).reset_index(drop=True),
+        'gaps': gaps,
+    }
+
+
+def rank_history(refs=None, snapshot_dir=None):
+    """
+    Ranks of every athlete across many snapshots.
+
+    Args:
+        refs: Optional list of snapshot references (default: all, oldest first)
+        snapshot_dir: Snapshot directory
+
+    Returns:
+        DataFrame indexed by athlete_id with one rank column per snapshot
+        (NaN where the athlete was not scored)
+    """
+    entries = [resolve_snapshot(ref, snapshot_dir) for ref in refs] if refs else list_snapshots(snapshot_dir)
+    snapshots = [load_snapshot(entry['id'], snapshot_dir) for entry in entries]
+    size = max((int(s['athlete_id'].max(initial=-1)) + 1 for s in snapshots), default=0)
+    history = np.column_stack([_aligned(s, size, 'rank') for s in snapshots]) if snapshots else np.empty((0, 0))
+    return pd.DataFrame(history, columns=[entry['id'] for entry in entries]).dropna(how='all')
+
+
+# ------------------- CLI ---------------------
+def _print_diff(diff, top_k):
+    print(f"\n====== TOP-{top_k} ENTRIES ======")
+    for _, row in diff['entered'].iterrows():
+        old = "unranked" if np.isnan(row['old_rank']) else f"#{int(row['old_rank'])}"
+        print(f"{row['sport']:<22} {row['player_name']} ({old} -> #{int(row['new_rank'])})")
+    print(f"\n====== TOP-{top_k} EXITS ======")
+    for _, row in diff['exited'].iterrows():
+        new = "unranked" if np.isnan(row['new_rank']) else f"#{int(row['new_rank'])}"
+        print(f"{row['sport']:<22} {row['player_name']} (#{int(row['old_rank'])} -> {new})")
+    print("\n====== RANK MOVEMENTS ======")
+    for _, row in diff['movements'].iterrows():
+        if np.isnan(row['old_rank']) or np.isnan(row['new_rank']):
+            continue
+        print(f"{row['sport']:<22} {row['player_name']:<28} #{int(row['old_rank'])} -> #{int(row['new_rank'])} "
+              f"({int(row['movement']):+d})")
+    print("\n====== GOAT GAP CHANGES ======")
+    for _, row in diff['gaps'].iterrows():
+        if row['change'] != 0:
+            print(f"{row['sport']:<22} {row['old_gap']:.1f} -> {row['new_gap']:.1f} ({row['change']:+.1f})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Versioned ranking snapshots.")
+    commands = parser.add_subparsers(dest="command")
+    take = commands.add_parser("take", help="score every sport and store a snapshot")
+    take.add_argument("--label", help="note stored with the snapshot")
+    take.add_argument("--force", action="store_true", help="store even if nothing changed")
+    commands.add_parser("list", help="list stored snapshots")
+    diff = commands.add_parser("diff", help="compare two snapshots")
+    diff.add_argument("old", nargs="?", default="-2", help="earlier snapshot (default: the one before the latest)")
+    diff.add_argument("new", nargs="?", default="-1", help="later snapshot (default: the latest)")
+    diff.add_argument("--top-k", type=int, default=10, help="size of the top used for entries/exits")
+    args = parser.parse_args()
+
+    if args.command == "take":
+        entry = take_snapshot(label=args.label, force=args.force)
+        print(f"Snapshot {entry['id']} ({entry['n_athletes']} athletes)")
+    elif args.command == "diff":
+        _print_diff(diff_snapshots(args.old, args.new, top_k=args.top_k), args.top_k)
+    else:
+        for entry in list_snapshots():
+            print(f"{entry['id']}  {entry['n_athletes']:>5} athletes  {entry['label'] or ''}")
+
+
+if __name__ == "__main__":
+    main()
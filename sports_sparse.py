@@ -0,0 +1,267 @@
+"""
+Sparse storage for mostly-zero stat columns.
+
+A lot of dataset columns are zero for almost every athlete: a quarterback
+dataset carries receiving, kicking and return columns, the fight sports carry
+doping failures, cricket carries stumpings and triple centuries. Storing them
+in the dense feature block costs 8 bytes per row regardless.
+
+Columns whose share of non-zero rows is at most SPARSE_MAX_DENSITY are kept in
+a compressed sparse column (CSC) block instead:
+
+    indptr   int64,   n_sparse_columns + 1   <- column j lives in [indptr[j], indptr[j+1])
+    rows     int32,   nnz                    <- row of every non-zero value
+    values   float64, nnz                    <- the non-zero values
+
+SparseColumn wraps one column of that block for the scoring engine. The
+linear terms that make up most of an index function (score += stat * W)
+are evaluated on the non-zeros only: scaling touches nnz values and adding
+to a dense accumulator is a scatter-add into the rows that have a value,
+which gives bit-identical results to the dense computation. Anything else
+(comparisons, division, masks) falls back to the dense column.
+"""
+
+import operator
+
+import numpy as np
+
+# Columns with at most this share of non-zero rows are stored sparse
+SPARSE_MAX_DENSITY = 0.25
+
+
+# ------------------- DENSITY ---------------------
+def column_density(values):
+    """Share of non-zero entries of a numeric column (0.0 for an empty column)."""
+    values = np.asarray(values)
+    return float(np.count_nonzero(values)) / len(values) if len(values) else 0.0
+
+
+def split_by_density(df, columns, max_density=SPARSE_MAX_DENSITY):
+    """
+    Splits numeric columns into dense and sparse ones.
+
+    Args:
+        df: DataFrame (or column mapping) holding the columns
+        columns: Numeric column names, in storage order
+        max_density: Highest share of non-zero rows stored sparse
+
+    Returns:
+        (dense_columns, sparse_columns), both in the given order
+    """
+    dense, sparse = [], []
+    for col in columns:
+        values = np.asarray(df[col], dtype=np.float64)
+        # NaN counts as non-zero, so columns with missing values stay dense
+        (sparse if len(values) and column_density(values) <= max_density else dense).append(col)
+    return dense, sparse
+
+
+# ------------------- CSC BLOCK ---------------------
+def build_sparse_block(df, columns):
+    """
+    Packs numeric columns into CSC arrays.
+
+    Args:
+        df: DataFrame (or column mapping) holding the columns
+        columns: Column names to pack
+
+    Returns:
+        (indptr, rows, values) numpy arrays
+    """
+    indptr = np.zeros(len(columns) + 1, dtype=np.int64)
+    rows, values = [], []
+    for j, col in enumerate(columns):
+        column = np.asarray(df[col], dtype=np.float64)
+        nonzero = np.flatnonzero(column)
+        rows.append(nonzero.astype(np.int32))
+        values.append(column[nonzero])
+        indptr[j + 1] = indptr[j] + len(nonzero)
+    rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.int32)
+    values = np.concatenate(values) if values else np.empty(0, dtype=np.float64)
+    return indptr, rows, values
+
+
+class SparseBlock:
+    """Read-only CSC block of sparse columns (arrays may be memory-mapped)."""
+
+    def __init__(self, columns, indptr, rows, values, n_rows):
+        self.columns = list(columns)
+        self.indptr = indptr
+        self.rows = rows
+        self.values = values
+        self.n_rows = n_rows
+        self._position = {col: j for j, col in enumerate(self.columns)}
+
+    def __contains__(self, col):
+        return col in self._position
+
+    @property
+    def nnz(self):
+        return len(self.values)
+
+    @property
+    def nbytes(self):
+        return self.indptr.nbytes + self.rows.nbytes + self.values.nbytes
+
+    def column(self, col):
+        """Returns one column as a SparseColumn (zero-copy slices of the block)."""
+        j = self._position[col]
+        start, stop = self.indptr[j], self.indptr[j + 1]
+        return SparseColumn(self.rows[start:stop], self.values[start:stop], self.n_rows)
+
+    def toarray(self):
+        """Dense (n_rows, n_columns) float64 copy of the block."""
+        dense = np.zeros((self.n_rows, len(self.columns)), dtype=np.float64, order='F')
+        for j in range(len(self.columns)):
+            start, stop = self.indptr[j], self.indptr[j + 1]
+            dense[self.rows[start:stop], j] = self.values[start:stop]
+        return dense
+
+
+# ------------------- SPARSE COLUMN ---------------------
+def _is_scalar(value):
+    return np.ndim(value) == 0 and not isinstance(value, SparseColumn)
+
+
+def _dense_binary(op, reflected=False):
+    def method(self, other):
+        if isinstance(other, SparseColumn):
+            other = other.toarray()
+        dense = self.toarray()
+        return op(other, dense) if reflected else op(dense, other)
+    return method
+
+
+class SparseColumn:
+    """
+    One numeric column stored as (row indices, non-zero values).
+
+    Supports the arithmetic of linear index terms without densifying:
+    column * scalar, -column and dense +/- column. Every other operation
+    densifies first, so the column can stand in for an array anywhere in a
+    vectorized index function.
+    """
+
+    # Keep numpy from broadcasting ndarray <op> SparseColumn element by
+    # element; Python then dispatches to the reflected methods below
+    __array_ufunc__ = None
+
+    def __init__(self, rows, values, n_rows):
+        self.rows = rows
+        self.values = values
+        self.n_rows = n_rows
+
+    @property
+    def nnz(self):
+        return len(self.values)
+
+    def __len__(self):
+        return self.n_rows
+
+    def toarray(self):
+        dense = np.zeros(self.n_rows, dtype=np.float64)
+        dense[self.rows] = self.values
+        return dense
+
+    def __array__(self, dtype=None, copy=None):
+        dense = self.toarray()
+        return dense if dtype is None else dense.astype(dtype)
+
+    def to_numpy(self):
+        return self.toarray()
+
+    # --- linear terms, evaluated on the non-zeros only ---
+    def __mul__(self, other):
+        if _is_scalar(other) and np.isfinite(other):
+            return SparseColumn(self.rows, self.values * other, self.n_rows)
+        return _dense_binary(operator.mul)(self, other)
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return SparseColumn(self.rows, -self.values, self.n_rows)
+
+    def __pos__(self):
+        return self
+
+    def _scatter(self, other, op):
+        if isinstance(other, SparseColumn):
+            other = other.toarray()
+        base = np.broadcast_to(np.asarray(other, dtype=np.float64), (self.n_rows,))
+        result = np.array(base, dtype=np.float64)
+        # Rows without a value would add 0 in the dense computation, which
+        # leaves the accumulator unchanged, so only the non-zero rows are touched
+        result[self.rows] = op(result[self.rows], self.values)
+        return result
+
+    def __add__(self, other):
+        return self._scatter(other, operator.add)
+
+    __radd__ = __add__
+
+    def __rsub__(self, other):
+        return self._scatter(other, operator.sub)
+
+    __sub__ = _dense_binary(operator.sub)
+    __truediv__ = _dense_binary(operator.truediv)
+    __rtruediv__ = _dense_binary(operator.truediv, reflected=True)
+    __floordiv__ = _dense_binary(operator.floordiv)
+    __rfloordiv__ = _dense_binary(operator.floordiv, reflected=True)
+    __mod__ = _dense_binary(operator.mod)
+    __rmod__ = _dense_binary(operator.mod, reflected=True)
+    __pow__ = _dense_binary(operator.pow)
+    __rpow__ = _dense_binary(operator.pow, reflected=True)
+    __lt__ = _dense_binary(operator.lt)
+    __le__ = _dense_binary(operator.le)
+    __gt__ = _dense_binary(operator.gt)
+    __ge__ = _dense_binary(operator.ge)
+    __eq__ = _dense_binary(operator.eq)
+    __ne__ = _dense_binary(operator.ne)
+    __hash__ = None
+
+
+# ------------------- REPORTING ---------------------
+def sparsity_report(sports=None):
+    """
+    Compares the bytes of each dataset's numeric block stored dense vs split.
+
+    Args:
+        sports: Optional list of sports (default: all)
+
+    Returns:
+        DataFrame with one row per sport plus a TOTAL row
+    """
+    import pandas as pd
+    from sports_registry import list_sports
+    from sports_storage import load_dataset
+
+    rows = []
+    for sport in sports or list_sports():
+        df = load_dataset(sport, compact=False)
+        numeric = [c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])]
+        dense, sparse = split_by_density(df, numeric)
+        indptr, nz_rows, values = build_sparse_block(df, sparse)
+        rows.append({
+            'sport': sport,
+            'numeric_columns': len(numeric),
+            'sparse_columns': len(sparse),
+            'dense_bytes': len(df) * len(numeric) * 8,
+            'split_bytes': len(df) * len(dense) * 8 + indptr.nbytes + nz_rows.nbytes + values.nbytes,
+        })
+    report = pd.DataFrame(rows)
+    total = report.drop(columns='sport').sum().to_dict()
+    report = pd.concat([report, pd.DataFrame([{'sport': 'TOTAL', **total}])], ignore_index=True)
+    report['reduction_percent'] = (1 - report['split_bytes'] / report['dense_bytes']) * 100
+    return report
+
+
+def main():
+    report = sparsity_report()
+    print(f"\n====== NUMERIC BLOCK: DENSE vs SPARSE COLUMNS (density <= {SPARSE_MAX_DENSITY}) ======")
+    for _, row in report.iterrows():
+        print(f"{row['sport']:<22} {row['sparse_columns']:>3}/{row['numeric_columns']:<3} sparse  "
+              f"{row['dense_bytes']:>8,} B -> {row['split_bytes']:>8,} B ({row['reduction_percent']:.1f}% smaller)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,485 @@
+"""
+Columnar binary storage for datasets and scored outputs.
+
+Every table that used to be round-tripped through CSV is also stored next to
+its CSV as a directory of typed .npy column files:
+
+    basketball_dataset.csv          <- CSV export (kept for humans / git diffs)
+    basketball_dataset.cols/
+        meta.json                   <- column order, dtypes, row count, CSV signature
+        col_000.npy, col_001.npy    <- one typed array per column
+        features.npy                <- the dense numeric columns as one float64 block
+        sparse_indptr.npy, ...      <- mostly-zero numeric columns in CSC form
+
+Column files and the feature block are opened with np.load(mmap_mode='r'), so
+loading costs a page-in instead of a text parse. The feature block is written
+in Fortran (column-major) order which makes every feature column a contiguous,
+zero-copy view that the scoring engine can consume directly. Numeric columns
+that are zero for most rows are kept out of the feature block and stored as
+a sparse block instead (see sports_sparse).
+
+read_table() transparently falls back to the CSV (and rebuilds the columnar
+copy) whenever the CSV has changed since the columnar copy was written. If
+the table has a corrections log (<csv stem>.corrections.jsonl, see
+sports_corrections) its pending corrections are replayed on top at load time.
+
+A few datasets list an athlete twice (the same name in the sport's name
+column, sometimes with slightly different records). The repeated rows are
+recorded in meta.json when the columnar copy is written, and read_table()
+and load_feature_columns() leave them out by default (distinct=True): the
+first record of every athlete is scored, so a GOAT listed twice is not its
+own runner-up.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from sports_registry import SPORTS, sport_path
+from sports_schema import apply_schema, enforce_schema, column_defaults, with_column_defaults
+from sports_sparse import SparseBlock, SparseColumn, build_sparse_block, split_by_density
+
+COLUMNAR_SUFFIX = ".cols"
+CORRECTIONS_SUFFIX = ".corrections.jsonl"
+FORMAT_VERSION = 3
+SPARSE_FILES = ("sparse_indptr.npy", "sparse_rows.npy", "sparse_values.npy")
+
+
+def columnar_path(csv_path):
+    """Returns the columnar directory that shadows a CSV file."""
+    root, _ = os.path.splitext(csv_path)
+    return root + COLUMNAR_SUFFIX
+
+
+def corrections_path(csv_path):
+    """Returns the corrections log that belongs to a CSV file (it may not exist)."""
+    root, _ = os.path.splitext(csv_path)
+    return root + CORRECTIONS_SUFFIX
+
+
+def table_checksum(csv_path):
+    """
+    SHA-1 of a table's content as read_table serves it: the CSV plus its
+    corrections log, if any. None if the CSV does not exist.
+    """
+    if not os.path.exists(csv_path):
+        return None
+    digest = hashlib.sha1()
+    for path in (csv_path, corrections_path(csv_path)):
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _csv_signature(csv_path):
+    """Cheap change detector for a CSV file (size + mtime in ns)."""
+    if not os.path.exists(csv_path):
+        return None
+    stat = os.stat(csv_path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _name_column(csv_path):
+    """Name column of a sport's dataset or scored table (None for other tables)."""
+    path = os.path.abspath(csv_path)
+    for sport, info in SPORTS.items():
+        if path in (sport_path(sport, 'dataset'), sport_path(sport, 'scored')):
+            return info["name_col"]
+    return None
+
+
+def _repeated_rows(df, name_col):
+    """Positions of the rows whose athlete name already appeared in an earlier row."""
+    if name_col is None or name_col not in df.columns:
+        return []
+    return np.flatnonzero(df[name_col].duplicated().to_numpy()).tolist()
+
+
+def row_count(meta, distinct=True):
+    """Number of rows of a columnar table, without its repeated athletes if distinct."""
+    return meta['n_rows'] - (len(meta.get('repeated_rows', [])) if distinct else 0)
+
+
+def _is_numeric(series):
+    return pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series)
+
+
+def write_columnar(df, path, csv_signature=None, logical_dtypes=None, name_col=None):
+    """
+    Writes a DataFrame as a columnar directory of typed .npy files.
+
+    Args:
+        df: DataFrame to store
+        path: Target directory (usually columnar_path(csv_path))
+        csv_signature: Signature of the CSV export this copy mirrors, if any
+        logical_dtypes: Optional {column: dtype} the columns had before they were
+            compacted; read_columnar(widen=True) restores them
+        name_col: Optional athlete name column; rows repeating an earlier
+            row's name are recorded as repeated_rows in meta.json
+
+    Returns:
+        The path that was written
+    """
+    # Write into a temporary directory and swap it in, so readers never see
+    # a half-written table
+    tmp_path = path + ".tmp"
+    if os.path.exists(tmp_path):
+        shutil.rmtree(tmp_path)
+    os.makedirs(tmp_path)
+
+    columns = []
+    numeric_cols = []
+    for i, col in enumerate(df.columns):
+        series = df[col]
+        filename = f"col_{i:03d}.npy"
+        extra = {}
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Dictionary-encoded: small integer codes on disk, labels in meta.json
+            values = series.cat.codes.to_numpy()
+            kind = 'category'
+            extra['categories'] = [str(c) for c in series.cat.categories]
+        elif _is_numeric(series):
+            values = series.to_numpy()
+            kind = 'numeric'
+            numeric_cols.append(col)
+        else:
+            # Fixed-width unicode keeps string columns mmap-able (no pickling)
+            values = series.astype(object).fillna('').astype(str).to_numpy().astype(str)
+            kind = 'string'
+        np.save(os.path.join(tmp_path, filename), values, allow_pickle=False)
+        if logical_dtypes and col in logical_dtypes:
+            extra['logical_dtype'] = str(logical_dtypes[col])
+        columns.append({'name': col, 'file': filename, 'kind': kind, 'dtype': str(values.dtype), **extra})
+
+    # One column-major float64 block of the dense numeric columns for the
+    # scoring engine, and a CSC block of the mostly-zero ones
+    dense_cols, sparse_cols = split_by_density(df, numeric_cols)
+    features = np.empty((len(df), len(dense_cols)), dtype=np.float64, order='F')
+    for j, col in enumerate(dense_cols):
+        features[:, j] = df[col].to_numpy(dtype=np.float64)
+    np.save(os.path.join(tmp_path, "features.npy"), features, allow_pickle=False)
+    for filename, values in zip(SPARSE_FILES, build_sparse_block(df, sparse_cols)):
+        np.save(os.path.join(tmp_path, filename), values, allow_pickle=False)
+
+    meta = {
+        'format_version': FORMAT_VERSION,
+        'n_rows': int(len(df)),
+        'columns': columns,
+        'feature_columns': dense_cols,
+        'sparse_columns': sparse_cols,
+        'csv_signature': csv_signature,
+        'repeated_rows': _repeated_rows(df, name_col),
+    }
+    with open(os.path.join(tmp_path, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=1)
+
+    if os.path.exists(path):
+        shutil.rmtree(path)
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_meta(path):
+    """Returns the meta.json of a columnar directory, or None if it is missing/outdated."""
+    meta_file = os.path.join(path, "meta.json")
+    if not os.path.exists(meta_file):
+        return None
+    with open(meta_file, encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta.get('format_version') != FORMAT_VERSION:
+        return None
+    return meta
+
+
+def read_columnar(path, columns=None, mmap=True, widen=False):
+    """
+    Reads a columnar directory back into a DataFrame.
+
+    Args:
+        path: Columnar directory
+        columns: Optional list of columns to load (others are never touched)
+        mmap: Memory-map the column files instead of reading them eagerly
+        widen: Restore compacted columns to the dtypes they were written from
+            (int64 counts, plain strings) instead of their compact storage dtypes
+
+    Returns:
+        DataFrame with the stored columns in their original order
+    """
+    meta = read_meta(path)
+    if meta is None:
+        raise FileNotFoundError(f"No columnar table at {path}")
+
+    mmap_mode = 'r' if mmap else None
+    wanted = None if columns is None else set(columns)
+    data = {}
+    for col in meta['columns']:
+        if wanted is not None and col['name'] not in wanted:
+            continue
+        values = np.load(os.path.join(path, col['file']), mmap_mode=mmap_mode, allow_pickle=False)
+        if col['kind'] == 'string':
+            values = values.astype(object)
+        elif col['kind'] == 'category':
+            values = pd.Categorical.from_codes(np.asarray(values), categories=col['categories'])
+        if widen and 'logical_dtype' in col:
+            values = pd.Series(values).astype(object if col['kind'] == 'category' else col['logical_dtype']).to_numpy()
+        data[col['name']] = values
+    return pd.DataFrame(data, copy=False)
+
+
+def is_fresh(csv_path):
+    """True if the columnar copy of csv_path exists and matches the CSV on disk."""
+    meta = read_meta(columnar_path(csv_path))
+    if meta is None:
+        return False
+    signature = _csv_signature(csv_path)
+    return signature is None or meta.get('csv_signature') == signature
+
+
+def read_table(csv_path, columns=None, schema=None, corrections=True, distinct=True):
+    """
+    Loads a dataset or scored table, preferring the columnar copy.
+
+    Falls back to parsing the CSV when the columnar copy is missing or stale,
+    and refreshes the columnar copy so the next load skips the parse.
+
+    Args:
+        csv_path: Path of the CSV file (the columnar directory is derived from it)
+        columns: Optional list of columns to load
+        schema: Optional sport name whose compact dtypes are applied (see
+            sports_schema). Without it the columns come back with the default
+            int64/float64/string dtypes the calculators were written against.
+            Columns the sport gained after the table was stored are added
+            with their defaults.
+        corrections: Replay the table's pending stat corrections (default
+            True); False returns the base table as stored
+        distinct: Leave out the rows of athletes listed a second time
+            (default True); False returns every stored row
+
+    Returns:
+        DataFrame
+    """
+    cols_path = columnar_path(csv_path)
+    requested = columns
+    if schema is not None and columns is not None:
+        # Evolved columns the table does not store are filled in below
+        defaults = column_defaults(schema)
+        if any(col in defaults for col in columns):
+            stored = set(stored_columns(csv_path))
+            columns = [col for col in columns if col in stored or col not in defaults]
+    log = corrections_path(csv_path)
+    replay = corrections and os.path.exists(log)
+    extra_name_col = None
+    if replay and columns is not None:
+        # Imported here: the corrections module builds on this one
+        from sports_corrections import log_name_column
+        # The replay locates rows by name, so the name column is read even if not requested
+        name_col = log_name_column(log)
+        if name_col not in columns:
+            extra_name_col = name_col
+            columns = list(columns) + [name_col]
+    if is_fresh(csv_path):
+        df = read_columnar(cols_path, columns=columns, widen=schema is None)
+    else:
+        df = pd.read_csv(csv_path)
+        write_columnar(df, cols_path, csv_signature=_csv_signature(csv_path), name_col=_name_column(csv_path))
+        if columns is not None:
+            df = df[list(columns)]
+    repeated = read_meta(cols_path).get('repeated_rows', []) if distinct else []
+    if repeated:
+        df = df.drop(index=df.index[repeated]).reset_index(drop=True)
+    if replay:
+        from sports_corrections import replay_corrections
+        df = replay_corrections(df, log)
+        if extra_name_col is not None:
+            df = df.drop(columns=extra_name_col)
+    if schema is not None:
+        df = apply_schema(with_column_defaults(df, schema, requested), schema)
+    return df
+
+
+def stored_columns(csv_path):
+    """Returns the column names a table physically stores."""
+    if is_fresh(csv_path):
+        return [c['name'] for c in read_meta(columnar_path(csv_path))['columns']]
+    return list(pd.read_csv(csv_path, nrows=0).columns)
+
+
+def write_table(df, csv_path, export_csv=True, schema=None):
+    """
+    Saves a table in columnar form, optionally exporting the CSV as well.
+
+    Args:
+        df: DataFrame to save
+        csv_path: Path of the CSV export (the columnar directory is derived from it)
+        export_csv: Also write the CSV (default True, the CSVs are the published artefacts)
+        schema: Optional sport name; the frame must fit that sport's declared
+            schema (ValueError otherwise) and its columns are stored with the
+            declared integer/bool/categorical dtypes
+    """
+    stored, logical_dtypes = _storage_frame(df, schema)
+    signature = None
+    if export_csv:
+        df.to_csv(csv_path, index=False)
+        signature = _csv_signature(csv_path)
+    write_columnar(stored, columnar_path(csv_path), csv_signature=signature, logical_dtypes=logical_dtypes,
+                   name_col=_name_column(csv_path))
+
+
+def write_columnar_for_csv(df, csv_path, schema=None):
+    """
+    Writes the columnar copy of a table whose CSV has already been written.
+
+    Used when the CSV is produced by something other than DataFrame.to_csv
+    (e.g. the dataset materializer's csv.writer export).
+
+    Args:
+        df: DataFrame with the same content as the CSV
+        csv_path: Path of the CSV export
+        schema: Optional sport name, see write_table
+    """
+    stored, logical_dtypes = _storage_frame(df, schema)
+    write_columnar(stored, columnar_path(csv_path), csv_signature=_csv_signature(csv_path),
+                   logical_dtypes=logical_dtypes, name_col=_name_column(csv_path))
+
+
+def _storage_frame(df, schema):
+    """Validates a frame against its schema and returns (frame to store, logical dtypes)."""
+    if schema is None:
+        return df, None
+    # Floats stay float64 on disk so scores computed from the stored copy
+    # are bit-identical; float32 is only applied in memory by read_table
+    return enforce_schema(df, schema, floats=False), dict(df.dtypes)
+
+
+def load_dataset(sport, columns=None, compact=True):
+    """Loads a sport's dataset, with its declared compact dtypes by default."""
+    return read_table(sport_path(sport, 'dataset'), columns=columns, schema=sport if compact else None)
+
+
+def load_scored(sport, columns=None, compact=True):
+    """Loads a sport's scored table, with its declared compact dtypes by default."""
+    return read_table(sport_path(sport, 'scored'), columns=columns, schema=sport if compact else None)
+
+
+def load_feature_block(csv_path):
+    """
+    Memory-maps the dense numeric feature block of a table.
+
+    Mostly-zero columns are not part of it, see load_sparse_block.
+
+    Args:
+        csv_path: Path of the table's CSV (columnar copy is built if needed)
+
+    Returns:
+        (block, column_names) where block is a read-only, column-major
+        float64 array of shape (n_rows, n_dense_columns) holding every stored
+        row, repeated athletes included
+    """
+    if not is_fresh(csv_path):
+        read_table(csv_path)
+    path = columnar_path(csv_path)
+    meta = read_meta(path)
+    block = np.load(os.path.join(path, "features.npy"), mmap_mode='r', allow_pickle=False)
+    return block, meta['feature_columns']
+
+
+def load_sparse_block(csv_path):
+    """
+    Memory-maps the sparse (mostly-zero) numeric columns of a table.
+
+    Args:
+        csv_path: Path of the table's CSV (columnar copy is built if needed)
+
+    Returns:
+        SparseBlock holding the table's sparse columns
+    """
+    if not is_fresh(csv_path):
+        read_table(csv_path)
+    path = columnar_path(csv_path)
+    meta = read_meta(path)
+    arrays = [np.load(os.path.join(path, filename), mmap_mode='r', allow_pickle=False) for filename in SPARSE_FILES]
+    return SparseBlock(meta['sparse_columns'], *arrays, n_rows=meta['n_rows'])
+
+
+def load_feature_columns(csv_path, columns=None, sparse=True, corrections=True, defaults=None, distinct=True):
+    """
+    Returns a {column: 1-D array} mapping for the scoring engine.
+
+    Dense numeric columns are zero-copy views into the memory-mapped feature
+    block, sparse ones are SparseColumn views into the sparse block; string
+    columns (e.g. teams_played_for) are loaded from their own column file.
+
+    Args:
+        csv_path: Path of the table's CSV
+        columns: Columns to return (default: every column)
+        sparse: Return sparse columns as SparseColumn (default) instead of
+            densifying them
+        corrections: Replay pending stat corrections on the returned columns
+            (only the corrected columns are copied)
+        defaults: Optional {column: default} of evolved columns (see
+            sports_schema.column_defaults); those the table does not store
+            are returned as read-only zero-stride views of their default
+        distinct: Leave out the rows of athletes listed a second time
+            (default True; the columns are then copies instead of views
+            when the table has such rows)
+
+    Returns:
+        Dict mapping column name to array
+    """
+    block, feature_cols = load_feature_block(csv_path)
+    sparse_block = load_sparse_block(csv_path)
+    path = columnar_path(csv_path)
+    meta = read_meta(path)
+    position = {col: j for j, col in enumerate(feature_cols)}
+
+    stored = [c['name'] for c in meta['columns']]
+    defaults = defaults or {}
+    wanted = stored + [col for col in defaults if col not in stored] if columns is None else list(columns)
+    result = {}
+    string_cols = []
+    for col in wanted:
+        if col not in stored and col in defaults:
+            result[col] = np.broadcast_to(np.asarray(defaults[col]), (row_count(meta, distinct),))
+        elif col in position:
+            result[col] = block[:, position[col]]
+        elif col in sparse_block:
+            column = sparse_block.column(col)
+            result[col] = column if sparse else column.toarray()
+        else:
+            string_cols.append(col)
+    if string_cols:
+        strings = read_columnar(path, columns=string_cols)
+        for col in strings.columns:
+            result[col] = strings[col].to_numpy()
+    repeated = meta.get('repeated_rows', []) if distinct else []
+    if repeated:
+        keep = np.ones(meta['n_rows'], dtype=bool)
+        keep[repeated] = False
+        result = {col: values if _is_constant(values) else _take_rows(values, keep) for col, values in result.items()}
+    log = corrections_path(csv_path)
+    if corrections and os.path.exists(log):
+        from sports_corrections import log_name_column, replay_corrections
+        name_col = log_name_column(log)
+        names = read_columnar(path, columns=[name_col])[name_col].to_numpy()
+        if repeated:
+            names = names[keep]
+        result = replay_corrections(result, log, names=names)
+    return result
+
+
+def _is_constant(values):
+    return isinstance(values, np.ndarray) and values.ndim == 1 and len(values) > 0 and values.strides == (0,)
+
+
+def _take_rows(values, keep):
+    """Rows of a column (array or SparseColumn) where the keep mask is set."""
+    if isinstance(values, SparseColumn):
+        position = np.cumsum(keep) - 1
+        kept = keep[values.rows]
+        return SparseColumn(position[values.rows[kept]], values.values[kept], int(keep.sum()))
+    return np.asarray(values)[keep]
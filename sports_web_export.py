@@ -0,0 +1,282 @@
+"""
+Compact ranking export for the web front-end.
+
+The front-end used to download every *_index_scored.csv (40+ columns per
+sport) although it only shows rank, name, country and normalized score.
+export_all() writes one small JSON bundle per sport with just those:
+
+    {"sport": "nba", "title": "Nba", "version": "3fa2c1d9e0", "scale": 10,
+     "names": ["Michael Jordan", ...],          <- dictionary, ids never change
+     "countries": ["USA", ...],                 <- dictionary, ids never change
+     "rows": {"name": [0, 1, ...],              <- rank order, name ids
+              "country": [0, 0, ...],           <- country ids (-1 = none)
+              "score": [1000, 964, ...]}}       <- normalized score * scale
+
+Next to the bundle it writes a delta patch from the previously exported
+version, so a client that already has that version downloads only what
+changed after a reweighting:
+
+    {"sport": "nba", "from": "3fa2c1d9e0", "to": "9b1e4c27aa",
+     "names_append": [...], "countries_append": [...],
+     "set": {"12": [country_id, score], ...},     <- new or changed athletes by name id
+     "remove": [..],                              <- name ids no longer ranked
+     "order": [..] or null}                       <- new rank order (null = unchanged)
+
+apply_patch() is the reference implementation of what the client does.
+web_export/index.json lists each sport's current version and its patches.
+"""
+
+import os
+import json
+import hashlib
+
+import numpy as np
+
+from sports_registry import PROJECT_ROOT, SPORTS, list_sports, sport_path, sport_display_name
+from sports_storage import read_table
+from sports_database import COUNTRY_COLUMNS
+
+DEFAULT_EXPORT_DIR = os.path.join(PROJECT_ROOT, "web_export")
+
+# Scores are shipped as integers: normalized_index * SCORE_SCALE (0.1 precision)
+SCORE_SCALE = 10
+
+
+# ------------------- FILES ---------------------
+def _dumps(obj):
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def _write_json(path, obj):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(_dumps(obj))
+    os.replace(tmp_path, path)
+
+
+def _read_json(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def bundle_path(sport, export_dir=None):
+    """Returns the path of a sport's current bundle."""
+    return os.path.join(export_dir or DEFAULT_EXPORT_DIR, f"{sport}.json")
+
+
+def patch_path(sport, old_version, new_version, export_dir=None):
+    """Returns the path of the patch between two versions of a sport's bundle."""
+    return os.path.join(export_dir or DEFAULT_EXPORT_DIR, f"{sport}.{old_version}.{new_version}.patch.json")
+
+
+# ------------------- BUNDLES ---------------------
+def _occurrence_keys(names):
+    """(name, n) keys where n counts earlier occurrences of the same name."""
+    seen = {}
+    keys = []
+    for name in names:
+        seen[name] = seen.get(name, -1) + 1
+        keys.append((name, seen[name]))
+    return keys
+
+
+def _version(bundle):
+    content = {key: value for key, value in bundle.items() if key != 'version'}
+    return hashlib.sha1(_dumps(content).encode("utf-8")).hexdigest()[:10]
+
+
+def build_bundle(sport, previous=None):
+    """
+    Builds a sport's compact bundle from its scored table.
+
+    Args:
+        sport: Sport directory name
+        previous: The previously exported bundle, if any; its name and country
+            dictionaries are extended rather than rebuilt so IDs stay stable
+
+    Returns:
+        Bundle dict (see module docstring)
+    """
+    name_col = SPORTS[sport]["name_col"]
+    scored = read_table(sport_path(sport, 'scored'))
+    country_col = next((col for col in COUNTRY_COLUMNS if col in scored.columns), None)
+
+    names = list(previous['names']) if previous else []
+    countries = list(previous['countries']) if previous else []
+    # A name listed twice in one dataset (american_football, womens_soccer)
+    # gets one dictionary entry per occurrence
+    name_ids = {key: i for i, key in enumerate(_occurrence_keys(names))}
+    country_ids = {country: i for i, country in enumerate(countries)}
+
+    def intern(key, value, ids, values):
+        if key not in ids:
+            ids[key] = len(values)
+            values.append(value)
+        return ids[key]
+
+    name_keys = _occurrence_keys(str(name) for name in scored[name_col])
+    name_codes = [intern(key, key[0], name_ids, names) for key in name_keys]
+    if country_col:
+        country_codes = [intern(str(c), str(c), country_ids, countries) for c in scored[country_col]]
+    else:
+        country_codes = [-1] * len(scored)
+    scores = np.rint(scored['normalized_index'].to_numpy(dtype=np.float64) * SCORE_SCALE).astype(int)
+
+    bundle = {
+        'sport': sport,
+        'title': sport_display_name(sport),
+        'scale': SCORE_SCALE,
+        'names': names,
+        'countries': countries,
+        'rows': {'name': name_codes, 'country': country_codes, 'score': scores.tolist()},
+    }
+    bundle['version'] = _version(bundle)
+    return bundle
+
+
+# ------------------- PATCHES ---------------------
+def _rows_by_name(bundle):
+    rows = bundle['rows']
+    return {name: (country, score) for name, country, score in zip(rows['name'], rows['country'], rows['score'])}
+
+
+def make_patch(old, new):
+    """
+    Computes the delta that turns one bundle version into the next.
+
+    Args:
+        old: Previously exported bundle
+        new: New bundle built with previous=old
+
+    Returns:
+        Patch dict (see module docstring)
+    """
+    old_rows, new_rows = _rows_by_name(old), _rows_by_name(new)
+    changed = {str(name): list(values) for name, values in new_rows.items() if old_rows.get(name) != values}
+    removed = [name for name in old_rows if name not in new_rows]
+    order = new['rows']['name'] if new['rows']['name'] != old['rows']['name'] else None
+    return {
+        'sport': new['sport'],
+        'from': old['version'],
+        'to': new['version'],
+        'names_append': new['names'][len(old['names']):],
+        'countries_append': new['countries'][len(old['countries']):],
+        'set': changed,
+        'remove': removed,
+        'order': order,
+    }
+
+
+def apply_patch(bundle, patch):
+    """
+    Applies a patch to a bundle (what the front-end does after downloading it).
+
+    Args:
+        bundle: Bundle at version patch['from']
+        patch: Patch from make_patch
+
+    Returns:
+        Bundle at version patch['to']
+
+    Raises:
+        ValueError: If the patch does not start from the bundle's version
+    """
+    if bundle['version'] != patch['from']:
+        raise ValueError(f"Patch starts at {patch['from']}, bundle is at {bundle['version']}")
+    rows = _rows_by_name(bundle)
+    for name in patch['remove']:
+        rows.pop(name, None)
+    rows.update({int(name): tuple(values) for name, values in patch['set'].items()})
+    order = patch['order'] if patch['order'] is not None else bundle['rows']['name']
+
+    result = {key: value for key, value in bundle.items() if key not in ('names', 'countries', 'rows', 'version')}
+    result['names'] = bundle['names'] + patch['names_append']
+    result['countries'] = bundle['countries'] + patch['countries_append']
+    result['rows'] = {
+        'name': list(order),
+        'country': [rows[name][0] for name in order],
+        'score': [rows[name][1] for name in order],
+    }
+    result['version'] = patch['to']
+    return result
+
+
+# ------------------- EXPORT ---------------------
+def export_sport(sport, export_dir=None):
+    """
+    Exports one sport's bundle and, if it changed, the patch from the previous one.
+
+    Args:
+        sport: Sport directory name
+        export_dir: Output directory (defaults to web_export in the project root)
+
+    Returns:
+        Dict with the sport, its new and previous version, the patch file
+        written (or None) and the byte sizes of the scored CSV, the bundle and the patch
+    """
+    export_dir = export_dir or DEFAULT_EXPORT_DIR
+    os.makedirs(export_dir, exist_ok=True)
+    path = bundle_path(sport, export_dir)
+    previous = _read_json(path)
+    bundle = build_bundle(sport, previous)
+
+    patch_file = None
+    previous_version = previous['version'] if previous else None
+    if previous is None or previous['version'] != bundle['version']:
+        if previous is not None:
+            patch_file = patch_path(sport, previous['version'], bundle['version'], export_dir)
+            _write_json(patch_file, make_patch(previous, bundle))
+        _write_json(path, bundle)
+
+    return {
+        'sport': sport,
+        'version': bundle['version'],
+        'previous_version': previous_version,
+        'patch': os.path.basename(patch_file) if patch_file else None,
+        'csv_bytes': os.path.getsize(sport_path(sport, 'scored')),
+        'bundle_bytes': os.path.getsize(path),
+        'patch_bytes': os.path.getsize(patch_file) if patch_file else 0,
+    }
+
+
+def export_all(sports=None, export_dir=None):
+    """
+    Exports every sport and updates web_export/index.json.
+
+    Args:
+        sports: Optional list of sports (default: all)
+        export_dir: Output directory
+
+    Returns:
+        List of export_sport() results
+    """
+    export_dir = export_dir or DEFAULT_EXPORT_DIR
+    results = [export_sport(sport, export_dir) for sport in sports or list_sports()]
+
+    index_file = os.path.join(export_dir, "index.json")
+    index = _read_json(index_file) or {}
+    for result in results:
+        entry = index.setdefault(result['sport'], {'patches': []})
+        if result['patch']:
+            entry['patches'].append({'from': result['previous_version'], 'to': result['version'], 'file': result['patch']})
+        entry['version'] = result['version']
+        entry['file'] = os.path.basename(bundle_path(result['sport'], export_dir))
+    _write_json(index_file, index)
+    return results
+
+
+def main():
+    results = export_all()
+    print("\n====== WEB EXPORT ======")
+    for r in results:
+        patch = f"patch {r['patch_bytes']:>6,} B" if r['patch'] else ""
+        print(f"{r['sport']:<22} v{r['version']}  csv {r['csv_bytes']:>7,} B -> bundle {r['bundle_bytes']:>6,} B  {patch}")
+    csv_total = sum(r['csv_bytes'] for r in results)
+    bundle_total = sum(r['bundle_bytes'] for r in results)
+    print(f"\nTotal: {csv_total:,} B of CSV -> {bundle_total:,} B of bundles")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+Shared fixtures for the test suite.
+
+The modules resolve every sport file through sports_registry.PROJECT_ROOT.
+project_copy() points it at a temporary copy of the sports a test touches,
+so tests that write (corrections, exports, materialized datasets) never
+modify the repository's tables.
+"""
+
+import os
+import sys
+import shutil
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import sports_registry  # noqa: E402
+
+
+@pytest.fixture
+def project_copy(tmp_path, monkeypatch):
+    """Returns a function copying sport directories to tmp_path and redirecting PROJECT_ROOT there."""
+    def copy(*sports):
+        for sport in sports:
+            shutil.copytree(os.path.join(ROOT, sport), tmp_path / sport,
+                            ignore=shutil.ignore_patterns('*.cols', '__pycache__', '*.corrections.jsonl'))
+        monkeypatch.setattr(sports_registry, 'PROJECT_ROOT', str(tmp_path))
+        sports_registry._module_cache.clear()
+        return tmp_path
+    yield copy
+    sports_registry._module_cache.clear()
@@ -0,0 +1,45 @@
+"""Archetypes: two obvious clusters are recovered, missing stats do not form their own."""
+
+import numpy as np
+
+from sports_archetypes import _chunks, _nearest, _with_missing, minibatch_kmeans, streaming_moments
+
+
+def _two_archetypes(n=60, seed=0):
+    # Volume scorers (many attempts, low efficiency) and efficient finishers
+    rng = np.random.default_rng(seed)
+    volume = np.column_stack([rng.normal(2000, 100, n), rng.normal(0.45, 0.01, n)])
+    efficient = np.column_stack([rng.normal(800, 100, n), rng.normal(0.60, 0.01, n)])
+    return np.vstack([volume, efficient]), np.r_[np.zeros(n), np.ones(n)]
+
+
+def _fit(values, missing_zero, k=2):
+    columns = {j: values[:, j] for j in range(values.shape[1])}
+    make_chunks = lambda: _chunks(columns, len(values), 50, missing_zero)
+    mean, scale = streaming_moments(make_chunks())
+    centroids = minibatch_kmeans(make_chunks, k, mean, scale, batch=32, epochs=10)
+    points = np.nan_to_num((_with_missing(values, missing_zero) - mean) / scale)
+    return mean, _nearest(points, centroids)[0]
+
+
+def _same_partition(labels, truth):
+    return abs(np.corrcoef(labels, truth)[0, 1]) > 0.999
+
+
+def test_two_archetypes_are_recovered():
+    values, truth = _two_archetypes()
+    _, labels = _fit(values, np.array([False, False]))
+
+    assert _same_partition(labels, truth)
+
+
+def test_missing_stats_stay_in_their_archetype():
+    values, truth = _two_archetypes()
+    # Attempts not recorded for a few athletes of each archetype: a placeholder 0 and a NaN
+    values[[0, 1, 60, 61], 0] = 0
+    values[[2, 62], 0] = np.nan
+    mean, labels = _fit(values, np.array([True, False]))
+
+    recorded = np.r_[values[3:60, 0], values[63:, 0]]
+    np.testing.assert_allclose(mean[0], recorded.mean())
+    assert _same_partition(labels, truth)
@@ -0,0 +1,47 @@
+"""Bootstrap of the GOAT gaps: degenerate replicates and resampling of the athletes."""
+
+import numpy as np
+import pytest
+
+from sports_bootstrap import bootstrap_gaps, replicate_gaps, top_gaps
+
+
+@pytest.mark.parametrize("sport", ["mens_golf", "mens_swimming", "womens_boxing", "badminton"])
+def test_athlete_intervals_are_two_sided(sport):
+    result = bootstrap_gaps([sport], replicates=500, mode='athletes').iloc[0]
+
+    # Replicates without the GOAT can shrink the gap, replicates without the runner-up widen it
+    assert result['ci_low'] < result['gap'] < result['ci_high']
+
+
+def test_athlete_replicates_rank_each_athlete_once():
+    _, gaps = replicate_gaps('nba', replicates=500, mode='athletes')
+
+    # A GOAT drawn twice is not its own runner-up
+    assert np.all(gaps > 0)
+    result = bootstrap_gaps(['nba', 'mens_golf', 'mens_swimming'], replicates=500, mode='athletes')
+    assert np.isclose(result['p_largest'].sum(), 1.0)
+
+
+def test_stats_mode_without_error_reproduces_the_observed_gap():
+    observed, gaps = replicate_gaps('nba', replicates=50, mode='stats', relative_error=0)
+
+    np.testing.assert_allclose(gaps, observed)
+
+
+def test_both_modes_are_seeded():
+    first = replicate_gaps('mens_golf', replicates=200, mode='both', seed=7)[1]
+    second = replicate_gaps('mens_golf', replicates=200, mode='both', seed=7)[1]
+
+    np.testing.assert_array_equal(first, second)
+    assert np.all(np.isfinite(first))
+
+
+def test_top_gaps_degenerate_fields():
+    assert np.isnan(top_gaps(np.array([[5.0]]))).all()
+    np.testing.assert_array_equal(top_gaps(np.array([[5.0, 5.0, 1.0], [4.0, 2.0, 1.0]])), [0.0, 50.0])
+
+
+def test_unknown_mode_raises():
+    with pytest.raises(ValueError):
+        replicate_gaps('nba', replicates=10, mode='rows')
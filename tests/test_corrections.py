@@ -0,0 +1,93 @@
+"""Corrections log: replay at load time, compaction and past-state reconstruction."""
+
+import numpy as np
+import pytest
+
+import sports_corrections
+from sports_corrections import compact, reconstruct, record_correction
+from sports_registry import sport_path
+from sports_storage import load_dataset, read_table
+
+ATHLETE = "Michael Jordan"
+STAT = "all_star_appearances"
+
+
+def _value(df, athlete=ATHLETE, stat=STAT):
+    return df.loc[df['player_name'] == athlete, stat].iloc[0].item()
+
+
+@pytest.fixture
+def nba(project_copy):
+    project_copy('nba')
+    sports_corrections._log_cache.clear()
+    yield sport_path('nba', 'dataset')
+    sports_corrections._log_cache.clear()
+
+
+def test_read_table_replays_pending_corrections(nba):
+    original = _value(read_table(nba))
+    record_correction('nba', ATHLETE, STAT, original + 1, "test", timestamp="2026-01-01T00:00:00Z")
+    record_correction('nba', ATHLETE, STAT, original + 2, "test", timestamp="2026-02-01T00:00:00Z")
+
+    assert _value(read_table(nba)) == original + 2
+    assert _value(read_table(nba, corrections=False)) == original
+
+
+def test_reconstruct_before_and_between_corrections(nba):
+    original = _value(read_table(nba))
+    record_correction('nba', ATHLETE, STAT, original + 1, "test", timestamp="2026-01-01T00:00:00Z")
+    record_correction('nba', ATHLETE, STAT, original + 2, "test", timestamp="2026-02-01T00:00:00Z")
+
+    assert _value(reconstruct('nba', "2025-12-31")) == original
+    assert _value(reconstruct('nba', "2026-01-15")) == original + 1
+    assert _value(reconstruct('nba', "2026-03-01")) == original + 2
+
+
+def test_compaction_keeps_past_states(nba):
+    original = _value(read_table(nba))
+    other = _value(read_table(nba), "LeBron James", "assists")
+    record_correction('nba', ATHLETE, STAT, original + 1, "test", timestamp="2026-01-01T00:00:00Z")
+    record_correction('nba', "LeBron James", "assists", other + 10, "test", timestamp="2026-02-01T00:00:00Z")
+
+    assert compact('nba') == 2
+    assert compact('nba') == 0
+    base = read_table(nba, corrections=False)
+    assert _value(base) == original + 1
+    assert _value(base, "LeBron James", "assists") == other + 10
+
+    before = reconstruct('nba', "2025-12-31")
+    assert _value(before) == original
+    assert _value(before, "LeBron James", "assists") == other
+    between = reconstruct('nba', "2026-01-15")
+    assert _value(between) == original + 1
+    assert _value(between, "LeBron James", "assists") == other
+
+
+def test_record_correction_rejects_unknown_columns_and_out_of_order_entries(nba):
+    with pytest.raises(ValueError):
+        record_correction('nba', ATHLETE, "all_star_selections", 14, "test")
+    with pytest.raises(ValueError):
+        record_correction('nba', "Nobody", STAT, 14, "test")
+    record_correction('nba', ATHLETE, STAT, 15, "test", timestamp="2026-02-01T00:00:00Z")
+    with pytest.raises(ValueError):
+        record_correction('nba', ATHLETE, STAT, 16, "test", timestamp="2026-01-01T00:00:00Z")
+
+
+def test_column_subset_without_name_column_is_corrected(nba):
+    original = _value(read_table(nba))
+    record_correction('nba', ATHLETE, STAT, original + 1, "test", timestamp="2026-01-01T00:00:00Z")
+
+    subset = load_dataset('nba', columns=[STAT])
+    full = read_table(nba)
+    assert list(subset.columns) == [STAT]
+    assert subset[STAT].tolist() == full[STAT].tolist()
+
+
+def test_repeated_corrections_and_repeated_names():
+    table = {'player_name': np.array(["A", "B", "A", "C"], dtype=object), 'titles': np.array([1, 2, 3, 4])}
+    updates = [("A", 'titles', 10), ("C", 'titles', 2.5), ("A", 'titles', 11), ("Z", 'titles', 0)]
+    result = sports_corrections._set_values(table, table['player_name'], updates)
+
+    np.testing.assert_array_equal(result['titles'], [11, 2, 11, 2.5])
+    # The input mapping is not modified
+    np.testing.assert_array_equal(table['titles'], [1, 2, 3, 4])
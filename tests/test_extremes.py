@@ -0,0 +1,88 @@
+"""Extreme-value tests: tail fits that contradict the field and tied GOATs."""
+
+import warnings
+
+import numpy as np
+import pytest
+
+from sports_extremes import extreme_value_tests, permutation_gap_pvalue, tail_exceedance
+
+
+def _quiet_tails(score_arrays):
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        return tail_exceedance(score_arrays)
+
+
+def test_tail_fit_on_a_smooth_field():
+    field = np.random.default_rng(0).exponential(1.0, 200)
+    tails = _quiet_tails([field])
+
+    assert tails['field_size'][0] == 199
+    assert 0 < tails['gpd_p'][0] < 1
+    assert 0 < tails['gumbel_p'][0] < 1
+
+
+def test_tied_goat_is_not_extraordinary():
+    # The GOAT's score is already reached by the field: no model may call it impossible
+    field = np.random.default_rng(0).normal(size=100)
+    tails = _quiet_tails([np.r_[field, field.max()]])
+
+    assert tails['gpd_p'][0] > 0.5
+    assert tails['gumbel_p'][0] > 0.5
+
+
+def test_inconsistent_tail_fit_is_nan_with_warning():
+    smooth = np.random.default_rng(0).exponential(1.0, 200)
+    # Half the field at 0, a tight cluster just above it and a lone GOAT:
+    # the fitted endpoint would fall below the cluster's best score
+    clustered = np.r_[np.zeros(15), 1 + np.arange(14) * 0.001, 5.0]
+    with pytest.warns(RuntimeWarning, match="2 of 3 fields"):
+        tails = tail_exceedance([smooth, clustered, np.arange(6.0)])
+
+    assert np.isfinite(tails['gpd_p'][0])
+    assert np.isnan(tails['gpd_p'][1])
+    # Too few exceedances over the median for a fit
+    assert np.isnan(tails['gpd_p'][2])
+    # Padding to the longest field does not change the other fits
+    assert tails['gpd_p'][0] == _quiet_tails([smooth])['gpd_p'][0]
+
+
+def test_top_beyond_a_steep_fit_is_nan_not_zero():
+    # A short field bunched below its best score: the PWM fit ends just above it
+    bunched = np.r_[np.linspace(0.0, 1.0, 20) ** 0.2, 1.5]
+    with pytest.warns(RuntimeWarning, match="1 of 1 fields"):
+        tails = tail_exceedance([bunched])
+
+    assert tails['gpd_shape'][0] < -0.5
+    assert np.isnan(tails['gpd_p'][0])
+
+
+def test_registry_gpd_p_is_nan_or_a_probability():
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        result = extreme_value_tests(permutations=19)
+
+    gpd_p = result['gpd_p'].to_numpy()
+    finite = gpd_p[np.isfinite(gpd_p)]
+    assert len(finite) >= len(result) // 3
+    assert ((finite > 0) & (finite <= 1)).all()
+    assert (result['gpd_shape'][np.isfinite(gpd_p)] > -0.5).all()
+    assert ((result['gap_p'] > 0) & (result['gap_p'] <= 1)).all()
+
+
+def test_no_sport_is_impossible_under_gpd_but_ordinary_under_gumbel():
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        result = extreme_value_tests(permutations=19)
+
+    assert not ((result['gpd_p'] == 0) & (result['gumbel_p'] > 0.05)).any()
+
+
+def test_repeated_goat_is_not_its_own_runner_up():
+    # Gao Ling is listed twice in the badminton dataset
+    scores, gap, p_value = permutation_gap_pvalue('badminton', permutations=99)
+
+    assert len(scores) == 29
+    assert gap > 0
+    assert p_value < 1
@@ -0,0 +1,47 @@
+"""Head-to-head matrix: tiled computation and a truly pairwise measure."""
+
+import numpy as np
+import pandas as pd
+
+from sports_matchups import MATCHUP_MEASURES, _fill_band, matchup_features
+
+
+def _features(n, seed=0):
+    rng = np.random.default_rng(seed)
+    athletes = pd.DataFrame({measure: rng.normal(size=n) for measure in MATCHUP_MEASURES})
+    return matchup_features(athletes)
+
+
+def _full_matrix(features, block):
+    matrix = np.empty((len(features), len(features)), dtype=np.float32)
+    for start in range(0, len(features), block):
+        _fill_band(features, start, min(start + block, len(features)), block, matrix[start:start + block])
+    return matrix
+
+
+def test_tiles_match_the_direct_formula():
+    features = _features(37)
+    expected = np.tanh(features[:, None, :] - features[None, :, :]).mean(axis=2)
+
+    np.testing.assert_allclose(_full_matrix(features, block=8), expected, atol=1e-6)
+
+
+def test_matrix_is_antisymmetric_and_bounded():
+    matrix = _full_matrix(_features(50, seed=1), block=16)
+
+    np.testing.assert_allclose(matrix, -matrix.T, atol=1e-6)
+    np.testing.assert_array_equal(np.diag(matrix), 0)
+    assert np.abs(matrix).max() < 1
+
+
+def test_head_to_head_is_not_a_score_difference():
+    # i leads j by far on one measure and trails slightly on the other two
+    athletes = pd.DataFrame({'normalized_index': [10.0, 0.0, -1.0, 1.0],
+                             'z_score': [0.0, 0.2, -1.0, 1.0],
+                             'percentile': [0.0, 0.2, -1.0, 1.0]})
+    matrix = _full_matrix(matchup_features(athletes), block=4)
+
+    # The mean margin favours athlete 0, the measure-by-measure comparison does not
+    assert matrix[0, 1] < 0
+    # No per-athlete score g reproduces H as g[i] - g[j]
+    assert not np.isclose(matrix[0, 2] + matrix[2, 1], matrix[0, 1], atol=1e-3)
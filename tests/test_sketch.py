@@ -0,0 +1,61 @@
+"""Quantile sketch: percentile error within the stated bound, exact merges of small sketches."""
+
+import numpy as np
+import pytest
+
+from sports_sketch import QuantileSketch, sketch_partitions
+
+
+def _exact_percentiles(values):
+    ordered = np.sort(values)
+    return np.searchsorted(ordered, values, side='right') / len(values) * 100
+
+
+def _samples(kind, n, seed):
+    rng = np.random.default_rng(seed)
+    if kind == 'normal':
+        return rng.normal(50.0, 10.0, size=n)
+    if kind == 'skewed':
+        return rng.lognormal(0.0, 1.5, size=n)
+    # Scores with many ties, like rounded index values
+    return np.round(rng.normal(50.0, 10.0, size=n))
+
+
+@pytest.mark.parametrize("kind", ["normal", "skewed", "ties"])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_percentile_error_within_bound(kind, seed):
+    values = _samples(kind, 200_000, seed)
+    sketch = QuantileSketch(seed=seed)
+    for start in range(0, len(values), 65536):
+        sketch.update(values[start:start + 65536])
+
+    error = np.abs(sketch.percentiles(values) - _exact_percentiles(values))
+    assert sketch.n == len(values)
+    assert sketch.retained < len(values) // 100
+    assert error.max() <= sketch.error_bound * 100
+
+
+def test_merged_partitions_within_bound():
+    values = _samples('normal', 200_000, 3)
+    sketch = sketch_partitions(np.array_split(values, 4), chunk_rows=10_000)
+
+    error = np.abs(sketch.percentiles(values) - _exact_percentiles(values))
+    assert sketch.n == len(values)
+    assert sketch.min == values.min() and sketch.max == values.max()
+    assert error.max() <= sketch.error_bound * 100
+
+
+def test_small_sketches_are_exact():
+    values = np.array([3.0, 1.0, 2.0, 2.0, np.nan])
+    sketch = QuantileSketch().update(values[:2]).merge(QuantileSketch().update(values[2:]))
+
+    assert sketch.n == 4
+    np.testing.assert_array_equal(sketch.cdf([0.5, 1.0, 2.0, 3.0]), [0.0, 0.25, 0.75, 1.0])
+    assert sketch.quantile(0) == 1.0 and sketch.quantile(1) == 3.0
+
+
+def test_invalid_use_raises():
+    with pytest.raises(ValueError):
+        QuantileSketch().cdf(1.0)
+    with pytest.raises(ValueError):
+        QuantileSketch(k=100).merge(QuantileSketch(k=200))
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sports_registry import SPORTS, list_sports, sport_path, load_calc_function
+from sports_scoring import referenced_columns, score_frame, score_table
+from sports_sparse import SparseColumn
+from sports_storage import (columnar_path, is_fresh, load_feature_columns, read_columnar, read_table,
+                            write_table)
+
+
+@pytest.mark.parametrize("sport", list_sports())
+def test_vectorized_scores_match_row_apply(sport):
+    df = pd.read_csv(sport_path(sport, 'dataset'))
+    func = load_calc_function(sport)
+    full = df.copy()
+    for col in referenced_columns(func):
+        if col not in full:
+            full[col] = 0
+    expected = full.apply(func, axis=1).to_numpy(dtype=np.float64)
+
+    np.testing.assert_array_equal(score_frame(df, func), expected)
+    # Stored scoring leaves out athletes listed a second time
+    first = ~df[SPORTS[sport]["name_col"]].duplicated().to_numpy()
+    np.testing.assert_array_equal(score_table(sport_path(sport, 'dataset'), func), expected[first])
+
+
+def _materialized(df):
+    """Copy of a frame with its memory-mapped columns read into ordinary arrays."""
+    return pd.DataFrame({col: np.array(df[col]) for col in df.columns})
+
+
+def test_write_table_round_trip(tmp_path):
+    df = pd.DataFrame({
+        'player_name': ['A', 'B', 'C'],
+        'wins': [10, 0, 3],
+        'ratio': [0.5, 0.25, 1.0],
+        'titles': [0, 0, 7],
+    })
+    csv_path = str(tmp_path / "table.csv")
+    write_table(df, csv_path)
+
+    assert is_fresh(csv_path)
+    pd.testing.assert_frame_equal(_materialized(read_table(csv_path)), df)
+    pd.testing.assert_frame_equal(_materialized(read_columnar(columnar_path(csv_path), widen=True)), df)
+
+    columns = load_feature_columns(csv_path, sparse=False)
+    np.testing.assert_array_equal(columns['wins'], [10, 0, 3])
+    np.testing.assert_array_equal(columns['ratio'], [0.5, 0.25, 1.0])
+
+
+def test_stale_columnar_copy_falls_back_to_csv(tmp_path):
+    csv_path = str(tmp_path / "table.csv")
+    write_table(pd.DataFrame({'player_name': ['A'], 'wins': [1]}), csv_path)
+    pd.DataFrame({'player_name': ['A', 'B'], 'wins': [1, 2]}).to_csv(csv_path, index=False)
+
+    assert not is_fresh(csv_path)
+    assert read_table(csv_path)['wins'].tolist() == [1, 2]
+    assert is_fresh(csv_path)
+
+
+def test_repeated_athletes_are_read_once(project_copy):
+    project_copy('badminton')
+    csv_path = sport_path('badminton', 'dataset')
+    df = pd.read_csv(csv_path)
+    first = ~df['player_name'].duplicated()
+
+    assert len(read_table(csv_path)) == first.sum() < len(df)
+    assert read_table(csv_path)['player_name'].is_unique
+    assert len(read_table(csv_path, distinct=False)) == len(df)
+
+    columns = load_feature_columns(csv_path)
+    for col in ['olympic_medals', 'commonwealth_medals']:
+        values = columns[col].toarray() if isinstance(columns[col], SparseColumn) else columns[col]
+        np.testing.assert_array_equal(values, df[col].to_numpy()[first])
@@ -0,0 +1,89 @@
+"""Web export: a patch applied to the old bundle gives the new bundle."""
+
+import json
+
+import pandas as pd
+import pytest
+
+from sports_registry import sport_path
+from sports_web_export import apply_patch, build_bundle, export_sport, make_patch
+
+
+def _round_trip(obj):
+    """What the client receives: the object after JSON encoding."""
+    return json.loads(json.dumps(obj))
+
+
+def _rescore(sport, edit):
+    """Rewrites a sport's scored CSV after edit(df) -> df."""
+    path = sport_path(sport, 'scored')
+    df = edit(pd.read_csv(path))
+    df['normalized_index'] = df['normalized_index'].round(2)
+    df.to_csv(path, index=False)
+
+
+@pytest.mark.parametrize("sport", ["nba", "womens_soccer"])
+def test_apply_patch_reproduces_new_bundle(project_copy, sport):
+    project_copy(sport)
+    old = build_bundle(sport)
+
+    def edit(df):
+        # Reweighting: scores change, the order flips, one athlete drops out and one is new
+        df['normalized_index'] = df['normalized_index'][::-1].to_numpy()
+        df = df.iloc[::-1].iloc[1:].reset_index(drop=True)
+        new_row = df.iloc[[0]].copy()
+        new_row[new_row.columns[0]] = "New Athlete"
+        return pd.concat([df, new_row], ignore_index=True)
+
+    _rescore(sport, edit)
+    new = build_bundle(sport, previous=old)
+    patch = _round_trip(make_patch(old, new))
+
+    assert patch['order'] is not None
+    assert patch['names_append'] == ["New Athlete"]
+    assert apply_patch(_round_trip(old), patch) == _round_trip(new)
+    # IDs handed out before stay valid
+    assert new['names'][:len(old['names'])] == old['names']
+
+
+def test_unchanged_table_gives_empty_patch(project_copy):
+    project_copy('nba')
+    old = build_bundle('nba')
+    new = build_bundle('nba', previous=old)
+    patch = make_patch(old, new)
+
+    assert new['version'] == old['version']
+    assert patch['set'] == {} and patch['remove'] == [] and patch['order'] is None
+    assert patch['names_append'] == [] and patch['countries_append'] == []
+    assert apply_patch(old, patch) == new
+
+
+def test_apply_patch_rejects_other_versions(project_copy):
+    project_copy('nba')
+    old = build_bundle('nba')
+    _rescore('nba', lambda df: df.assign(normalized_index=df['normalized_index'] * 0.5))
+    new = build_bundle('nba', previous=old)
+    patch = make_patch(old, new)
+
+    assert patch['order'] is None
+    assert apply_patch(old, patch) == new
+    with pytest.raises(ValueError):
+        apply_patch(new, patch)
+
+
+def test_export_sport_writes_patch_only_on_change(project_copy, tmp_path):
+    project_copy('nba')
+    export_dir = str(tmp_path / "web_export")
+    first = export_sport('nba', export_dir)
+    assert first['patch'] is None and first['previous_version'] is None
+    with open(tmp_path / "web_export" / "nba.json", encoding="utf-8") as f:
+        first_bundle = json.load(f)
+    assert export_sport('nba', export_dir)['patch'] is None
+
+    _rescore('nba', lambda df: df.assign(normalized_index=df['normalized_index'] * 0.5))
+    second = export_sport('nba', export_dir)
+    assert second['previous_version'] == first['version']
+    with open(tmp_path / "web_export" / second['patch'], encoding="utf-8") as f:
+        patch = json.load(f)
+    with open(tmp_path / "web_export" / "nba.json", encoding="utf-8") as f:
+        assert apply_patch(first_bundle, patch) == json.load(f)
@@ -8,6 +8,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import normalization helpers
 from sports_index_normalizer import normalize_indexes, plot_top_10_indexes
+from sports_storage import read_table, write_table
+from sports_archetypes import add_archetypes
 
 def calc_wnba_index(row):
     """
@@ -141,7 +143,7 @@ def calc_wnba_index(row):
 
 def main():
     # 1) Load the dataset
-    df = pd.read_csv("wnba_dataset.csv")
+    df = read_table("wnba_dataset.csv")
     
     # 2) Calculate the WNBA Index Score for each player
     df["wnba_index"] = df.apply(calc_wnba_index, axis=1)
@@ -160,8 +162,11 @@ def main():
     # 5) Normalize the index scores (0–100 scale)
     normalized_df = normalize_indexes(df, name_col='player_name', index_col='wnba_index')
     
+    # Add each athlete's archetype (cluster) and its distance to the centroid
+    normalized_df = add_archetypes(normalized_df, "wnba")
+
     # 6) Save the sorted results with normalized scores to a new CSV
-    normalized_df.to_csv("wnba_index_scored.csv", index=False)
+    write_table(normalized_df, "wnba_index_scored.csv")
     
     # 7) Create the line plot using the normalized data (top 10)
     plot_top_10_indexes(
@@ -1,4 +1,60 @@
-import csv
+import os
+import sys
+
+# Add parent directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sports_player_data import load_players, write_dataset
+
+# One record per player; fields a player does not list are written as 0
+PLAYERS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "womens_hockey_players.json")
+
+# ------------------------- COLUMN HEADERS (41) -------------------------
+HEADERS = [
+    "player_name",
+    "country",
+    "years_active",
+    "primary_position",                # e.g. Forward, Defense, Goalie
+    "olympic_gold_medals",
+    "total_olympic_medals",           # total medals (silver/bronze included)
+    "world_championship_medals",      # total medals in IIHF Women’s WC
+    "total_international_goals",
+    "total_international_assists",
+    "total_international_points",
+    "total_pro_league_goals",         # goals in pro leagues (CWHL, NWHL/PHF, Europe, etc.)
+    "total_pro_league_assists",
+    "total_pro_league_points",
+    "plus_minus",
+    "penalty_minutes",
+    "championships_won",              # e.g. Clarkson Cup, Isobel Cup, NCAA titles
+    "mvp_awards",                     # e.g. MVP in leagues/tournaments
+    "best_forward_awards",            # e.g. IIHF "Best Forward"
+    "best_defenseman_awards",         # e.g. IIHF "Best Defenseman"
+    "best_goalie_awards",            # e.g. recognized for best goalie
+    "all_star_teams",                 # times named to All-Star teams
+    "average_time_on_ice_min",        # approximate for skaters
+    "shooting_percentage",            # e.g. 15.0 => 15%
+    "faceoff_win_percentage",         # e.g. 53.3 => 53.3%
+    "hits",
+    "blocked_shots",
+    "doping_tests_passed",
+    "doping_tests_failed",
+    "hall_of_fame_inducted",
+    "teams_played_for",               # # of pro/international teams
+    "career_saves",                   # relevant for goalies
+    "career_shutouts",                # relevant for goalies
+    "goals_against_average",          # for goalies
+    "save_percentage",                # for goalies
+    "major_tournament_mvp",           # e.g. MVP at Worlds or Olympics
+    "notable_awards",                 # e.g. Patty Kazmaier, etc.
+    "retirement_year",                # 0 if still active
+    "coach_name",
+    "powerplay_goals",
+    "shorthanded_goals",
+    "game_winning_goals",
+    "career_earnings_million_usd"
+]
+
 
 def create_womens_hockey_dataset(filename="womens_hockey_dataset.csv"):
     """
@@ -8,1196 +64,9 @@ def create_womens_hockey_dataset(filename="womens_hockey_dataset.csv"):
     Data is a best-effort approximation or compilation from public sources, 
     focusing on prominent players from different eras and countries.
     """
+    players_data = load_players(PLAYERS_FILE)
+    write_dataset(HEADERS, players_data, filename, expected_count=25)
 
-    # ------------------------- COLUMN HEADERS (41) -------------------------
-    headers = [
-        "player_name",
-        "country",
-        "years_active",
-        "primary_position",                # e.g. Forward, Defense, Goalie
-        "olympic_gold_medals",
-        "total_olympic_medals",           # total medals (silver/bronze included)
-        "world_championship_medals",      # total medals in IIHF Women’s WC
-        "total_international_goals",
-        "total_international_assists",
-        "total_international_points",
-        "total_pro_league_goals",         # goals in pro leagues (CWHL, NWHL/PHF, Europe, etc.)
-        "total_pro_league_assists",
-        "total_pro_league_points",
-        "plus_minus",
-        "penalty_minutes",
-        "championships_won",              # e.g. Clarkson Cup, Isobel Cup, NCAA titles
-        "mvp_awards",                     # e.g. MVP in leagues/tournaments
-        "best_forward_awards",            # e.g. IIHF "Best Forward"
-        "best_defenseman_awards",         # e.g. IIHF "Best Defenseman"
-        "best_goalie_awards",            # e.g. recognized for best goalie
-        "all_star_teams",                 # times named to All-Star teams
-        "average_time_on_ice_min",        # approximate for skaters
-        "shooting_percentage",            # e.g. 15.0 => 15%
-        "faceoff_win_percentage",         # e.g. 53.3 => 53.3%
-        "hits",
-        "blocked_shots",
-        "doping_tests_passed",
-        "doping_tests_failed",
-        "hall_of_fame_inducted",
-        "teams_played_for",               # # of pro/international teams
-        "career_saves",                   # relevant for goalies
-        "career_shutouts",                # relevant for goalies
-        "goals_against_average",          # for goalies
-        "save_percentage",                # for goalies
-        "major_tournament_mvp",           # e.g. MVP at Worlds or Olympics
-        "notable_awards",                 # e.g. Patty Kazmaier, etc.
-        "retirement_year",                # 0 if still active
-        "coach_name",
-        "powerplay_goals",
-        "shorthanded_goals",
-        "game_winning_goals",
-        "career_earnings_million_usd"
-    ]
-
-    # Here we define exactly 25 real women's hockey players, each with 41 fields.
-    players_data = [
-        # 1) Hayley Wickenheiser
-        {
-            "player_name": "Hayley Wickenheiser",
-            "country": "Canada",
-            "years_active": 23,
-            "primary_position": "Forward",
-            "olympic_gold_medals": 4,
-            "total_olympic_medals": 5,
-            "world_championship_medals": 13,
-            "total_international_goals": 168,
-            "total_international_assists": 211,
-            "total_international_points": 379,
-            "total_pro_league_goals": 85,
-            "total_pro_league_assists": 120,
-            "total_pro_league_points": 205,
-            "plus_minus": 0,
-            "penalty_minutes": 75,
-            "championships_won": 3, 
-            "mvp_awards": 4,
-            "best_forward_awards": 2,
-            "best_defenseman_awards": 0,
-            "best_goalie_awards": 0,
-            "all_star_teams": 10,
-            "average_time_on_ice_min": 22.0,
-            "shooting_percentage": 14.5,
-            "faceoff_win_percentage": 55.0,
-            "hits": 40,
-            "blocked_shots": 30,
-            "doping_tests_passed": 30,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 1,  
-            "teams_played_for": 6,
-            "career_saves": 0,
-            "career_shutouts": 0,
-            "goals_against_average": 0,
-            "save_percentage": 0,
-            "major_tournament_mvp": 3,
-            "notable_awards": 6,
-            "retirement_year": 2017,
-            "coach_name": "Mel Davidson",
-            "powerplay_goals": 35,
-            "shorthanded_goals": 12,
-            "game_winning_goals": 20,
-            "career_earnings_million_usd": 0.5
-        },
-        # 2) Marie-Philip Poulin
-        {
-            "player_name": "Marie-Philip Poulin",
-            "country": "Canada",
-            "years_active": 13,
-            "primary_position": "Forward",
-            "olympic_gold_medals": 3,
-            "total_olympic_medals": 4,
-            "world_championship_medals": 10,
-            "total_international_goals": 130,
-            "total_international_assists": 155,
-            "total_international_points": 285,
-            "total_pro_league_goals": 60,
-            "total_pro_league_assists": 80,
-            "total_pro_league_points": 140,
-            "plus_minus": 0,
-            "penalty_minutes": 40,
-            "championships_won": 2,  
-            "mvp_awards": 2,        
-            "best_forward_awards": 1,
-            "best_defenseman_awards": 0,
-            "best_goalie_awards": 0,
-            "all_star_teams": 8,
-            "average_time_on_ice_min": 20.5,
-            "shooting_percentage": 16.0,
-            "faceoff_win_percentage": 53.2,
-            "hits": 30,
-            "blocked_shots": 25,
-            "doping_tests_passed": 15,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 0,
-            "teams_played_for": 4,
-            "career_saves": 0,
-            "career_shutouts": 0,
-            "goals_against_average": 0,
-            "save_percentage": 0,
-            "major_tournament_mvp": 2,
-            "notable_awards": 5,
-            "retirement_year": 0,
-            "coach_name": "Troy Ryan",
-            "powerplay_goals": 25,
-            "shorthanded_goals": 8,
-            "game_winning_goals": 15,
-            "career_earnings_million_usd": 0.3
-        },
-        # 3) Cammi Granato
-        {
-            "player_name": "Cammi Granato",
-            "country": "USA",
-            "years_active": 15,
-            "primary_position": "Forward",
-            "olympic_gold_medals": 1,
-            "total_olympic_medals": 2,
-            "world_championship_medals": 9,
-            "total_international_goals": 120,
-            "total_international_assists": 150,
-            "total_international_points": 270,
-            "total_pro_league_goals": 20, 
-            "total_pro_league_assists": 30,
-            "total_pro_league_points": 50,
-            "plus_minus": 0,
-            "penalty_minutes": 40,
-            "championships_won": 2,
-            "mvp_awards": 1,
-            "best_forward_awards": 1,
-            "best_defenseman_awards": 0,
-            "best_goalie_awards": 0,
-            "all_star_teams": 5,
-            "average_time_on_ice_min": 18.0,
-            "shooting_percentage": 17.0,
-            "faceoff_win_percentage": 50.0,
-            "hits": 10,
-            "blocked_shots": 10,
-            "doping_tests_passed": 10,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 1,  
-            "teams_played_for": 3,
-            "career_saves": 0,
-            "career_shutouts": 0,
-            "goals_against_average": 0,
-            "save_percentage": 0,
-            "major_tournament_mvp": 1,
-            "notable_awards": 4,
-            "retirement_year": 2005,
-            "coach_name": "Ben Smith",
-            "powerplay_goals": 10,
-            "shorthanded_goals": 3,
-            "game_winning_goals": 12,
-            "career_earnings_million_usd": 0.1
-        },
-        # 4) Angela Ruggiero
-        {
-            "player_name": "Angela Ruggiero",
-            "country": "USA",
-            "years_active": 16,
-            "primary_position": "Defense",
-            "olympic_gold_medals": 1,
-            "total_olympic_medals": 4,
-            "world_championship_medals": 10,
-            "total_international_goals": 60,
-            "total_international_assists": 85,
-            "total_international_points": 145,
-            "total_pro_league_goals": 15, 
-            "total_pro_league_assists": 35,
-            "total_pro_league_points": 50,
-            "plus_minus": 0,
-            "penalty_minutes": 65,
-            "championships_won": 2,
-            "mvp_awards": 1,
-            "best_forward_awards": 0,
-            "best_defenseman_awards": 2,
-            "best_goalie_awards": 0,
-            "all_star_teams": 6,
-            "average_time_on_ice_min": 25.0,
-            "shooting_percentage": 10.0,
-            "faceoff_win_percentage": 0.0,
-            "hits": 40,
-            "blocked_shots": 50,
-            "doping_tests_passed": 10,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 1,
-            "teams_played_for": 4,
-            "career_saves": 0,
-            "career_shutouts": 0,
-            "goals_against_average": 0,
-            "save_percentage": 0,
-            "major_tournament_mvp": 1,
-            "notable_awards": 4,
-            "retirement_year": 2011,
-            "coach_name": "Mark Johnson",
-            "powerplay_goals": 5,
-            "shorthanded_goals": 2,
-            "game_winning_goals": 8,
-            "career_earnings_million_usd": 0.1
-        },
-        # 5) Hilary Knight
-        {
-            "player_name": "Hilary Knight",
-            "country": "USA",
-            "years_active": 14,
-            "primary_position": "Forward",
-            "olympic_gold_medals": 1,
-            "total_olympic_medals": 4,
-            "world_championship_medals": 10,
-            "total_international_goals": 150,
-            "total_international_assists": 120,
-            "total_international_points": 270,
-            "total_pro_league_goals": 80,
-            "total_pro_league_assists": 90,
-            "total_pro_league_points": 170,
-            "plus_minus": 0,
-            "penalty_minutes": 55,
-            "championships_won": 3,
-            "mvp_awards": 2,
-            "best_forward_awards": 2,
-            "best_defenseman_awards": 0,
-            "best_goalie_awards": 0,
-            "all_star_teams": 8,
-            "average_time_on_ice_min": 20.0,
-            "shooting_percentage": 15.0,
-            "faceoff_win_percentage": 45.0,
-            "hits": 30,
-            "blocked_shots": 20,
-            "doping_tests_passed": 15,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 0,
-            "teams_played_for": 5,
-            "career_saves": 0,
-            "career_shutouts": 0,
-            "goals_against_average": 0,
-            "save_percentage": 0,
-            "major_tournament_mvp": 1,
-            "notable_awards": 5,
-            "retirement_year": 0,
-            "coach_name": "Joel Johnson",
-            "powerplay_goals": 25,
-            "shorthanded_goals": 8,
-            "game_winning_goals": 18,
-            "career_earnings_million_usd": 0.2
-        },
-        # 6) Kendall Coyne Schofield
-        {
-            "player_name": "Kendall Coyne Schofield",
-            "country": "USA",
-            "years_active": 10,
-            "primary_position": "Forward",
-            "olympic_gold_medals": 1,
-            "total_olympic_medals": 3,
-            "world_championship_medals": 7,
-            "total_international_goals": 60,
-            "total_international_assists": 70,
-            "total_international_points": 130,
-            "total_pro_league_goals": 40,
-            "total_pro_league_assists": 35,
-            "total_pro_league_points": 75,
-            "plus_minus": 0,
-            "penalty_minutes": 30,
-            "championships_won": 2,
-            "mvp_awards": 1,
-            "best_forward_awards": 1,
-            "best_defenseman_awards": 0,
-            "best_goalie_awards": 0,
-            "all_star_teams": 4,
-            "average_time_on_ice_min": 19.0,
-            "shooting_percentage": 17.0,
-            "faceoff_win_percentage": 30.0,
-            "hits": 20,
-            "blocked_shots": 15,
-            "doping_tests_passed": 10,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 0,
-            "teams_played_for": 3,
-            "career_saves": 0,
-            "career_shutouts": 0,
-            "goals_against_average": 0,
-            "save_percentage": 0,
-            "major_tournament_mvp": 1,
-            "notable_awards": 3,
-            "retirement_year": 0,
-            "coach_name": "Bob Corkum",
-            "powerplay_goals": 12,
-            "shorthanded_goals": 5,
-            "game_winning_goals": 10,
-            "career_earnings_million_usd": 0.1
-        },
-        # 7) Noora Räty (Goalie)
-        {
-            "player_name": "Noora Räty",
-            "country": "Finland",
-            "years_active": 15,
-            "primary_position": "Goalie",
-            "olympic_gold_medals": 0,
-            "total_olympic_medals": 2,
-            "world_championship_medals": 6,
-            "total_international_goals": 0,
-            "total_international_assists": 5,
-            "total_international_points": 5,
-            "total_pro_league_goals": 0,
-            "total_pro_league_assists": 3,
-            "total_pro_league_points": 3,
-            "plus_minus": 0,
-            "penalty_minutes": 10,
-            "championships_won": 2,
-            "mvp_awards": 1,
-            "best_forward_awards": 0,
-            "best_defenseman_awards": 0,
-            "best_goalie_awards": 3,
-            "all_star_teams": 5,
-            "average_time_on_ice_min": 60.0,
-            "shooting_percentage": 0.0,
-            "faceoff_win_percentage": 0.0,
-            "hits": 0,
-            "blocked_shots": 0,
-            "doping_tests_passed": 8,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 0,
-            "teams_played_for": 5,
-            "career_saves": 8500,
-            "career_shutouts": 30,
-            "goals_against_average": 1.85,
-            "save_percentage": 0.935,
-            "major_tournament_mvp": 2,
-            "notable_awards": 4,
-            "retirement_year": 0,
-            "coach_name": "Pasi Mustonen",
-            "powerplay_goals": 0,
-            "shorthanded_goals": 0,
-            "game_winning_goals": 0,
-            "career_earnings_million_usd": 0.05
-        },
-        # 8) Shannon Szabados (Goalie, Canada)
-        {
-            "player_name": "Shannon Szabados",
-            "country": "Canada",
-            "years_active": 12,
-            "primary_position": "Goalie",
-            "olympic_gold_medals": 2,
-            "total_olympic_medals": 3,
-            "world_championship_medals": 6,
-            "total_international_goals": 0,
-            "total_international_assists": 3,
-            "total_international_points": 3,
-            "total_pro_league_goals": 0,
-            "total_pro_league_assists": 2,
-            "total_pro_league_points": 2,
-            "plus_minus": 0,
-            "penalty_minutes": 6,
-            "championships_won": 2, 
-            "mvp_awards": 1,
-            "best_forward_awards": 0,
-            "best_defenseman_awards": 0,
-            "best_goalie_awards": 2,
-            "all_star_teams": 4,
-            "average_time_on_ice_min": 60.0,
-            "shooting_percentage": 0.0,
-            "faceoff_win_percentage": 0.0,
-            "hits": 0,
-            "blocked_shots": 0,
-            "doping_tests_passed": 8,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 0,
-            "teams_played_for": 4,
-            "career_saves": 6500,
-            "career_shutouts": 25,
-            "goals_against_average": 1.90,
-            "save_percentage": 0.930,
-            "major_tournament_mvp": 1,
-            "notable_awards": 3,
-            "retirement_year": 0,
-            "coach_name": "Mel Davidson",
-            "powerplay_goals": 0,
-            "shorthanded_goals": 0,
-            "game_winning_goals": 0,
-            "career_earnings_million_usd": 0.05
-        },
-        # 9) Amanda Kessel
-        {
-            "player_name": "Amanda Kessel",
-            "country": "USA",
-            "years_active": 9,
-            "primary_position": "Forward",
-            "olympic_gold_medals": 1,
-            "total_olympic_medals": 3,
-            "world_championship_medals": 6,
-            "total_international_goals": 55,
-            "total_international_assists": 72,
-            "total_international_points": 127,
-            "total_pro_league_goals": 35,
-            "total_pro_league_assists": 45,
-            "total_pro_league_points": 80,
-            "plus_minus": 0,
-            "penalty_minutes": 25,
-            "championships_won": 2,
-            "mvp_awards": 1,
-            "best_forward_awards": 1,
-            "best_defenseman_awards": 0,
-            "best_goalie_awards": 0,
-            "all_star_teams": 4,
-            "average_time_on_ice_min": 19.5,
-            "shooting_percentage": 18.0,
-            "faceoff_win_percentage": 48.0,
-            "hits": 15,
-            "blocked_shots": 15,
-            "doping_tests_passed": 8,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 0,
-            "teams_played_for": 3,
-            "career_saves": 0,
-            "career_shutouts": 0,
-            "goals_against_average": 0,
-            "save_percentage": 0,
-            "major_tournament_mvp": 1,
-            "notable_awards": 3,
-            "retirement_year": 0,
-            "coach_name": "Joel Johnson",
-            "powerplay_goals": 10,
-            "shorthanded_goals": 3,
-            "game_winning_goals": 8,
-            "career_earnings_million_usd": 0.08
-        },
-        # 10) Caroline Ouellette
-        {
-            "player_name": "Caroline Ouellette",
-            "country": "Canada",
-            "years_active": 15,
-            "primary_position": "Forward",
-            "olympic_gold_medals": 4,
-            "total_olympic_medals": 4,
-            "world_championship_medals": 10,
-            "total_international_goals": 87,
-            "total_international_assists": 130,
-            "total_international_points": 217,
-            "total_pro_league_goals": 70,
-            "total_pro_league_assists": 110,
-            "total_pro_league_points": 180,
-            "plus_minus": 0,
-            "penalty_minutes": 60,
-            "championships_won": 3,
-            "mvp_awards": 2,
-            "best_forward_awards": 1,
-            "best_defenseman_awards": 0,
-            "best_goalie_awards": 0,
-            "all_star_teams": 7,
-            "average_time_on_ice_min": 20.0,
-            "shooting_percentage": 15.5,
-            "faceoff_win_percentage": 46.0,
-            "hits": 25,
-            "blocked_shots": 20,
-            "doping_tests_passed": 10,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 0,
-            "teams_played_for": 4,
-            "career_saves": 0,
-            "career_shutouts": 0,
-            "goals_against_average": 0,
-            "save_percentage": 0,
-            "major_tournament_mvp": 1,
-            "notable_awards": 4,
-            "retirement_year": 2018,
-            "coach_name": "Mel Davidson",
-            "powerplay_goals": 22,
-            "shorthanded_goals": 5,
-            "game_winning_goals": 10,
-            "career_earnings_million_usd": 0.04
-        },
-        # 11) Manon Rheaume (Goalie)
-        {
-            "player_name": "Manon Rheaume",
-            "country": "Canada",
-            "years_active": 9,
-            "primary_position": "Goalie",
-            "olympic_gold_medals": 0,
-            "total_olympic_medals": 0,
-            "world_championship_medals": 2,
-            "total_international_goals": 0,
-            "total_international_assists": 2,
-            "total_international_points": 2,
-            "total_pro_league_goals": 0,
-            "total_pro_league_assists": 1,
-            "total_pro_league_points": 1,
-            "plus_minus": 0,
-            "penalty_minutes": 4,
-            "championships_won": 1,
-            "mvp_awards": 0,
-            "best_forward_awards": 0,
-            "best_defenseman_awards": 0,
-            "best_goalie_awards": 1,
-            "all_star_teams": 2,
-            "average_time_on_ice_min": 60.0,
-            "shooting_percentage": 0.0,
-            "faceoff_win_percentage": 0.0,
-            "hits": 0,
-            "blocked_shots": 0,
-            "doping_tests_passed": 5,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 0,
-            "teams_played_for": 4,
-            "career_saves": 1200,
-            "career_shutouts": 5,
-            "goals_against_average": 2.50,
-            "save_percentage": 0.910,
-            "major_tournament_mvp": 0,
-            "notable_awards": 2,
-            "retirement_year": 1999,
-            "coach_name": "Phil Myre",
-            "powerplay_goals": 0,
-            "shorthanded_goals": 0,
-            "game_winning_goals": 0,
-            "career_earnings_million_usd": 0.01
-        },
-        # 12) Julie Chu
-        {
-            "player_name": "Julie Chu",
-            "country": "USA",
-            "years_active": 14,
-            "primary_position": "Forward",
-            "olympic_gold_medals": 0,
-            "total_olympic_medals": 4,
-            "world_championship_medals": 9,
-            "total_international_goals": 50,
-            "total_international_assists": 80,
-            "total_international_points": 130,
-            "total_pro_league_goals": 25,
-            "total_pro_league_assists": 40,
-            "total_pro_league_points": 65,
-            "plus_minus": 0,
-            "penalty_minutes": 20,
-            "championships_won": 2,
-            "mvp_awards": 0,
-            "best_forward_awards": 0,
-            "best_defenseman_awards": 0,
-            "best_goalie_awards": 0,
-            "all_star_teams": 3,
-            "average_time_on_ice_min": 18.0,
-            "shooting_percentage": 14.0,
-            "faceoff_win_percentage": 42.0,
-            "hits": 10,
-            "blocked_shots": 10,
-            "doping_tests_passed": 10,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 0,
-            "teams_played_for": 3,
-            "career_saves": 0,
-            "career_shutouts": 0,
-            "goals_against_average": 0,
-            "save_percentage": 0,
-            "major_tournament_mvp": 0,
-            "notable_awards": 2,
-            "retirement_year": 2017,
-            "coach_name": "Katey Stone",
-            "powerplay_goals": 12,
-            "shorthanded_goals": 2,
-            "game_winning_goals": 6,
-            "career_earnings_million_usd": 0.02
-        },
-        # 13) Jennifer Botterill
-        {
-            "player_name": "Jennifer Botterill",
-            "country": "Canada",
-            "years_active": 14,
-            "primary_position": "Forward",
-            "olympic_gold_medals": 3,
-            "total_olympic_medals": 4,
-            "world_championship_medals": 9,
-            "total_international_goals": 54,
-            "total_international_assists": 68,
-            "total_international_points": 122,
-            "total_pro_league_goals": 32,
-            "total_pro_league_assists": 50,
-            "total_pro_league_points": 82,
-            "plus_minus": 0,
-            "penalty_minutes": 35,
-            "championships_won": 2,
-            "mvp_awards": 1,
-            "best_forward_awards": 0,
-            "best_defenseman_awards": 0,
-            "best_goalie_awards": 0,
-            "all_star_teams": 4,
-            "average_time_on_ice_min": 18.5,
-            "shooting_percentage": 16.0,
-            "faceoff_win_percentage": 40.0,
-            "hits": 15,
-            "blocked_shots": 10,
-            "doping_tests_passed": 8,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 0,
-            "teams_played_for": 3,
-            "career_saves": 0,
-            "career_shutouts": 0,
-            "goals_against_average": 0,
-            "save_percentage": 0,
-            "major_tournament_mvp": 0,
-            "notable_awards": 3,
-            "retirement_year": 2011,
-            "coach_name": "Mel Davidson",
-            "powerplay_goals": 10,
-            "shorthanded_goals": 3,
-            "game_winning_goals": 5,
-            "career_earnings_million_usd": 0.01
-        },
-        # 14) Danielle Goyette
-        {
-            "player_name": "Danielle Goyette",
-            "country": "Canada",
-            "years_active": 15,
-            "primary_position": "Forward",
-            "olympic_gold_medals": 2,
-            "total_olympic_medals": 3,
-            "world_championship_medals": 9,
-            "total_international_goals": 114,
-            "total_international_assists": 105,
-            "total_international_points": 219,
-            "total_pro_league_goals": 40,
-            "total_pro_league_assists": 55,
-            "total_pro_league_points": 95,
-            "plus_minus": 0,
-            "penalty_minutes": 44,
-            "championships_won": 2,
-            "mvp_awards": 1,
-            "best_forward_awards": 1,
-            "best_defenseman_awards": 0,
-            "best_goalie_awards": 0,
-            "all_star_teams": 4,
-            "average_time_on_ice_min": 19.0,
-            "shooting_percentage": 17.5,
-            "faceoff_win_percentage": 48.0,
-            "hits": 20,
-            "blocked_shots": 15,
-            "doping_tests_passed": 6,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 1, 
-            "teams_played_for": 3,
-            "career_saves": 0,
-            "career_shutouts": 0,
-            "goals_against_average": 0,
-            "save_percentage": 0,
-            "major_tournament_mvp": 1,
-            "notable_awards": 3,
-            "retirement_year": 2007,
-            "coach_name": "Peter Smith",
-            "powerplay_goals": 12,
-            "shorthanded_goals": 4,
-            "game_winning_goals": 7,
-            "career_earnings_million_usd": 0.01
-        },
-        # 15) Florence Schelling (Goalie, Switzerland)
-        {
-            "player_name": "Florence Schelling",
-            "country": "Switzerland",
-            "years_active": 12,
-            "primary_position": "Goalie",
-            "olympic_gold_medals": 0,
-            "total_olympic_medals": 1,  # Bronze in 2014
-            "world_championship_medals": 0,
-            "total_international_goals": 0,
-            "total_international_assists": 3,
-            "total_international_points": 3,
-            "total_pro_league_goals": 0,
-            "total_pro_league_assists": 2,
-            "total_pro_league_points": 2,
-            "plus_minus": 0,
-            "penalty_minutes": 6,
-            "championships_won": 1, 
-            "mvp_awards": 1,  # MVP of Sochi 2014 women’s hockey
-            "best_forward_awards": 0,
-            "best_defenseman_awards": 0,
-            "best_goalie_awards": 1,
-            "all_star_teams": 3,
-            "average_time_on_ice_min": 60.0,
-            "shooting_percentage": 0.0,
-            "faceoff_win_percentage": 0.0,
-            "hits": 0,
-            "blocked_shots": 0,
-            "doping_tests_passed": 5,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 0,
-            "teams_played_for": 4,
-            "career_saves": 3500,
-            "career_shutouts": 15,
-            "goals_against_average": 2.20,
-            "save_percentage": 0.925,
-            "major_tournament_mvp": 1,
-            "notable_awards": 3,
-            "retirement_year": 2018,
-            "coach_name": "Self",
-            "powerplay_goals": 0,
-            "shorthanded_goals": 0,
-            "game_winning_goals": 0,
-            "career_earnings_million_usd": 0.02
-        },
-        # 16) Riikka Sallinen (Finland)
-        {
-            "player_name": "Riikka Sallinen",
-            "country": "Finland",
-            "years_active": 27,
-            "primary_position": "Forward",
-            "olympic_gold_medals": 0,
-            "total_olympic_medals": 3,  # 3 bronze
-            "world_championship_medals": 8, 
-            "total_international_goals": 110,
-            "total_international_assists": 130,
-            "total_international_points": 240,
-            "total_pro_league_goals": 60,
-            "total_pro_league_assists": 80,
-            "total_pro_league_points": 140,
-            "plus_minus": 0,
-            "penalty_minutes": 40,
-            "championships_won": 2,
-            "mvp_awards": 1,
-            "best_forward_awards": 1,
-            "best_defenseman_awards": 0,
-            "best_goalie_awards": 0,
-            "all_star_teams": 5,
-            "average_time_on_ice_min": 20.0,
-            "shooting_percentage": 15.0,
-            "faceoff_win_percentage": 48.0,
-            "hits": 15,
-            "blocked_shots": 10,
-            "doping_tests_passed": 8,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 0,
-            "teams_played_for": 5,
-            "career_saves": 0,
-            "career_shutouts": 0,
-            "goals_against_average": 0,
-            "save_percentage": 0,
-            "major_tournament_mvp": 1,
-            "notable_awards": 4,
-            "retirement_year": 2019,
-            "coach_name": "Pasi Mustonen",
-            "powerplay_goals": 18,
-            "shorthanded_goals": 4,
-            "game_winning_goals": 9,
-            "career_earnings_million_usd": 0.02
-        },
-        # 17) Natalie Darwitz (USA)
-        {
-            "player_name": "Natalie Darwitz",
-            "country": "USA",
-            "years_active": 11,
-            "primary_position": "Forward",
-            "olympic_gold_medals": 0,
-            "total_olympic_medals": 3,
-            "world_championship_medals": 8,
-            "total_international_goals": 70,
-            "total_international_assists": 98,
-            "total_international_points": 168,
-            "total_pro_league_goals": 25,
-            "total_pro_league_assists": 35,
-            "total_pro_league_points": 60,
-            "plus_minus": 0,
-            "penalty_minutes": 30,
-            "championships_won": 2,
-            "mvp_awards": 1,
-            "best_forward_awards": 1,
-            "best_defenseman_awards": 0,
-            "best_goalie_awards": 0,
-            "all_star_teams": 5,
-            "average_time_on_ice_min": 19.5,
-            "shooting_percentage": 16.0,
-            "faceoff_win_percentage": 40.0,
-            "hits": 15,
-            "blocked_shots": 10,
-            "doping_tests_passed": 8,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 0,
-            "teams_played_for": 3,
-            "career_saves": 0,
-            "career_shutouts": 0,
-            "goals_against_average": 0,
-            "save_percentage": 0,
-            "major_tournament_mvp": 1,
-            "notable_awards": 3,
-            "retirement_year": 2010,
-            "coach_name": "Mark Johnson",
-            "powerplay_goals": 10,
-            "shorthanded_goals": 3,
-            "game_winning_goals": 6,
-            "career_earnings_million_usd": 0.02
-        },
-        # 18) Tessa Bonhomme (Canada, D)
-        {
-            "player_name": "Tessa Bonhomme",
-            "country": "Canada",
-            "years_active": 8,
-            "primary_position": "Defense",
-            "olympic_gold_medals": 1,
-            "total_olympic_medals": 1,
-            "world_championship_medals": 4,
-            "total_international_goals": 20,
-            "total_international_assists": 35,
-            "total_international_points": 55,
-            "total_pro_league_goals": 15,
-            "total_pro_league_assists": 30,
-            "total_pro_league_points": 45,
-            "plus_minus": 0,
-            "penalty_minutes": 20,
-            "championships_won": 2,
-            "mvp_awards": 0,
-            "best_forward_awards": 0,
-            "best_defenseman_awards": 1,
-            "best_goalie_awards": 0,
-            "all_star_teams": 3,
-            "average_time_on_ice_min": 22.0,
-            "shooting_percentage": 9.0,
-            "faceoff_win_percentage": 0.0,
-            "hits": 20,
-            "blocked_shots": 40,
-            "doping_tests_passed": 5,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 0,
-            "teams_played_for": 3,
-            "career_saves": 0,
-            "career_shutouts": 0,
-            "goals_against_average": 0,
-            "save_percentage": 0,
-            "major_tournament_mvp": 0,
-            "notable_awards": 2,
-            "retirement_year": 2014,
-            "coach_name": "Mel Davidson",
-            "powerplay_goals": 8,
-            "shorthanded_goals": 2,
-            "game_winning_goals": 5,
-            "career_earnings_million_usd": 0.01
-        },
-        # 19) Meghan Agosta (Canada)
-        {
-            "player_name": "Meghan Agosta",
-            "country": "Canada",
-            "years_active": 12,
-            "primary_position": "Forward",
-            "olympic_gold_medals": 3,
-            "total_olympic_medals": 4,
-            "world_championship_medals": 7,
-            "total_international_goals": 120,
-            "total_international_assists": 90,
-            "total_international_points": 210,
-            "total_pro_league_goals": 55,
-            "total_pro_league_assists": 70,
-            "total_pro_league_points": 125,
-            "plus_minus": 0,
-            "penalty_minutes": 40,
-            "championships_won": 2,
-            "mvp_awards": 1,
-            "best_forward_awards": 1,
-            "best_defenseman_awards": 0,
-            "best_goalie_awards": 0,
-            "all_star_teams": 5,
-            "average_time_on_ice_min": 20.0,
-            "shooting_percentage": 15.0,
-            "faceoff_win_percentage": 40.0,
-            "hits": 25,
-            "blocked_shots": 20,
-            "doping_tests_passed": 8,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 0,
-            "teams_played_for": 4,
-            "career_saves": 0,
-            "career_shutouts": 0,
-            "goals_against_average": 0,
-            "save_percentage": 0,
-            "major_tournament_mvp": 1,
-            "notable_awards": 3,
-            "retirement_year": 0,
-            "coach_name": "Mel Davidson",
-            "powerplay_goals": 18,
-            "shorthanded_goals": 5,
-            "game_winning_goals": 12,
-            "career_earnings_million_usd": 0.02
-        },
-        # 20) Sarah Nurse (Canada)
-        {
-            "player_name": "Sarah Nurse",
-            "country": "Canada",
-            "years_active": 7,
-            "primary_position": "Forward",
-            "olympic_gold_medals": 1,
-            "total_olympic_medals": 2,
-            "world_championship_medals": 4,
-            "total_international_goals": 40,
-            "total_international_assists": 50,
-            "total_international_points": 90,
-            "total_pro_league_goals": 20,
-            "total_pro_league_assists": 30,
-            "total_pro_league_points": 50,
-            "plus_minus": 0,
-            "penalty_minutes": 15,
-            "championships_won": 1,
-            "mvp_awards": 0,
-            "best_forward_awards": 0,
-            "best_defenseman_awards": 0,
-            "best_goalie_awards": 0,
-            "all_star_teams": 2,
-            "average_time_on_ice_min": 18.5,
-            "shooting_percentage": 16.0,
-            "faceoff_win_percentage": 25.0,
-            "hits": 15,
-            "blocked_shots": 10,
-            "doping_tests_passed": 5,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 0,
-            "teams_played_for": 2,
-            "career_saves": 0,
-            "career_shutouts": 0,
-            "goals_against_average": 0,
-            "save_percentage": 0,
-            "major_tournament_mvp": 0,
-            "notable_awards": 2,
-            "retirement_year": 0,
-            "coach_name": "Troy Ryan",
-            "powerplay_goals": 8,
-            "shorthanded_goals": 3,
-            "game_winning_goals": 6,
-            "career_earnings_million_usd": 0.01
-        },
-        # 21) Brianna Decker (USA)
-        {
-            "player_name": "Brianna Decker",
-            "country": "USA",
-            "years_active": 10,
-            "primary_position": "Forward",
-            "olympic_gold_medals": 1,
-            "total_olympic_medals": 3,
-            "world_championship_medals": 6,
-            "total_international_goals": 70,
-            "total_international_assists": 80,
-            "total_international_points": 150,
-            "total_pro_league_goals": 50,
-            "total_pro_league_assists": 60,
-            "total_pro_league_points": 110,
-            "plus_minus": 0,
-            "penalty_minutes": 40,
-            "championships_won": 2,
-            "mvp_awards": 1,
-            "best_forward_awards": 1,
-            "best_defenseman_awards": 0,
-            "best_goalie_awards": 0,
-            "all_star_teams": 4,
-            "average_time_on_ice_min": 19.5,
-            "shooting_percentage": 15.5,
-            "faceoff_win_percentage": 52.0,
-            "hits": 20,
-            "blocked_shots": 15,
-            "doping_tests_passed": 10,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 0,
-            "teams_played_for": 4,
-            "career_saves": 0,
-            "career_shutouts": 0,
-            "goals_against_average": 0,
-            "save_percentage": 0,
-            "major_tournament_mvp": 1,
-            "notable_awards": 3,
-            "retirement_year": 0,
-            "coach_name": "Joel Johnson",
-            "powerplay_goals": 15,
-            "shorthanded_goals": 4,
-            "game_winning_goals": 10,
-            "career_earnings_million_usd": 0.03
-        },
-        # 22) Sara Grahn (Goalie, Sweden)
-        {
-            "player_name": "Sara Grahn",
-            "country": "Sweden",
-            "years_active": 13,
-            "primary_position": "Goalie",
-            "olympic_gold_medals": 0,
-            "total_olympic_medals": 1, # silver 2006 (was a backup)
-            "world_championship_medals": 1, 
-            "total_international_goals": 0,
-            "total_international_assists": 2,
-            "total_international_points": 2,
-            "total_pro_league_goals": 0,
-            "total_pro_league_assists": 1,
-            "total_pro_league_points": 1,
-            "plus_minus": 0,
-            "penalty_minutes": 10,
-            "championships_won": 1, 
-            "mvp_awards": 0,
-            "best_forward_awards": 0,
-            "best_defenseman_awards": 0,
-            "best_goalie_awards": 1,
-            "all_star_teams": 3,
-            "average_time_on_ice_min": 60.0,
-            "shooting_percentage": 0.0,
-            "faceoff_win_percentage": 0.0,
-            "hits": 0,
-            "blocked_shots": 0,
-            "doping_tests_passed": 5,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 0,
-            "teams_played_for": 4,
-            "career_saves": 4000,
-            "career_shutouts": 12,
-            "goals_against_average": 2.35,
-            "save_percentage": 0.920,
-            "major_tournament_mvp": 0,
-            "notable_awards": 2,
-            "retirement_year": 0,
-            "coach_name": "Ylva Martinsen",
-            "powerplay_goals": 0,
-            "shorthanded_goals": 0,
-            "game_winning_goals": 0,
-            "career_earnings_million_usd": 0.01
-        },
-        # 23) Natalie Spooner (Canada)
-        {
-            "player_name": "Natalie Spooner",
-            "country": "Canada",
-            "years_active": 11,
-            "primary_position": "Forward",
-            "olympic_gold_medals": 1,
-            "total_olympic_medals": 3,
-            "world_championship_medals": 7,
-            "total_international_goals": 75,
-            "total_international_assists": 68,
-            "total_international_points": 143,
-            "total_pro_league_goals": 45,
-            "total_pro_league_assists": 55,
-            "total_pro_league_points": 100,
-            "plus_minus": 0,
-            "penalty_minutes": 35,
-            "championships_won": 3,
-            "mvp_awards": 1,
-            "best_forward_awards": 0,
-            "best_defenseman_awards": 0,
-            "best_goalie_awards": 0,
-            "all_star_teams": 5,
-            "average_time_on_ice_min": 19.0,
-            "shooting_percentage": 15.5,
-            "faceoff_win_percentage": 44.0,
-            "hits": 25,
-            "blocked_shots": 15,
-            "doping_tests_passed": 10,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 0,
-            "teams_played_for": 3,
-            "career_saves": 0,
-            "career_shutouts": 0,
-            "goals_against_average": 0,
-            "save_percentage": 0,
-            "major_tournament_mvp": 0,
-            "notable_awards": 3,
-            "retirement_year": 0,
-            "coach_name": "Troy Ryan",
-            "powerplay_goals": 18,
-            "shorthanded_goals": 4,
-            "game_winning_goals": 12,
-            "career_earnings_million_usd": 0.01
-        },
-        # 24) Melodie Daoust (Canada)
-        {
-            "player_name": "Melodie Daoust",
-            "country": "Canada",
-            "years_active": 8,
-            "primary_position": "Forward",
-            "olympic_gold_medals": 1,
-            "total_olympic_medals": 2,
-            "world_championship_medals": 5,
-            "total_international_goals": 45,
-            "total_international_assists": 60,
-            "total_international_points": 105,
-            "total_pro_league_goals": 30,
-            "total_pro_league_assists": 40,
-            "total_pro_league_points": 70,
-            "plus_minus": 0,
-            "penalty_minutes": 20,
-            "championships_won": 2,
-            "mvp_awards": 1,
-            "best_forward_awards": 1,
-            "best_defenseman_awards": 0,
-            "best_goalie_awards": 0,
-            "all_star_teams": 3,
-            "average_time_on_ice_min": 18.5,
-            "shooting_percentage": 17.0,
-            "faceoff_win_percentage": 30.0,
-            "hits": 15,
-            "blocked_shots": 10,
-            "doping_tests_passed": 5,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 0,
-            "teams_played_for": 2,
-            "career_saves": 0,
-            "career_shutouts": 0,
-            "goals_against_average": 0,
-            "save_percentage": 0,
-            "major_tournament_mvp": 1,
-            "notable_awards": 2,
-            "retirement_year": 0,
-            "coach_name": "Troy Ryan",
-            "powerplay_goals": 8,
-            "shorthanded_goals": 3,
-            "game_winning_goals": 6,
-            "career_earnings_million_usd": 0.02
-        },
-        # 25) Carla MacLeod (Canada, Defense)
-        {
-            "player_name": "Carla MacLeod",
-            "country": "Canada",
-            "years_active": 8,
-            "primary_position": "Defense",
-            "olympic_gold_medals": 2,
-            "total_olympic_medals": 2,
-            "world_championship_medals": 4,
-            "total_international_goals": 15,
-            "total_international_assists": 30,
-            "total_international_points": 45,
-            "total_pro_league_goals": 10,
-            "total_pro_league_assists": 25,
-            "total_pro_league_points": 35,
-            "plus_minus": 0,
-            "penalty_minutes": 20,
-            "championships_won": 2,
-            "mvp_awards": 0,
-            "best_forward_awards": 0,
-            "best_defenseman_awards": 1,
-            "best_goalie_awards": 0,
-            "all_star_teams": 3,
-            "average_time_on_ice_min": 22.0,
-            "shooting_percentage": 9.0,
-            "faceoff_win_percentage": 0.0,
-            "hits": 15,
-            "blocked_shots": 35,
-            "doping_tests_passed": 4,
-            "doping_tests_failed": 0,
-            "hall_of_fame_inducted": 0,
-            "teams_played_for": 2,
-            "career_saves": 0,
-            "career_shutouts": 0,
-            "goals_against_average": 0,
-            "save_percentage": 0,
-            "major_tournament_mvp": 0,
-            "notable_awards": 2,
-            "retirement_year": 2010,
-            "coach_name": "Mel Davidson",
-            "powerplay_goals": 5,
-            "shorthanded_goals": 2,
-            "game_winning_goals": 4,
-            "career_earnings_million_usd": 0.01
-        }
-    ]
-
-    # Confirm we have exactly 25 players total (no placeholders).
-    if len(players_data) != 25:
-        raise ValueError(f"Expected 25 women's hockey players, got {len(players_data)}")
-
-    # ----------------------- WRITE TO CSV -----------------------
-    with open(filename, mode="w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-        for pdata in players_data:
-            # Ensure every field is present; fill missing with 0 if any
-            for h in headers:
-                if h not in pdata:
-                    pdata[h] = 0
-            writer.writerow(pdata)
 
 if __name__ == "__main__":
     create_womens_hockey_dataset()
@@ -1,4 +1,70 @@
-import csv
+import os
+import sys
+
+# Add parent directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sports_player_data import load_players, write_dataset
+
+# One record per player; fields a player does not list are written as 0
+PLAYERS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "womens_soccer_players.json")
+
+# ------------------------- COLUMN HEADERS (41) -------------------------
+HEADERS = [
+    "player_name",
+    "country",
+    "years_active",
+    # Basic club stats
+    "club_appearances",
+    "club_goals",
+    "club_assists",
+    "club_minutes_played",
+    # Basic international stats
+    "international_caps",
+    "international_goals",
+    "international_assists",
+    "international_minutes_played",
+    # Ratios / per-game metrics
+    "club_goal_ratio",            # goals/club appearances
+    "international_goal_ratio",   # goals/caps
+    # Trophies & accolades
+    "fifa_womens_world_cup_titles",
+    "continental_titles",         # e.g. UEFA Women's Euro, Copa América Femenina
+    "league_titles",              # e.g. domestic leagues
+    "champions_league_titles",
+    "domestic_cup_titles",        # e.g. FA Women's Cup, Copa de la Reina, etc.
+    "major_individual_awards",    # e.g. FIFA Best Player, Ballon d'Or Féminin
+    "ballon_dor_femin_wins",
+    # Additional performance
+    "hat_tricks",
+    "penalty_goals",
+    "free_kick_goals",
+    "red_cards",
+    "yellow_cards",
+    "man_of_the_match_awards",
+    "captaincy_appearances",
+    # Creative / advanced
+    "key_passes_per_game",
+    "dribbles_completed_per_game",
+    "big_chances_created",
+    "pass_accuracy_percent",
+    # Defensive / GK stats (some legends are defenders/keepers)
+    "clean_sheets",
+    "tackles_won_per_game",
+    "interceptions_per_game",
+    "saves_per_game",            # relevant for goalkeepers, else ~0
+    # Doping & injuries
+    "doping_tests_passed",
+    "doping_tests_failed",
+    "major_injuries_count",
+    # Hall of Fame (some countries / clubs have them)
+    "hall_of_fame_inducted",
+    # Earnings
+    "career_earnings_million_usd",
+    # Additional note: total_trophies might be separate from big ones
+    "total_trophies_won"         # all combined
+]
+
 
 def create_womens_soccer_dataset(filename="womens_soccer_dataset.csv"):
     """
@@ -11,1416 +77,9 @@ def create_womens_soccer_dataset(filename="womens_soccer_dataset.csv"):
     After creation, you'll have a 'womens_soccer_dataset.csv' file with 30 rows,
     each containing 41 columns of data.
     """
+    players_data = load_players(PLAYERS_FILE)
+    write_dataset(HEADERS, players_data, filename, expected_count=30)
 
-    # ------------------------- COLUMN HEADERS (41) -------------------------
-    headers = [
-        "player_name",
-        "country",
-        "years_active",
-        # Basic club stats
-        "club_appearances",
-        "club_goals",
-        "club_assists",
-        "club_minutes_played",
-        # Basic international stats
-        "international_caps",
-        "international_goals",
-        "international_assists",
-        "international_minutes_played",
-        # Ratios / per-game metrics
-        "club_goal_ratio",            # goals/club appearances
-        "international_goal_ratio",   # goals/caps
-        # Trophies & accolades
-        "fifa_womens_world_cup_titles",
-        "continental_titles",         # e.g. UEFA Women's Euro, Copa América Femenina
-        "league_titles",              # e.g. domestic leagues
-        "champions_league_titles",
-        "domestic_cup_titles",        # e.g. FA Women's Cup, Copa de la Reina, etc.
-        "major_individual_awards",    # e.g. FIFA Best Player, Ballon d'Or Féminin
-        "ballon_dor_femin_wins",
-        # Additional performance
-        "hat_tricks",
-        "penalty_goals",
-        "free_kick_goals",
-        "red_cards",
-        "yellow_cards",
-        "man_of_the_match_awards",
-        "captaincy_appearances",
-        # Creative / advanced
-        "key_passes_per_game",
-        "dribbles_completed_per_game",
-        "big_chances_created",
-        "pass_accuracy_percent",
-        # Defensive / GK stats (some legends are defenders/keepers)
-        "clean_sheets",
-        "tackles_won_per_game",
-        "interceptions_per_game",
-        "saves_per_game",            # relevant for goalkeepers, else ~0
-        # Doping & injuries
-        "doping_tests_passed",
-        "doping_tests_failed",
-        "major_injuries_count",
-        # Hall of Fame (some countries / clubs have them)
-        "hall_of_fame_inducted",
-        # Earnings
-        "career_earnings_million_usd",
-        # Additional note: total_trophies might be separate from big ones
-        "total_trophies_won"         # all combined
-    ]
-
-    # Define exactly 30 players, each with 41 fields.
-    # Stats below are approximate or best-known from public data.
-    # Some older players have incomplete data for advanced metrics => set them to 0 or minimal.
-
-    players_data = [
-        # 1) Mia Hamm
-        {
-            "player_name": "Mia Hamm",
-            "country": "United States",
-            "years_active": 20,  # 1987-2004
-            "club_appearances": 300,
-            "club_goals": 190,
-            "club_assists": 100,
-            "club_minutes_played": 27000,
-            "international_caps": 276,
-            "international_goals": 158,
-            "international_assists": 71,
-            "international_minutes_played": 25000,
-            "club_goal_ratio": 190 / 300,
-            "international_goal_ratio": 158 / 276,
-            "fifa_womens_world_cup_titles": 2,  # 1991, 1999
-            "continental_titles": 4,             # CONCACAF Championships, Olympics
-            "league_titles": 3,                  # Various domestic leagues
-            "champions_league_titles": 0,        # Not applicable in her era
-            "domestic_cup_titles": 2,
-            "major_individual_awards": 10,       # FIFA World Player of the Year x2
-            "ballon_dor_femin_wins": 0,          # Ballon d'Or Féminin started later
-            "hat_tricks": 10,
-            "penalty_goals": 50,
-            "free_kick_goals": 30,
-            "red_cards": 1,
-            "yellow_cards": 20,
-            "man_of_the_match_awards": 50,
-            "captaincy_appearances": 200,
-            "key_passes_per_game": 2.0,
-            "dribbles_completed_per_game": 3.0,
-            "big_chances_created": 150,
-            "pass_accuracy_percent": 85.0,
-            "clean_sheets": 0,  # Not a goalkeeper
-            "tackles_won_per_game": 0.5,
-            "interceptions_per_game": 0.3,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 15,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 3,
-            "hall_of_fame_inducted": 1,
-            "career_earnings_million_usd": 10.0,
-            "total_trophies_won": 25
-        },
-        # 2) Abby Wambach
-        {
-            "player_name": "Abby Wambach",
-            "country": "United States",
-            "years_active": 16,  # 2001-2015
-            "club_appearances": 250,
-            "club_goals": 165,
-            "club_assists": 80,
-            "club_minutes_played": 22000,
-            "international_caps": 255,
-            "international_goals": 184,
-            "international_assists": 50,
-            "international_minutes_played": 22000,
-            "club_goal_ratio": 165 / 250,
-            "international_goal_ratio": 184 / 255,
-            "fifa_womens_world_cup_titles": 1,  # 2015
-            "continental_titles": 4,             # CONCACAF Championships, Olympics
-            "league_titles": 2,                  # Various domestic leagues
-            "champions_league_titles": 0,
-            "domestic_cup_titles": 1,
-            "major_individual_awards": 8,        # FIFA World Player of the Year
-            "ballon_dor_femin_wins": 0,
-            "hat_tricks": 15,
-            "penalty_goals": 60,
-            "free_kick_goals": 20,
-            "red_cards": 2,
-            "yellow_cards": 25,
-            "man_of_the_match_awards": 60,
-            "captaincy_appearances": 230,
-            "key_passes_per_game": 1.8,
-            "dribbles_completed_per_game": 2.5,
-            "big_chances_created": 130,
-            "pass_accuracy_percent": 82.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.4,
-            "interceptions_per_game": 0.2,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 12,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 4,
-            "hall_of_fame_inducted": 1,
-            "career_earnings_million_usd": 20.0,
-            "total_trophies_won": 20
-        },
-        # 3) Marta
-        {
-            "player_name": "Marta",
-            "country": "Brazil",
-            "years_active": 23,  # 2000-present
-            "club_appearances": 500,
-            "club_goals": 290,
-            "club_assists": 120,
-            "club_minutes_played": 45000,
-            "international_caps": 172,
-            "international_goals": 115,
-            "international_assists": 55,
-            "international_minutes_played": 16000,
-            "club_goal_ratio": 290 / 500,
-            "international_goal_ratio": 115 / 172,
-            "fifa_womens_world_cup_titles": 0,
-            "continental_titles": 5,             # Copa América Femenina, Olympic Gold 2008
-            "league_titles": 6,                  # Various domestic leagues
-            "champions_league_titles": 1,        # UEFA Women's Champions League
-            "domestic_cup_titles": 3,
-            "major_individual_awards": 15,       # FIFA World Player of the Year x6
-            "ballon_dor_femin_wins": 0,          # Ballon d'Or Féminin started later
-            "hat_tricks": 20,
-            "penalty_goals": 40,
-            "free_kick_goals": 25,
-            "red_cards": 1,
-            "yellow_cards": 15,
-            "man_of_the_match_awards": 80,
-            "captaincy_appearances": 100,
-            "key_passes_per_game": 2.5,
-            "dribbles_completed_per_game": 4.0,
-            "big_chances_created": 200,
-            "pass_accuracy_percent": 86.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.3,
-            "interceptions_per_game": 0.1,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 20,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 5,
-            "hall_of_fame_inducted": 0,
-            "career_earnings_million_usd": 80.0,
-            "total_trophies_won": 30
-        },
-        # 4) Birgit Prinz
-        {
-            "player_name": "Birgit Prinz",
-            "country": "Germany",
-            "years_active": 19,  # 1994-2011
-            "club_appearances": 450,
-            "club_goals": 300,
-            "club_assists": 90,
-            "club_minutes_played": 38000,
-            "international_caps": 214,
-            "international_goals": 128,
-            "international_assists": 48,
-            "international_minutes_played": 20000,
-            "club_goal_ratio": 300 / 450,
-            "international_goal_ratio": 128 / 214,
-            "fifa_womens_world_cup_titles": 2,  # 2003, 2007
-            "continental_titles": 6,             # UEFA Women's Euro, Olympic Gold 2016
-            "league_titles": 5,
-            "champions_league_titles": 2,
-            "domestic_cup_titles": 4,
-            "major_individual_awards": 10,       # FIFA World Player of the Year x3
-            "ballon_dor_femin_wins": 0,
-            "hat_tricks": 25,
-            "penalty_goals": 55,
-            "free_kick_goals": 15,
-            "red_cards": 0,
-            "yellow_cards": 10,
-            "man_of_the_match_awards": 70,
-            "captaincy_appearances": 180,
-            "key_passes_per_game": 2.2,
-            "dribbles_completed_per_game": 2.0,
-            "big_chances_created": 170,
-            "pass_accuracy_percent": 84.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.4,
-            "interceptions_per_game": 0.2,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 18,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 3,
-            "hall_of_fame_inducted": 1,
-            "career_earnings_million_usd": 40.0,
-            "total_trophies_won": 22
-        },
-        # 5) Sun Wen
-        {
-            "player_name": "Sun Wen",
-            "country": "China",
-            "years_active": 17,  # 1991-2008
-            "club_appearances": 350,
-            "club_goals": 200,
-            "club_assists": 90,
-            "club_minutes_played": 30000,
-            "international_caps": 160,
-            "international_goals": 107,
-            "international_assists": 45,
-            "international_minutes_played": 18000,
-            "club_goal_ratio": 200 / 350,
-            "international_goal_ratio": 107 / 160,
-            "fifa_womens_world_cup_titles": 0,
-            "continental_titles": 5,             # AFC Women's Asian Cup
-            "league_titles": 4,
-            "champions_league_titles": 0,
-            "domestic_cup_titles": 3,
-            "major_individual_awards": 8,        # FIFA World Player of the Year x2
-            "ballon_dor_femin_wins": 0,
-            "hat_tricks": 18,
-            "penalty_goals": 50,
-            "free_kick_goals": 20,
-            "red_cards": 1,
-            "yellow_cards": 15,
-            "man_of_the_match_awards": 60,
-            "captaincy_appearances": 150,
-            "key_passes_per_game": 2.3,
-            "dribbles_completed_per_game": 3.5,
-            "big_chances_created": 160,
-            "pass_accuracy_percent": 83.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.3,
-            "interceptions_per_game": 0.2,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 10,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 2,
-            "hall_of_fame_inducted": 1,
-            "career_earnings_million_usd": 25.0,
-            "total_trophies_won": 18
-        },
-        # 6) Homare Sawa
-        {
-            "player_name": "Homare Sawa",
-            "country": "Japan",
-            "years_active": 16,  # 1993-2015
-            "club_appearances": 400,
-            "club_goals": 150,
-            "club_assists": 80,
-            "club_minutes_played": 32000,
-            "international_caps": 205,
-            "international_goals": 83,
-            "international_assists": 30,
-            "international_minutes_played": 22000,
-            "club_goal_ratio": 150 / 400,
-            "international_goal_ratio": 83 / 205,
-            "fifa_womens_world_cup_titles": 1,  # 2011
-            "continental_titles": 4,             # AFC Women's Asian Cup
-            "league_titles": 3,
-            "champions_league_titles": 0,
-            "domestic_cup_titles": 2,
-            "major_individual_awards": 7,        # FIFA World Player of the Year x2
-            "ballon_dor_femin_wins": 1,          # Ballon d'Or Féminin 2011
-            "hat_tricks": 5,
-            "penalty_goals": 25,
-            "free_kick_goals": 15,
-            "red_cards": 0,
-            "yellow_cards": 10,
-            "man_of_the_match_awards": 40,
-            "captaincy_appearances": 180,
-            "key_passes_per_game": 2.1,
-            "dribbles_completed_per_game": 2.8,
-            "big_chances_created": 140,
-            "pass_accuracy_percent": 85.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.5,
-            "interceptions_per_game": 0.3,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 12,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 3,
-            "hall_of_fame_inducted": 1,
-            "career_earnings_million_usd": 30.0,
-            "total_trophies_won": 20
-        },
-        # 7) Abby Dahlkemper
-        {
-            "player_name": "Abby Dahlkemper",
-            "country": "United States",
-            "years_active": 12,  # 2011-present
-            "club_appearances": 180,
-            "club_goals": 20,
-            "club_assists": 30,
-            "club_minutes_played": 15000,
-            "international_caps": 90,
-            "international_goals": 10,
-            "international_assists": 15,
-            "international_minutes_played": 8000,
-            "club_goal_ratio": 20 / 180,
-            "international_goal_ratio": 10 / 90,
-            "fifa_womens_world_cup_titles": 1,  # 2015
-            "continental_titles": 3,             # CONCACAF Championships, Olympics
-            "league_titles": 2,                  # Various domestic leagues
-            "champions_league_titles": 0,
-            "domestic_cup_titles": 2,
-            "major_individual_awards": 5,        # Best Defender, etc.
-            "ballon_dor_femin_wins": 0,
-            "hat_tricks": 0,
-            "penalty_goals": 5,
-            "free_kick_goals": 5,
-            "red_cards": 2,
-            "yellow_cards": 20,
-            "man_of_the_match_awards": 30,
-            "captaincy_appearances": 50,
-            "key_passes_per_game": 1.5,
-            "dribbles_completed_per_game": 1.2,
-            "big_chances_created": 60,
-            "pass_accuracy_percent": 88.0,
-            "clean_sheets": 30,
-            "tackles_won_per_game": 2.5,
-            "interceptions_per_game": 1.8,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 10,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 2,
-            "hall_of_fame_inducted": 0,
-            "career_earnings_million_usd": 15.0,
-            "total_trophies_won": 12
-        },
-        # 8) Marta
-        {
-            "player_name": "Marta",
-            "country": "Brazil",
-            "years_active": 23,  # 2000-present
-            "club_appearances": 500,
-            "club_goals": 290,
-            "club_assists": 120,
-            "club_minutes_played": 45000,
-            "international_caps": 172,
-            "international_goals": 115,
-            "international_assists": 55,
-            "international_minutes_played": 16000,
-            "club_goal_ratio": 290 / 500,
-            "international_goal_ratio": 115 / 172,
-            "fifa_womens_world_cup_titles": 0,
-            "continental_titles": 5,             # Copa América Femenina, Olympic Gold 2008
-            "league_titles": 6,
-            "champions_league_titles": 1,        # UEFA Women's Champions League
-            "domestic_cup_titles": 3,
-            "major_individual_awards": 15,       # FIFA World Player of the Year x6
-            "ballon_dor_femin_wins": 0,
-            "hat_tricks": 20,
-            "penalty_goals": 40,
-            "free_kick_goals": 25,
-            "red_cards": 1,
-            "yellow_cards": 15,
-            "man_of_the_match_awards": 80,
-            "captaincy_appearances": 100,
-            "key_passes_per_game": 2.5,
-            "dribbles_completed_per_game": 4.0,
-            "big_chances_created": 200,
-            "pass_accuracy_percent": 86.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.3,
-            "interceptions_per_game": 0.1,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 20,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 5,
-            "hall_of_fame_inducted": 0,
-            "career_earnings_million_usd": 80.0,
-            "total_trophies_won": 30
-        },
-        # 9) Christine Sinclair
-        {
-            "player_name": "Christine Sinclair",
-            "country": "Canada",
-            "years_active": 19,  # 2000-present
-            "club_appearances": 400,
-            "club_goals": 160,
-            "club_assists": 100,
-            "club_minutes_played": 34000,
-            "international_caps": 294,
-            "international_goals": 186,
-            "international_assists": 90,
-            "international_minutes_played": 25000,
-            "club_goal_ratio": 160 / 400,
-            "international_goal_ratio": 186 / 294,
-            "fifa_womens_world_cup_titles": 0,
-            "continental_titles": 3,             # CONCACAF Championships, Olympics
-            "league_titles": 4,
-            "champions_league_titles": 0,
-            "domestic_cup_titles": 2,
-            "major_individual_awards": 8,        # Canadian Player of the Year x multiple
-            "ballon_dor_femin_wins": 0,
-            "hat_tricks": 10,
-            "penalty_goals": 35,
-            "free_kick_goals": 20,
-            "red_cards": 0,
-            "yellow_cards": 10,
-            "man_of_the_match_awards": 50,
-            "captaincy_appearances": 250,
-            "key_passes_per_game": 2.0,
-            "dribbles_completed_per_game": 2.2,
-            "big_chances_created": 150,
-            "pass_accuracy_percent": 85.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.2,
-            "interceptions_per_game": 0.1,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 18,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 3,
-            "hall_of_fame_inducted": 0,
-            "career_earnings_million_usd": 25.0,
-            "total_trophies_won": 15
-        },
-        # 10) Megan Rapinoe
-        {
-            "player_name": "Megan Rapinoe",
-            "country": "United States",
-            "years_active": 14,  # 2006-present
-            "club_appearances": 250,
-            "club_goals": 120,
-            "club_assists": 80,
-            "club_minutes_played": 20000,
-            "international_caps": 150,
-            "international_goals": 58,
-            "international_assists": 40,
-            "international_minutes_played": 13000,
-            "club_goal_ratio": 120 / 250,
-            "international_goal_ratio": 58 / 150,
-            "fifa_womens_world_cup_titles": 1,  # 2019
-            "continental_titles": 3,             # CONCACAF Championships, Olympics
-            "league_titles": 2,
-            "champions_league_titles": 0,
-            "domestic_cup_titles": 2,
-            "major_individual_awards": 7,        # FIFA Best Player, Ballon d'Or Féminin runner-up
-            "ballon_dor_femin_wins": 0,
-            "hat_tricks": 5,
-            "penalty_goals": 15,
-            "free_kick_goals": 10,
-            "red_cards": 1,
-            "yellow_cards": 20,
-            "man_of_the_match_awards": 40,
-            "captaincy_appearances": 100,
-            "key_passes_per_game": 2.3,
-            "dribbles_completed_per_game": 2.5,
-            "big_chances_created": 100,
-            "pass_accuracy_percent": 83.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.3,
-            "interceptions_per_game": 0.2,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 10,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 2,
-            "hall_of_fame_inducted": 0,
-            "career_earnings_million_usd": 50.0,
-            "total_trophies_won": 15
-        },
-        # 11) Carli Lloyd
-        {
-            "player_name": "Carli Lloyd",
-            "country": "United States",
-            "years_active": 19,  # 2005-2023
-            "club_appearances": 350,
-            "club_goals": 175,
-            "club_assists": 90,
-            "club_minutes_played": 27000,
-            "international_caps": 330,
-            "international_goals": 134,
-            "international_assists": 50,
-            "international_minutes_played": 30000,
-            "club_goal_ratio": 175 / 350,
-            "international_goal_ratio": 134 / 330,
-            "fifa_womens_world_cup_titles": 2,  # 2015, 2019
-            "continental_titles": 4,             # CONCACAF Championships, Olympics
-            "league_titles": 3,
-            "champions_league_titles": 0,
-            "domestic_cup_titles": 2,
-            "major_individual_awards": 9,        # FIFA World Player of the Year x1, Golden Boot
-            "ballon_dor_femin_wins": 0,
-            "hat_tricks": 7,
-            "penalty_goals": 25,
-            "free_kick_goals": 12,
-            "red_cards": 1,
-            "yellow_cards": 15,
-            "man_of_the_match_awards": 55,
-            "captaincy_appearances": 220,
-            "key_passes_per_game": 2.1,
-            "dribbles_completed_per_game": 2.8,
-            "big_chances_created": 130,
-            "pass_accuracy_percent": 84.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.4,
-            "interceptions_per_game": 0.3,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 15,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 3,
-            "hall_of_fame_inducted": 1,
-            "career_earnings_million_usd": 60.0,
-            "total_trophies_won": 25
-        },
-        # 12) Alex Morgan
-        {
-            "player_name": "Alex Morgan",
-            "country": "United States",
-            "years_active": 16,  # 2010-present
-            "club_appearances": 280,
-            "club_goals": 160,
-            "club_assists": 80,
-            "club_minutes_played": 21000,
-            "international_caps": 192,
-            "international_goals": 127,
-            "international_assists": 60,
-            "international_minutes_played": 22000,
-            "club_goal_ratio": 160 / 280,
-            "international_goal_ratio": 127 / 192,
-            "fifa_womens_world_cup_titles": 1,  # 2019
-            "continental_titles": 3,             # CONCACAF Championships, Olympics
-            "league_titles": 2,
-            "champions_league_titles": 0,
-            "domestic_cup_titles": 2,
-            "major_individual_awards": 7,        # FIFA World Player of the Year x1
-            "ballon_dor_femin_wins": 0,
-            "hat_tricks": 8,
-            "penalty_goals": 35,
-            "free_kick_goals": 15,
-            "red_cards": 1,
-            "yellow_cards": 20,
-            "man_of_the_match_awards": 45,
-            "captaincy_appearances": 180,
-            "key_passes_per_game": 2.0,
-            "dribbles_completed_per_game": 2.5,
-            "big_chances_created": 120,
-            "pass_accuracy_percent": 85.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.3,
-            "interceptions_per_game": 0.2,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 12,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 2,
-            "hall_of_fame_inducted": 0,
-            "career_earnings_million_usd": 40.0,
-            "total_trophies_won": 18
-        },
-        # 13) Sam Kerr
-        {
-            "player_name": "Sam Kerr",
-            "country": "Australia",
-            "years_active": 13,  # 2013-present
-            "club_appearances": 220,
-            "club_goals": 150,
-            "club_assists": 60,
-            "club_minutes_played": 16000,
-            "international_caps": 101,
-            "international_goals": 50,
-            "international_assists": 25,
-            "international_minutes_played": 9000,
-            "club_goal_ratio": 150 / 220,
-            "international_goal_ratio": 50 / 101,
-            "fifa_womens_world_cup_titles": 0,
-            "continental_titles": 2,             # AFC Olympic Qualifiers, Asian Cup
-            "league_titles": 3,
-            "champions_league_titles": 0,
-            "domestic_cup_titles": 2,
-            "major_individual_awards": 6,        # AFC Women's Player of the Year x multiple
-            "ballon_dor_femin_wins": 0,
-            "hat_tricks": 12,
-            "penalty_goals": 20,
-            "free_kick_goals": 10,
-            "red_cards": 0,
-            "yellow_cards": 10,
-            "man_of_the_match_awards": 35,
-            "captaincy_appearances": 60,
-            "key_passes_per_game": 1.5,
-            "dribbles_completed_per_game": 3.0,
-            "big_chances_created": 90,
-            "pass_accuracy_percent": 80.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.2,
-            "interceptions_per_game": 0.1,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 8,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 1,
-            "hall_of_fame_inducted": 0,
-            "career_earnings_million_usd": 35.0,
-            "total_trophies_won": 10
-        },
-        # 14) Formiga
-        {
-            "player_name": "Formiga",
-            "country": "Brazil",
-            "years_active": 28,  # 1995-present
-            "club_appearances": 600,
-            "club_goals": 50,
-            "club_assists": 70,
-            "club_minutes_played": 48000,
-            "international_caps": 302,
-            "international_goals": 30,
-            "international_assists": 35,
-            "international_minutes_played": 27000,
-            "club_goal_ratio": 50 / 600,
-            "international_goal_ratio": 30 / 302,
-            "fifa_womens_world_cup_titles": 0,
-            "continental_titles": 3,             # Copa América Femenina, Olympics
-            "league_titles": 4,
-            "champions_league_titles": 0,
-            "domestic_cup_titles": 3,
-            "major_individual_awards": 5,        # Various awards
-            "ballon_dor_femin_wins": 0,
-            "hat_tricks": 1,
-            "penalty_goals": 10,
-            "free_kick_goals": 5,
-            "red_cards": 2,
-            "yellow_cards": 25,
-            "man_of_the_match_awards": 30,
-            "captaincy_appearances": 150,
-            "key_passes_per_game": 1.8,
-            "dribbles_completed_per_game": 1.5,
-            "big_chances_created": 80,
-            "pass_accuracy_percent": 88.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 1.0,
-            "interceptions_per_game": 0.8,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 25,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 2,
-            "hall_of_fame_inducted": 1,
-            "career_earnings_million_usd": 20.0,
-            "total_trophies_won": 18
-        },
-        # 15) Marta Vieira da Silva
-        {
-            "player_name": "Marta Vieira da Silva",
-            "country": "Brazil",
-            "years_active": 23,  # 2000-present
-            "club_appearances": 600,
-            "club_goals": 350,
-            "club_assists": 120,
-            "club_minutes_played": 50000,
-            "international_caps": 185,
-            "international_goals": 115,
-            "international_assists": 50,
-            "international_minutes_played": 18000,
-            "club_goal_ratio": 350 / 600,
-            "international_goal_ratio": 115 / 185,
-            "fifa_womens_world_cup_titles": 0,
-            "continental_titles": 5,             # Copa América Femenina, Olympic Gold 2008
-            "league_titles": 6,
-            "champions_league_titles": 1,        # UEFA Women's Champions League
-            "domestic_cup_titles": 3,
-            "major_individual_awards": 18,       # FIFA World Player of the Year x6
-            "ballon_dor_femin_wins": 0,
-            "hat_tricks": 25,
-            "penalty_goals": 45,
-            "free_kick_goals": 20,
-            "red_cards": 1,
-            "yellow_cards": 15,
-            "man_of_the_match_awards": 90,
-            "captaincy_appearances": 120,
-            "key_passes_per_game": 2.7,
-            "dribbles_completed_per_game": 4.5,
-            "big_chances_created": 200,
-            "pass_accuracy_percent": 85.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.3,
-            "interceptions_per_game": 0.2,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 20,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 4,
-            "hall_of_fame_inducted": 0,
-            "career_earnings_million_usd": 100.0,
-            "total_trophies_won": 25
-        },
-        # 16) Hope Solo
-        {
-            "player_name": "Hope Solo",
-            "country": "United States",
-            "years_active": 15,  # 2007-2016
-            "club_appearances": 180,
-            "club_goals": 0,    # Goalkeeper
-            "club_assists": 5,
-            "club_minutes_played": 16000,
-            "international_caps": 202,
-            "international_goals": 0,
-            "international_assists": 10,
-            "international_minutes_played": 18000,
-            "club_goal_ratio": 0 / 180,
-            "international_goal_ratio": 0 / 202,
-            "fifa_womens_world_cup_titles": 2,  # 2015, 2019
-            "continental_titles": 3,             # CONCACAF Championships, Olympics
-            "league_titles": 1,
-            "champions_league_titles": 0,
-            "domestic_cup_titles": 1,
-            "major_individual_awards": 8,        # FIFA Best Goalkeeper, etc.
-            "ballon_dor_femin_wins": 0,
-            "hat_tricks": 0,
-            "penalty_goals": 0,
-            "free_kick_goals": 0,
-            "red_cards": 5,
-            "yellow_cards": 25,
-            "man_of_the_match_awards": 30,
-            "captaincy_appearances": 100,
-            "key_passes_per_game": 0.2,
-            "dribbles_completed_per_game": 0.1,
-            "big_chances_created": 5,
-            "pass_accuracy_percent": 78.0,
-            "clean_sheets": 120,
-            "tackles_won_per_game": 0.1,
-            "interceptions_per_game": 0.1,
-            "saves_per_game": 4.5,
-            "doping_tests_passed": 8,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 2,
-            "hall_of_fame_inducted": 0,
-            "career_earnings_million_usd": 60.0,
-            "total_trophies_won": 15
-        },
-        # 17) Lucy Bronze
-        {
-            "player_name": "Lucy Bronze",
-            "country": "England",
-            "years_active": 13,  # 2010-present
-            "club_appearances": 250,
-            "club_goals": 35,
-            "club_assists": 60,
-            "club_minutes_played": 20000,
-            "international_caps": 160,
-            "international_goals": 22,
-            "international_assists": 35,
-            "international_minutes_played": 18000,
-            "club_goal_ratio": 35 / 250,
-            "international_goal_ratio": 22 / 160,
-            "fifa_womens_world_cup_titles": 1,  # 2023
-            "continental_titles": 4,             # UEFA Women's Euro, Olympics
-            "league_titles": 4,
-            "champions_league_titles": 1,        # UEFA Women's Champions League
-            "domestic_cup_titles": 3,
-            "major_individual_awards": 9,        # FIFA Best Player, etc.
-            "ballon_dor_femin_wins": 0,
-            "hat_tricks": 0,
-            "penalty_goals": 5,
-            "free_kick_goals": 10,
-            "red_cards": 1,
-            "yellow_cards": 15,
-            "man_of_the_match_awards": 40,
-            "captaincy_appearances": 70,
-            "key_passes_per_game": 2.2,
-            "dribbles_completed_per_game": 2.5,
-            "big_chances_created": 80,
-            "pass_accuracy_percent": 87.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 1.5,
-            "interceptions_per_game": 1.2,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 10,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 2,
-            "hall_of_fame_inducted": 0,
-            "career_earnings_million_usd": 50.0,
-            "total_trophies_won": 20
-        },
-        # 18) Marta Vieira da Silva
-        {
-            "player_name": "Marta Vieira da Silva",
-            "country": "Brazil",
-            "years_active": 23,  # 2000-present
-            "club_appearances": 600,
-            "club_goals": 350,
-            "club_assists": 120,
-            "club_minutes_played": 50000,
-            "international_caps": 185,
-            "international_goals": 115,
-            "international_assists": 50,
-            "international_minutes_played": 18000,
-            "club_goal_ratio": 350 / 600,
-            "international_goal_ratio": 115 / 185,
-            "fifa_womens_world_cup_titles": 0,
-            "continental_titles": 5,             # Copa América Femenina, Olympic Gold 2008
-            "league_titles": 6,
-            "champions_league_titles": 1,        # UEFA Women's Champions League
-            "domestic_cup_titles": 3,
-            "major_individual_awards": 18,       # FIFA World Player of the Year x6
-            "ballon_dor_femin_wins": 0,
-            "hat_tricks": 25,
-            "penalty_goals": 45,
-            "free_kick_goals": 20,
-            "red_cards": 1,
-            "yellow_cards": 15,
-            "man_of_the_match_awards": 90,
-            "captaincy_appearances": 120,
-            "key_passes_per_game": 2.7,
-            "dribbles_completed_per_game": 4.5,
-            "big_chances_created": 200,
-            "pass_accuracy_percent": 85.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.3,
-            "interceptions_per_game": 0.2,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 20,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 4,
-            "hall_of_fame_inducted": 0,
-            "career_earnings_million_usd": 100.0,
-            "total_trophies_won": 25
-        },
-        # 19) Marta Vieira da Silva (Duplicate Removed)
-        # To reach 30, continue adding real legends or use placeholders with accurate data.
-        # For brevity, let's add additional players with approximate data.
-        # 19) Sydney Leroux
-        {
-            "player_name": "Sydney Leroux",
-            "country": "United States",
-            "years_active": 14,  # 2009-present
-            "club_appearances": 180,
-            "club_goals": 60,
-            "club_assists": 50,
-            "club_minutes_played": 14000,
-            "international_caps": 141,
-            "international_goals": 35,
-            "international_assists": 25,
-            "international_minutes_played": 13000,
-            "club_goal_ratio": 60 / 180,
-            "international_goal_ratio": 35 / 141,
-            "fifa_womens_world_cup_titles": 1,  # 2015
-            "continental_titles": 4,             # CONCACAF Championships, Olympics
-            "league_titles": 3,
-            "champions_league_titles": 0,
-            "domestic_cup_titles": 2,
-            "major_individual_awards": 6,        # Various MVP awards
-            "ballon_dor_femin_wins": 0,
-            "hat_tricks": 3,
-            "penalty_goals": 15,
-            "free_kick_goals": 10,
-            "red_cards": 1,
-            "yellow_cards": 10,
-            "man_of_the_match_awards": 25,
-            "captaincy_appearances": 40,
-            "key_passes_per_game": 1.8,
-            "dribbles_completed_per_game": 2.2,
-            "big_chances_created": 90,
-            "pass_accuracy_percent": 80.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.3,
-            "interceptions_per_game": 0.2,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 10,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 2,
-            "hall_of_fame_inducted": 0,
-            "career_earnings_million_usd": 20.0,
-            "total_trophies_won": 12
-        },
-        # 20) Tobin Heath
-        {
-            "player_name": "Tobin Heath",
-            "country": "United States",
-            "years_active": 15,  # 2009-present
-            "club_appearances": 220,
-            "club_goals": 45,
-            "club_assists": 70,
-            "club_minutes_played": 18000,
-            "international_caps": 164,
-            "international_goals": 24,
-            "international_assists": 40,
-            "international_minutes_played": 16000,
-            "club_goal_ratio": 45 / 220,
-            "international_goal_ratio": 24 / 164,
-            "fifa_womens_world_cup_titles": 1,  # 2015
-            "continental_titles": 4,             # CONCACAF Championships, Olympics
-            "league_titles": 4,
-            "champions_league_titles": 1,        # UEFA Women's Champions League
-            "domestic_cup_titles": 3,
-            "major_individual_awards": 7,        # Various MVP and Best Player awards
-            "ballon_dor_femin_wins": 0,
-            "hat_tricks": 2,
-            "penalty_goals": 10,
-            "free_kick_goals": 15,
-            "red_cards": 0,
-            "yellow_cards": 5,
-            "man_of_the_match_awards": 35,
-            "captaincy_appearances": 60,
-            "key_passes_per_game": 2.4,
-            "dribbles_completed_per_game": 3.0,
-            "big_chances_created": 100,
-            "pass_accuracy_percent": 87.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.4,
-            "interceptions_per_game": 0.3,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 12,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 2,
-            "hall_of_fame_inducted": 0,
-            "career_earnings_million_usd": 30.0,
-            "total_trophies_won": 18
-        },
-        # 21) Dzsenifer Marozsán
-        {
-            "player_name": "Dzsenifer Marozsán",
-            "country": "Germany",
-            "years_active": 15,  # 2010-present
-            "club_appearances": 300,
-            "club_goals": 60,
-            "club_assists": 80,
-            "club_minutes_played": 22000,
-            "international_caps": 120,
-            "international_goals": 25,
-            "international_assists": 35,
-            "international_minutes_played": 15000,
-            "club_goal_ratio": 60 / 300,
-            "international_goal_ratio": 25 / 120,
-            "fifa_womens_world_cup_titles": 1,  # 2015
-            "continental_titles": 3,             # UEFA Women's Euro
-            "league_titles": 5,
-            "champions_league_titles": 2,
-            "domestic_cup_titles": 3,
-            "major_individual_awards": 6,        # Various MVP and Best Player awards
-            "ballon_dor_femin_wins": 0,
-            "hat_tricks": 3,
-            "penalty_goals": 12,
-            "free_kick_goals": 8,
-            "red_cards": 0,
-            "yellow_cards": 10,
-            "man_of_the_match_awards": 30,
-            "captaincy_appearances": 80,
-            "key_passes_per_game": 2.6,
-            "dribbles_completed_per_game": 3.2,
-            "big_chances_created": 110,
-            "pass_accuracy_percent": 89.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.5,
-            "interceptions_per_game": 0.3,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 10,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 3,
-            "hall_of_fame_inducted": 0,
-            "career_earnings_million_usd": 40.0,
-            "total_trophies_won": 20
-        },
-        # 22) Ada Hegerberg
-        {
-            "player_name": "Ada Hegerberg",
-            "country": "Norway",
-            "years_active": 11,  # 2012-present
-            "club_appearances": 180,
-            "club_goals": 150,
-            "club_assists": 40,
-            "club_minutes_played": 16000,
-            "international_caps": 84,
-            "international_goals": 38,
-            "international_assists": 20,
-            "international_minutes_played": 7000,
-            "club_goal_ratio": 150 / 180,
-            "international_goal_ratio": 38 / 84,
-            "fifa_womens_world_cup_titles": 0,
-            "continental_titles": 2,             # UEFA Women's Euro, Olympic Gold
-            "league_titles": 3,
-            "champions_league_titles": 1,
-            "domestic_cup_titles": 1,
-            "major_individual_awards": 5,        # Ballon d'Or Féminin x1
-            "ballon_dor_femin_wins": 1,
-            "hat_tricks": 5,
-            "penalty_goals": 20,
-            "free_kick_goals": 10,
-            "red_cards": 0,
-            "yellow_cards": 5,
-            "man_of_the_match_awards": 25,
-            "captaincy_appearances": 30,
-            "key_passes_per_game": 1.5,
-            "dribbles_completed_per_game": 2.5,
-            "big_chances_created": 70,
-            "pass_accuracy_percent": 80.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.1,
-            "interceptions_per_game": 0.1,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 5,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 1,
-            "hall_of_fame_inducted": 0,
-            "career_earnings_million_usd": 50.0,
-            "total_trophies_won": 12
-        },
-        # 23) Julie Fleeting
-        {
-            "player_name": "Julie Fleeting",
-            "country": "Scotland",
-            "years_active": 20,  # 1997-2017
-            "club_appearances": 500,
-            "club_goals": 300,
-            "club_assists": 100,
-            "club_minutes_played": 40000,
-            "international_caps": 116,
-            "international_goals": 46,
-            "international_assists": 25,
-            "international_minutes_played": 12000,
-            "club_goal_ratio": 300 / 500,
-            "international_goal_ratio": 46 / 116,
-            "fifa_womens_world_cup_titles": 0,
-            "continental_titles": 3,             # Various international and domestic titles
-            "league_titles": 5,
-            "champions_league_titles": 0,
-            "domestic_cup_titles": 3,
-            "major_individual_awards": 6,        # Top scorer awards, etc.
-            "ballon_dor_femin_wins": 0,
-            "hat_tricks": 10,
-            "penalty_goals": 25,
-            "free_kick_goals": 15,
-            "red_cards": 1,
-            "yellow_cards": 10,
-            "man_of_the_match_awards": 30,
-            "captaincy_appearances": 80,
-            "key_passes_per_game": 1.5,
-            "dribbles_completed_per_game": 2.0,
-            "big_chances_created": 60,
-            "pass_accuracy_percent": 78.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.2,
-            "interceptions_per_game": 0.1,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 0,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 2,
-            "hall_of_fame_inducted": 1,
-            "career_earnings_million_usd": 15.0,
-            "total_trophies_won": 15
-        },
-        # 24) Lisa De Vanna
-        {
-            "player_name": "Lisa De Vanna",
-            "country": "Australia",
-            "years_active": 17,  # 2001-2018
-            "club_appearances": 400,
-            "club_goals": 200,
-            "club_assists": 70,
-            "club_minutes_played": 35000,
-            "international_caps": 153,
-            "international_goals": 57,
-            "international_assists": 25,
-            "international_minutes_played": 15000,
-            "club_goal_ratio": 200 / 400,
-            "international_goal_ratio": 57 / 153,
-            "fifa_womens_world_cup_titles": 0,
-            "continental_titles": 3,             # AFC Olympic Qualifiers, etc.
-            "league_titles": 4,
-            "champions_league_titles": 0,
-            "domestic_cup_titles": 2,
-            "major_individual_awards": 5,        # Various top scorer awards
-            "ballon_dor_femin_wins": 0,
-            "hat_tricks": 7,
-            "penalty_goals": 20,
-            "free_kick_goals": 10,
-            "red_cards": 1,
-            "yellow_cards": 10,
-            "man_of_the_match_awards": 35,
-            "captaincy_appearances": 50,
-            "key_passes_per_game": 1.8,
-            "dribbles_completed_per_game": 2.5,
-            "big_chances_created": 80,
-            "pass_accuracy_percent": 80.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.3,
-            "interceptions_per_game": 0.2,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 10,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 3,
-            "hall_of_fame_inducted": 1,
-            "career_earnings_million_usd": 25.0,
-            "total_trophies_won": 18
-        },
-        # 25) Megan Rapinoe (Duplicate Removed)
-        # To continue, ensure unique players. Let's add more top players:
-        # 25) Christine Sinclair
-        {
-            "player_name": "Christine Sinclair",
-            "country": "Canada",
-            "years_active": 19,  # 2000-present
-            "club_appearances": 400,
-            "club_goals": 160,
-            "club_assists": 100,
-            "club_minutes_played": 34000,
-            "international_caps": 294,
-            "international_goals": 186,
-            "international_assists": 90,
-            "international_minutes_played": 25000,
-            "club_goal_ratio": 160 / 400,
-            "international_goal_ratio": 186 / 294,
-            "fifa_womens_world_cup_titles": 0,
-            "continental_titles": 3,             # CONCACAF Championships, Olympics
-            "league_titles": 4,
-            "champions_league_titles": 0,
-            "domestic_cup_titles": 2,
-            "major_individual_awards": 8,        # Canadian Player of the Year x multiple
-            "ballon_dor_femin_wins": 0,
-            "hat_tricks": 10,
-            "penalty_goals": 35,
-            "free_kick_goals": 20,
-            "red_cards": 0,
-            "yellow_cards": 10,
-            "man_of_the_match_awards": 50,
-            "captaincy_appearances": 250,
-            "key_passes_per_game": 2.0,
-            "dribbles_completed_per_game": 2.2,
-            "big_chances_created": 150,
-            "pass_accuracy_percent": 85.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.2,
-            "interceptions_per_game": 0.1,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 18,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 3,
-            "hall_of_fame_inducted": 0,
-            "career_earnings_million_usd": 25.0,
-            "total_trophies_won": 15
-        },
-        # 26) Nadine Angerer
-        {
-            "player_name": "Nadine Angerer",
-            "country": "Germany",
-            "years_active": 19,  # 2001-2020
-            "club_appearances": 450,
-            "club_goals": 0,    # Goalkeeper
-            "club_assists": 10,
-            "club_minutes_played": 40000,
-            "international_caps": 214,
-            "international_goals": 0,
-            "international_assists": 5,
-            "international_minutes_played": 20000,
-            "club_goal_ratio": 0 / 450,
-            "international_goal_ratio": 0 / 214,
-            "fifa_womens_world_cup_titles": 1,  # 2007
-            "continental_titles": 4,             # UEFA Women's Euro
-            "league_titles": 5,
-            "champions_league_titles": 2,
-            "domestic_cup_titles": 3,
-            "major_individual_awards": 7,        # FIFA Best Goalkeeper
-            "ballon_dor_femin_wins": 0,
-            "hat_tricks": 0,
-            "penalty_goals": 0,
-            "free_kick_goals": 0,
-            "red_cards": 0,
-            "yellow_cards": 5,
-            "man_of_the_match_awards": 20,
-            "captaincy_appearances": 100,
-            "key_passes_per_game": 0.0,
-            "dribbles_completed_per_game": 0.0,
-            "big_chances_created": 0,
-            "pass_accuracy_percent": 85.0,
-            "clean_sheets": 150,
-            "tackles_won_per_game": 0.1,
-            "interceptions_per_game": 0.1,
-            "saves_per_game": 5.0,
-            "doping_tests_passed": 10,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 1,
-            "hall_of_fame_inducted": 1,
-            "career_earnings_million_usd": 30.0,
-            "total_trophies_won": 20
-        },
-        # 27) Marta Vieira da Silva (Duplicate Removed)
-        # 27) Alex Morgan (Duplicate Removed)
-        # Add unique players:
-        # 27) Christen Press
-        {
-            "player_name": "Christen Press",
-            "country": "United States",
-            "years_active": 13,  # 2010-present
-            "club_appearances": 220,
-            "club_goals": 100,
-            "club_assists": 80,
-            "club_minutes_played": 18000,
-            "international_caps": 152,
-            "international_goals": 61,
-            "international_assists": 40,
-            "international_minutes_played": 17000,
-            "club_goal_ratio": 100 / 220,
-            "international_goal_ratio": 61 / 152,
-            "fifa_womens_world_cup_titles": 1,  # 2015
-            "continental_titles": 4,             # CONCACAF Championships, Olympics
-            "league_titles": 3,
-            "champions_league_titles": 0,
-            "domestic_cup_titles": 2,
-            "major_individual_awards": 6,        # Various MVP and Best Player awards
-            "ballon_dor_femin_wins": 0,
-            "hat_tricks": 5,
-            "penalty_goals": 15,
-            "free_kick_goals": 10,
-            "red_cards": 1,
-            "yellow_cards": 15,
-            "man_of_the_match_awards": 35,
-            "captaincy_appearances": 80,
-            "key_passes_per_game": 2.1,
-            "dribbles_completed_per_game": 2.3,
-            "big_chances_created": 100,
-            "pass_accuracy_percent": 83.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.2,
-            "interceptions_per_game": 0.1,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 8,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 2,
-            "hall_of_fame_inducted": 0,
-            "career_earnings_million_usd": 30.0,
-            "total_trophies_won": 15
-        },
-        # 28) Saki Kumagai
-        {
-            "player_name": "Saki Kumagai",
-            "country": "Japan",
-            "years_active": 16,  # 2009-present
-            "club_appearances": 220,
-            "club_goals": 10,
-            "club_assists": 40,
-            "club_minutes_played": 18000,
-            "international_caps": 125,
-            "international_goals": 5,
-            "international_assists": 20,
-            "international_minutes_played": 11000,
-            "club_goal_ratio": 10 / 220,
-            "international_goal_ratio": 5 / 125,
-            "fifa_womens_world_cup_titles": 1,  # 2011
-            "continental_titles": 3,             # AFC Women's Asian Cup, Olympics
-            "league_titles": 4,
-            "champions_league_titles": 1,
-            "domestic_cup_titles": 2,
-            "major_individual_awards": 5,        # Best Defender awards
-            "ballon_dor_femin_wins": 0,
-            "hat_tricks": 0,
-            "penalty_goals": 2,
-            "free_kick_goals": 5,
-            "red_cards": 0,
-            "yellow_cards": 10,
-            "man_of_the_match_awards": 20,
-            "captaincy_appearances": 60,
-            "key_passes_per_game": 2.0,
-            "dribbles_completed_per_game": 1.5,
-            "big_chances_created": 60,
-            "pass_accuracy_percent": 85.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 1.5,
-            "interceptions_per_game": 1.2,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 10,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 2,
-            "hall_of_fame_inducted": 0,
-            "career_earnings_million_usd": 20.0,
-            "total_trophies_won": 15
-        },
-        # 29) Lucy Bronze (Duplicate Removed)
-        # 29) Dzsenifer Marozsán (Duplicate Removed)
-        # 29) Formiga (Duplicate Removed)
-        # Add unique players:
-        # 29) Lauren Holiday
-        {
-            "player_name": "Lauren Holiday",
-            "country": "United States",
-            "years_active": 16,  # 2006-2022
-            "club_appearances": 300,
-            "club_goals": 40,
-            "club_assists": 50,
-            "club_minutes_played": 25000,
-            "international_caps": 160,
-            "international_goals": 27,
-            "international_assists": 35,
-            "international_minutes_played": 16000,
-            "club_goal_ratio": 40 / 300,
-            "international_goal_ratio": 27 / 160,
-            "fifa_womens_world_cup_titles": 1,  # 2015
-            "continental_titles": 5,             # CONCACAF Championships, Olympics
-            "league_titles": 3,
-            "champions_league_titles": 0,
-            "domestic_cup_titles": 2,
-            "major_individual_awards": 6,        # Various MVP and Best Player awards
-            "ballon_dor_femin_wins": 0,
-            "hat_tricks": 2,
-            "penalty_goals": 10,
-            "free_kick_goals": 5,
-            "red_cards": 0,
-            "yellow_cards": 10,
-            "man_of_the_match_awards": 25,
-            "captaincy_appearances": 100,
-            "key_passes_per_game": 1.8,
-            "dribbles_completed_per_game": 2.0,
-            "big_chances_created": 80,
-            "pass_accuracy_percent": 84.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.3,
-            "interceptions_per_game": 0.2,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 10,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 2,
-            "hall_of_fame_inducted": 1,
-            "career_earnings_million_usd": 25.0,
-            "total_trophies_won": 15
-        },
-        # 30) Julie Ertz
-        {
-            "player_name": "Julie Ertz",
-            "country": "United States",
-            "years_active": 12,  # 2013-present
-            "club_appearances": 200,
-            "club_goals": 25,
-            "club_assists": 60,
-            "club_minutes_played": 16000,
-            "international_caps": 162,
-            "international_goals": 16,
-            "international_assists": 35,
-            "international_minutes_played": 15000,
-            "club_goal_ratio": 25 / 200,
-            "international_goal_ratio": 16 / 162,
-            "fifa_womens_world_cup_titles": 1,  # 2019
-            "continental_titles": 4,             # CONCACAF Championships, Olympics
-            "league_titles": 2,
-            "champions_league_titles": 0,
-            "domestic_cup_titles": 2,
-            "major_individual_awards": 5,        # Various MVP and Best Player awards
-            "ballon_dor_femin_wins": 0,
-            "hat_tricks": 1,
-            "penalty_goals": 8,
-            "free_kick_goals": 5,
-            "red_cards": 0,
-            "yellow_cards": 8,
-            "man_of_the_match_awards": 20,
-            "captaincy_appearances": 80,
-            "key_passes_per_game": 2.0,
-            "dribbles_completed_per_game": 1.5,
-            "big_chances_created": 70,
-            "pass_accuracy_percent": 86.0,
-            "clean_sheets": 0,
-            "tackles_won_per_game": 0.4,
-            "interceptions_per_game": 0.3,
-            "saves_per_game": 0.0,
-            "doping_tests_passed": 10,
-            "doping_tests_failed": 0,
-            "major_injuries_count": 1,
-            "hall_of_fame_inducted": 0,
-            "career_earnings_million_usd": 20.0,
-            "total_trophies_won": 12
-        }
-    ]
-
-    # Confirm we have exactly 30 players
-    if len(players_data) != 30:
-        raise ValueError(f"Expected 30 women's soccer players, got {len(players_data)}")
-
-    # ----------------------- WRITE TO CSV -----------------------
-    with open(filename, mode="w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-        for pdata in players_data:
-            # Fill missing fields with 0 if needed
-            for h in headers:
-                if h not in pdata:
-                    pdata[h] = 0
-            writer.writerow(pdata)
 
 if __name__ == "__main__":
     create_womens_soccer_dataset()
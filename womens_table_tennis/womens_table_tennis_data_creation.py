@@ -1,4 +1,67 @@
-import csv
+import os
+import sys
+
+# Add parent directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sports_player_data import load_players, write_dataset
+
+# One record per player; fields a player does not list are written as 0
+PLAYERS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "womens_table_tennis_players.json")
+
+# ------------------------- COLUMN HEADERS (41+) -------------------------
+HEADERS = [
+    "player_name",
+    "country",
+    "handedness",
+    "playing_style",  # Offensive/Defensive/All-round
+    "years_active",
+    "highest_world_ranking",
+    "world_ranking_history",  # Number of times ranked in top 10
+    "international_matches_played",
+    "international_matches_won",
+    "international_matches_lost",
+    "international_titles_won",
+    "international_title_percentage",
+    "olympic_medals",
+    "world_championship_titles",
+    "world_cup_titles",
+    "asian_games_medals",
+    "bwf_world_series_titles",
+    "bwf_grand_slam_titles",
+    "bwf_olympic_titles",
+    "bwf_super_series_titles",
+    "bwf_world_superseries_championships",
+    "bwf_world_cup_titles",
+    "bwf_world_series_titles",
+    "total_points_scored",
+    "total_serves",
+    "total_volleys",
+    "total_smashes",
+    "total_dropshots",
+    "total_defensive_blocks",
+    "total_offensive_blocks",
+    "serve_accuracy_percent",
+    "return_accuracy_percent",
+    "smash_success_rate",
+    "dropshot_success_rate",
+    "volleys_success_rate",
+    "overall_efficiency",
+    "offensive_efficiency",
+    "defensive_efficiency",
+    "reaction_time_ms",
+    "serve_receive_efficiency",
+    "career_earnings_million_usd",
+    "total_trophies_won",
+    "best_player_awards",
+    "mvp_awards",
+    "most_improved_player_awards",
+    "sportsmanship_awards",
+    "hall_of_fame_inducted",
+    "coach_achievements",
+    "overall_performance_score",
+]
+
 
 def create_womens_table_tennis_dataset(filename="womens_table_tennis_dataset.csv"):
     """
@@ -11,1643 +74,9 @@ def create_womens_table_tennis_dataset(filename="womens_table_tennis_dataset.csv
     After creation, you'll have a 'womens_table_tennis_dataset.csv' file with 30 rows,
     each containing 41+ columns of data.
     """
+    players_data = load_players(PLAYERS_FILE)
+    write_dataset(HEADERS, players_data, filename, expected_count=30)
 
-    # ------------------------- COLUMN HEADERS (41+) -------------------------
-    headers = [
-        "player_name",
-        "country",
-        "handedness",
-        "playing_style",  # Offensive/Defensive/All-round
-        "years_active",
-        "highest_world_ranking",
-        "world_ranking_history",  # Number of times ranked in top 10
-        "international_matches_played",
-        "international_matches_won",
-        "international_matches_lost",
-        "international_titles_won",
-        "international_title_percentage",
-        "olympic_medals",
-        "world_championship_titles",
-        "world_cup_titles",
-        "asian_games_medals",
-        "bwf_world_series_titles",
-        "bwf_grand_slam_titles",
-        "bwf_olympic_titles",
-        "bwf_super_series_titles",
-        "bwf_world_superseries_championships",
-        "bwf_world_cup_titles",
-        "bwf_world_series_titles",
-        "total_points_scored",
-        "total_serves",
-        "total_volleys",
-        "total_smashes",
-        "total_dropshots",
-        "total_defensive_blocks",
-        "total_offensive_blocks",
-        "serve_accuracy_percent",
-        "return_accuracy_percent",
-        "smash_success_rate",
-        "dropshot_success_rate",
-        "volleys_success_rate",
-        "overall_efficiency",
-        "offensive_efficiency",
-        "defensive_efficiency",
-        "reaction_time_ms",
-        "serve_receive_efficiency",
-        "career_earnings_million_usd",
-        "total_trophies_won",
-        "best_player_awards",
-        "mvp_awards",
-        "most_improved_player_awards",
-        "sportsmanship_awards",
-        "hall_of_fame_inducted",
-        "coach_achievements",
-        "overall_performance_score",
-    ]
-
-    # Define exactly 30 players, each with 41+ fields.
-    # Stats below are approximate or best-known from public data.
-    # Some older players may have incomplete data for advanced metrics => set them to 0 or minimal.
-
-    players_data = [
-        # 1) Deng Yaping (China, Female)
-        {
-            "player_name": "Deng Yaping",
-            "country": "China",
-            "handedness": "Right",
-            "playing_style": "All-round",
-            "years_active": 15,  # 1989-2004
-            "highest_world_ranking": 1,
-            "world_ranking_history": 20,
-            "international_matches_played": 500,
-            "international_matches_won": 480,
-            "international_matches_lost": 20,
-            "international_titles_won": 45,
-            "international_title_percentage": 90.0,  # 45/50
-            "olympic_medals": 4,  # 2 Gold, 2 Silver
-            "world_championship_titles": 5,
-            "world_cup_titles": 4,
-            "asian_games_medals": 6,
-            "bwf_world_series_titles": 20,
-            "bwf_grand_slam_titles": 15,
-            "bwf_olympic_titles": 2,
-            "bwf_super_series_titles": 18,
-            "bwf_world_superseries_championships": 3,
-            "bwf_world_cup_titles": 4,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 25000,
-            "total_serves": 12000,
-            "total_volleys": 13000,
-            "total_smashes": 10000,
-            "total_dropshots": 7000,
-            "total_defensive_blocks": 5000,
-            "total_offensive_blocks": 4000,
-            "serve_accuracy_percent": 85.0,
-            "return_accuracy_percent": 88.0,
-            "smash_success_rate": 90.0,
-            "dropshot_success_rate": 85.0,
-            "volleys_success_rate": 87.0,
-            "overall_efficiency": 92.0,
-            "offensive_efficiency": 95.0,
-            "defensive_efficiency": 90.0,
-            "reaction_time_ms": 240,
-            "serve_receive_efficiency": 88.0,
-            "career_earnings_million_usd": 8.0,
-            "total_trophies_won": 80,
-            "best_player_awards": 20,
-            "mvp_awards": 18,
-            "most_improved_player_awards": 5,
-            "sportsmanship_awards": 10,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 100.0,
-        },
-        # 2) Zhang Yining (China, Female)
-        {
-            "player_name": "Zhang Yining",
-            "country": "China",
-            "handedness": "Right",
-            "playing_style": "Offensive",
-            "years_active": 14,  # 2001-2015
-            "highest_world_ranking": 1,
-            "world_ranking_history": 18,
-            "international_matches_played": 480,
-            "international_matches_won": 460,
-            "international_matches_lost": 20,
-            "international_titles_won": 40,
-            "international_title_percentage": 83.3,  # 40/48
-            "olympic_medals": 4,  # 2 Gold, 2 Silver
-            "world_championship_titles": 5,
-            "world_cup_titles": 4,
-            "asian_games_medals": 5,
-            "bwf_world_series_titles": 18,
-            "bwf_grand_slam_titles": 14,
-            "bwf_olympic_titles": 2,
-            "bwf_super_series_titles": 17,
-            "bwf_world_superseries_championships": 3,
-            "bwf_world_cup_titles": 4,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 24000,
-            "total_serves": 11500,
-            "total_volleys": 12500,
-            "total_smashes": 9800,
-            "total_dropshots": 6800,
-            "total_defensive_blocks": 4800,
-            "total_offensive_blocks": 3800,
-            "serve_accuracy_percent": 86.0,
-            "return_accuracy_percent": 89.0,
-            "smash_success_rate": 91.0,
-            "dropshot_success_rate": 86.0,
-            "volleys_success_rate": 88.0,
-            "overall_efficiency": 93.0,
-            "offensive_efficiency": 96.0,
-            "defensive_efficiency": 91.0,
-            "reaction_time_ms": 235,
-            "serve_receive_efficiency": 89.0,
-            "career_earnings_million_usd": 7.5,
-            "total_trophies_won": 75,
-            "best_player_awards": 19,
-            "mvp_awards": 17,
-            "most_improved_player_awards": 5,
-            "sportsmanship_awards": 9,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 99.5,
-        },
-        # 3) Liu Shiwen (China, Female)
-        {
-            "player_name": "Liu Shiwen",
-            "country": "China",
-            "handedness": "Right",
-            "playing_style": "All-round",
-            "years_active": 12,  # 2007-2019
-            "highest_world_ranking": 1,
-            "world_ranking_history": 16,
-            "international_matches_played": 450,
-            "international_matches_won": 430,
-            "international_matches_lost": 20,
-            "international_titles_won": 38,
-            "international_title_percentage": 84.4,  # 38/45
-            "olympic_medals": 3,  # 1 Gold, 2 Silver
-            "world_championship_titles": 4,
-            "world_cup_titles": 3,
-            "asian_games_medals": 4,
-            "bwf_world_series_titles": 19,
-            "bwf_grand_slam_titles": 15,
-            "bwf_olympic_titles": 3,
-            "bwf_super_series_titles": 18,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 23000,
-            "total_serves": 11000,
-            "total_volleys": 12000,
-            "total_smashes": 9500,
-            "total_dropshots": 6500,
-            "total_defensive_blocks": 4700,
-            "total_offensive_blocks": 3700,
-            "serve_accuracy_percent": 87.0,
-            "return_accuracy_percent": 90.0,
-            "smash_success_rate": 92.0,
-            "dropshot_success_rate": 87.0,
-            "volleys_success_rate": 89.0,
-            "overall_efficiency": 94.0,
-            "offensive_efficiency": 97.0,
-            "defensive_efficiency": 92.0,
-            "reaction_time_ms": 230,
-            "serve_receive_efficiency": 90.0,
-            "career_earnings_million_usd": 7.0,
-            "total_trophies_won": 78,
-            "best_player_awards": 18,
-            "mvp_awards": 16,
-            "most_improved_player_awards": 5,
-            "sportsmanship_awards": 9,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 99.0,
-        },
-        # 4) Ding Ning (China, Female)
-        {
-            "player_name": "Ding Ning",
-            "country": "China",
-            "handedness": "Right",
-            "playing_style": "Offensive",
-            "years_active": 14,  # 2008-2022
-            "highest_world_ranking": 1,
-            "world_ranking_history": 18,
-            "international_matches_played": 470,
-            "international_matches_won": 450,
-            "international_matches_lost": 20,
-            "international_titles_won": 42,
-            "international_title_percentage": 89.5,  # 42/47
-            "olympic_medals": 4,  # 2 Gold, 2 Silver
-            "world_championship_titles": 5,
-            "world_cup_titles": 4,
-            "asian_games_medals": 5,
-            "bwf_world_series_titles": 20,
-            "bwf_grand_slam_titles": 16,
-            "bwf_olympic_titles": 4,
-            "bwf_super_series_titles": 19,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 4,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 24000,
-            "total_serves": 11500,
-            "total_volleys": 12500,
-            "total_smashes": 10000,
-            "total_dropshots": 7000,
-            "total_defensive_blocks": 5000,
-            "total_offensive_blocks": 4000,
-            "serve_accuracy_percent": 88.0,
-            "return_accuracy_percent": 91.0,
-            "smash_success_rate": 93.0,
-            "dropshot_success_rate": 88.0,
-            "volleys_success_rate": 90.0,
-            "overall_efficiency": 95.0,
-            "offensive_efficiency": 98.0,
-            "defensive_efficiency": 93.0,
-            "reaction_time_ms": 225,
-            "serve_receive_efficiency": 91.0,
-            "career_earnings_million_usd": 7.8,
-            "total_trophies_won": 82,
-            "best_player_awards": 19,
-            "mvp_awards": 17,
-            "most_improved_player_awards": 5,
-            "sportsmanship_awards": 10,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 100.0,
-        },
-        # 5) Wang Nan (China, Female)
-        {
-            "player_name": "Wang Nan",
-            "country": "China",
-            "handedness": "Right",
-            "playing_style": "All-round",
-            "years_active": 16,  # 1995-2011
-            "highest_world_ranking": 1,
-            "world_ranking_history": 19,
-            "international_matches_played": 500,
-            "international_matches_won": 480,
-            "international_matches_lost": 20,
-            "international_titles_won": 44,
-            "international_title_percentage": 88.0,  # 44/50
-            "olympic_medals": 4,  # 2 Gold, 2 Bronze
-            "world_championship_titles": 5,
-            "world_cup_titles": 4,
-            "asian_games_medals": 6,
-            "bwf_world_series_titles": 20,
-            "bwf_grand_slam_titles": 16,
-            "bwf_olympic_titles": 4,
-            "bwf_super_series_titles": 19,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 4,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 24500,
-            "total_serves": 11800,
-            "total_volleys": 12800,
-            "total_smashes": 10200,
-            "total_dropshots": 7200,
-            "total_defensive_blocks": 5100,
-            "total_offensive_blocks": 4100,
-            "serve_accuracy_percent": 89.0,
-            "return_accuracy_percent": 92.0,
-            "smash_success_rate": 94.0,
-            "dropshot_success_rate": 89.0,
-            "volleys_success_rate": 91.0,
-            "overall_efficiency": 96.0,
-            "offensive_efficiency": 99.0,
-            "defensive_efficiency": 94.0,
-            "reaction_time_ms": 220,
-            "serve_receive_efficiency": 92.0,
-            "career_earnings_million_usd": 8.2,
-            "total_trophies_won": 85,
-            "best_player_awards": 20,
-            "mvp_awards": 18,
-            "most_improved_player_awards": 6,
-            "sportsmanship_awards": 11,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 100.0,
-        },
-        # 6) Li Xiaoxia (China, Female)
-        {
-            "player_name": "Li Xiaoxia",
-            "country": "China",
-            "handedness": "Right",
-            "playing_style": "Offensive",
-            "years_active": 13,  # 2008-2021
-            "highest_world_ranking": 1,
-            "world_ranking_history": 17,
-            "international_matches_played": 460,
-            "international_matches_won": 440,
-            "international_matches_lost": 20,
-            "international_titles_won": 40,
-            "international_title_percentage": 86.9,  # 40/46
-            "olympic_medals": 4,  # 2 Gold, 2 Silver
-            "world_championship_titles": 5,
-            "world_cup_titles": 4,
-            "asian_games_medals": 5,
-            "bwf_world_series_titles": 19,
-            "bwf_grand_slam_titles": 15,
-            "bwf_olympic_titles": 4,
-            "bwf_super_series_titles": 18,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 4,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 24000,
-            "total_serves": 11500,
-            "total_volleys": 12500,
-            "total_smashes": 10000,
-            "total_dropshots": 7000,
-            "total_defensive_blocks": 5000,
-            "total_offensive_blocks": 4000,
-            "serve_accuracy_percent": 88.0,
-            "return_accuracy_percent": 91.0,
-            "smash_success_rate": 93.0,
-            "dropshot_success_rate": 88.0,
-            "volleys_success_rate": 90.0,
-            "overall_efficiency": 94.0,
-            "offensive_efficiency": 97.0,
-            "defensive_efficiency": 93.0,
-            "reaction_time_ms": 225,
-            "serve_receive_efficiency": 91.0,
-            "career_earnings_million_usd": 7.8,
-            "total_trophies_won": 80,
-            "best_player_awards": 19,
-            "mvp_awards": 17,
-            "most_improved_player_awards": 5,
-            "sportsmanship_awards": 10,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 99.5,
-        },
-        # 7) Feng Tianwei (Singapore, Female)
-        {
-            "player_name": "Feng Tianwei",
-            "country": "Singapore",
-            "handedness": "Left",
-            "playing_style": "All-round",
-            "years_active": 12,  # 2005-2017
-            "highest_world_ranking": 1,
-            "world_ranking_history": 16,
-            "international_matches_played": 420,
-            "international_matches_won": 400,
-            "international_matches_lost": 20,
-            "international_titles_won": 35,
-            "international_title_percentage": 83.3,  # 35/42
-            "olympic_medals": 3,  # 1 Gold, 1 Silver, 1 Bronze
-            "world_championship_titles": 4,
-            "world_cup_titles": 3,
-            "asian_games_medals": 5,
-            "bwf_world_series_titles": 17,
-            "bwf_grand_slam_titles": 14,
-            "bwf_olympic_titles": 3,
-            "bwf_super_series_titles": 17,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 22000,
-            "total_serves": 11000,
-            "total_volleys": 12000,
-            "total_smashes": 9500,
-            "total_dropshots": 6800,
-            "total_defensive_blocks": 4800,
-            "total_offensive_blocks": 3800,
-            "serve_accuracy_percent": 87.0,
-            "return_accuracy_percent": 90.0,
-            "smash_success_rate": 92.0,
-            "dropshot_success_rate": 87.0,
-            "volleys_success_rate": 89.0,
-            "overall_efficiency": 93.0,
-            "offensive_efficiency": 96.0,
-            "defensive_efficiency": 91.0,
-            "reaction_time_ms": 235,
-            "serve_receive_efficiency": 90.0,
-            "career_earnings_million_usd": 7.2,
-            "total_trophies_won": 80,
-            "best_player_awards": 19,
-            "mvp_awards": 17,
-            "most_improved_player_awards": 5,
-            "sportsmanship_awards": 10,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 99.0,
-        },
-        # 8) Kasumi Ishikawa (Japan, Female)
-        {
-            "player_name": "Kasumi Ishikawa",
-            "country": "Japan",
-            "handedness": "Right",
-            "playing_style": "All-round",
-            "years_active": 14,  # 2009-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 17,
-            "international_matches_played": 430,
-            "international_matches_won": 410,
-            "international_matches_lost": 20,
-            "international_titles_won": 36,
-            "international_title_percentage": 84.2,  # 36/43
-            "olympic_medals": 3,  # 1 Gold, 1 Silver, 1 Bronze
-            "world_championship_titles": 4,
-            "world_cup_titles": 3,
-            "asian_games_medals": 4,
-            "bwf_world_series_titles": 18,
-            "bwf_grand_slam_titles": 15,
-            "bwf_olympic_titles": 3,
-            "bwf_super_series_titles": 18,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 22500,
-            "total_serves": 11200,
-            "total_volleys": 12200,
-            "total_smashes": 9700,
-            "total_dropshots": 6900,
-            "total_defensive_blocks": 4900,
-            "total_offensive_blocks": 3900,
-            "serve_accuracy_percent": 88.0,
-            "return_accuracy_percent": 91.0,
-            "smash_success_rate": 93.0,
-            "dropshot_success_rate": 88.0,
-            "volleys_success_rate": 90.0,
-            "overall_efficiency": 94.0,
-            "offensive_efficiency": 97.0,
-            "defensive_efficiency": 92.0,
-            "reaction_time_ms": 230,
-            "serve_receive_efficiency": 91.0,
-            "career_earnings_million_usd": 7.4,
-            "total_trophies_won": 82,
-            "best_player_awards": 19,
-            "mvp_awards": 17,
-            "most_improved_player_awards": 5,
-            "sportsmanship_awards": 10,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 99.5,
-        },
-        # 9) Mima Ito (Japan, Female)
-        {
-            "player_name": "Mima Ito",
-            "country": "Japan",
-            "handedness": "Right",
-            "playing_style": "Offensive",
-            "years_active": 10,  # 2013-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 15,
-            "international_matches_played": 400,
-            "international_matches_won": 380,
-            "international_matches_lost": 20,
-            "international_titles_won": 34,
-            "international_title_percentage": 85.0,  # 34/40
-            "olympic_medals": 3,  # 1 Gold, 1 Silver, 1 Bronze
-            "world_championship_titles": 4,
-            "world_cup_titles": 3,
-            "asian_games_medals": 4,
-            "bwf_world_series_titles": 17,
-            "bwf_grand_slam_titles": 14,
-            "bwf_olympic_titles": 3,
-            "bwf_super_series_titles": 19,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 21500,
-            "total_serves": 10800,
-            "total_volleys": 11800,
-            "total_smashes": 9300,
-            "total_dropshots": 6800,
-            "total_defensive_blocks": 4700,
-            "total_offensive_blocks": 3700,
-            "serve_accuracy_percent": 89.0,
-            "return_accuracy_percent": 92.0,
-            "smash_success_rate": 94.0,
-            "dropshot_success_rate": 89.0,
-            "volleys_success_rate": 91.0,
-            "overall_efficiency": 95.0,
-            "offensive_efficiency": 98.0,
-            "defensive_efficiency": 93.0,
-            "reaction_time_ms": 225,
-            "serve_receive_efficiency": 92.0,
-            "career_earnings_million_usd": 7.6,
-            "total_trophies_won": 80,
-            "best_player_awards": 19,
-            "mvp_awards": 17,
-            "most_improved_player_awards": 5,
-            "sportsmanship_awards": 10,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 100.0,
-        },
-        # 10) Feng Tianwei (Duplicate Removed)
-        # 10) Zhu Yuling (China, Female)
-        {
-            "player_name": "Zhu Yuling",
-            "country": "China",
-            "handedness": "Right",
-            "playing_style": "All-round",
-            "years_active": 11,  # 2010-2021
-            "highest_world_ranking": 1,
-            "world_ranking_history": 16,
-            "international_matches_played": 420,
-            "international_matches_won": 400,
-            "international_matches_lost": 20,
-            "international_titles_won": 38,
-            "international_title_percentage": 90.5,  # 38/42
-            "olympic_medals": 3,  # 1 Gold, 2 Silver
-            "world_championship_titles": 5,
-            "world_cup_titles": 4,
-            "asian_games_medals": 5,
-            "bwf_world_series_titles": 19,
-            "bwf_grand_slam_titles": 15,
-            "bwf_olympic_titles": 4,
-            "bwf_super_series_titles": 19,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 4,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 23500,
-            "total_serves": 11200,
-            "total_volleys": 12200,
-            "total_smashes": 9800,
-            "total_dropshots": 6900,
-            "total_defensive_blocks": 4900,
-            "total_offensive_blocks": 3900,
-            "serve_accuracy_percent": 90.0,
-            "return_accuracy_percent": 93.0,
-            "smash_success_rate": 95.0,
-            "dropshot_success_rate": 90.0,
-            "volleys_success_rate": 92.0,
-            "overall_efficiency": 96.0,
-            "offensive_efficiency": 99.0,
-            "defensive_efficiency": 94.0,
-            "reaction_time_ms": 220,
-            "serve_receive_efficiency": 93.0,
-            "career_earnings_million_usd": 8.0,
-            "total_trophies_won": 85,
-            "best_player_awards": 20,
-            "mvp_awards": 18,
-            "most_improved_player_awards": 6,
-            "sportsmanship_awards": 11,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 100.0,
-        },
-        # 11) Chen Meng (China, Female)
-        {
-            "player_name": "Chen Meng",
-            "country": "China",
-            "handedness": "Right",
-            "playing_style": "Offensive",
-            "years_active": 10,  # 2013-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 17,
-            "international_matches_played": 400,
-            "international_matches_won": 380,
-            "international_matches_lost": 20,
-            "international_titles_won": 35,
-            "international_title_percentage": 87.5,  # 35/40
-            "olympic_medals": 3,  # 1 Gold, 1 Silver, 1 Bronze
-            "world_championship_titles": 4,
-            "world_cup_titles": 3,
-            "asian_games_medals": 4,
-            "bwf_world_series_titles": 18,
-            "bwf_grand_slam_titles": 15,
-            "bwf_olympic_titles": 3,
-            "bwf_super_series_titles": 19,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 23000,
-            "total_serves": 11000,
-            "total_volleys": 12000,
-            "total_smashes": 9600,
-            "total_dropshots": 7000,
-            "total_defensive_blocks": 5000,
-            "total_offensive_blocks": 4000,
-            "serve_accuracy_percent": 89.0,
-            "return_accuracy_percent": 92.0,
-            "smash_success_rate": 94.0,
-            "dropshot_success_rate": 89.0,
-            "volleys_success_rate": 91.0,
-            "overall_efficiency": 95.0,
-            "offensive_efficiency": 98.0,
-            "defensive_efficiency": 93.0,
-            "reaction_time_ms": 225,
-            "serve_receive_efficiency": 92.0,
-            "career_earnings_million_usd": 7.9,
-            "total_trophies_won": 80,
-            "best_player_awards": 19,
-            "mvp_awards": 17,
-            "most_improved_player_awards": 5,
-            "sportsmanship_awards": 10,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 99.5,
-        },
-        # 12) Sun Yingsha (China, Female)
-        {
-            "player_name": "Sun Yingsha",
-            "country": "China",
-            "handedness": "Left",
-            "playing_style": "Offensive",
-            "years_active": 8,  # 2015-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 14,
-            "international_matches_played": 350,
-            "international_matches_won": 330,
-            "international_matches_lost": 20,
-            "international_titles_won": 30,
-            "international_title_percentage": 85.7,  # 30/35
-            "olympic_medals": 2,  # 1 Gold, 1 Silver
-            "world_championship_titles": 3,
-            "world_cup_titles": 3,
-            "asian_games_medals": 3,
-            "bwf_world_series_titles": 16,
-            "bwf_grand_slam_titles": 14,
-            "bwf_olympic_titles": 3,
-            "bwf_super_series_titles": 20,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 21000,
-            "total_serves": 10500,
-            "total_volleys": 11500,
-            "total_smashes": 9200,
-            "total_dropshots": 6800,
-            "total_defensive_blocks": 4800,
-            "total_offensive_blocks": 3900,
-            "serve_accuracy_percent": 90.0,
-            "return_accuracy_percent": 93.0,
-            "smash_success_rate": 95.0,
-            "dropshot_success_rate": 90.0,
-            "volleys_success_rate": 92.0,
-            "overall_efficiency": 95.0,
-            "offensive_efficiency": 98.0,
-            "defensive_efficiency": 93.0,
-            "reaction_time_ms": 220,
-            "serve_receive_efficiency": 93.0,
-            "career_earnings_million_usd": 7.7,
-            "total_trophies_won": 80,
-            "best_player_awards": 19,
-            "mvp_awards": 17,
-            "most_improved_player_awards": 5,
-            "sportsmanship_awards": 10,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 100.0,
-        },
-        # 13) Feng Tianwei (Duplicate Removed)
-        # 13) Wang Manyu (China, Female)
-        {
-            "player_name": "Wang Manyu",
-            "country": "China",
-            "handedness": "Right",
-            "playing_style": "All-round",
-            "years_active": 9,  # 2014-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 15,
-            "international_matches_played": 360,
-            "international_matches_won": 340,
-            "international_matches_lost": 20,
-            "international_titles_won": 32,
-            "international_title_percentage": 88.9,  # 32/36
-            "olympic_medals": 3,  # 1 Gold, 1 Silver, 1 Bronze
-            "world_championship_titles": 4,
-            "world_cup_titles": 3,
-            "asian_games_medals": 4,
-            "bwf_world_series_titles": 17,
-            "bwf_grand_slam_titles": 14,
-            "bwf_olympic_titles": 3,
-            "bwf_super_series_titles": 19,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 22000,
-            "total_serves": 10800,
-            "total_volleys": 11800,
-            "total_smashes": 9400,
-            "total_dropshots": 7000,
-            "total_defensive_blocks": 4900,
-            "total_offensive_blocks": 3900,
-            "serve_accuracy_percent": 90.0,
-            "return_accuracy_percent": 93.0,
-            "smash_success_rate": 95.0,
-            "dropshot_success_rate": 90.0,
-            "volleys_success_rate": 92.0,
-            "overall_efficiency": 95.0,
-            "offensive_efficiency": 98.0,
-            "defensive_efficiency": 93.0,
-            "reaction_time_ms": 220,
-            "serve_receive_efficiency": 93.0,
-            "career_earnings_million_usd": 7.5,
-            "total_trophies_won": 80,
-            "best_player_awards": 19,
-            "mvp_awards": 17,
-            "most_improved_player_awards": 5,
-            "sportsmanship_awards": 10,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 100.0,
-        },
-        # 14) Simulated Player A (Country, Female)
-        {
-            "player_name": "Simulated Player A",
-            "country": "Country A",
-            "handedness": "Left",
-            "playing_style": "Defensive",
-            "years_active": 10,  # 2013-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 14,
-            "international_matches_played": 380,
-            "international_matches_won": 360,
-            "international_matches_lost": 20,
-            "international_titles_won": 34,
-            "international_title_percentage": 89.5,  # 34/38
-            "olympic_medals": 2,  # 1 Gold, 1 Silver
-            "world_championship_titles": 4,
-            "world_cup_titles": 3,
-            "asian_games_medals": 4,
-            "bwf_world_series_titles": 18,
-            "bwf_grand_slam_titles": 15,
-            "bwf_olympic_titles": 3,
-            "bwf_super_series_titles": 19,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 22500,
-            "total_serves": 11200,
-            "total_volleys": 12200,
-            "total_smashes": 9600,
-            "total_dropshots": 7000,
-            "total_defensive_blocks": 5000,
-            "total_offensive_blocks": 4000,
-            "serve_accuracy_percent": 90.0,
-            "return_accuracy_percent": 93.0,
-            "smash_success_rate": 95.0,
-            "dropshot_success_rate": 90.0,
-            "volleys_success_rate": 92.0,
-            "overall_efficiency": 95.0,
-            "offensive_efficiency": 98.0,
-            "defensive_efficiency": 93.0,
-            "reaction_time_ms": 220,
-            "serve_receive_efficiency": 93.0,
-            "career_earnings_million_usd": 7.5,
-            "total_trophies_won": 80,
-            "best_player_awards": 19,
-            "mvp_awards": 17,
-            "most_improved_player_awards": 5,
-            "sportsmanship_awards": 10,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 100.0,
-        },
-        # 15) Simulated Player B (Country, Female)
-        {
-            "player_name": "Simulated Player B",
-            "country": "Country B",
-            "handedness": "Right",
-            "playing_style": "Offensive",
-            "years_active": 9,  # 2014-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 13,
-            "international_matches_played": 360,
-            "international_matches_won": 340,
-            "international_matches_lost": 20,
-            "international_titles_won": 32,
-            "international_title_percentage": 88.9,  # 32/36
-            "olympic_medals": 2,  # 1 Gold, 1 Silver
-            "world_championship_titles": 4,
-            "world_cup_titles": 3,
-            "asian_games_medals": 4,
-            "bwf_world_series_titles": 17,
-            "bwf_grand_slam_titles": 14,
-            "bwf_olympic_titles": 3,
-            "bwf_super_series_titles": 19,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 22000,
-            "total_serves": 11000,
-            "total_volleys": 12000,
-            "total_smashes": 9500,
-            "total_dropshots": 7000,
-            "total_defensive_blocks": 5000,
-            "total_offensive_blocks": 4000,
-            "serve_accuracy_percent": 90.0,
-            "return_accuracy_percent": 93.0,
-            "smash_success_rate": 95.0,
-            "dropshot_success_rate": 90.0,
-            "volleys_success_rate": 92.0,
-            "overall_efficiency": 95.0,
-            "offensive_efficiency": 98.0,
-            "defensive_efficiency": 93.0,
-            "reaction_time_ms": 220,
-            "serve_receive_efficiency": 93.0,
-            "career_earnings_million_usd": 7.5,
-            "total_trophies_won": 80,
-            "best_player_awards": 19,
-            "mvp_awards": 17,
-            "most_improved_player_awards": 5,
-            "sportsmanship_awards": 10,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 100.0,
-        },
-        # 16) Simulated Player C (Country, Female)
-        {
-            "player_name": "Simulated Player C",
-            "country": "Country C",
-            "handedness": "Left",
-            "playing_style": "Defensive",
-            "years_active": 8,  # 2015-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 12,
-            "international_matches_played": 340,
-            "international_matches_won": 320,
-            "international_matches_lost": 20,
-            "international_titles_won": 28,
-            "international_title_percentage": 87.5,  # 28/32
-            "olympic_medals": 2,  # 1 Gold, 1 Silver
-            "world_championship_titles": 3,
-            "world_cup_titles": 3,
-            "asian_games_medals": 3,
-            "bwf_world_series_titles": 16,
-            "bwf_grand_slam_titles": 14,
-            "bwf_olympic_titles": 3,
-            "bwf_super_series_titles": 19,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 3,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 21500,
-            "total_serves": 10700,
-            "total_volleys": 11700,
-            "total_smashes": 9400,
-            "total_dropshots": 7000,
-            "total_defensive_blocks": 5000,
-            "total_offensive_blocks": 4000,
-            "serve_accuracy_percent": 90.0,
-            "return_accuracy_percent": 93.0,
-            "smash_success_rate": 95.0,
-            "dropshot_success_rate": 90.0,
-            "volleys_success_rate": 92.0,
-            "overall_efficiency": 95.0,
-            "offensive_efficiency": 98.0,
-            "defensive_efficiency": 93.0,
-            "reaction_time_ms": 220,
-            "serve_receive_efficiency": 93.0,
-            "career_earnings_million_usd": 7.5,
-            "total_trophies_won": 80,
-            "best_player_awards": 19,
-            "mvp_awards": 17,
-            "most_improved_player_awards": 5,
-            "sportsmanship_awards": 10,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 100.0,
-        },
-        # 17) Simulated Player D (Country, Female)
-        {
-            "player_name": "Simulated Player D",
-            "country": "Country D",
-            "handedness": "Right",
-            "playing_style": "Offensive",
-            "years_active": 7,  # 2016-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 11,
-            "international_matches_played": 320,
-            "international_matches_won": 300,
-            "international_matches_lost": 20,
-            "international_titles_won": 25,
-            "international_title_percentage": 83.3,  # 25/30
-            "olympic_medals": 1,  # 1 Silver
-            "world_championship_titles": 3,
-            "world_cup_titles": 2,
-            "asian_games_medals": 3,
-            "bwf_world_series_titles": 15,
-            "bwf_grand_slam_titles": 13,
-            "bwf_olympic_titles": 2,
-            "bwf_super_series_titles": 18,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 2,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 21000,
-            "total_serves": 10500,
-            "total_volleys": 11500,
-            "total_smashes": 9300,
-            "total_dropshots": 7000,
-            "total_defensive_blocks": 5000,
-            "total_offensive_blocks": 4000,
-            "serve_accuracy_percent": 90.0,
-            "return_accuracy_percent": 93.0,
-            "smash_success_rate": 95.0,
-            "dropshot_success_rate": 90.0,
-            "volleys_success_rate": 92.0,
-            "overall_efficiency": 95.0,
-            "offensive_efficiency": 98.0,
-            "defensive_efficiency": 93.0,
-            "reaction_time_ms": 220,
-            "serve_receive_efficiency": 93.0,
-            "career_earnings_million_usd": 7.5,
-            "total_trophies_won": 80,
-            "best_player_awards": 19,
-            "mvp_awards": 17,
-            "most_improved_player_awards": 5,
-            "sportsmanship_awards": 10,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 100.0,
-        },
-        # 18) Simulated Player E (Country, Female)
-        {
-            "player_name": "Simulated Player E",
-            "country": "Country E",
-            "handedness": "Left",
-            "playing_style": "Defensive",
-            "years_active": 6,  # 2017-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 10,
-            "international_matches_played": 300,
-            "international_matches_won": 280,
-            "international_matches_lost": 20,
-            "international_titles_won": 22,
-            "international_title_percentage": 73.3,  # 22/30
-            "olympic_medals": 1,  # 1 Bronze
-            "world_championship_titles": 2,
-            "world_cup_titles": 2,
-            "asian_games_medals": 2,
-            "bwf_world_series_titles": 14,
-            "bwf_grand_slam_titles": 12,
-            "bwf_olympic_titles": 2,
-            "bwf_super_series_titles": 17,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 2,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 20500,
-            "total_serves": 10200,
-            "total_volleys": 11200,
-            "total_smashes": 9200,
-            "total_dropshots": 6900,
-            "total_defensive_blocks": 5000,
-            "total_offensive_blocks": 4000,
-            "serve_accuracy_percent": 90.0,
-            "return_accuracy_percent": 93.0,
-            "smash_success_rate": 95.0,
-            "dropshot_success_rate": 90.0,
-            "volleys_success_rate": 92.0,
-            "overall_efficiency": 95.0,
-            "offensive_efficiency": 98.0,
-            "defensive_efficiency": 93.0,
-            "reaction_time_ms": 220,
-            "serve_receive_efficiency": 93.0,
-            "career_earnings_million_usd": 7.5,
-            "total_trophies_won": 80,
-            "best_player_awards": 19,
-            "mvp_awards": 17,
-            "most_improved_player_awards": 5,
-            "sportsmanship_awards": 10,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 100.0,
-        },
-        # 19) Simulated Player F (Country, Female)
-        {
-            "player_name": "Simulated Player F",
-            "country": "Country F",
-            "handedness": "Right",
-            "playing_style": "Offensive",
-            "years_active": 5,  # 2018-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 9,
-            "international_matches_played": 280,
-            "international_matches_won": 260,
-            "international_matches_lost": 20,
-            "international_titles_won": 20,
-            "international_title_percentage": 71.4,  # 20/28
-            "olympic_medals": 1,  # 1 Silver
-            "world_championship_titles": 2,
-            "world_cup_titles": 2,
-            "asian_games_medals": 2,
-            "bwf_world_series_titles": 13,
-            "bwf_grand_slam_titles": 11,
-            "bwf_olympic_titles": 2,
-            "bwf_super_series_titles": 16,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 2,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 20000,
-            "total_serves": 10000,
-            "total_volleys": 11000,
-            "total_smashes": 9000,
-            "total_dropshots": 6500,
-            "total_defensive_blocks": 4800,
-            "total_offensive_blocks": 3900,
-            "serve_accuracy_percent": 90.0,
-            "return_accuracy_percent": 93.0,
-            "smash_success_rate": 95.0,
-            "dropshot_success_rate": 90.0,
-            "volleys_success_rate": 92.0,
-            "overall_efficiency": 95.0,
-            "offensive_efficiency": 98.0,
-            "defensive_efficiency": 93.0,
-            "reaction_time_ms": 220,
-            "serve_receive_efficiency": 93.0,
-            "career_earnings_million_usd": 7.5,
-            "total_trophies_won": 80,
-            "best_player_awards": 19,
-            "mvp_awards": 17,
-            "most_improved_player_awards": 5,
-            "sportsmanship_awards": 10,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 100.0,
-        },
-        # 20) Simulated Player G (Country, Female)
-        {
-            "player_name": "Simulated Player G",
-            "country": "Country G",
-            "handedness": "Left",
-            "playing_style": "Defensive",
-            "years_active": 4,  # 2019-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 8,
-            "international_matches_played": 260,
-            "international_matches_won": 240,
-            "international_matches_lost": 20,
-            "international_titles_won": 18,
-            "international_title_percentage": 75.0,  # 18/24
-            "olympic_medals": 1,  # 1 Bronze
-            "world_championship_titles": 2,
-            "world_cup_titles": 2,
-            "asian_games_medals": 2,
-            "bwf_world_series_titles": 12,
-            "bwf_grand_slam_titles": 10,
-            "bwf_olympic_titles": 2,
-            "bwf_super_series_titles": 15,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 2,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 19500,
-            "total_serves": 9750,
-            "total_volleys": 10750,
-            "total_smashes": 8800,
-            "total_dropshots": 6300,
-            "total_defensive_blocks": 4700,
-            "total_offensive_blocks": 3800,
-            "serve_accuracy_percent": 90.0,
-            "return_accuracy_percent": 93.0,
-            "smash_success_rate": 95.0,
-            "dropshot_success_rate": 90.0,
-            "volleys_success_rate": 92.0,
-            "overall_efficiency": 95.0,
-            "offensive_efficiency": 98.0,
-            "defensive_efficiency": 93.0,
-            "reaction_time_ms": 220,
-            "serve_receive_efficiency": 93.0,
-            "career_earnings_million_usd": 7.5,
-            "total_trophies_won": 80,
-            "best_player_awards": 19,
-            "mvp_awards": 17,
-            "most_improved_player_awards": 5,
-            "sportsmanship_awards": 10,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 100.0,
-        },
-        # 21) Simulated Player H (Country, Female)
-        {
-            "player_name": "Simulated Player H",
-            "country": "Country H",
-            "handedness": "Right",
-            "playing_style": "Offensive",
-            "years_active": 3,  # 2020-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 7,
-            "international_matches_played": 240,
-            "international_matches_won": 220,
-            "international_matches_lost": 20,
-            "international_titles_won": 16,
-            "international_title_percentage": 80.0,  # 16/20
-            "olympic_medals": 1,  # 1 Silver
-            "world_championship_titles": 1,
-            "world_cup_titles": 1,
-            "asian_games_medals": 1,
-            "bwf_world_series_titles": 11,
-            "bwf_grand_slam_titles": 9,
-            "bwf_olympic_titles": 2,
-            "bwf_super_series_titles": 14,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 1,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 19000,
-            "total_serves": 9500,
-            "total_volleys": 11000,
-            "total_smashes": 8600,
-            "total_dropshots": 6200,
-            "total_defensive_blocks": 4600,
-            "total_offensive_blocks": 3700,
-            "serve_accuracy_percent": 90.0,
-            "return_accuracy_percent": 93.0,
-            "smash_success_rate": 95.0,
-            "dropshot_success_rate": 90.0,
-            "volleys_success_rate": 92.0,
-            "overall_efficiency": 95.0,
-            "offensive_efficiency": 98.0,
-            "defensive_efficiency": 93.0,
-            "reaction_time_ms": 220,
-            "serve_receive_efficiency": 93.0,
-            "career_earnings_million_usd": 7.5,
-            "total_trophies_won": 80,
-            "best_player_awards": 19,
-            "mvp_awards": 17,
-            "most_improved_player_awards": 5,
-            "sportsmanship_awards": 10,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 100.0,
-        },
-        # 22) Simulated Player I (Country, Female)
-        {
-            "player_name": "Simulated Player I",
-            "country": "Country I",
-            "handedness": "Left",
-            "playing_style": "Defensive",
-            "years_active": 2,  # 2021-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 6,
-            "international_matches_played": 220,
-            "international_matches_won": 200,
-            "international_matches_lost": 20,
-            "international_titles_won": 14,
-            "international_title_percentage": 70.0,  # 14/20
-            "olympic_medals": 1,  # 1 Bronze
-            "world_championship_titles": 1,
-            "world_cup_titles": 1,
-            "asian_games_medals": 1,
-            "bwf_world_series_titles": 10,
-            "bwf_grand_slam_titles": 8,
-            "bwf_olympic_titles": 2,
-            "bwf_super_series_titles": 13,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 1,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 18500,
-            "total_serves": 9250,
-            "total_volleys": 10750,
-            "total_smashes": 8400,
-            "total_dropshots": 6100,
-            "total_defensive_blocks": 4500,
-            "total_offensive_blocks": 3500,
-            "serve_accuracy_percent": 90.0,
-            "return_accuracy_percent": 93.0,
-            "smash_success_rate": 95.0,
-            "dropshot_success_rate": 90.0,
-            "volleys_success_rate": 92.0,
-            "overall_efficiency": 95.0,
-            "offensive_efficiency": 98.0,
-            "defensive_efficiency": 93.0,
-            "reaction_time_ms": 220,
-            "serve_receive_efficiency": 93.0,
-            "career_earnings_million_usd": 7.5,
-            "total_trophies_won": 80,
-            "best_player_awards": 19,
-            "mvp_awards": 17,
-            "most_improved_player_awards": 5,
-            "sportsmanship_awards": 10,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 100.0,
-        },
-        # 23) Simulated Player J (Country, Female)
-        {
-            "player_name": "Simulated Player J",
-            "country": "Country J",
-            "handedness": "Right",
-            "playing_style": "Offensive",
-            "years_active": 1,  # 2022-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 5,
-            "international_matches_played": 200,
-            "international_matches_won": 180,
-            "international_matches_lost": 20,
-            "international_titles_won": 12,
-            "international_title_percentage": 60.0,  # 12/20
-            "olympic_medals": 1,  # 1 Silver
-            "world_championship_titles": 1,
-            "world_cup_titles": 1,
-            "asian_games_medals": 1,
-            "bwf_world_series_titles": 9,
-            "bwf_grand_slam_titles": 7,
-            "bwf_olympic_titles": 2,
-            "bwf_super_series_titles": 12,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 1,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 18000,
-            "total_serves": 9000,
-            "total_volleys": 10500,
-            "total_smashes": 8300,
-            "total_dropshots": 6000,
-            "total_defensive_blocks": 4400,
-            "total_offensive_blocks": 3400,
-            "serve_accuracy_percent": 90.0,
-            "return_accuracy_percent": 93.0,
-            "smash_success_rate": 95.0,
-            "dropshot_success_rate": 90.0,
-            "volleys_success_rate": 92.0,
-            "overall_efficiency": 95.0,
-            "offensive_efficiency": 98.0,
-            "defensive_efficiency": 93.0,
-            "reaction_time_ms": 220,
-            "serve_receive_efficiency": 93.0,
-            "career_earnings_million_usd": 7.5,
-            "total_trophies_won": 80,
-            "best_player_awards": 19,
-            "mvp_awards": 17,
-            "most_improved_player_awards": 5,
-            "sportsmanship_awards": 10,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 100.0,
-        },
-        # 24) Simulated Player K (Country, Female)
-        {
-            "player_name": "Simulated Player K",
-            "country": "Country K",
-            "handedness": "Left",
-            "playing_style": "Defensive",
-            "years_active": 1,  # 2023-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 4,
-            "international_matches_played": 180,
-            "international_matches_won": 160,
-            "international_matches_lost": 20,
-            "international_titles_won": 10,
-            "international_title_percentage": 55.6,  # 10/18
-            "olympic_medals": 1,  # 1 Bronze
-            "world_championship_titles": 1,
-            "world_cup_titles": 1,
-            "asian_games_medals": 1,
-            "bwf_world_series_titles": 8,
-            "bwf_grand_slam_titles": 6,
-            "bwf_olympic_titles": 2,
-            "bwf_super_series_titles": 11,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 1,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 17500,
-            "total_serves": 8750,
-            "total_volleys": 10250,
-            "total_smashes": 8100,
-            "total_dropshots": 5800,
-            "total_defensive_blocks": 4300,
-            "total_offensive_blocks": 3300,
-            "serve_accuracy_percent": 90.0,
-            "return_accuracy_percent": 93.0,
-            "smash_success_rate": 95.0,
-            "dropshot_success_rate": 90.0,
-            "volleys_success_rate": 92.0,
-            "overall_efficiency": 95.0,
-            "offensive_efficiency": 98.0,
-            "defensive_efficiency": 93.0,
-            "reaction_time_ms": 220,
-            "serve_receive_efficiency": 93.0,
-            "career_earnings_million_usd": 7.5,
-            "total_trophies_won": 80,
-            "best_player_awards": 19,
-            "mvp_awards": 17,
-            "most_improved_player_awards": 5,
-            "sportsmanship_awards": 10,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 100.0,
-        },
-        # 25) Simulated Player L (Country, Female)
-        {
-            "player_name": "Simulated Player L",
-            "country": "Country L",
-            "handedness": "Right",
-            "playing_style": "Offensive",
-            "years_active": 1,  # 2023-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 3,
-            "international_matches_played": 160,
-            "international_matches_won": 140,
-            "international_matches_lost": 20,
-            "international_titles_won": 8,
-            "international_title_percentage": 50.0,  # 8/16
-            "olympic_medals": 1,  # 1 Silver
-            "world_championship_titles": 1,
-            "world_cup_titles": 1,
-            "asian_games_medals": 1,
-            "bwf_world_series_titles": 7,
-            "bwf_grand_slam_titles": 5,
-            "bwf_olympic_titles": 2,
-            "bwf_super_series_titles": 10,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 1,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 17000,
-            "total_serves": 8500,
-            "total_volleys": 10000,
-            "total_smashes": 8000,
-            "total_dropshots": 5600,
-            "total_defensive_blocks": 4200,
-            "total_offensive_blocks": 3200,
-            "serve_accuracy_percent": 90.0,
-            "return_accuracy_percent": 93.0,
-            "smash_success_rate": 95.0,
-            "dropshot_success_rate": 90.0,
-            "volleys_success_rate": 92.0,
-            "overall_efficiency": 95.0,
-            "offensive_efficiency": 98.0,
-            "defensive_efficiency": 93.0,
-            "reaction_time_ms": 220,
-            "serve_receive_efficiency": 93.0,
-            "career_earnings_million_usd": 7.5,
-            "total_trophies_won": 80,
-            "best_player_awards": 19,
-            "mvp_awards": 17,
-            "most_improved_player_awards": 5,
-            "sportsmanship_awards": 10,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 100.0,
-        },
-        # 26) Simulated Player M (Country, Female)
-        {
-            "player_name": "Simulated Player M",
-            "country": "Country M",
-            "handedness": "Left",
-            "playing_style": "Defensive",
-            "years_active": 1,  # 2023-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 2,
-            "international_matches_played": 140,
-            "international_matches_won": 120,
-            "international_matches_lost": 20,
-            "international_titles_won": 6,
-            "international_title_percentage": 42.9,  # 6/14
-            "olympic_medals": 1,  # 1 Bronze
-            "world_championship_titles": 1,
-            "world_cup_titles": 1,
-            "asian_games_medals": 1,
-            "bwf_world_series_titles": 6,
-            "bwf_grand_slam_titles": 4,
-            "bwf_olympic_titles": 2,
-            "bwf_super_series_titles": 9,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 1,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 16000,
-            "total_serves": 8000,
-            "total_volleys": 9500,
-            "total_smashes": 7800,
-            "total_dropshots": 5500,
-            "total_defensive_blocks": 4000,
-            "total_offensive_blocks": 3000,
-            "serve_accuracy_percent": 90.0,
-            "return_accuracy_percent": 93.0,
-            "smash_success_rate": 95.0,
-            "dropshot_success_rate": 90.0,
-            "volleys_success_rate": 92.0,
-            "overall_efficiency": 95.0,
-            "offensive_efficiency": 98.0,
-            "defensive_efficiency": 93.0,
-            "reaction_time_ms": 220,
-            "serve_receive_efficiency": 93.0,
-            "career_earnings_million_usd": 7.5,
-            "total_trophies_won": 80,
-            "best_player_awards": 19,
-            "mvp_awards": 17,
-            "most_improved_player_awards": 5,
-            "sportsmanship_awards": 10,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 100.0,
-        },
-        # 27) Simulated Player N (Country, Female)
-        {
-            "player_name": "Simulated Player N",
-            "country": "Country N",
-            "handedness": "Right",
-            "playing_style": "Offensive",
-            "years_active": 1,  # 2023-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 1,
-            "international_matches_played": 120,
-            "international_matches_won": 100,
-            "international_matches_lost": 20,
-            "international_titles_won": 4,
-            "international_title_percentage": 33.3,  # 4/12
-            "olympic_medals": 1,  # 1 Silver
-            "world_championship_titles": 1,
-            "world_cup_titles": 1,
-            "asian_games_medals": 1,
-            "bwf_world_series_titles": 5,
-            "bwf_grand_slam_titles": 3,
-            "bwf_olympic_titles": 2,
-            "bwf_super_series_titles": 8,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 1,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 15500,
-            "total_serves": 7750,
-            "total_volleys": 9250,
-            "total_smashes": 7700,
-            "total_dropshots": 5200,
-            "total_defensive_blocks": 3900,
-            "total_offensive_blocks": 2900,
-            "serve_accuracy_percent": 90.0,
-            "return_accuracy_percent": 93.0,
-            "smash_success_rate": 95.0,
-            "dropshot_success_rate": 90.0,
-            "volleys_success_rate": 92.0,
-            "overall_efficiency": 95.0,
-            "offensive_efficiency": 98.0,
-            "defensive_efficiency": 93.0,
-            "reaction_time_ms": 220,
-            "serve_receive_efficiency": 93.0,
-            "career_earnings_million_usd": 7.5,
-            "total_trophies_won": 80,
-            "best_player_awards": 19,
-            "mvp_awards": 17,
-            "most_improved_player_awards": 5,
-            "sportsmanship_awards": 10,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 100.0,
-        },
-        # 28) Simulated Player O (Country, Female)
-        {
-            "player_name": "Simulated Player O",
-            "country": "Country O",
-            "handedness": "Left",
-            "playing_style": "Defensive",
-            "years_active": 1,  # 2023-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 0,
-            "international_matches_played": 100,
-            "international_matches_won": 80,
-            "international_matches_lost": 20,
-            "international_titles_won": 2,
-            "international_title_percentage": 20.0,  # 2/10
-            "olympic_medals": 0,  # No medals
-            "world_championship_titles": 0,
-            "world_cup_titles": 0,
-            "asian_games_medals": 0,
-            "bwf_world_series_titles": 3,
-            "bwf_grand_slam_titles": 1,
-            "bwf_olympic_titles": 0,
-            "bwf_super_series_titles": 5,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 0,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 15000,
-            "total_serves": 7500,
-            "total_volleys": 9000,
-            "total_smashes": 7600,
-            "total_dropshots": 5000,
-            "total_defensive_blocks": 3800,
-            "total_offensive_blocks": 2800,
-            "serve_accuracy_percent": 90.0,
-            "return_accuracy_percent": 93.0,
-            "smash_success_rate": 95.0,
-            "dropshot_success_rate": 90.0,
-            "volleys_success_rate": 92.0,
-            "overall_efficiency": 95.0,
-            "offensive_efficiency": 98.0,
-            "defensive_efficiency": 93.0,
-            "reaction_time_ms": 220,
-            "serve_receive_efficiency": 93.0,
-            "career_earnings_million_usd": 7.5,
-            "total_trophies_won": 80,
-            "best_player_awards": 19,
-            "mvp_awards": 17,
-            "most_improved_player_awards": 5,
-            "sportsmanship_awards": 10,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 100.0,
-        },
-        # 29) Simulated Player P (Country, Female)
-        {
-            "player_name": "Simulated Player P",
-            "country": "Country P",
-            "handedness": "Right",
-            "playing_style": "Offensive",
-            "years_active": 1,  # 2023-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 0,
-            "international_matches_played": 80,
-            "international_matches_won": 60,
-            "international_matches_lost": 20,
-            "international_titles_won": 1,
-            "international_title_percentage": 12.5,  # 1/8
-            "olympic_medals": 0,  # No medals
-            "world_championship_titles": 0,
-            "world_cup_titles": 0,
-            "asian_games_medals": 0,
-            "bwf_world_series_titles": 2,
-            "bwf_grand_slam_titles": 1,
-            "bwf_olympic_titles": 0,
-            "bwf_super_series_titles": 4,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 0,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 14000,
-            "total_serves": 7000,
-            "total_volleys": 8500,
-            "total_smashes": 7400,
-            "total_dropshots": 4800,
-            "total_defensive_blocks": 3600,
-            "total_offensive_blocks": 2600,
-            "serve_accuracy_percent": 90.0,
-            "return_accuracy_percent": 93.0,
-            "smash_success_rate": 95.0,
-            "dropshot_success_rate": 90.0,
-            "volleys_success_rate": 92.0,
-            "overall_efficiency": 95.0,
-            "offensive_efficiency": 98.0,
-            "defensive_efficiency": 93.0,
-            "reaction_time_ms": 220,
-            "serve_receive_efficiency": 93.0,
-            "career_earnings_million_usd": 7.5,
-            "total_trophies_won": 80,
-            "best_player_awards": 19,
-            "mvp_awards": 17,
-            "most_improved_player_awards": 5,
-            "sportsmanship_awards": 10,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 100.0,
-        },
-        # 30) Simulated Player Q (Country, Female)
-        {
-            "player_name": "Simulated Player Q",
-            "country": "Country Q",
-            "handedness": "Left",
-            "playing_style": "Defensive",
-            "years_active": 1,  # 2023-2023
-            "highest_world_ranking": 1,
-            "world_ranking_history": 0,
-            "international_matches_played": 60,
-            "international_matches_won": 50,
-            "international_matches_lost": 10,
-            "international_titles_won": 1,
-            "international_title_percentage": 16.7,  # 1/6
-            "olympic_medals": 0,  # No medals
-            "world_championship_titles": 0,
-            "world_cup_titles": 0,
-            "asian_games_medals": 0,
-            "bwf_world_series_titles": 1,
-            "bwf_grand_slam_titles": 1,
-            "bwf_olympic_titles": 0,
-            "bwf_super_series_titles": 3,
-            "bwf_world_superseries_championships": 4,
-            "bwf_world_cup_titles": 0,
-            "bwf_world_series_titles": 0,
-            "total_points_scored": 13000,
-            "total_serves": 6500,
-            "total_volleys": 8000,
-            "total_smashes": 7200,
-            "total_dropshots": 4500,
-            "total_defensive_blocks": 3400,
-            "total_offensive_blocks": 2400,
-            "serve_accuracy_percent": 90.0,
-            "return_accuracy_percent": 93.0,
-            "smash_success_rate": 95.0,
-            "dropshot_success_rate": 90.0,
-            "volleys_success_rate": 92.0,
-            "overall_efficiency": 95.0,
-            "offensive_efficiency": 98.0,
-            "defensive_efficiency": 93.0,
-            "reaction_time_ms": 220,
-            "serve_receive_efficiency": 93.0,
-            "career_earnings_million_usd": 7.5,
-            "total_trophies_won": 80,
-            "best_player_awards": 19,
-            "mvp_awards": 17,
-            "most_improved_player_awards": 5,
-            "sportsmanship_awards": 10,
-            "hall_of_fame_inducted": 1,
-            "coach_achievements": 0,
-            "overall_performance_score": 100.0,
-        },
-    ]
-
-    # Confirm we have exactly 30 players
-    if len(players_data) != 30:
-        raise ValueError(f"Expected 30 women's table tennis players, got {len(players_data)}")
-
-    # ----------------------- WRITE TO CSV -----------------------
-    with open(filename, mode="w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-        for pdata in players_data:
-            # Fill missing fields with 0 if needed
-            for h in headers:
-                if h not in pdata:
-                    pdata[h] = 0
-            writer.writerow(pdata)
 
 if __name__ == "__main__":
     create_womens_table_tennis_dataset()
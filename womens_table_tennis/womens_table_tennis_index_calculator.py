@@ -8,6 +8,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import normalization helpers
 from sports_index_normalizer import normalize_indexes, plot_top_10_indexes
+from sports_storage import read_table, write_table
+from sports_archetypes import add_archetypes
 
 def calc_table_tennis_index(row):
     """
@@ -182,7 +184,7 @@ def calc_table_tennis_index(row):
 
 def main():
     # 1) Load the dataset
-    df = pd.read_csv("womens_table_tennis_dataset.csv")
+    df = read_table("womens_table_tennis_dataset.csv")
 
     # 2) Ensure all necessary columns are present
     required_columns = [
@@ -261,8 +263,11 @@ def main():
     # 6) Normalize the index scores (0–100)
     normalized_df = normalize_indexes(df_sorted, name_col='player_name', index_col='table_tennis_index')
 
+    # Add each athlete's archetype (cluster) and its distance to the centroid
+    normalized_df = add_archetypes(normalized_df, "womens_table_tennis")
+
     # 7) Save the sorted results with normalized scores to a new CSV
-    normalized_df.to_csv("womens_table_tennis_index_scored.csv", index=False)
+    write_table(normalized_df, "womens_table_tennis_index_scored.csv")
 
     # 8) Create a line plot of the top 10
     plot_top_10_indexes(
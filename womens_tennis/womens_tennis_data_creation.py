@@ -1,4 +1,57 @@
-import csv
+import os
+import sys
+
+# Add parent directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sports_player_data import load_players, write_dataset
+
+# One record per player; fields a player does not list are written as 0
+PLAYERS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "womens_tennis_players.json")
+
+# Define the header (player_name + 40 stats = 41 columns)
+HEADERS = [
+    "player_name",
+    "country",
+    "years_active",
+    "career_singles_titles",
+    "career_doubles_titles",
+    "grand_slam_singles_titles",
+    "grand_slam_doubles_titles",
+    "weeks_at_no1",
+    "year_end_no1_finishes",
+    "olympic_gold_medals",
+    "fed_cup_titles",             # analogous to Davis Cup for men
+    "wta_1000_titles",           # premier mandatory / 1000-level
+    "wta_finals_titles",
+    "career_match_wins",
+    "career_match_losses",
+    "career_win_percentage",
+    "aces",
+    "double_faults",
+    "first_serve_percentage",
+    "first_serve_points_won_percentage",
+    "second_serve_points_won_percentage",
+    "break_points_saved_percentage",
+    "service_games_won_percentage",
+    "return_games_won_percentage",
+    "tie_breaks_won_percentage",
+    "hard_court_titles",
+    "clay_court_titles",
+    "grass_court_titles",
+    "indoor_court_titles",
+    "career_prize_money_million_usd",
+    "head_to_head_vs_top10_wins",
+    "best_calendar_year_match_record",
+    "most_consecutive_matches_won",
+    "big_titles_count",           # grand slams + WTA finals + WTA 1000
+    "three_set_match_wins",       # women usually play best-of-3
+    "three_setters_played",       # total 3-set matches
+    "longest_match_hours",
+    "career_retirement_year",     # 0 if still active
+    "hall_of_fame_inducted"       # 1 if inducted, 0 if not
+]
+
 
 def create_womens_tennis_dataset(filename="womens_tennis_dataset.csv"):
     """
@@ -6,848 +59,8 @@ def create_womens_tennis_dataset(filename="womens_tennis_dataset.csv"):
     Stats are approximations, intended for demonstration and for building
     a 'Women's Tennis Index Score' later.
     """
-
-    # Define the header (player_name + 40 stats = 41 columns)
-    headers = [
-        "player_name",
-        "country",
-        "years_active",
-        "career_singles_titles",
-        "career_doubles_titles",
-        "grand_slam_singles_titles",
-        "grand_slam_doubles_titles",
-        "weeks_at_no1",
-        "year_end_no1_finishes",
-        "olympic_gold_medals",
-        "fed_cup_titles",             # analogous to Davis Cup for men
-        "wta_1000_titles",           # premier mandatory / 1000-level
-        "wta_finals_titles",
-        "career_match_wins",
-        "career_match_losses",
-        "career_win_percentage",
-        "aces",
-        "double_faults",
-        "first_serve_percentage",
-        "first_serve_points_won_percentage",
-        "second_serve_points_won_percentage",
-        "break_points_saved_percentage",
-        "service_games_won_percentage",
-        "return_games_won_percentage",
-        "tie_breaks_won_percentage",
-        "hard_court_titles",
-        "clay_court_titles",
-        "grass_court_titles",
-        "indoor_court_titles",
-        "career_prize_money_million_usd",
-        "head_to_head_vs_top10_wins",
-        "best_calendar_year_match_record",
-        "most_consecutive_matches_won",
-        "big_titles_count",           # grand slams + WTA finals + WTA 1000
-        "three_set_match_wins",       # women usually play best-of-3
-        "three_setters_played",       # total 3-set matches
-        "longest_match_hours",
-        "career_retirement_year",     # 0 if still active
-        "hall_of_fame_inducted"       # 1 if inducted, 0 if not
-    ]
-
-    # List of dictionaries, each with 41 fields
-    players_data = [
-        {
-            "player_name": "Serena Williams",
-            "country": "USA",
-            "years_active": 27,
-            "career_singles_titles": 73,
-            "career_doubles_titles": 23,
-            "grand_slam_singles_titles": 23,
-            "grand_slam_doubles_titles": 14,
-            "weeks_at_no1": 319,
-            "year_end_no1_finishes": 5,
-            "olympic_gold_medals": 4,  # 3 in doubles, 1 singles
-            "fed_cup_titles": 1,
-            "wta_1000_titles": 23,  # combined WTA 1000 / Premier Mandatory + 5
-            "wta_finals_titles": 5,
-            "career_match_wins": 855,
-            "career_match_losses": 153,
-            "career_win_percentage": 84.8,
-            "aces": 4000,
-            "double_faults": 1500,
-            "first_serve_percentage": 61.0,
-            "first_serve_points_won_percentage": 74.0,
-            "second_serve_points_won_percentage": 51.0,
-            "break_points_saved_percentage": 63.0,
-            "service_games_won_percentage": 86.0,
-            "return_games_won_percentage": 38.0,
-            "tie_breaks_won_percentage": 57.0,
-            "hard_court_titles": 47,
-            "clay_court_titles": 13,
-            "grass_court_titles": 8,
-            "indoor_court_titles": 5,
-            "career_prize_money_million_usd": 94.6,
-            "head_to_head_vs_top10_wins": 220,
-            "best_calendar_year_match_record": 78,  # e.g. 78-4 in 2013 or 2015
-            "most_consecutive_matches_won": 34,
-            "big_titles_count": 39,  # 23 Slams + 5 WTA Finals + 11 WTA 1000
-            "three_set_match_wins": 130,
-            "three_setters_played": 210,
-            "longest_match_hours": 3.63,
-            "career_retirement_year": 2022,
-            "hall_of_fame_inducted": 0  # not yet
-        },
-        {
-            "player_name": "Steffi Graf",
-            "country": "Germany",
-            "years_active": 17,
-            "career_singles_titles": 107,
-            "career_doubles_titles": 11,
-            "grand_slam_singles_titles": 22,
-            "grand_slam_doubles_titles": 1,
-            "weeks_at_no1": 377,
-            "year_end_no1_finishes": 8,
-            "olympic_gold_medals": 1,  # 1988
-            "fed_cup_titles": 2,
-            "wta_1000_titles": 21,  # pre-terminology, approximate
-            "wta_finals_titles": 5,
-            "career_match_wins": 900,
-            "career_match_losses": 115,
-            "career_win_percentage": 88.7,
-            "aces": 2200,
-            "double_faults": 700,
-            "first_serve_percentage": 64.0,
-            "first_serve_points_won_percentage": 73.0,
-            "second_serve_points_won_percentage": 53.0,
-            "break_points_saved_percentage": 66.0,
-            "service_games_won_percentage": 85.0,
-            "return_games_won_percentage": 42.0,
-            "tie_breaks_won_percentage": 60.0,
-            "hard_court_titles": 35,
-            "clay_court_titles": 30,
-            "grass_court_titles": 17,
-            "indoor_court_titles": 25,
-            "career_prize_money_million_usd": 21.8,
-            "head_to_head_vs_top10_wins": 200,
-            "best_calendar_year_match_record": 86,
-            "most_consecutive_matches_won": 66,
-            "big_titles_count": 28,
-            "three_set_match_wins": 90,
-            "three_setters_played": 140,
-            "longest_match_hours": 3.55,
-            "career_retirement_year": 1999,
-            "hall_of_fame_inducted": 1
-        },
-        {
-            "player_name": "Martina Navratilova",
-            "country": "USA/Czechoslovakia",
-            "years_active": 31,
-            "career_singles_titles": 167,
-            "career_doubles_titles": 177,
-            "grand_slam_singles_titles": 18,
-            "grand_slam_doubles_titles": 31,
-            "weeks_at_no1": 332,
-            "year_end_no1_finishes": 7,
-            "olympic_gold_medals": 0,  
-            "fed_cup_titles": 4,
-            "wta_1000_titles": 24,  
-            "wta_finals_titles": 8,
-            "career_match_wins": 1442,
-            "career_match_losses": 219,
-            "career_win_percentage": 86.8,
-            "aces": 1800,
-            "double_faults": 650,
-            "first_serve_percentage": 68.0,
-            "first_serve_points_won_percentage": 72.0,
-            "second_serve_points_won_percentage": 55.0,
-            "break_points_saved_percentage": 64.0,
-            "service_games_won_percentage": 83.0,
-            "return_games_won_percentage": 40.0,
-            "tie_breaks_won_percentage": 57.0,
-            "hard_court_titles": 50,
-            "clay_court_titles": 35,
-            "grass_court_titles": 25,
-            "indoor_court_titles": 57,
-            "career_prize_money_million_usd": 21.6,
-            "head_to_head_vs_top10_wins": 220,
-            "best_calendar_year_match_record": 86,
-            "most_consecutive_matches_won": 74,
-            "big_titles_count": 30,  # 18 Slams singles + 8 WTA finals + 4 bigger events
-            "three_set_match_wins": 160,
-            "three_setters_played": 230,
-            "longest_match_hours": 3.45,
-            "career_retirement_year": 2006,
-            "hall_of_fame_inducted": 1
-        },
-        {
-            "player_name": "Chris Evert",
-            "country": "USA",
-            "years_active": 17,
-            "career_singles_titles": 157,
-            "career_doubles_titles": 8,
-            "grand_slam_singles_titles": 18,
-            "grand_slam_doubles_titles": 3,
-            "weeks_at_no1": 260,
-            "year_end_no1_finishes": 5,
-            "olympic_gold_medals": 0,
-            "fed_cup_titles": 8,
-            "wta_1000_titles": 25,
-            "wta_finals_titles": 4,
-            "career_match_wins": 1309,
-            "career_match_losses": 146,
-            "career_win_percentage": 90.0,
-            "aces": 1000,
-            "double_faults": 400,
-            "first_serve_percentage": 70.0,
-            "first_serve_points_won_percentage": 68.0,
-            "second_serve_points_won_percentage": 55.0,
-            "break_points_saved_percentage": 65.0,
-            "service_games_won_percentage": 82.0,
-            "return_games_won_percentage": 46.0,
-            "tie_breaks_won_percentage": 0.0,  # tiebreaks introduced 1970
-            "hard_court_titles": 40,
-            "clay_court_titles": 66,
-            "grass_court_titles": 10,
-            "indoor_court_titles": 41,
-            "career_prize_money_million_usd": 8.9,
-            "head_to_head_vs_top10_wins": 180,
-            "best_calendar_year_match_record": 84,
-            "most_consecutive_matches_won": 55,
-            "big_titles_count": 26,
-            "three_set_match_wins": 150,
-            "three_setters_played": 195,
-            "longest_match_hours": 3.3,
-            "career_retirement_year": 1989,
-            "hall_of_fame_inducted": 1
-        },
-        {
-            "player_name": "Margaret Court",
-            "country": "Australia",
-            "years_active": 17,
-            "career_singles_titles": 192,
-            "career_doubles_titles": 48,
-            "grand_slam_singles_titles": 24,
-            "grand_slam_doubles_titles": 19,
-            "weeks_at_no1": 0,
-            "year_end_no1_finishes": 3,   # not fully official
-            "olympic_gold_medals": 0,
-            "fed_cup_titles": 4,
-            "wta_1000_titles": 0,   # pre WTA
-            "wta_finals_titles": 0,
-            "career_match_wins": 1180,
-            "career_match_losses": 150,
-            "career_win_percentage": 88.7,
-            "aces": 800,
-            "double_faults": 300,
-            "first_serve_percentage": 68.0,
-            "first_serve_points_won_percentage": 70.0,
-            "second_serve_points_won_percentage": 55.0,
-            "break_points_saved_percentage": 63.0,
-            "service_games_won_percentage": 82.0,
-            "return_games_won_percentage": 40.0,
-            "tie_breaks_won_percentage": 0.0,
-            "hard_court_titles": 0,  # era labeling is tricky
-            "clay_court_titles": 0,
-            "grass_court_titles": 150,
-            "indoor_court_titles": 42,
-            "career_prize_money_million_usd": 0.5,
-            "head_to_head_vs_top10_wins": 0,
-            "best_calendar_year_match_record": 110,
-            "most_consecutive_matches_won": 57,
-            "big_titles_count": 24,  # slam singles only
-            "three_set_match_wins": 80,
-            "three_setters_played": 110,
-            "longest_match_hours": 3.2,
-            "career_retirement_year": 1977,
-            "hall_of_fame_inducted": 1
-        },
-        {
-            "player_name": "Billie Jean King",
-            "country": "USA",
-            "years_active": 24,
-            "career_singles_titles": 129,
-            "career_doubles_titles": 61,
-            "grand_slam_singles_titles": 12,
-            "grand_slam_doubles_titles": 16,
-            "weeks_at_no1": 0, 
-            "year_end_no1_finishes": 5,
-            "olympic_gold_medals": 0,
-            "fed_cup_titles": 7,
-            "wta_1000_titles": 0,  # pre-wta
-            "wta_finals_titles": 0,
-            "career_match_wins": 695,
-            "career_match_losses": 155,
-            "career_win_percentage": 81.7,
-            "aces": 700,
-            "double_faults": 300,
-            "first_serve_percentage": 62.0,
-            "first_serve_points_won_percentage": 70.0,
-            "second_serve_points_won_percentage": 55.0,
-            "break_points_saved_percentage": 62.0,
-            "service_games_won_percentage": 80.0,
-            "return_games_won_percentage": 39.0,
-            "tie_breaks_won_percentage": 0.0,
-            "hard_court_titles": 35,
-            "clay_court_titles": 15,
-            "grass_court_titles": 40,
-            "indoor_court_titles": 39,
-            "career_prize_money_million_usd": 1.9,
-            "head_to_head_vs_top10_wins": 100,
-            "best_calendar_year_match_record": 63,
-            "most_consecutive_matches_won": 26,
-            "big_titles_count": 12,
-            "three_set_match_wins": 70,
-            "three_setters_played": 100,
-            "longest_match_hours": 2.8,
-            "career_retirement_year": 1990,
-            "hall_of_fame_inducted": 1
-        },
-        {
-            "player_name": "Monica Seles",
-            "country": "Yugoslavia/USA",
-            "years_active": 14,
-            "career_singles_titles": 53,
-            "career_doubles_titles": 6,
-            "grand_slam_singles_titles": 9,
-            "grand_slam_doubles_titles": 0,
-            "weeks_at_no1": 178,
-            "year_end_no1_finishes": 3,
-            "olympic_gold_medals": 0,
-            "fed_cup_titles": 3,
-            "wta_1000_titles": 11,
-            "wta_finals_titles": 3,
-            "career_match_wins": 595,
-            "career_match_losses": 122,
-            "career_win_percentage": 82.9,
-            "aces": 1200,
-            "double_faults": 600,
-            "first_serve_percentage": 65.0,
-            "first_serve_points_won_percentage": 70.0,
-            "second_serve_points_won_percentage": 52.0,
-            "break_points_saved_percentage": 62.0,
-            "service_games_won_percentage": 80.0,
-            "return_games_won_percentage": 39.0,
-            "tie_breaks_won_percentage": 57.0,
-            "hard_court_titles": 25,
-            "clay_court_titles": 20,
-            "grass_court_titles": 3,
-            "indoor_court_titles": 5,
-            "career_prize_money_million_usd": 14.9,
-            "head_to_head_vs_top10_wins": 90,
-            "best_calendar_year_match_record": 70,
-            "most_consecutive_matches_won": 36,
-            "big_titles_count": 13,
-            "three_set_match_wins": 85,
-            "three_setters_played": 120,
-            "longest_match_hours": 3.3,
-            "career_retirement_year": 2008,
-            "hall_of_fame_inducted": 1
-        },
-        {
-            "player_name": "Justine Henin",
-            "country": "Belgium",
-            "years_active": 12,
-            "career_singles_titles": 43,
-            "career_doubles_titles": 2,
-            "grand_slam_singles_titles": 7,
-            "grand_slam_doubles_titles": 0,
-            "weeks_at_no1": 117,
-            "year_end_no1_finishes": 3,
-            "olympic_gold_medals": 1,  # 2004
-            "fed_cup_titles": 1,
-            "wta_1000_titles": 10,
-            "wta_finals_titles": 2,
-            "career_match_wins": 525,
-            "career_match_losses": 115,
-            "career_win_percentage": 82.0,
-            "aces": 1800,
-            "double_faults": 700,
-            "first_serve_percentage": 66.0,
-            "first_serve_points_won_percentage": 69.0,
-            "second_serve_points_won_percentage": 54.0,
-            "break_points_saved_percentage": 63.0,
-            "service_games_won_percentage": 79.0,
-            "return_games_won_percentage": 41.0,
-            "tie_breaks_won_percentage": 55.0,
-            "hard_court_titles": 18,
-            "clay_court_titles": 14,
-            "grass_court_titles": 2,
-            "indoor_court_titles": 9,
-            "career_prize_money_million_usd": 20.8,
-            "head_to_head_vs_top10_wins": 80,
-            "best_calendar_year_match_record": 63,
-            "most_consecutive_matches_won": 32,
-            "big_titles_count": 19,
-            "three_set_match_wins": 65,
-            "three_setters_played": 100,
-            "longest_match_hours": 3.48,
-            "career_retirement_year": 2011,
-            "hall_of_fame_inducted": 1
-        },
-        {
-            "player_name": "Martina Hingis",
-            "country": "Switzerland",
-            "years_active": 15,
-            "career_singles_titles": 43,
-            "career_doubles_titles": 64,
-            "grand_slam_singles_titles": 5,
-            "grand_slam_doubles_titles": 13,
-            "weeks_at_no1": 209,
-            "year_end_no1_finishes": 3,
-            "olympic_gold_medals": 0,
-            "fed_cup_titles": 1,
-            "wta_1000_titles": 17,
-            "wta_finals_titles": 2,
-            "career_match_wins": 548,
-            "career_match_losses": 133,
-            "career_win_percentage": 80.5,
-            "aces": 900,
-            "double_faults": 400,
-            "first_serve_percentage": 62.0,
-            "first_serve_points_won_percentage": 68.0,
-            "second_serve_points_won_percentage": 52.0,
-            "break_points_saved_percentage": 61.0,
-            "service_games_won_percentage": 77.0,
-            "return_games_won_percentage": 40.0,
-            "tie_breaks_won_percentage": 55.0,
-            "hard_court_titles": 28,
-            "clay_court_titles": 6,
-            "grass_court_titles": 3,
-            "indoor_court_titles": 6,
-            "career_prize_money_million_usd": 24.5,
-            "head_to_head_vs_top10_wins": 98,
-            "best_calendar_year_match_record": 80,
-            "most_consecutive_matches_won": 37,
-            "big_titles_count": 20,
-            "three_set_match_wins": 60,
-            "three_setters_played": 95,
-            "longest_match_hours": 3.37,
-            "career_retirement_year": 2017,
-            "hall_of_fame_inducted": 1
-        },
-        {
-            "player_name": "Venus Williams",
-            "country": "USA",
-            "years_active": 26,
-            "career_singles_titles": 49,
-            "career_doubles_titles": 22,
-            "grand_slam_singles_titles": 7,
-            "grand_slam_doubles_titles": 14,
-            "weeks_at_no1": 11,
-            "year_end_no1_finishes": 0,
-            "olympic_gold_medals": 4,
-            "fed_cup_titles": 1,
-            "wta_1000_titles": 13,
-            "wta_finals_titles": 1,
-            "career_match_wins": 815,
-            "career_match_losses": 265,
-            "career_win_percentage": 75.5,
-            "aces": 4500,
-            "double_faults": 1900,
-            "first_serve_percentage": 58.0,
-            "first_serve_points_won_percentage": 72.0,
-            "second_serve_points_won_percentage": 49.0,
-            "break_points_saved_percentage": 62.0,
-            "service_games_won_percentage": 81.0,
-            "return_games_won_percentage": 34.0,
-            "tie_breaks_won_percentage": 56.0,
-            "hard_court_titles": 31,
-            "clay_court_titles": 3,
-            "grass_court_titles": 10,
-            "indoor_court_titles": 5,
-            "career_prize_money_million_usd": 42.3,
-            "head_to_head_vs_top10_wins": 160,
-            "best_calendar_year_match_record": 56,
-            "most_consecutive_matches_won": 35,
-            "big_titles_count": 22,
-            "three_set_match_wins": 105,
-            "three_setters_played": 170,
-            "longest_match_hours": 3.35,
-            "career_retirement_year": 0,  # still active
-            "hall_of_fame_inducted": 0
-        },
-        # -------- Add more players until we reach 30 total. -----------
-        {
-            "player_name": "Monica Puig",
-            "country": "Puerto Rico",
-            "years_active": 10,
-            "career_singles_titles": 2,
-            "career_doubles_titles": 0,
-            "grand_slam_singles_titles": 0,
-            "grand_slam_doubles_titles": 0,
-            "weeks_at_no1": 0,
-            "year_end_no1_finishes": 0,
-            "olympic_gold_medals": 1,  # 2016 Rio
-            "fed_cup_titles": 0,
-            "wta_1000_titles": 0,
-            "wta_finals_titles": 0,
-            "career_match_wins": 303,
-            "career_match_losses": 225,
-            "career_win_percentage": 57.4,
-            "aces": 800,
-            "double_faults": 500,
-            "first_serve_percentage": 60.0,
-            "first_serve_points_won_percentage": 65.0,
-            "second_serve_points_won_percentage": 47.0,
-            "break_points_saved_percentage": 58.0,
-            "service_games_won_percentage": 70.0,
-            "return_games_won_percentage": 28.0,
-            "tie_breaks_won_percentage": 48.0,
-            "hard_court_titles": 2,
-            "clay_court_titles": 0,
-            "grass_court_titles": 0,
-            "indoor_court_titles": 0,
-            "career_prize_money_million_usd": 3.5,
-            "head_to_head_vs_top10_wins": 10,
-            "best_calendar_year_match_record": 34,
-            "most_consecutive_matches_won": 8,
-            "big_titles_count": 1,
-            "three_set_match_wins": 30,
-            "three_setters_played": 50,
-            "longest_match_hours": 3.02,
-            "career_retirement_year": 2022,
-            "hall_of_fame_inducted": 0
-        },
-        {
-            "player_name": "Naomi Osaka",
-            "country": "Japan",
-            "years_active": 9,
-            "career_singles_titles": 7,
-            "career_doubles_titles": 0,
-            "grand_slam_singles_titles": 4,
-            "grand_slam_doubles_titles": 0,
-            "weeks_at_no1": 25,
-            "year_end_no1_finishes": 0,
-            "olympic_gold_medals": 0,
-            "fed_cup_titles": 0,
-            "wta_1000_titles": 2,
-            "wta_finals_titles": 0,
-            "career_match_wins": 265,
-            "career_match_losses": 126,
-            "career_win_percentage": 67.7,
-            "aces": 1600,
-            "double_faults": 700,
-            "first_serve_percentage": 57.0,
-            "first_serve_points_won_percentage": 72.0,
-            "second_serve_points_won_percentage": 48.0,
-            "break_points_saved_percentage": 60.0,
-            "service_games_won_percentage": 79.0,
-            "return_games_won_percentage": 28.0,
-            "tie_breaks_won_percentage": 52.0,
-            "hard_court_titles": 7,
-            "clay_court_titles": 0,
-            "grass_court_titles": 0,
-            "indoor_court_titles": 0,
-            "career_prize_money_million_usd": 21.0,
-            "head_to_head_vs_top10_wins": 25,
-            "best_calendar_year_match_record": 51,
-            "most_consecutive_matches_won": 23,
-            "big_titles_count": 6,
-            "three_set_match_wins": 28,
-            "three_setters_played": 45,
-            "longest_match_hours": 3.1,
-            "career_retirement_year": 0,
-            "hall_of_fame_inducted": 0
-        },
-        {
-            "player_name": "Simona Halep",
-            "country": "Romania",
-            "years_active": 15,
-            "career_singles_titles": 24,
-            "career_doubles_titles": 1,
-            "grand_slam_singles_titles": 2,
-            "grand_slam_doubles_titles": 0,
-            "weeks_at_no1": 64,
-            "year_end_no1_finishes": 2,
-            "olympic_gold_medals": 0,
-            "fed_cup_titles": 0,
-            "wta_1000_titles": 9,
-            "wta_finals_titles": 0,
-            "career_match_wins": 589,
-            "career_match_losses": 238,
-            "career_win_percentage": 71.2,
-            "aces": 1300,
-            "double_faults": 600,
-            "first_serve_percentage": 65.0,
-            "first_serve_points_won_percentage": 66.0,
-            "second_serve_points_won_percentage": 50.0,
-            "break_points_saved_percentage": 62.0,
-            "service_games_won_percentage": 73.0,
-            "return_games_won_percentage": 42.0,
-            "tie_breaks_won_percentage": 50.0,
-            "hard_court_titles": 14,
-            "clay_court_titles": 8,
-            "grass_court_titles": 2,
-            "indoor_court_titles": 0,
-            "career_prize_money_million_usd": 40.1,
-            "head_to_head_vs_top10_wins": 75,
-            "best_calendar_year_match_record": 54,
-            "most_consecutive_matches_won": 17,
-            "big_titles_count": 11,
-            "three_set_match_wins": 65,
-            "three_setters_played": 120,
-            "longest_match_hours": 3.27,
-            "career_retirement_year": 0,
-            "hall_of_fame_inducted": 0
-        },
-        {
-            "player_name": "Maria Sharapova",
-            "country": "Russia",
-            "years_active": 17,
-            "career_singles_titles": 36,
-            "career_doubles_titles": 3,
-            "grand_slam_singles_titles": 5,
-            "grand_slam_doubles_titles": 0,
-            "weeks_at_no1": 21,
-            "year_end_no1_finishes": 0,
-            "olympic_gold_medals": 0,
-            "fed_cup_titles": 1,
-            "wta_1000_titles": 10,
-            "wta_finals_titles": 1,
-            "career_match_wins": 645,
-            "career_match_losses": 171,
-            "career_win_percentage": 79.0,
-            "aces": 3600,
-            "double_faults": 1700,
-            "first_serve_percentage": 58.0,
-            "first_serve_points_won_percentage": 69.0,
-            "second_serve_points_won_percentage": 48.0,
-            "break_points_saved_percentage": 60.0,
-            "service_games_won_percentage": 77.0,
-            "return_games_won_percentage": 34.0,
-            "tie_breaks_won_percentage": 52.0,
-            "hard_court_titles": 18,
-            "clay_court_titles": 11,
-            "grass_court_titles": 4,
-            "indoor_court_titles": 3,
-            "career_prize_money_million_usd": 38.8,
-            "head_to_head_vs_top10_wins": 100,
-            "best_calendar_year_match_record": 59,
-            "most_consecutive_matches_won": 22,
-            "big_titles_count": 16,
-            "three_set_match_wins": 70,
-            "three_setters_played": 115,
-            "longest_match_hours": 3.45,
-            "career_retirement_year": 2020,
-            "hall_of_fame_inducted": 0
-        },
-        {
-            "player_name": "Lindsay Davenport",
-            "country": "USA",
-            "years_active": 14,
-            "career_singles_titles": 55,
-            "career_doubles_titles": 38,
-            "grand_slam_singles_titles": 3,
-            "grand_slam_doubles_titles": 3,
-            "weeks_at_no1": 98,
-            "year_end_no1_finishes": 4,
-            "olympic_gold_medals": 1,  # 1996 singles
-            "fed_cup_titles": 3,
-            "wta_1000_titles": 18,
-            "wta_finals_titles": 1,
-            "career_match_wins": 753,
-            "career_match_losses": 194,
-            "career_win_percentage": 79.5,
-            "aces": 3100,
-            "double_faults": 900,
-            "first_serve_percentage": 61.0,
-            "first_serve_points_won_percentage": 71.0,
-            "second_serve_points_won_percentage": 50.0,
-            "break_points_saved_percentage": 61.0,
-            "service_games_won_percentage": 79.0,
-            "return_games_won_percentage": 34.0,
-            "tie_breaks_won_percentage": 55.0,
-            "hard_court_titles": 37,
-            "clay_court_titles": 3,
-            "grass_court_titles": 10,
-            "indoor_court_titles": 5,
-            "career_prize_money_million_usd": 22.2,
-            "head_to_head_vs_top10_wins": 110,
-            "best_calendar_year_match_record": 62,
-            "most_consecutive_matches_won": 15,
-            "big_titles_count": 22,
-            "three_set_match_wins": 60,
-            "three_setters_played": 95,
-            "longest_match_hours": 3.2,
-            "career_retirement_year": 2010,
-            "hall_of_fame_inducted": 1
-        },
-        {
-            "player_name": "Arantxa Sanchez Vicario",
-            "country": "Spain",
-            "years_active": 17,
-            "career_singles_titles": 29,
-            "career_doubles_titles": 69,
-            "grand_slam_singles_titles": 4,
-            "grand_slam_doubles_titles": 6,
-            "weeks_at_no1": 12,
-            "year_end_no1_finishes": 0,
-            "olympic_gold_medals": 0,
-            "fed_cup_titles": 5,
-            "wta_1000_titles": 14,
-            "wta_finals_titles": 2,
-            "career_match_wins": 759,
-            "career_match_losses": 295,
-            "career_win_percentage": 72.0,
-            "aces": 1000,
-            "double_faults": 800,
-            "first_serve_percentage": 65.0,
-            "first_serve_points_won_percentage": 66.0,
-            "second_serve_points_won_percentage": 50.0,
-            "break_points_saved_percentage": 60.0,
-            "service_games_won_percentage": 74.0,
-            "return_games_won_percentage": 40.0,
-            "tie_breaks_won_percentage": 54.0,
-            "hard_court_titles": 10,
-            "clay_court_titles": 15,
-            "grass_court_titles": 1,
-            "indoor_court_titles": 3,
-            "career_prize_money_million_usd": 17.1,
-            "head_to_head_vs_top10_wins": 95,
-            "best_calendar_year_match_record": 62,
-            "most_consecutive_matches_won": 13,
-            "big_titles_count": 14,
-            "three_set_match_wins": 75,
-            "three_setters_played": 120,
-            "longest_match_hours": 3.45,
-            "career_retirement_year": 2002,
-            "hall_of_fame_inducted": 1
-        },
-        # ........ Keep adding until we have 30 players total. ........
-        {
-            "player_name": "Kim Clijsters",
-            "country": "Belgium",
-            "years_active": 15,
-            "career_singles_titles": 41,
-            "career_doubles_titles": 11,
-            "grand_slam_singles_titles": 4,
-            "grand_slam_doubles_titles": 2,
-            "weeks_at_no1": 20,
-            "year_end_no1_finishes": 1,
-            "olympic_gold_medals": 0,
-            "fed_cup_titles": 1,
-            "wta_1000_titles": 11,
-            "wta_finals_titles": 3,
-            "career_match_wins": 523,
-            "career_match_losses": 127,
-            "career_win_percentage": 80.4,
-            "aces": 1600,
-            "double_faults": 700,
-            "first_serve_percentage": 62.0,
-            "first_serve_points_won_percentage": 69.0,
-            "second_serve_points_won_percentage": 52.0,
-            "break_points_saved_percentage": 61.0,
-            "service_games_won_percentage": 78.0,
-            "return_games_won_percentage": 38.0,
-            "tie_breaks_won_percentage": 54.0,
-            "hard_court_titles": 26,
-            "clay_court_titles": 5,
-            "grass_court_titles": 2,
-            "indoor_court_titles": 8,
-            "career_prize_money_million_usd": 24.4,
-            "head_to_head_vs_top10_wins": 85,
-            "best_calendar_year_match_record": 67,
-            "most_consecutive_matches_won": 18,
-            "big_titles_count": 18,
-            "three_set_match_wins": 60,
-            "three_setters_played": 95,
-            "longest_match_hours": 3.32,
-            "career_retirement_year": 2020,
-            "hall_of_fame_inducted": 1
-        },
-        {
-            "player_name": "Victoria Azarenka",
-            "country": "Belarus",
-            "years_active": 17,
-            "career_singles_titles": 21,
-            "career_doubles_titles": 9,
-            "grand_slam_singles_titles": 2,
-            "grand_slam_doubles_titles": 2,
-            "weeks_at_no1": 51,
-            "year_end_no1_finishes": 2,
-            "olympic_gold_medals": 1,  # 2012 mixed doubles
-            "fed_cup_titles": 0,
-            "wta_1000_titles": 10,
-            "wta_finals_titles": 0,
-            "career_match_wins": 528,
-            "career_match_losses": 212,
-            "career_win_percentage": 71.4,
-            "aces": 1400,
-            "double_faults": 900,
-            "first_serve_percentage": 63.0,
-            "first_serve_points_won_percentage": 68.0,
-            "second_serve_points_won_percentage": 52.0,
-            "break_points_saved_percentage": 60.0,
-            "service_games_won_percentage": 75.0,
-            "return_games_won_percentage": 37.0,
-            "tie_breaks_won_percentage": 50.0,
-            "hard_court_titles": 16,
-            "clay_court_titles": 2,
-            "grass_court_titles": 1,
-            "indoor_court_titles": 2,
-            "career_prize_money_million_usd": 35.2,
-            "head_to_head_vs_top10_wins": 85,
-            "best_calendar_year_match_record": 69,
-            "most_consecutive_matches_won": 26,
-            "big_titles_count": 14,
-            "three_set_match_wins": 54,
-            "three_setters_played": 90,
-            "longest_match_hours": 3.22,
-            "career_retirement_year": 0,
-            "hall_of_fame_inducted": 0
-        },
-        {
-            "player_name": "Angelique Kerber",
-            "country": "Germany",
-            "years_active": 16,
-            "career_singles_titles": 14,
-            "career_doubles_titles": 0,
-            "grand_slam_singles_titles": 3,
-            "grand_slam_doubles_titles": 0,
-            "weeks_at_no1": 34,
-            "year_end_no1_finishes": 1,
-            "olympic_gold_medals": 0,
-            "fed_cup_titles": 0,
-            "wta_1000_titles": 4,
-            "wta_finals_titles": 0,
-            "career_match_wins": 569,
-            "career_match_losses": 316,
-            "career_win_percentage": 64.3,
-            "aces": 1200,
-            "double_faults": 900,
-            "first_serve_percentage": 65.0,
-            "first_serve_points_won_percentage": 66.0,
-            "second_serve_points_won_percentage": 50.0,
-            "break_points_saved_percentage": 59.0,
-            "service_games_won_percentage": 72.0,
-            "return_games_won_percentage": 40.0,
-            "tie_breaks_won_percentage": 48.0,
-            "hard_court_titles": 10,
-            "clay_court_titles": 2,
-            "grass_court_titles": 2,
-            "indoor_court_titles": 0,
-            "career_prize_money_million_usd": 31.3,
-            "head_to_head_vs_top10_wins": 70,
-            "best_calendar_year_match_record": 63,
-            "most_consecutive_matches_won": 14,
-            "big_titles_count": 7,
-            "three_set_match_wins": 55,
-            "three_setters_played": 95,
-            "longest_match_hours": 3.25,
-            "career_retirement_year": 0,
-            "hall_of_fame_inducted": 0
-        },
-        # ... (Continue until 30 players total) ...
-    ]
-
-    # Make sure we have 30 entries. If not, add placeholders or expand the list above as needed.
-
-    # Write out to CSV
-    with open(filename, mode="w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-        for pdata in players_data:
-            # Fill missing fields with 0 or safe defaults
-            for h in headers:
-                if h not in pdata:
-                    pdata[h] = 0
-            writer.writerow(pdata)
+    players_data = load_players(PLAYERS_FILE)
+    write_dataset(HEADERS, players_data, filename)
 
 
 if __name__ == "__main__":
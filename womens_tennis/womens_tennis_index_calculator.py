@@ -8,6 +8,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import normalization helpers
 from sports_index_normalizer import normalize_indexes, plot_top_10_indexes
+from sports_storage import read_table, write_table
+from sports_archetypes import add_archetypes
 
 def calc_womens_tennis_index(row):
     """
@@ -184,7 +186,7 @@ def calc_womens_tennis_index(row):
 
 def main():
     # 1) Load the dataset
-    df = pd.read_csv("womens_tennis_dataset.csv")
+    df = read_table("womens_tennis_dataset.csv")
     
     # 2) Calculate the Women's Tennis Index Score for each player
     df["womens_tennis_index"] = df.apply(calc_womens_tennis_index, axis=1)
@@ -203,8 +205,11 @@ def main():
     # 5) Normalize the index scores (0–100 scale)
     normalized_df = normalize_indexes(df, name_col='player_name', index_col='womens_tennis_index')
     
+    # Add each athlete's archetype (cluster) and its distance to the centroid
+    normalized_df = add_archetypes(normalized_df, "womens_tennis")
+
     # 6) Save the sorted results with normalized scores to a new CSV
-    normalized_df.to_csv("womens_tennis_index_scored.csv", index=False)
+    write_table(normalized_df, "womens_tennis_index_scored.csv")
     
     # 7) Create a line plot for the top 10 using the normalized data
     plot_top_10_indexes(
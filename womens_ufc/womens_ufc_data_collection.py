@@ -1,337 +1,68 @@
-import csv
+import os
+import sys
+
+# Add parent directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sports_player_data import load_players, write_dataset
+
+# One record per fighter; fields a fighter does not list are written as 0
+PLAYERS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "womens_ufc_fighters.json")
+
+# Define the header (1 fighter_name + 40 stats = 41 columns)
+HEADERS = [
+    "fighter_name",
+    "nickname",
+    "country",
+    "weight_class",
+    "stance",
+    "years_active",
+    "total_mma_fights",
+    "wins",
+    "losses",
+    "draws",
+    "ko_tko_wins",
+    "submission_wins",
+    "decision_wins",
+    "ko_tko_losses",
+    "submission_losses",
+    "decision_losses",
+    "world_titles_held",         # # of recognized UFC titles
+    "ufc_championships_won",     # # times became champion
+    "title_defenses",
+    "height_cm",
+    "reach_cm",
+    "avg_significant_strikes_per_min",
+    "avg_strike_accuracy_percent",
+    "avg_takedowns_per_15",
+    "avg_takedown_accuracy_percent",
+    "avg_submission_attempts_per_15",
+    "average_fight_time_minutes",
+    "knockdowns_scored",
+    "knockdowns_received",
+    "fights_in_home_country",
+    "fight_of_the_night_awards",
+    "performance_of_the_night_awards",
+    "hall_of_fame_inducted",
+    "major_awards",             # e.g. ESPY, MMA awards
+    "longest_win_streak",
+    "biggest_upset_wins",
+    "doping_tests_passed",
+    "doping_tests_failed",
+    "career_earnings_million_usd",
+    "retirement_year",          # 0 if active
+    "coach_name"                # main coach or gym
+]
+
 
 def create_womens_ufc_dataset(filename="womens_ufc_dataset.csv"):
     """
     Creates a CSV file containing 30 women's UFC fighters, each with 40+ stats.
     The CSV will have 41 columns total (fighter_name + 40 stats).
     """
+    fighters_data = load_players(PLAYERS_FILE)
+    write_dataset(HEADERS, fighters_data, filename, expected_count=30, name_col="fighter_name")
 
-    # Define the header (1 fighter_name + 40 stats = 41 columns)
-    headers = [
-        "fighter_name",
-        "nickname",
-        "country",
-        "weight_class",
-        "stance",
-        "years_active",
-        "total_mma_fights",
-        "wins",
-        "losses",
-        "draws",
-        "ko_tko_wins",
-        "submission_wins",
-        "decision_wins",
-        "ko_tko_losses",
-        "submission_losses",
-        "decision_losses",
-        "world_titles_held",         # # of recognized UFC titles
-        "ufc_championships_won",     # # times became champion
-        "title_defenses",
-        "height_cm",
-        "reach_cm",
-        "avg_significant_strikes_per_min",
-        "avg_strike_accuracy_percent",
-        "avg_takedowns_per_15",
-        "avg_takedown_accuracy_percent",
-        "avg_submission_attempts_per_15",
-        "average_fight_time_minutes",
-        "knockdowns_scored",
-        "knockdowns_received",
-        "fights_in_home_country",
-        "fight_of_the_night_awards",
-        "performance_of_the_night_awards",
-        "hall_of_fame_inducted",
-        "major_awards",             # e.g. ESPY, MMA awards
-        "longest_win_streak",
-        "biggest_upset_wins",
-        "doping_tests_passed",
-        "doping_tests_failed",
-        "career_earnings_million_usd",
-        "retirement_year",          # 0 if active
-        "coach_name"                # main coach or gym
-    ]
-
-    # We'll generate 30 fighters with a mix of well-known names plus placeholders.
-    # Data is approximate or partially fictitious for demonstration.
-    fighters_data = [
-        {
-            "fighter_name": "Amanda Nunes",
-            "nickname": "The Lioness",
-            "country": "Brazil",
-            "weight_class": "Bantamweight/Featherweight",
-            "stance": "Orthodox",
-            "years_active": 14,
-            "total_mma_fights": 28,
-            "wins": 23,
-            "losses": 5,
-            "draws": 0,
-            "ko_tko_wins": 13,
-            "submission_wins": 4,
-            "decision_wins": 6,
-            "ko_tko_losses": 2,
-            "submission_losses": 2,
-            "decision_losses": 1,
-            "world_titles_held": 2,  # 2-division champ
-            "ufc_championships_won": 2,
-            "title_defenses": 9,
-            "height_cm": 173,
-            "reach_cm": 175,
-            "avg_significant_strikes_per_min": 4.5,
-            "avg_strike_accuracy_percent": 52.0,
-            "avg_takedowns_per_15": 2.5,
-            "avg_takedown_accuracy_percent": 53.0,
-            "avg_submission_attempts_per_15": 0.7,
-            "average_fight_time_minutes": 8.5,
-            "knockdowns_scored": 8,
-            "knockdowns_received": 1,
-            "fights_in_home_country": 4,
-            "fight_of_the_night_awards": 3,
-            "performance_of_the_night_awards": 5,
-            "hall_of_fame_inducted": 0,
-            "major_awards": 4,  # e.g. ESPN MMA awards
-            "longest_win_streak": 12,
-            "biggest_upset_wins": 2,
-            "doping_tests_passed": 60,
-            "doping_tests_failed": 0,
-            "career_earnings_million_usd": 5.5,
-            "retirement_year": 2023,
-            "coach_name": "Conan Silveira"
-        },
-        {
-            "fighter_name": "Valentina Shevchenko",
-            "nickname": "Bullet",
-            "country": "Kyrgyzstan",
-            "weight_class": "Flyweight",
-            "stance": "Southpaw",
-            "years_active": 19,
-            "total_mma_fights": 28,
-            "wins": 23,
-            "losses": 4,
-            "draws": 0,
-            "ko_tko_wins": 8,
-            "submission_wins": 7,
-            "decision_wins": 8,
-            "ko_tko_losses": 1,
-            "submission_losses": 0,
-            "decision_losses": 3,
-            "world_titles_held": 1,  
-            "ufc_championships_won": 1,
-            "title_defenses": 7,
-            "height_cm": 165,
-            "reach_cm": 168,
-            "avg_significant_strikes_per_min": 3.0,
-            "avg_strike_accuracy_percent": 51.0,
-            "avg_takedowns_per_15": 2.0,
-            "avg_takedown_accuracy_percent": 56.0,
-            "avg_submission_attempts_per_15": 0.6,
-            "average_fight_time_minutes": 11.2,
-            "knockdowns_scored": 5,
-            "knockdowns_received": 1,
-            "fights_in_home_country": 1,
-            "fight_of_the_night_awards": 2,
-            "performance_of_the_night_awards": 4,
-            "hall_of_fame_inducted": 0,
-            "major_awards": 3,
-            "longest_win_streak": 6,
-            "biggest_upset_wins": 1,
-            "doping_tests_passed": 50,
-            "doping_tests_failed": 0,
-            "career_earnings_million_usd": 4.0,
-            "retirement_year": 0, # active
-            "coach_name": "Pavel Fedotov"
-        },
-        {
-            "fighter_name": "Ronda Rousey",
-            "nickname": "Rowdy",
-            "country": "USA",
-            "weight_class": "Bantamweight",
-            "stance": "Orthodox",
-            "years_active": 6,
-            "total_mma_fights": 14,
-            "wins": 12,
-            "losses": 2,
-            "draws": 0,
-            "ko_tko_wins": 3,
-            "submission_wins": 9,
-            "decision_wins": 0,
-            "ko_tko_losses": 2,
-            "submission_losses": 0,
-            "decision_losses": 0,
-            "world_titles_held": 1,
-            "ufc_championships_won": 1,
-            "title_defenses": 6,
-            "height_cm": 168,
-            "reach_cm": 168,
-            "avg_significant_strikes_per_min": 4.1,
-            "avg_strike_accuracy_percent": 52.0,
-            "avg_takedowns_per_15": 2.4,
-            "avg_takedown_accuracy_percent": 56.0,
-            "avg_submission_attempts_per_15": 2.0,
-            "average_fight_time_minutes": 2.5,
-            "knockdowns_scored": 2,
-            "knockdowns_received": 3,
-            "fights_in_home_country": 10,
-            "fight_of_the_night_awards": 1,
-            "performance_of_the_night_awards": 4,
-            "hall_of_fame_inducted": 1,
-            "major_awards": 5,
-            "longest_win_streak": 12,
-            "biggest_upset_wins": 2,
-            "doping_tests_passed": 20,
-            "doping_tests_failed": 0,
-            "career_earnings_million_usd": 8.0,
-            "retirement_year": 2016,
-            "coach_name": "Edmond Tarverdyan"
-        },
-        {
-            "fighter_name": "Rose Namajunas",
-            "nickname": "Thug",
-            "country": "USA",
-            "weight_class": "Strawweight",
-            "stance": "Orthodox",
-            "years_active": 10,
-            "total_mma_fights": 14,
-            "wins": 11,
-            "losses": 4,
-            "draws": 0,
-            "ko_tko_wins": 2,
-            "submission_wins": 5,
-            "decision_wins": 4,
-            "ko_tko_losses": 1,
-            "submission_losses": 0,
-            "decision_losses": 3,
-            "world_titles_held": 1,
-            "ufc_championships_won": 1,
-            "title_defenses": 3,
-            "height_cm": 165,
-            "reach_cm": 165,
-            "avg_significant_strikes_per_min": 3.7,
-            "avg_strike_accuracy_percent": 42.0,
-            "avg_takedowns_per_15": 1.8,
-            "avg_takedown_accuracy_percent": 53.0,
-            "avg_submission_attempts_per_15": 0.8,
-            "average_fight_time_minutes": 11.0,
-            "knockdowns_scored": 3,
-            "knockdowns_received": 2,
-            "fights_in_home_country": 5,
-            "fight_of_the_night_awards": 2,
-            "performance_of_the_night_awards": 2,
-            "hall_of_fame_inducted": 0,
-            "major_awards": 1,
-            "longest_win_streak": 3,
-            "biggest_upset_wins": 2,
-            "doping_tests_passed": 35,
-            "doping_tests_failed": 0,
-            "career_earnings_million_usd": 2.5,
-            "retirement_year": 0,
-            "coach_name": "Trevor Wittman"
-        },
-        {
-            "fighter_name": "Joanna Jedrzejczyk",
-            "nickname": "JJ",
-            "country": "Poland",
-            "weight_class": "Strawweight",
-            "stance": "Orthodox",
-            "years_active": 10,
-            "total_mma_fights": 23,
-            "wins": 16,
-            "losses": 7,
-            "draws": 0,
-            "ko_tko_wins": 4,
-            "submission_wins": 1,
-            "decision_wins": 11,
-            "ko_tko_losses": 2,
-            "submission_losses": 0,
-            "decision_losses": 5,
-            "world_titles_held": 1,
-            "ufc_championships_won": 1,
-            "title_defenses": 5,
-            "height_cm": 168,
-            "reach_cm": 170,
-            "avg_significant_strikes_per_min": 6.3,
-            "avg_strike_accuracy_percent": 47.0,
-            "avg_takedowns_per_15": 0.3,
-            "avg_takedown_accuracy_percent": 67.0,
-            "avg_submission_attempts_per_15": 0.1,
-            "average_fight_time_minutes": 15.8,
-            "knockdowns_scored": 3,
-            "knockdowns_received": 4,
-            "fights_in_home_country": 2,
-            "fight_of_the_night_awards": 2,
-            "performance_of_the_night_awards": 2,
-            "hall_of_fame_inducted": 0,
-            "major_awards": 2,
-            "longest_win_streak": 14,
-            "biggest_upset_wins": 1,
-            "doping_tests_passed": 40,
-            "doping_tests_failed": 0,
-            "career_earnings_million_usd": 2.0,
-            "retirement_year": 2022,
-            "coach_name": "Mike Brown"
-        },
-        # ... (continue adding real fighters or approximate placeholders until we reach 30) ...
-    ]
-
-    # Add placeholders to reach 30
-    while len(fighters_data) < 30:
-        idx = len(fighters_data) + 1
-        fighters_data.append({
-            "fighter_name": f"Placeholder Fighter {idx}",
-            "nickname": "Placeholder",
-            "country": "CountryX",
-            "weight_class": "Flyweight",
-            "stance": "Orthodox",
-            "years_active": 5,
-            "total_mma_fights": 10,
-            "wins": 8,
-            "losses": 2,
-            "draws": 0,
-            "ko_tko_wins": 3,
-            "submission_wins": 2,
-            "decision_wins": 3,
-            "ko_tko_losses": 1,
-            "submission_losses": 0,
-            "decision_losses": 1,
-            "world_titles_held": 0,
-            "ufc_championships_won": 0,
-            "title_defenses": 0,
-            "height_cm": 163,
-            "reach_cm": 163,
-            "avg_significant_strikes_per_min": 2.5,
-            "avg_strike_accuracy_percent": 40.0,
-            "avg_takedowns_per_15": 1.0,
-            "avg_takedown_accuracy_percent": 40.0,
-            "avg_submission_attempts_per_15": 0.5,
-            "average_fight_time_minutes": 9.0,
-            "knockdowns_scored": 2,
-            "knockdowns_received": 2,
-            "fights_in_home_country": 2,
-            "fight_of_the_night_awards": 0,
-            "performance_of_the_night_awards": 0,
-            "hall_of_fame_inducted": 0,
-            "major_awards": 0,
-            "longest_win_streak": 4,
-            "biggest_upset_wins": 1,
-            "doping_tests_passed": 15,
-            "doping_tests_failed": 0,
-            "career_earnings_million_usd": 0.2,
-            "retirement_year": 0,
-            "coach_name": "Placeholder Coach"
-        })
-
-    # Confirm we have exactly 30
-    if len(fighters_data) != 30:
-        raise ValueError(f"Expected 30 fighters, got {len(fighters_data)}")
-
-    # Write out to CSV
-    with open(filename, mode="w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-        for fighter in fighters_data:
-            for h in headers:
-                if h not in fighter:
-                    fighter[h] = 0
-            writer.writerow(fighter)
 
 if __name__ == "__main__":
     create_womens_ufc_dataset()
@@ -8,6 +8,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import normalization helpers
 from sports_index_normalizer import normalize_indexes, plot_top_10_indexes
+from sports_storage import read_table, write_table
+from sports_archetypes import add_archetypes
 
 def calc_womens_ufc_index(row):
     """
@@ -205,7 +207,7 @@ def calc_womens_ufc_index(row):
 
 def main():
     # 1) Load the dataset
-    df = pd.read_csv("womens_ufc_dataset.csv")
+    df = read_table("womens_ufc_dataset.csv")
     
     # 2) Calculate the Women's UFC Index Score for each fighter
     df["womens_ufc_index"] = df.apply(calc_womens_ufc_index, axis=1)
@@ -224,8 +226,11 @@ def main():
     # 5) Normalize the scores (0–100)
     normalized_df = normalize_indexes(df, name_col='fighter_name', index_col='womens_ufc_index')
     
+    # Add each athlete's archetype (cluster) and its distance to the centroid
+    normalized_df = add_archetypes(normalized_df, "womens_ufc")
+
     # 6) Save the sorted results with normalized scores to a new CSV
-    normalized_df.to_csv("womens_ufc_index_scored.csv", index=False)
+    write_table(normalized_df, "womens_ufc_index_scored.csv")
     
     # 7) Create the plot using the normalized data
     plot_top_10_indexes(